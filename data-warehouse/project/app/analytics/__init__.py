@@ -0,0 +1,17 @@
+"""Analytics exports and query engines over the gold layer."""
+from .duckdb_engine import DuckDBSession
+from .parquet_export import FACT_YEAR_COLUMNS, export_gold, export_tables
+from .queries import ANALYTICS_BACKENDS, GOLD_QUERIES, analytics_session, query_df, run_query, table_count
+
+__all__ = [
+    "export_gold",
+    "export_tables",
+    "FACT_YEAR_COLUMNS",
+    "DuckDBSession",
+    "ANALYTICS_BACKENDS",
+    "GOLD_QUERIES",
+    "analytics_session",
+    "query_df",
+    "run_query",
+    "table_count",
+]
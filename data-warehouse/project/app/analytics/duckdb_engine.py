@@ -0,0 +1,165 @@
+"""
+Embedded DuckDB query engine over the gold Parquet export.
+
+DuckDBSession exposes each exported table as a view named gold.<table>
+(an empty, typed view for a table exported without rows) and
+supports the subset of the SQLAlchemy Session API that the analytics code
+uses (execute(text(sql), params) with scalar/fetchall/all/keys). The same
+PostgreSQL-flavoured SQL can therefore run against the export without
+touching the database. Requires duckdb (see requirements.txt).
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, SmallInteger, Table
+
+from app.shared import settings
+from app.shared.query_cache import QueryResult
+from .parquet_export import FACT_YEAR_COLUMNS, MANIFEST_NAME, DATA_FILE, export_tables, load_manifest
+
+# :name bind parameters (but not ::type casts)
+BIND_PARAMETER = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+def _require_duckdb():
+    """Import duckdb, with an actionable error if missing."""
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError("The DuckDB backend requires duckdb: pip install duckdb") from e
+    return duckdb
+
+
+def to_duckdb_sql(sql: str) -> str:
+    """Rewrite SQLAlchemy :name bind parameters as DuckDB $name parameters."""
+    return BIND_PARAMETER.sub(r"$\1", sql)
+
+
+def view_sql(root: Path, table: Table) -> str:
+    """
+    CREATE VIEW statement exposing one exported table as gold.<table>.
+
+    Fact views list the table's columns explicitly so the year=
+    directories do not add a column the PostgreSQL table lacks.
+    """
+    columns = ", ".join(column.name for column in table.columns)
+    if table.name in FACT_YEAR_COLUMNS:
+        source = f"read_parquet('{(root / table.name).as_posix()}/*/{DATA_FILE}', hive_partitioning = true)"
+    else:
+        source = f"read_parquet('{(root / table.name / DATA_FILE).as_posix()}')"
+    return f"CREATE OR REPLACE VIEW gold.{table.name} AS SELECT {columns} FROM {source}"
+
+
+def has_data_files(root: Path, table: Table) -> bool:
+    """Whether an exported table has Parquet files to read (facts without rows have none)."""
+    if table.name in FACT_YEAR_COLUMNS:
+        return any((root / table.name).glob(f"*/{DATA_FILE}"))
+    return (root / table.name / DATA_FILE).exists()
+
+
+def duckdb_type(column) -> str:
+    """DuckDB type of a gold column, matching parquet_export.arrow_schema."""
+    types = [
+        (SmallInteger, "SMALLINT"),
+        (Integer, "INTEGER"),
+        (Float, "DOUBLE"),
+        (Boolean, "BOOLEAN"),
+        (DateTime, "TIMESTAMP"),
+        (Date, "DATE"),
+    ]
+    return next((name for sql_type, name in types if isinstance(column.type, sql_type)), "VARCHAR")
+
+
+def empty_view_sql(table: Table) -> str:
+    """
+    CREATE VIEW statement exposing a table exported without rows as an empty gold.<table>.
+
+    read_parquet fails on a glob that matches no file, so the view selects
+    typed NULLs instead and queries see the table's columns with no rows.
+    """
+    columns = ", ".join(f"CAST(NULL AS {duckdb_type(column)}) AS {column.name}" for column in table.columns)
+    return f"CREATE OR REPLACE VIEW gold.{table.name} AS SELECT {columns} WHERE false"
+
+
+class DuckDBSession:
+    """
+    In-process, read-only session over a gold Parquet export.
+
+    Example:
+        with DuckDBSession() as session:
+            session.execute(text("SELECT COUNT(*) FROM gold.dim_patient")).scalar()
+    """
+
+    def __init__(self, root: Optional[Path] = None, threads: Optional[int] = None):
+        """
+        Open an in-memory DuckDB database with views over the export.
+
+        Args:
+            root: Export root directory (default: settings.export_path)
+            threads: DuckDB worker threads (default: all cores)
+
+        Raises:
+            FileNotFoundError: If there is no export at root
+        """
+        duckdb = _require_duckdb()
+        self.root = Path(root or settings.export_path)
+        if not (self.root / MANIFEST_NAME).exists():
+            raise FileNotFoundError(f"No gold export found at {self.root}; run scripts/export_gold.py first")
+
+        self.manifest = load_manifest(self.root)
+        self.connection = duckdb.connect(":memory:")
+        if threads:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        self.connection.execute("CREATE SCHEMA IF NOT EXISTS gold")
+        for table in export_tables():
+            if has_data_files(self.root, table):
+                self.connection.execute(view_sql(self.root, table))
+            elif table.name in self.manifest:
+                self.connection.execute(empty_view_sql(table))
+
+    def execute(self, statement, params: Optional[Dict[str, Any]] = None) -> QueryResult:
+        """
+        Run a query (a SQLAlchemy text() clause or a string).
+
+        Args:
+            statement: SQL using :name bind parameters
+            params: Bind parameter values
+
+        Returns:
+            Fully fetched result
+        """
+        sql = to_duckdb_sql(str(statement))
+        used = set(BIND_PARAMETER.findall(str(statement)))
+        cursor = self.connection.execute(sql, {k: v for k, v in (params or {}).items() if k in used})
+        keys = [column[0] for column in cursor.description or []]
+        return QueryResult(cursor.fetchall(), keys)
+
+    def table_versions(self, tables: List[str]) -> Dict[str, str]:
+        """
+        Version of each gold.<table>: a digest of its export fingerprints.
+
+        Re-exporting changed data changes the digest, which invalidates
+        cached results (see app.shared.query_cache).
+        """
+        return {
+            name: hashlib.sha1(
+                json.dumps(self.manifest.get(name.split(".", 1)[-1]), sort_keys=True).encode()
+            ).hexdigest()[:16]
+            for name in tables
+        }
+
+    def commit(self):
+        """No-op: the session is read-only."""
+
+    def close(self):
+        """Close the DuckDB connection."""
+        self.connection.close()
+
+    def __enter__(self) -> "DuckDBSession":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
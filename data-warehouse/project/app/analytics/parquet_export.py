@@ -0,0 +1,321 @@
+"""
+Columnar Parquet export of the gold star schema.
+
+Every gold dimension, fact and aggregate table is written under the export
+root as:
+
+    <root>/<table>/data.parquet                 dimensions and aggregates
+    <root>/<table>/year=<YYYY>/data.parquet     facts, by event year
+
+The year= directories follow the Hive layout, so DuckDB, pandas and Spark can
+read a fact table as one dataset and skip years a query filters out. Fact
+rows without a timestamp go to year=0.
+
+Each partition is fingerprinted in the database (row count plus a sum of
+row hashes) and the fingerprints are saved in <root>/_manifest.json. An
+incremental export recomputes them and only rewrites the partitions whose
+fingerprint changed. Requires pyarrow (see requirements.txt).
+"""
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, SmallInteger, Table, text
+from sqlalchemy.orm import Session
+
+from app.models.gold import GoldBase
+from app.shared import logger
+
+# Fact table -> timestamp column whose year partitions the export
+FACT_YEAR_COLUMNS = {
+    "fact_admission": "admittime",
+    "fact_icu_stay": "intime",
+    "fact_lab_event": "charttime",
+    "fact_prescription": "startdate",
+    "fact_transfer": "intime",
+    "fact_input_event": "charttime",
+    "fact_output_event": "charttime",
+    "fact_procedure": "starttime",
+    "fact_microbiology": "chartdate",
+}
+
+# Gold tables exported (ETL control tables are skipped)
+EXPORT_PREFIXES = ("dim_", "fact_", "agg_")
+
+MANIFEST_NAME = "_manifest.json"
+DATA_FILE = "data.parquet"
+NO_YEAR = 0
+
+
+def _require_pyarrow():
+    """Import pyarrow and pyarrow.parquet, with an actionable error if missing."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+    return pa, pq
+
+
+def export_tables(names: Optional[Sequence[str]] = None) -> List[Table]:
+    """
+    Gold tables to export, in dependency order.
+
+    Args:
+        names: Table names to restrict to (default: every dimension, fact
+            and aggregate)
+
+    Raises:
+        ValueError: If a requested table is not an exportable gold table
+    """
+    tables = [t for t in GoldBase.metadata.sorted_tables if t.name.startswith(EXPORT_PREFIXES)]
+    if names is None:
+        return tables
+
+    by_name = {t.name: t for t in tables}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown gold tables: {', '.join(unknown)}")
+    return [by_name[name] for name in names]
+
+
+def arrow_schema(table: Table):
+    """
+    Arrow schema matching a gold table's columns.
+
+    Raises:
+        TypeError: For a column type with no Arrow mapping
+    """
+    pa, _ = _require_pyarrow()
+    types = [
+        (SmallInteger, pa.int16()),
+        (Integer, pa.int32()),
+        (Float, pa.float64()),
+        (Boolean, pa.bool_()),
+        (DateTime, pa.timestamp("us")),
+        (Date, pa.date32()),
+    ]
+
+    fields = []
+    for column in table.columns:
+        arrow_type = next((t for sql_type, t in types if isinstance(column.type, sql_type)), pa.string())
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def partition_key(table: Table, year: Optional[int]) -> str:
+    """Manifest key of a partition: 'year=YYYY' for facts, '' for whole tables."""
+    return f"year={year}" if table.name in FACT_YEAR_COLUMNS else ""
+
+
+def partition_path(root: Path, table: Table, key: str) -> Path:
+    """Parquet file holding one partition of a table."""
+    return root / table.name / key / DATA_FILE if key else root / table.name / DATA_FILE
+
+
+def fingerprint_sql(table: Table) -> str:
+    """
+    SQL computing (year, row count, row hash sum) per export partition.
+
+    Runs entirely in the database; only one row per partition comes back.
+    """
+    column = FACT_YEAR_COLUMNS.get(table.name)
+    year = f"COALESCE(EXTRACT(YEAR FROM t.{column})::int, {NO_YEAR})" if column else "NULL::int"
+    return (
+        f"SELECT {year} AS year, COUNT(*), "
+        f"COALESCE(SUM(hashtextextended(t::text, 0)::numeric), 0) "
+        f"FROM {table.fullname} t GROUP BY 1"
+    )
+
+
+def partition_fingerprints(session: Session, table: Table) -> Dict[str, str]:
+    """
+    Fingerprint every export partition of a table.
+
+    Returns:
+        Map of partition key -> 'count:hash'. Whole tables always have an
+        entry, so an empty dimension still gets an (empty) file.
+    """
+    fingerprints = {
+        partition_key(table, year): f"{count}:{digest}"
+        for year, count, digest in session.execute(text(fingerprint_sql(table)))
+    }
+    if table.name not in FACT_YEAR_COLUMNS and not fingerprints:
+        fingerprints[""] = "0:0"
+    return fingerprints
+
+
+def changed_partitions(previous: Dict[str, str], current: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Compare two fingerprint maps.
+
+    Returns:
+        {'write': keys new or changed, 'delete': keys no longer present,
+        'unchanged': keys with identical fingerprints}
+    """
+    return {
+        "write": sorted(key for key, value in current.items() if previous.get(key) != value),
+        "delete": sorted(key for key in previous if key not in current),
+        "unchanged": sorted(key for key, value in current.items() if previous.get(key) == value),
+    }
+
+
+def select_partition_sql(table: Table, key: str) -> str:
+    """SELECT over one partition, using a sargable range on the year column."""
+    columns = ", ".join(column.name for column in table.columns)
+    sql = f"SELECT {columns} FROM {table.fullname}"
+    if not key:
+        return sql
+
+    column = FACT_YEAR_COLUMNS[table.name]
+    if key == f"year={NO_YEAR}":
+        return f"{sql} WHERE {column} IS NULL"
+    return f"{sql} WHERE {column} >= make_date(:year, 1, 1) AND {column} < make_date(:year + 1, 1, 1)"
+
+
+def write_partition(
+    session: Session, table: Table, key: str, path: Path, batch_size: int, compression: str
+) -> int:
+    """
+    Stream one partition into a Parquet file.
+
+    Rows are read through a server-side cursor and converted to Arrow one
+    batch (row group) at a time, so memory stays bounded by batch_size. The
+    file is written beside the target and renamed into place, so readers
+    never see a half-written partition.
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _require_pyarrow()
+    schema = arrow_schema(table)
+    params = {"year": int(key.split("=", 1)[1])} if key else {}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    rows = 0
+
+    result = session.connection().execution_options(stream_results=True, yield_per=batch_size).execute(
+        text(select_partition_sql(table, key)), params
+    )
+    with pq.ParquetWriter(temp_path, schema, compression=compression) as writer:
+        for batch in result.partitions(batch_size):
+            columns = list(zip(*batch))
+            arrays = [pa.array(values, type=f.type) for values, f in zip(columns, schema)]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            rows += len(batch)
+        if rows == 0:
+            writer.write_table(schema.empty_table())
+
+    os.replace(temp_path, path)
+    return rows
+
+
+def load_manifest(root: Path) -> Dict[str, Dict[str, str]]:
+    """Read the fingerprint manifest of an export (empty if none)."""
+    path = root / MANIFEST_NAME
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_manifest(root: Path, manifest: Dict[str, Dict[str, str]]):
+    """Atomically write the fingerprint manifest."""
+    path = root / MANIFEST_NAME
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(temp_path, path)
+
+
+def export_table(
+    session: Session,
+    table: Table,
+    root: Path,
+    previous: Optional[Dict[str, str]] = None,
+    batch_size: int = 50000,
+    compression: str = "zstd",
+) -> Dict[str, Any]:
+    """
+    Export one gold table.
+
+    Args:
+        session: SQLAlchemy session
+        table: Gold table
+        root: Export root directory
+        previous: Fingerprints from the last export for an incremental run,
+            or None to rewrite the whole table
+        batch_size: Rows per Arrow batch / Parquet row group
+        compression: Parquet codec ('zstd', 'snappy', 'gzip' or 'none')
+
+    Returns:
+        Stats with the new fingerprints under 'fingerprints'
+    """
+    start = time.time()
+    current = partition_fingerprints(session, table)
+
+    if previous is None:
+        shutil.rmtree(root / table.name, ignore_errors=True)
+        plan = changed_partitions({}, current)
+    else:
+        plan = changed_partitions(previous, current)
+
+    rows = 0
+    for key in plan["write"]:
+        rows += write_partition(session, table, key, partition_path(root, table, key), batch_size, compression)
+    for key in plan["delete"]:
+        shutil.rmtree(root / table.name / key, ignore_errors=True)
+
+    stats = {
+        "rows": rows,
+        "written": len(plan["write"]),
+        "deleted": len(plan["delete"]),
+        "unchanged": len(plan["unchanged"]),
+        "seconds": round(time.time() - start, 2),
+        "fingerprints": current,
+    }
+    logger.info(
+        f"Exported {table.name}: {rows} rows in {stats['written']} partitions "
+        f"({stats['unchanged']} unchanged, {stats['deleted']} removed) in {stats['seconds']:.2f}s"
+    )
+    return stats
+
+
+def export_gold(
+    session: Session,
+    root: Path,
+    tables: Optional[Sequence[str]] = None,
+    incremental: bool = False,
+    batch_size: int = 50000,
+    compression: str = "zstd",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Export gold tables to Parquet.
+
+    The manifest is saved after every table, so an interrupted export
+    resumes where it stopped on the next incremental run.
+
+    Args:
+        session: SQLAlchemy session
+        root: Export root directory
+        tables: Table names to export (default: all)
+        incremental: Only rewrite partitions whose fingerprint changed
+        batch_size: Rows per Arrow batch / Parquet row group
+        compression: Parquet codec
+
+    Returns:
+        Stats per table
+    """
+    _require_pyarrow()
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(root)
+    results = {}
+
+    for table in export_tables(tables):
+        previous = manifest.get(table.name) if incremental else None
+        stats = export_table(session, table, root, previous, batch_size, compression)
+        manifest[table.name] = stats.pop("fingerprints")
+        save_manifest(root, manifest)
+        results[table.name] = stats
+
+    return results
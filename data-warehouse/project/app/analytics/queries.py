@@ -0,0 +1,284 @@
+"""
+Gold analytics queries runnable on PostgreSQL or DuckDB.
+
+The queries of scripts/example_queries.py, scripts/verify_gold.py and the BI
+notebooks live in GOLD_QUERIES as plain SQL. They use only syntax both
+backends accept, so the same text runs against the warehouse or, through
+DuckDBSession, against the Parquet export. The backend is picked per call
+or by settings.analytics_backend.
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import text
+
+from app.shared import get_db, get_query_cache, logger, settings
+from .duckdb_engine import BIND_PARAMETER, DuckDBSession
+
+ANALYTICS_BACKENDS = ("postgres", "duckdb")
+
+# Named gold queries; :limit and other binds are filled by run_query
+GOLD_QUERIES = {
+    # scripts/example_queries.py, on the gold star schema
+    "patient_count": "SELECT COUNT(*) FROM gold.dim_patient",
+    "admission_count": "SELECT COUNT(*) FROM gold.fact_admission",
+    "first_patients": """
+        SELECT subject_id, gender, age_group, is_deceased
+        FROM gold.dim_patient
+        ORDER BY subject_id
+        LIMIT :limit
+    """,
+    "emergency_admissions": """
+        SELECT hadm_id, subject_id, admittime, hospital_expire
+        FROM gold.fact_admission
+        WHERE admission_type = 'EMERGENCY'
+        ORDER BY hadm_id
+        LIMIT :limit
+    """,
+    "patient_admissions": """
+        SELECT p.subject_id, p.gender, f.hadm_id, f.admission_type
+        FROM gold.dim_patient p
+        JOIN gold.fact_admission f ON f.patient_key = p.patient_key
+        ORDER BY f.hadm_id
+        LIMIT :limit
+    """,
+    # scripts/verify_gold.py
+    "negative_los": "SELECT COUNT(*) FROM gold.fact_admission WHERE los_days < 0",
+    "expire_flag_mismatch": """
+        SELECT COUNT(*) FROM gold.fact_admission
+        WHERE hospital_expire = TRUE AND discharge_location != 'DEAD/EXPIRED'
+    """,
+    "aggregate_admission_gap": """
+        SELECT ABS( (SELECT COUNT(*) FROM gold.fact_admission) -
+                    (SELECT SUM(total_admissions) FROM gold.agg_patient_summary) )
+    """,
+    "orphan_icu_stays": """
+        SELECT COUNT(*) FROM gold.fact_icu_stay
+        WHERE careunit_key NOT IN (SELECT careunit_key FROM gold.dim_careunit)
+    """,
+    # notebooks/business_intelligence/03_gold_bi_analysis
+    "patients_by_gender": """
+        SELECT
+            gender,
+            COUNT(*) as total,
+            SUM(CASE WHEN is_deceased THEN 1 ELSE 0 END) as deceased,
+            ROUND(100.0 * SUM(CASE WHEN is_deceased THEN 1 ELSE 0 END) / COUNT(*), 1) as mortality_pct,
+            ROUND(AVG(total_admissions)::numeric, 1) as avg_admissions,
+            ROUND(AVG(total_icu_stays)::numeric, 1) as avg_icu_stays
+        FROM gold.dim_patient
+        GROUP BY gender
+    """,
+    "icu_performance": """
+        SELECT careunit, total_stays, total_patients, avg_los_days
+        FROM gold.agg_icu_performance
+        ORDER BY total_stays DESC
+    """,
+    "caregiver_workload": """
+        SELECT
+            COALESCE(dc.label, 'Unknown') as role,
+            COUNT(*) as events,
+            COUNT(DISTINCT f.subject_id) as patients
+        FROM gold.fact_input_event f
+        LEFT JOIN gold.dim_caregiver dc ON f.caregiver_key = dc.caregiver_key
+        GROUP BY dc.label
+        ORDER BY events DESC
+        LIMIT 10
+    """,
+    "top_medications": """
+        SELECT drug, prescription_count, patient_count
+        FROM gold.agg_medication_usage
+        ORDER BY prescription_count DESC
+        LIMIT 10
+    """,
+    "lab_abnormality": """
+        SELECT
+            dl.label as test,
+            COUNT(*) as total,
+            SUM(CASE WHEN f.is_abnormal THEN 1 ELSE 0 END) as abnormal,
+            ROUND(100.0 * SUM(CASE WHEN f.is_abnormal THEN 1 ELSE 0 END) / COUNT(*), 1) as abnormal_pct
+        FROM gold.fact_lab_event f
+        JOIN gold.dim_labitem dl ON f.labitem_key = dl.labitem_key
+        GROUP BY dl.label
+        HAVING COUNT(*) > 100
+        ORDER BY abnormal_pct DESC
+        LIMIT 10
+    """,
+    "infection_stats": """
+        SELECT
+            organism_name,
+            total_cultures,
+            resistance_tests,
+            resistant_count,
+            ROUND(100.0 * resistant_count / NULLIF(resistance_tests, 0), 1) as resistance_pct
+        FROM gold.agg_infection_stats
+        WHERE organism_name IS NOT NULL
+        ORDER BY total_cultures DESC
+        LIMIT 10
+    """,
+}
+
+# Default bind values for GOLD_QUERIES
+QUERY_DEFAULTS = {"limit": 5}
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Backend name to use: the argument, else settings.analytics_backend.
+
+    Raises:
+        ValueError: For an unknown backend
+    """
+    backend = (backend or settings.analytics_backend).lower()
+    if backend not in ANALYTICS_BACKENDS:
+        raise ValueError(f"Unknown analytics backend '{backend}' (expected one of: {', '.join(ANALYTICS_BACKENDS)})")
+    return backend
+
+
+@contextmanager
+def analytics_session(backend: Optional[str] = None) -> Iterator[Any]:
+    """
+    Session for gold queries on the chosen backend.
+
+    Yields a SQLAlchemy Session for 'postgres' and a DuckDBSession over
+    settings.export_path for 'duckdb'; both accept
+    session.execute(text(sql), params).
+
+    Example:
+        with analytics_session("duckdb") as session:
+            session.execute(text("SELECT COUNT(*) FROM gold.dim_patient")).scalar()
+    """
+    if resolve_backend(backend) == "duckdb":
+        with DuckDBSession() as session:
+            yield session
+    else:
+        with get_db() as session:
+            yield session
+
+
+def execute(
+    session: Any,
+    sql: str,
+    params: Optional[Dict[str, Any]] = None,
+    cache: bool = True,
+    tables: Optional[List[str]] = None,
+):
+    """
+    Run SQL on an analytics session, through the query cache when enabled.
+
+    Args:
+        session: Session from analytics_session()
+        sql: SQL text with :name binds
+        params: Bind values
+        cache: Use the result cache (settings.query_cache) if configured
+        tables: Schema-qualified tables the query reads, for queries whose
+            tables the cache cannot parse (see referenced_tables)
+
+    Returns:
+        Result with fetchall()/keys()/scalar()
+    """
+    query_cache = get_query_cache() if cache else None
+    if query_cache is None:
+        return session.execute(text(sql), params or {})
+    return query_cache.execute(session, sql, params, tables)
+
+
+def run_query(name: str, session: Any, cache: bool = True, **params) -> List[tuple]:
+    """
+    Run a named gold query on an open analytics session.
+
+    Args:
+        name: Key in GOLD_QUERIES
+        session: Session from analytics_session()
+        cache: Use the result cache if configured
+        **params: Bind values (defaults from QUERY_DEFAULTS)
+
+    Returns:
+        Result rows
+    """
+    sql = GOLD_QUERIES[name]
+    binds = {k: v for k, v in {**QUERY_DEFAULTS, **params}.items() if k in BIND_PARAMETER.findall(sql)}
+    return execute(session, sql, binds, cache).fetchall()
+
+
+def query_df(
+    sql: str,
+    limit: Optional[int] = None,
+    backend: Optional[str] = None,
+    cache: bool = True,
+    tables: Optional[List[str]] = None,
+):
+    """
+    Run a query and return a pandas DataFrame (the BI notebook helper).
+
+    Repeated dashboard queries are served from the result cache until a
+    table they read is reloaded.
+
+    Args:
+        sql: SQL text
+        limit: Rows to keep from the head of the result
+        backend: 'postgres' or 'duckdb' (default: settings.analytics_backend)
+        cache: Use the result cache if configured
+        tables: Schema-qualified tables the query reads, if the cache
+            cannot work them out from the SQL
+    """
+    import pandas as pd
+
+    with analytics_session(backend) as session:
+        result = execute(session, sql, cache=cache, tables=tables)
+        df = pd.DataFrame(result.fetchall(), columns=result.keys())
+    return df.head(limit) if limit else df
+
+
+def table_count(schema: str, table: str, backend: Optional[str] = None) -> int:
+    """Row count of schema.table on the chosen backend (the BI notebook helper)."""
+    with analytics_session(backend) as session:
+        return session.execute(text(f"SELECT COUNT(*) FROM {schema}.{table}")).scalar()
+
+
+def example_count_patients(backend: Optional[str] = None) -> int:
+    """Count total patients."""
+    with analytics_session(backend) as session:
+        count = run_query("patient_count", session)[0][0]
+    logger.info(f"Total patients: {count}")
+    return count
+
+
+def example_get_first_patients(limit=5, backend: Optional[str] = None) -> List[tuple]:
+    """Get first N patients."""
+    with analytics_session(backend) as session:
+        patients = run_query("first_patients", session, limit=limit)
+
+    logger.info(f"\nFirst {limit} patients:")
+    for subject_id, gender, age_group, is_deceased in patients:
+        logger.info(f"  Patient {subject_id}: {gender}, Age group {age_group}, Deceased: {is_deceased}")
+    return patients
+
+
+def example_count_admissions(backend: Optional[str] = None) -> int:
+    """Count total admissions."""
+    with analytics_session(backend) as session:
+        count = run_query("admission_count", session)[0][0]
+    logger.info(f"\nTotal admissions: {count}")
+    return count
+
+
+def example_emergency_admissions(limit=5, backend: Optional[str] = None) -> List[tuple]:
+    """Get emergency admissions."""
+    with analytics_session(backend) as session:
+        admissions = run_query("emergency_admissions", session, limit=limit)
+
+    logger.info(f"\nFirst {limit} emergency admissions:")
+    for hadm_id, subject_id, admittime, hospital_expire in admissions:
+        logger.info(f"  Admission {hadm_id}: Patient {subject_id}, Admitted: {admittime}, Expired: {hospital_expire}")
+    return admissions
+
+
+def example_join_patients_admissions(limit=5, backend: Optional[str] = None) -> List[tuple]:
+    """Join patients and admissions."""
+    with analytics_session(backend) as session:
+        results = run_query("patient_admissions", session, limit=limit)
+
+    logger.info(f"\nFirst {limit} patient-admission pairs:")
+    for subject_id, gender, hadm_id, admission_type in results:
+        logger.info(f"  Patient {subject_id} ({gender}): Admission {hadm_id} - {admission_type}")
+    return results
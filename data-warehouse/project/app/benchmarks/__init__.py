@@ -0,0 +1,10 @@
+"""Synthetic data and measurements for pipeline benchmarks."""
+from .metrics import compare_to_baseline, measure_stage, peak_rss_mb
+from .synthetic import SyntheticMimic
+
+__all__ = [
+    "SyntheticMimic",
+    "measure_stage",
+    "compare_to_baseline",
+    "peak_rss_mb",
+]
@@ -0,0 +1,128 @@
+"""
+Stage measurements and baseline comparison for the pipeline benchmark.
+
+measure_stage() times one pipeline stage and records its throughput, the
+time spent inside database calls (from the shared pipeline metrics) and
+the peak resident set size of the process and its children.
+Results are plain dicts so they can be written as JSON and compared with
+a stored baseline run.
+"""
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.shared.metrics import instrument_engine, metrics
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Relative throughput drop reported as a regression
+DEFAULT_TOLERANCE = 0.10
+
+# Stages shorter than this in the baseline are too noisy to compare
+MIN_COMPARE_SECONDS = 1.0
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size so far of this process and its children, in MB.
+
+    Returns None where the resource module is unavailable (Windows).
+    """
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextmanager
+def measure_stage(stage: str, name: str, engine: Optional[Engine] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Measure one benchmark stage.
+
+    The body sets result["rows"] to the rows it processed; the rest is
+    filled in on exit from a pipeline metrics stage named
+    'benchmark.<stage>.<name>'. Database time covers statements run on this
+    thread through instrumented engines (the application engine always is),
+    not those run in worker processes.
+
+    Args:
+        stage: Pipeline stage ('parse', 'bronze', 'silver', 'gold')
+        name: Table or loader name
+        engine: Additional engine to instrument
+
+    Yields:
+        Result dict for the stage
+    """
+    if engine is not None:
+        instrument_engine(engine)
+    result: Dict[str, Any] = {"stage": stage, "name": name, "rows": 0}
+    try:
+        with metrics.stage(f"benchmark.{stage}.{name}") as current:
+            yield result
+    except Exception as e:
+        result["error"] = str(e)
+        raise
+    finally:
+        result["seconds"] = round(current.seconds, 3)
+        result["rows_per_sec"] = round(result["rows"] / current.seconds, 1) if current.seconds > 0 else 0.0
+        result["python_seconds"] = round(current.python_seconds, 3)
+        result["db_seconds"] = round(current.db_seconds, 3)
+        result["db_statements"] = current.db_round_trips
+        result["peak_rss_mb"] = peak_rss_mb()
+
+
+def stage_key(result: Dict[str, Any]) -> str:
+    """Identifier of a stage result across runs ('silver:labevents')."""
+    return f"{result['stage']}:{result['name']}"
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_seconds: float = MIN_COMPARE_SECONDS,
+) -> List[Dict[str, Any]]:
+    """
+    Stages whose throughput dropped by more than `tolerance` versus a baseline.
+
+    Stages missing from either run, failed stages, stages that processed
+    no rows and stages that took under min_seconds in the baseline are not
+    compared.
+
+    Args:
+        results: Stage results of this run
+        baseline: Stage results of the baseline run
+        tolerance: Allowed relative drop in rows/sec (0.10 = 10%)
+        min_seconds: Shortest baseline stage worth comparing
+
+    Returns:
+        One entry per regression with both throughputs and the change
+    """
+    previous = {
+        stage_key(r): r
+        for r in baseline
+        if r.get("rows_per_sec") and "error" not in r and r.get("seconds", 0) >= min_seconds
+    }
+    regressions = []
+    for result in results:
+        before = previous.get(stage_key(result))
+        if before is None or "error" in result or not result.get("rows"):
+            continue
+        change = result["rows_per_sec"] / before["rows_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append({
+                "stage": stage_key(result),
+                "baseline_rows_per_sec": before["rows_per_sec"],
+                "rows_per_sec": result["rows_per_sec"],
+                "change_pct": round(change * 100, 1),
+            })
+    return regressions
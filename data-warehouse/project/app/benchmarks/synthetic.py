@@ -0,0 +1,532 @@
+"""
+Deterministic synthetic MIMIC-III CSVs for benchmarks.
+
+SyntheticMimic builds a patient -> admission -> ICU stay cohort sized from
+the requested number of rows per event table, then streams every table in
+FIELD_MAPPINGS to <output>/<TABLE>.csv with the same lower-case headers and
+value formats the bronze loaders read. Event rows always reference an
+existing admission (and ICU stay where the table has one), item and
+caregiver, and all timestamps fall between 2100 and 2200 like the
+date-shifted MIMIC extract.
+
+Event tables are generated in fixed-size chunks, each with its own random
+stream, so chunks can be rendered by a pool of worker processes while the
+parent appends them to the file in order. Only a bounded number of chunks
+is in flight at once, so memory stays flat at any table size. The same
+seed and chunk size always produce the same files, whatever the number of
+processes.
+"""
+import csv
+import io
+import multiprocessing
+import os
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.shared import logger
+from app.transformers.bronze import FIELD_MAPPINGS
+
+# Event rows per admission; the cohort is sized so that event tables of the
+# requested size are spread like the real extract
+EVENTS_PER_ADMISSION = 160
+
+# Size of the dictionary tables
+NUM_CAREGIVERS = 100
+NUM_ITEMS = 400
+NUM_LABITEMS = 150
+
+FIRST_YEAR = 2100
+LAST_YEAR = 2200
+
+# Tables whose size is set by event_rows; all others follow from the cohort
+EVENT_TABLES = (
+    "LABEVENTS",
+    "INPUTEVENTS_CV",
+    "INPUTEVENTS_MV",
+    "OUTPUTEVENTS",
+    "PRESCRIPTIONS",
+    "PROCEDUREEVENTS_MV",
+    "MICROBIOLOGYEVENTS",
+    "NOTEEVENTS",
+)
+
+# Event rows rendered per worker task
+CHUNK_ROWS = 100_000
+
+# Rendered chunks waiting to be written, per worker process
+CHUNKS_IN_FLIGHT = 2
+
+CAREUNITS = ["MICU", "SICU", "CCU", "CSRU", "TSICU", "NICU"]
+WARDS = ["MED", "SURG", "CMED", "NMED", "OBS"]
+ADMISSION_TYPES = ["EMERGENCY", "EMERGENCY", "EMERGENCY", "ELECTIVE", "URGENT", "NEWBORN"]
+ADMISSION_LOCATIONS = ["EMERGENCY ROOM ADMIT", "PHYS REFERRAL/NORMAL DELI", "TRANSFER FROM HOSP/EXTRAM", "CLINIC REFERRAL/PREMATURE"]
+DISCHARGE_LOCATIONS = ["HOME", "HOME HEALTH CARE", "SNF", "REHAB/DISTINCT PART HOSP", "LONG TERM CARE HOSPITAL"]
+INSURANCES = ["Medicare", "Private", "Medicaid", "Government", "Self Pay"]
+ETHNICITIES = ["WHITE", "BLACK/AFRICAN AMERICAN", "HISPANIC OR LATINO", "ASIAN", "UNKNOWN/NOT SPECIFIED"]
+DIAGNOSES = ["SEPSIS", "PNEUMONIA", "CONGESTIVE HEART FAILURE", "CORONARY ARTERY DISEASE", "GASTROINTESTINAL BLEED"]
+SERVICES = ["MED", "SURG", "CMED", "CSURG", "NMED", "NSURG", "TRAUMA", "OMED"]
+CAREGIVER_ROLES = [("RN", "Registered Nurse"), ("MD", "Resident/Fellow/PA/NP"), ("RT", "Respiratory"), ("IMD", "Attending")]
+DRUGS = ["Heparin", "Insulin", "Furosemide", "Metoprolol", "Vancomycin", "Potassium Chloride", "Acetaminophen", "Pantoprazole"]
+ROUTES = ["IV", "PO", "SC", "IV DRIP", "NG"]
+ORGANISMS = ["STAPH AUREUS COAG +", "ESCHERICHIA COLI", "KLEBSIELLA PNEUMONIAE", "PSEUDOMONAS AERUGINOSA", "ENTEROCOCCUS SP."]
+ANTIBIOTICS = ["VANCOMYCIN", "GENTAMICIN", "CEFTRIAXONE", "MEROPENEM", "CIPROFLOXACIN"]
+SPECIMENS = ["BLOOD CULTURE", "URINE", "SPUTUM", "SWAB"]
+NOTE_CATEGORIES = ["Nursing/other", "Radiology", "Physician ", "ECG", "Discharge summary"]
+LAB_FLUIDS = ["Blood", "Urine", "Other Body Fluid"]
+LAB_CATEGORIES = ["Chemistry", "Hematology", "Blood Gas"]
+ITEM_LINKS = ["inputevents", "outputevents", "procedureevents_mv", "chartevents"]
+
+
+@dataclass
+class IcuStay:
+    """One synthetic ICU stay."""
+
+    icustay_id: int
+    careunit: str
+    intime: datetime
+    outtime: datetime
+
+
+@dataclass
+class Admission:
+    """One synthetic admission with its ICU stays."""
+
+    subject_id: int
+    hadm_id: int
+    admittime: datetime
+    dischtime: datetime
+    died: bool
+    icustays: List[IcuStay] = field(default_factory=list)
+
+
+@dataclass
+class Patient:
+    """One synthetic patient."""
+
+    subject_id: int
+    gender: str
+    dob: datetime
+    dod: Optional[datetime] = None
+
+
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "",
+    bool: lambda value: "1" if value else "0",
+    datetime: lambda value: value.isoformat(" ", "seconds"),
+    date: date.isoformat,
+    float: lambda value: f"{value:.2f}",
+    str: str,
+}
+
+
+def format_value(value: Any) -> str:
+    """Render a value the way the MIMIC CSVs (and the bronze parsers) expect."""
+    formatter = _FORMATTERS.get(type(value))
+    return formatter(value) if formatter is not None else str(value)
+
+
+# Generator shared with pool workers (set by _init_worker)
+_worker_generator: Optional["SyntheticMimic"] = None
+
+
+def _init_worker(generator: "SyntheticMimic"):
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_chunk(table: str, chunk: int) -> Tuple[str, int]:
+    return _worker_generator.render_chunk(table, chunk)
+
+
+class SyntheticMimic:
+    """
+    Generator of a consistent synthetic MIMIC-III extract.
+
+    Example:
+        SyntheticMimic(event_rows=100_000, seed=7).write(Path("bench_data"))
+        SyntheticMimic(event_rows=1_000_000, sizes={"LABEVENTS": 100_000_000}).write(Path("big"))
+    """
+
+    def __init__(
+        self,
+        event_rows: int,
+        seed: int = 42,
+        sizes: Optional[Dict[str, int]] = None,
+        chunk_rows: int = CHUNK_ROWS,
+    ):
+        """
+        Build the patient/admission/ICU stay cohort.
+
+        Args:
+            event_rows: Rows written to each event table
+            seed: Random seed; equal seeds give identical files
+            sizes: Row counts for individual event tables, overriding event_rows
+            chunk_rows: Event rows per chunk (part of what the seed reproduces)
+        """
+        unknown = set(sizes or {}) - set(EVENT_TABLES)
+        if unknown:
+            raise ValueError(f"Only event tables can be sized: {', '.join(sorted(unknown))}")
+
+        self.event_rows = event_rows
+        self.seed = seed
+        self.sizes = {table: (sizes or {}).get(table, event_rows) for table in EVENT_TABLES}
+        self.chunk_rows = chunk_rows
+        self.patients: List[Patient] = []
+        self.admissions: List[Admission] = []
+        self._build_cohort(max(10, max(self.sizes.values()) // EVENTS_PER_ADMISSION))
+        self.icustays = [(adm, stay) for adm in self.admissions for stay in adm.icustays]
+
+    def rng(self, table: str, chunk: Optional[int] = None) -> random.Random:
+        """Independent, reproducible random stream per table (and event chunk)."""
+        return random.Random(f"{self.seed}:{table}" if chunk is None else f"{self.seed}:{table}:{chunk}")
+
+    def _build_cohort(self, num_admissions: int):
+        rng = self.rng("cohort")
+        icustay_id = 200000
+        subject_id = 0
+
+        while len(self.admissions) < num_admissions:
+            subject_id += 1
+            dob = datetime(rng.randint(FIRST_YEAR, FIRST_YEAR + 40), rng.randint(1, 12), rng.randint(1, 28))
+            patient = Patient(subject_id, rng.choice("MF"), dob)
+            self.patients.append(patient)
+
+            admittime = datetime(rng.randint(FIRST_YEAR + 50, LAST_YEAR - 5), rng.randint(1, 12), rng.randint(1, 28),
+                                 rng.randint(0, 23), rng.randint(0, 59))
+            for _ in range(rng.choice((1, 1, 1, 2, 2, 3))):
+                dischtime = admittime + timedelta(hours=rng.randint(24, 24 * 20))
+                admission = Admission(subject_id, 100000 + len(self.admissions), admittime, dischtime, rng.random() < 0.1)
+                intime = admittime + timedelta(hours=rng.randint(1, 12))
+                for _ in range(rng.choices((0, 1, 2), weights=(1, 8, 1))[0]):
+                    outtime = min(intime + timedelta(hours=rng.randint(12, 24 * 7)), dischtime)
+                    admission.icustays.append(IcuStay(icustay_id, rng.choice(CAREUNITS), intime, outtime))
+                    icustay_id += 1
+                    intime = outtime
+                self.admissions.append(admission)
+                if admission.died:
+                    patient.dod = dischtime
+                    break
+                admittime = dischtime + timedelta(days=rng.randint(10, 400))
+
+        # Event tables that need an ICU stay fall back to the first admission
+        if not any(adm.icustays for adm in self.admissions):
+            adm = self.admissions[0]
+            adm.icustays.append(IcuStay(icustay_id, CAREUNITS[0], adm.admittime, adm.dischtime))
+
+    @staticmethod
+    def _between(rng: random.Random, start: datetime, end: datetime) -> datetime:
+        minutes = max(0, int((end - start).total_seconds()) // 60)
+        return start + timedelta(minutes=int(rng.random() * (minutes + 1)))
+
+    # ------------------------------------------------------------------
+    # Dictionaries and core entities
+    # ------------------------------------------------------------------
+
+    def rows_patients(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for row_id, p in enumerate(self.patients, 1):
+            yield {"row_id": row_id, "subject_id": p.subject_id, "gender": p.gender, "dob": p.dob,
+                   "dod": p.dod, "dod_hosp": p.dod, "dod_ssn": None, "expire_flag": p.dod is not None}
+
+    def rows_caregivers(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for i in range(NUM_CAREGIVERS):
+            label, description = rng.choice(CAREGIVER_ROLES)
+            yield {"row_id": i + 1, "cgid": 14000 + i, "label": label, "description": description}
+
+    def rows_d_items(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for i in range(NUM_ITEMS):
+            yield {"row_id": i + 1, "itemid": 220000 + i, "label": f"Item {i}", "abbreviation": f"I{i}",
+                   "dbsource": rng.choice(("carevue", "metavision")), "linksto": rng.choice(ITEM_LINKS),
+                   "category": rng.choice(("Fluids", "Medications", "Output", "Procedures")),
+                   "unitname": rng.choice(("mL", "mg", "mcg/kg/min", None)), "param_type": "Numeric",
+                   "conceptid": None}
+
+    def rows_d_labitems(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for i in range(NUM_LABITEMS):
+            yield {"row_id": i + 1, "itemid": 50800 + i, "label": f"Lab test {i}", "fluid": rng.choice(LAB_FLUIDS),
+                   "category": rng.choice(LAB_CATEGORIES), "loinc_code": f"{1000 + i}-{i % 10}"}
+
+    def rows_admissions(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for row_id, a in enumerate(self.admissions, 1):
+            admission_type = rng.choice(ADMISSION_TYPES)
+            emergency = admission_type == "EMERGENCY"
+            yield {
+                "row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id,
+                "admittime": a.admittime, "dischtime": a.dischtime, "deathtime": a.dischtime if a.died else None,
+                "admission_type": admission_type, "admission_location": rng.choice(ADMISSION_LOCATIONS),
+                "discharge_location": "DEAD/EXPIRED" if a.died else rng.choice(DISCHARGE_LOCATIONS),
+                "insurance": rng.choice(INSURANCES), "language": rng.choice(("ENGL", "SPAN", None)),
+                "religion": rng.choice(("CATHOLIC", "NOT SPECIFIED", "JEWISH", None)),
+                "marital_status": rng.choice(("MARRIED", "SINGLE", "WIDOWED", None)),
+                "ethnicity": rng.choice(ETHNICITIES),
+                "edregtime": a.admittime - timedelta(hours=3) if emergency else None,
+                "edouttime": a.admittime if emergency else None,
+                "diagnosis": rng.choice(DIAGNOSES), "hospital_expire_flag": a.died,
+                "has_chartevents_data": bool(a.icustays),
+            }
+
+    def rows_icustays(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for row_id, (a, s) in enumerate(self.icustays, 1):
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id, "icustay_id": s.icustay_id,
+                   "dbsource": rng.choice(("carevue", "metavision")), "first_careunit": s.careunit,
+                   "last_careunit": s.careunit, "first_wardid": rng.randint(1, 60), "last_wardid": rng.randint(1, 60),
+                   "intime": s.intime, "outtime": s.outtime, "los": (s.outtime - s.intime).total_seconds() / 86400}
+
+    def rows_services(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        for row_id, a in enumerate(self.admissions, 1):
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id,
+                   "transfertime": a.admittime, "prev_service": None, "curr_service": rng.choice(SERVICES)}
+
+    def rows_transfers(self, rng: random.Random) -> Iterator[Dict[str, Any]]:
+        row_id = 0
+        for a in self.admissions:
+            steps = [("admit", None, rng.choice(WARDS), a.admittime, None)]
+            for s in a.icustays:
+                steps.append(("transfer", s.icustay_id, s.careunit, s.intime, s.outtime))
+            steps.append(("discharge", None, None, a.dischtime, None))
+
+            prev_unit = None
+            for i, (eventtype, icustay_id, unit, intime, outtime) in enumerate(steps):
+                outtime = outtime or (steps[i + 1][3] if i + 1 < len(steps) else None)
+                row_id += 1
+                yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id, "icustay_id": icustay_id,
+                       "dbsource": "carevue", "eventtype": eventtype, "prev_careunit": prev_unit,
+                       "curr_careunit": unit if unit in CAREUNITS else None, "prev_wardid": None,
+                       "curr_wardid": rng.randint(1, 60) if unit else None, "intime": intime, "outtime": outtime,
+                       "los": (outtime - intime).total_seconds() / 3600 if outtime else None}
+                prev_unit = unit if unit in CAREUNITS else prev_unit
+
+    # ------------------------------------------------------------------
+    # Event tables (rows start+1..stop of each chunk)
+    # ------------------------------------------------------------------
+
+    def rows_labevents(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            a = rng.choice(self.admissions)
+            valuenum = round(rng.gauss(100, 30), 1)
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id,
+                   "itemid": 50800 + rng.randrange(NUM_LABITEMS), "charttime": self._between(rng, a.admittime, a.dischtime),
+                   "value": str(valuenum), "valuenum": valuenum, "valueuom": rng.choice(("mg/dL", "mEq/L", "K/uL")),
+                   "flag": "abnormal" if rng.random() < 0.2 else None}
+
+    def _icu_event(self, rng: random.Random) -> Dict[str, Any]:
+        a, s = rng.choice(self.icustays)
+        return {"subject_id": a.subject_id, "hadm_id": a.hadm_id, "icustay_id": s.icustay_id,
+                "itemid": 220000 + rng.randrange(NUM_ITEMS), "cgid": 14000 + rng.randrange(NUM_CAREGIVERS),
+                "_intime": s.intime, "_outtime": s.outtime}
+
+    def rows_inputevents_cv(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            row = self._icu_event(rng)
+            charttime = self._between(rng, row.pop("_intime"), row.pop("_outtime"))
+            amount = round(rng.uniform(1, 500), 2)
+            yield {**row, "row_id": row_id, "charttime": charttime, "amount": amount, "amountuom": "ml",
+                   "rate": round(rng.uniform(1, 100), 2), "rateuom": "ml/hr", "storetime": charttime,
+                   "orderid": rng.randint(1, 10**7), "linkorderid": rng.randint(1, 10**7), "stopped": None,
+                   "newbottle": None, "originalamount": amount, "originalamountuom": "ml",
+                   "originalroute": rng.choice(ROUTES), "originalrate": None, "originalrateuom": None,
+                   "originalsite": None}
+
+    def rows_inputevents_mv(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            row = self._icu_event(rng)
+            starttime = self._between(rng, row.pop("_intime"), row.pop("_outtime"))
+            amount = round(rng.uniform(1, 500), 2)
+            canceled = rng.random() < 0.05
+            yield {**row, "row_id": row_id, "starttime": starttime,
+                   "endtime": starttime + timedelta(minutes=rng.randint(1, 600)), "amount": amount,
+                   "amountuom": "mL", "rate": round(rng.uniform(1, 100), 2), "rateuom": "mL/hour",
+                   "storetime": starttime, "orderid": rng.randint(1, 10**7), "linkorderid": rng.randint(1, 10**7),
+                   "ordercategoryname": "01-Drips", "secondaryordercategoryname": None,
+                   "ordercomponenttypedescription": "Main order parameter", "ordercategorydescription": "Continuous IV",
+                   "patientweight": round(rng.uniform(40, 140), 1), "totalamount": amount, "totalamountuom": "mL",
+                   "isopenbag": False, "continueinnextdept": False, "cancelreason": 1 if canceled else 0,
+                   "statusdescription": "Rewritten" if canceled else "FinishedRunning", "comments_editedby": None,
+                   "comments_canceledby": None, "comments_date": None, "originalamount": amount, "originalrate": None}
+
+    def rows_outputevents(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            row = self._icu_event(rng)
+            charttime = self._between(rng, row.pop("_intime"), row.pop("_outtime"))
+            yield {**row, "row_id": row_id, "charttime": charttime, "value": round(rng.uniform(0, 1000), 1),
+                   "valueuom": "mL", "storetime": charttime, "stopped": None, "newbottle": None, "iserror": None}
+
+    def rows_procedureevents_mv(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            row = self._icu_event(rng)
+            starttime = self._between(rng, row.pop("_intime"), row.pop("_outtime"))
+            canceled = rng.random() < 0.05
+            yield {**row, "row_id": row_id, "starttime": starttime,
+                   "endtime": starttime + timedelta(minutes=rng.randint(5, 240)),
+                   "value": float(rng.randint(1, 240)), "valueuom": "min", "location": None,
+                   "locationcategory": None, "storetime": starttime, "orderid": rng.randint(1, 10**7),
+                   "linkorderid": rng.randint(1, 10**7), "ordercategoryname": "Procedures",
+                   "secondaryordercategoryname": None, "ordercategorydescription": "Task", "isopenbag": False,
+                   "continueinnextdept": False, "cancelreason": 1 if canceled else 0,
+                   "statusdescription": "Canceled" if canceled else "FinishedRunning", "comments_editedby": None,
+                   "comments_canceledby": None, "comments_date": None}
+
+    def rows_prescriptions(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            a = rng.choice(self.admissions)
+            startdate = self._between(rng, a.admittime, a.dischtime).replace(hour=0, minute=0)
+            drug = rng.choice(DRUGS)
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id,
+                   "icustay_id": a.icustays[0].icustay_id if a.icustays else None, "startdate": startdate,
+                   "enddate": startdate + timedelta(days=rng.randint(0, 7)), "drug_type": "MAIN", "drug": drug,
+                   "drug_name_poe": drug, "drug_name_generic": drug, "formulary_drug_cd": drug[:6].upper(),
+                   "gsn": str(rng.randint(1000, 99999)), "ndc": str(rng.randint(10**9, 10**10)),
+                   "prod_strength": "10mg Tab", "dose_val_rx": str(rng.choice((1, 2, 5, 10, 20, 40))),
+                   "dose_unit_rx": "mg", "form_val_disp": "1", "form_unit_disp": "TAB", "route": rng.choice(ROUTES)}
+
+    def rows_microbiologyevents(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            a = rng.choice(self.admissions)
+            charttime = self._between(rng, a.admittime, a.dischtime)
+            positive = rng.random() < 0.4
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id, "chartdate": charttime.date(),
+                   "charttime": charttime, "spec_itemid": 70000 + rng.randrange(len(SPECIMENS)),
+                   "spec_type_desc": rng.choice(SPECIMENS),
+                   "org_itemid": 80000 + rng.randrange(len(ORGANISMS)) if positive else None,
+                   "org_name": rng.choice(ORGANISMS) if positive else None, "isolate_num": 1 if positive else None,
+                   "ab_itemid": 90000 + rng.randrange(len(ANTIBIOTICS)) if positive else None,
+                   "ab_name": rng.choice(ANTIBIOTICS) if positive else None,
+                   "dilution_text": "<=1" if positive else None, "dilution_comparison": "<=" if positive else None,
+                   "dilution_value": 1.0 if positive else None,
+                   "interpretation": rng.choice(("S", "S", "R", "I")) if positive else None}
+
+    def rows_noteevents(self, rng: random.Random, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        for row_id in range(start + 1, stop + 1):
+            a = rng.choice(self.admissions)
+            charttime = self._between(rng, a.admittime, a.dischtime)
+            yield {"row_id": row_id, "subject_id": a.subject_id, "hadm_id": a.hadm_id,
+                   "chartdate": charttime.replace(hour=0, minute=0), "charttime": charttime, "storetime": charttime,
+                   "category": rng.choice(NOTE_CATEGORIES), "description": "Report",
+                   "cgid": 14000 + rng.randrange(NUM_CAREGIVERS), "iserror": None,
+                   "text": f"Patient {a.subject_id} stable. {rng.choice(DIAGNOSES).lower()} follow-up."}
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def num_chunks(self, table: str) -> int:
+        """Number of chunks an event table is generated in (1 for other tables)."""
+        if table not in self.sizes:
+            return 1
+        return max(1, -(-self.sizes[table] // self.chunk_rows))
+
+    def chunk_rows_of(self, table: str, chunk: int) -> Iterator[Dict[str, Any]]:
+        """Rows of one chunk of a table (the whole table when it is not an event table)."""
+        generate: Callable[..., Iterator[Dict[str, Any]]] = getattr(self, f"rows_{table.lower()}")
+        if table not in self.sizes:
+            return generate(self.rng(table))
+        start = chunk * self.chunk_rows
+        return generate(self.rng(table, chunk), start, min(start + self.chunk_rows, self.sizes[table]))
+
+    def table_rows(self, table: str) -> Iterator[Dict[str, Any]]:
+        """Rows of one FIELD_MAPPINGS table, in row_id order."""
+        for chunk in range(self.num_chunks(table)):
+            yield from self.chunk_rows_of(table, chunk)
+
+    def render_chunk(self, table: str, chunk: int) -> Tuple[str, int]:
+        """
+        Render one chunk of a table as CSV.
+
+        Returns:
+            CSV lines without header, and their number of rows
+        """
+        columns = list(FIELD_MAPPINGS[table])
+        rows = [[format_value(row.get(column)) for column in columns] for row in self.chunk_rows_of(table, chunk)]
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue(), len(rows)
+
+    def write_table(
+        self,
+        table: str,
+        output_dir: Path,
+        pool: Optional[Any] = None,
+        max_pending: int = CHUNKS_IN_FLIGHT,
+    ) -> int:
+        """
+        Stream one table to <output_dir>/<TABLE>.csv.
+
+        Args:
+            table: FIELD_MAPPINGS table name
+            output_dir: Directory for the CSV file
+            pool: multiprocessing pool (from worker_pool) rendering the chunks
+            max_pending: Chunks rendered ahead of the writer when using a pool
+
+        Returns:
+            Number of rows written
+        """
+        num_chunks = self.num_chunks(table)
+        if pool is None or num_chunks == 1:
+            chunks = (self.render_chunk(table, chunk) for chunk in range(num_chunks))
+        else:
+            chunks = self._pooled_chunks(table, num_chunks, pool, max_pending)
+
+        total = 0
+        with open(output_dir / f"{table}.csv", "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(FIELD_MAPPINGS[table])
+            for lines, rows in chunks:
+                f.write(lines)
+                total += rows
+        return total
+
+    @staticmethod
+    def _pooled_chunks(table: str, num_chunks: int, pool: Any, max_pending: int) -> Iterator[Tuple[str, int]]:
+        # Keep a bounded window of chunks in flight and hand them out in order
+        pending = deque()
+        for chunk in range(num_chunks):
+            pending.append(pool.apply_async(_render_chunk, (table, chunk)))
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def worker_pool(self, processes: Optional[int] = None):
+        """
+        Process pool whose workers hold a copy of this generator.
+
+        Args:
+            processes: Worker processes (default: CPU count)
+        """
+        return multiprocessing.Pool(processes or os.cpu_count(), initializer=_init_worker, initargs=(self,))
+
+    def write(
+        self,
+        output_dir: Path,
+        tables: Optional[Sequence[str]] = None,
+        processes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Write every table (or the given ones) as CSV.
+
+        Args:
+            output_dir: Directory for the CSV files (created if missing)
+            tables: FIELD_MAPPINGS table names (default: all)
+            processes: Worker processes for event tables (default: CPU count, 1 = in-process)
+
+        Returns:
+            Rows written per table
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tables = list(tables or FIELD_MAPPINGS)
+        processes = processes or os.cpu_count() or 1
+        parallel = processes > 1 and any(self.num_chunks(table) > 1 for table in tables)
+
+        pool = self.worker_pool(processes) if parallel else None
+        try:
+            counts = {}
+            for table in tables:
+                counts[table] = self.write_table(table, output_dir, pool, CHUNKS_IN_FLIGHT * processes)
+                logger.info(f"Generated {table}: {counts[table]:,} rows")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return counts
@@ -6,7 +6,11 @@ from .dictionaries import BronzeDItems, BronzeDLabItems
 from .icustays import BronzeICUStays
 from .inputevents import BronzeInputEventsCareVue, BronzeInputEventsMetaVision
 from .labevents import BronzeLabEvents
+from .load_checkpoints import BronzeLoadCheckpoint
+from .rejected_rows import BronzeRejectedRow
+from .file_manifest import BronzeFileManifest
 from .microbiologyevents import BronzeMicrobiologyEvents
+from .noteevents import BronzeNoteEvents
 from .outputevents import BronzeOutputEvents
 from .patients import BronzePatients
 from .prescriptions import BronzePrescriptions
@@ -39,5 +43,10 @@ __all__ = [
     "BronzeProcedureEventsMetaVision",
     "BronzeProceduresICD",
     "BronzeMicrobiologyEvents",
+    "BronzeNoteEvents",
+    # Control
+    "BronzeLoadCheckpoint",
+    "BronzeRejectedRow",
+    "BronzeFileManifest",
 ]
 
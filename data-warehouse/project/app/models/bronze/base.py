@@ -32,5 +32,6 @@ class BronzeBase(Base):
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
-        comment="Record last update timestamp",
+        index=True,
+        comment="Record last update timestamp (incremental silver watermark)",
     )
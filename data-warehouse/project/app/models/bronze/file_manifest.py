@@ -0,0 +1,36 @@
+"""Bronze layer manifest of the source files each table was loaded from."""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class BronzeFileManifest(Base):
+    """
+    Source file behind the current contents of each bronze table.
+    
+    Recorded when a reload is swapped in (load_bronze.py --skip-unchanged).
+    The next run compares the file on disk against it and skips the table
+    when the file has not changed.
+    """
+    
+    __tablename__ = "etl_file_manifest"
+    __table_args__ = {"schema": "bronze"}
+    
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Bronze table name")
+    file_path: Mapped[str] = mapped_column(String(1000), nullable=False, comment="CSV file loaded")
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="File size in bytes")
+    file_mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="File modification time (ns)")
+    sample_hash: Mapped[str] = mapped_column(
+        String(100), nullable=False, comment="Hash of the size and the first, middle and last blocks"
+    )
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True, comment="Hash of the whole file"
+    )
+    loaded_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<BronzeFileManifest({self.table_name} <- {self.file_path}, {self.file_size} bytes)>"
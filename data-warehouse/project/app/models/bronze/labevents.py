@@ -5,6 +5,7 @@ from typing import Optional
 from sqlalchemy import DateTime, Float, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..partitioning import event_table_args
 from .base import BronzeBase
 
 
@@ -17,9 +18,9 @@ class BronzeLabEvents(BronzeBase):
     """
 
     __tablename__ = "labevents"
-    __table_args__ = {"schema": "bronze"}
+    __table_args__ = event_table_args("bronze", "charttime", primary_key=("row_id",))
 
-    row_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment="Internal row identifier")
+    row_id: Mapped[int] = mapped_column(Integer, comment="Internal row identifier")
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="Patient ID")
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Hospital admission ID")
     itemid: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="Lab item ID (FK to d_labitems)")
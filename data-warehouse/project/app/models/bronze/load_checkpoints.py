@@ -0,0 +1,35 @@
+"""Bronze layer control table for resumable CSV loads."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class BronzeLoadCheckpoint(Base):
+    """
+    Progress of the latest CSV load of each bronze table.
+    
+    Written in the same transaction as every committed batch, so the byte
+    offset always points just past the last row in the table. A resumed
+    load (load_bronze.py --resume) seeks straight to it, provided the file
+    still has the recorded size and modification time.
+    """
+    
+    __tablename__ = "etl_load_checkpoints"
+    __table_args__ = {"schema": "bronze"}
+    
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Bronze table name")
+    file_path: Mapped[str] = mapped_column(String(1000), nullable=False, comment="CSV file being loaded")
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="File size in bytes")
+    file_mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="File modification time (ns)")
+    byte_offset: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, comment="Offset just past the last committed row (decompressed for .gz)"
+    )
+    rows_loaded: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Rows committed so far")
+    completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, comment="File fully loaded")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<BronzeLoadCheckpoint({self.table_name} @ {self.byte_offset}, {self.rows_loaded} rows)>"
@@ -0,0 +1,35 @@
+"""Bronze layer quarantine of CSV rows that could not be loaded."""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class BronzeRejectedRow(Base):
+    """
+    CSV row rejected while loading a bronze table.
+    
+    Written in bulk, in the transaction of the batch the row belonged to,
+    so a resumed load never quarantines a row twice.
+    """
+    
+    __tablename__ = "etl_rejected_rows"
+    __table_args__ = {"schema": "bronze"}
+    
+    rejected_row_key: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, comment="Bronze table name")
+    line_number: Mapped[Optional[int]] = mapped_column(
+        BigInteger, nullable=True, comment="Line the row starts on, when the file was read from its first line"
+    )
+    byte_offset: Mapped[Optional[int]] = mapped_column(
+        BigInteger, nullable=True, comment="Offset the row starts at (decompressed for .gz)"
+    )
+    raw_row: Mapped[str] = mapped_column(Text, nullable=False, comment="Row as read, JSON")
+    error: Mapped[str] = mapped_column(Text, nullable=False, comment="Why the row was rejected")
+    rejected_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<BronzeRejectedRow({self.table_name} line {self.line_number}: {self.error})>"
@@ -28,6 +28,14 @@ from .aggregates import (
     AggLabSummary,
     AggMedicationUsage,
     AggInfectionStats,
+    AggAdmissionRollup,
+)
+from .control import (
+    GoldWatermark,
+    ChangedSubject,
+    ChangedAdmission,
+    ChangedGroup,
+    GoldTableVersion,
 )
 
 __all__ = [
@@ -58,4 +66,11 @@ __all__ = [
     "AggLabSummary",
     "AggMedicationUsage",
     "AggInfectionStats",
+    "AggAdmissionRollup",
+    # ETL control
+    "GoldWatermark",
+    "ChangedSubject",
+    "ChangedAdmission",
+    "ChangedGroup",
+    "GoldTableVersion",
 ]
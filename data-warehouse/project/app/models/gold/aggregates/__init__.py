@@ -5,6 +5,7 @@ from .agg_icu_performance import AggIcuPerformance
 from .agg_lab_summary import AggLabSummary
 from .agg_medication_usage import AggMedicationUsage
 from .agg_infection_stats import AggInfectionStats
+from .agg_admission_rollup import AggAdmissionRollup
 
 __all__ = [
     "AggPatientSummary",
@@ -13,4 +14,5 @@ __all__ = [
     "AggLabSummary",
     "AggMedicationUsage",
     "AggInfectionStats",
+    "AggAdmissionRollup",
 ]
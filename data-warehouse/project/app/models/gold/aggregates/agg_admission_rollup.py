@@ -0,0 +1,33 @@
+"""Gold layer aggregate: Admission Rollup."""
+from sqlalchemy import Integer, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import GoldBase
+
+
+class AggAdmissionRollup(GoldBase):
+    """
+    Event counts per patient and admission.
+    
+    Built with one scan of each silver event table and shared by
+    fact_admission (per admission) and agg_patient_summary (summed per
+    patient). Events not linked to an admission are counted under
+    hadm_id = 0.
+    """
+    
+    __tablename__ = "agg_admission_rollup"
+    __table_args__ = {"schema": "gold"}
+    
+    # Composite natural key
+    subject_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    hadm_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment="0 = no admission")
+    
+    # Counts
+    num_icu_stays: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    num_lab_tests: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    num_prescriptions: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    num_procedures: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    num_transfers: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+    def __repr__(self) -> str:
+        return f"<AggAdmissionRollup(subject_id={self.subject_id}, hadm_id={self.hadm_id})>"
@@ -2,7 +2,7 @@
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Integer, Float, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..base import GoldBase
@@ -16,7 +16,10 @@ class AggLabSummary(GoldBase):
     """
     
     __tablename__ = "agg_lab_summary"
-    __table_args__ = {"schema": "gold"}
+    __table_args__ = (
+        UniqueConstraint("subject_id", "itemid", name="uq_agg_lab_summary_subject_item"),
+        {"schema": "gold"},
+    )
     
     # Composite primary key
     summary_key: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -0,0 +1,12 @@
+"""Gold layer ETL control tables."""
+from .etl_watermark import GoldWatermark
+from .changed_keys import ChangedSubject, ChangedAdmission, ChangedGroup
+from .table_version import GoldTableVersion
+
+__all__ = [
+    "GoldWatermark",
+    "ChangedSubject",
+    "ChangedAdmission",
+    "ChangedGroup",
+    "GoldTableVersion",
+]
@@ -0,0 +1,60 @@
+"""Gold layer control tables: keys touched since the last refresh."""
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import GoldBase
+
+
+class ChangedSubject(GoldBase):
+    """
+    Patients with silver rows changed since the last gold refresh.
+    
+    Rebuilt at the start of each incremental load; patient-grained tables
+    recompute only these subjects.
+    """
+    
+    __tablename__ = "etl_changed_subjects"
+    __table_args__ = {"schema": "gold"}
+    
+    subject_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"<ChangedSubject(subject_id={self.subject_id})>"
+
+
+class ChangedAdmission(GoldBase):
+    """
+    Admissions with silver rows changed since the last gold refresh.
+    
+    Rebuilt at the start of each incremental load; admission-grained tables
+    recompute only these admissions.
+    """
+    
+    __tablename__ = "etl_changed_admissions"
+    __table_args__ = {"schema": "gold"}
+    
+    hadm_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"<ChangedAdmission(hadm_id={self.hadm_id})>"
+
+
+class ChangedGroup(GoldBase):
+    """
+    Groups of the grouped aggregates touched since the last gold refresh.
+    
+    For every changed silver row, both the group it is in now (read from
+    silver) and the group it was in (read from the gold fact before the
+    facts are refreshed) are recorded, as text. Rebuilt at the start of each
+    incremental load; grouped aggregates delete and recompute only these
+    groups, so a group a row moved out of is corrected or removed.
+    """
+    
+    __tablename__ = "etl_changed_groups"
+    __table_args__ = {"schema": "gold"}
+    
+    aggregate: Mapped[str] = mapped_column(String(50), primary_key=True, comment="Gold aggregate table")
+    group_key: Mapped[str] = mapped_column(String(300), primary_key=True, comment="Group key as text")
+
+    def __repr__(self) -> str:
+        return f"<ChangedGroup({self.aggregate}: {self.group_key})>"
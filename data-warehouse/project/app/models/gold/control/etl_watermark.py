@@ -0,0 +1,26 @@
+"""Gold layer control table: refresh watermark."""
+from typing import Optional
+from datetime import datetime
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import GoldBase
+
+
+class GoldWatermark(GoldBase):
+    """
+    Silver high-water mark already reflected in gold.
+    
+    Incremental gold loads only process silver rows whose updated_at is
+    later than the stored watermark.
+    """
+    
+    __tablename__ = "etl_watermarks"
+    __table_args__ = {"schema": "gold"}
+    
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    watermark: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<GoldWatermark(name={self.name}, watermark={self.watermark})>"
@@ -0,0 +1,27 @@
+"""Gold layer control table: per-table data versions."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import GoldBase
+
+
+class GoldTableVersion(GoldBase):
+    """
+    Version counter per gold table.
+    
+    Bumped by load_gold.py and refresh_aggregates.py whenever a table is
+    reloaded; cached query results keyed on older versions are never hit
+    again (see app.shared.query_cache).
+    """
+    
+    __tablename__ = "etl_table_versions"
+    __table_args__ = {"schema": "gold"}
+    
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="schema.table")
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<GoldTableVersion(table_name={self.table_name}, version={self.version})>"
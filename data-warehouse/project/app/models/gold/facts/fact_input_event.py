@@ -5,6 +5,7 @@ from datetime import datetime, date
 from sqlalchemy import Integer, String, Boolean, Float, DateTime, Date, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ...partitioning import event_table_args
 from ..base import GoldBase
 
 
@@ -12,16 +13,18 @@ class FactInputEvent(GoldBase):
     """Input Event fact table (unified CV + MV)."""
     
     __tablename__ = "fact_input_event"
-    __table_args__ = {"schema": "gold"}
+    __table_args__ = event_table_args(
+        "gold", "charttime", primary_key=("input_event_key",), unique=("row_id", "source_system")
+    )
     
-    input_event_key: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    input_event_key: Mapped[int] = mapped_column(Integer, autoincrement=True)
     
     patient_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_patient.patient_key"), nullable=True, index=True)
     admission_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.fact_admission.admission_key"), nullable=True, index=True)
     item_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_item.item_key"), nullable=True, index=True)
     caregiver_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_caregiver.caregiver_key"), nullable=True, index=True)
     
-    row_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False)
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     icustay_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -5,6 +5,7 @@ from datetime import datetime, date
 from sqlalchemy import Integer, String, Boolean, Float, DateTime, Date, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ...partitioning import event_table_args
 from ..base import GoldBase
 
 
@@ -16,10 +17,10 @@ class FactLabEvent(GoldBase):
     """
     
     __tablename__ = "fact_lab_event"
-    __table_args__ = {"schema": "gold"}
+    __table_args__ = event_table_args("gold", "charttime", primary_key=("lab_event_key",), unique=("row_id",))
     
     # Surrogate key
-    lab_event_key: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    lab_event_key: Mapped[int] = mapped_column(Integer, autoincrement=True)
     
     # Dimension foreign keys
     patient_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_patient.patient_key"), nullable=True, index=True)
@@ -28,7 +29,7 @@ class FactLabEvent(GoldBase):
     chart_date_key: Mapped[Optional[date]] = mapped_column(Date, ForeignKey("gold.dim_time.time_key"), nullable=True)
     
     # Natural keys
-    row_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
     itemid: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
@@ -19,7 +19,7 @@ class FactMicrobiology(GoldBase):
     patient_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_patient.patient_key"), nullable=True, index=True)
     admission_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.fact_admission.admission_key"), nullable=True, index=True)
     
-    row_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True, index=True)
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False)
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
@@ -20,7 +20,7 @@ class FactOutputEvent(GoldBase):
     admission_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.fact_admission.admission_key"), nullable=True, index=True)
     item_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.dim_item.item_key"), nullable=True, index=True)
     
-    row_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True, index=True)
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False)
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     icustay_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
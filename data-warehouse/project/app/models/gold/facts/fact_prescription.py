@@ -22,7 +22,7 @@ class FactPrescription(GoldBase):
     admission_key: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("gold.fact_admission.admission_key"), nullable=True, index=True)
     start_date_key: Mapped[Optional[date]] = mapped_column(Date, ForeignKey("gold.dim_time.time_key"), nullable=True)
     
-    row_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True, index=True)
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     hadm_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     
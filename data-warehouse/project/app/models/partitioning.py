@@ -0,0 +1,263 @@
+"""
+Declarative PostgreSQL partitioning for high-volume event tables.
+
+The labevents and inputevents tables of every layer are partitioned
+according to settings.event_partitioning:
+
+- none: plain heap tables (default)
+- range: yearly ranges of chart time (partition_range_years per partition)
+- hash: hash of subject_id (partition_hash_modulus partitions)
+
+PostgreSQL requires every primary key and unique constraint of a
+partitioned table to include the partition key, so event models build
+their keys with key_columns() and their table arguments with
+event_table_args(). Child partitions are created right after the parent
+table by create_partitions, which is attached to every CREATE TABLE, so
+Base.metadata.create_all() (init_db.py, load_silver.py, load_gold.py) sets
+them up automatically. Switching schemes requires dropping and recreating
+the affected tables.
+
+With the partition key in every key, row_id is only unique per partition
+key value. Upserts match on (row_id, charttime) or (row_id, subject_id),
+so a source row whose chart time (or subject) was corrected would be
+inserted next to the stale one. Every upsert into a partitioned table
+therefore first deletes the rows it moves to another partition key value
+(see moved_rows_delete).
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import PrimaryKeyConstraint, Table, UniqueConstraint, event, text
+
+from app.shared import settings
+
+# MIMIC-III dates are shifted into 2100-2210; anything outside lands in the
+# default range partition.
+RANGE_START_YEAR = 2100
+RANGE_END_YEAR = 2220
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One child table of a partitioned event table."""
+
+    suffix: str
+    bound: str
+    condition: str
+
+    def name(self, parent: str) -> str:
+        """Fully qualified child table name for a parent table."""
+        return f"{parent}_{self.suffix}"
+
+    def predicate(self, parent: str, column: str) -> str:
+        """
+        SQL condition selecting the rows that belong in this partition.
+
+        Args:
+            parent: Fully qualified partitioned table name
+            column: Partition key expression on the rows being filtered
+
+        Returns:
+            Boolean SQL expression
+        """
+        return self.condition.replace("{parent}", parent).replace("{column}", column)
+
+
+def partition_method(method: Optional[str] = None) -> str:
+    """Return the configured partitioning method, or `method` if given."""
+    return (method or settings.event_partitioning).lower()
+
+
+def partition_column(range_column: str, method: Optional[str] = None) -> Optional[str]:
+    """
+    Partition key column of an event table.
+
+    Args:
+        range_column: Chart time column used for range partitioning
+        method: Override of the configured method
+
+    Returns:
+        The range column, 'subject_id' for hash partitioning, or None when
+        partitioning is off
+    """
+    method = partition_method(method)
+    if method == "range":
+        return range_column
+    if method == "hash":
+        return "subject_id"
+    return None
+
+
+def partitions(method: Optional[str] = None) -> List[Partition]:
+    """
+    Child partitions for the configured method.
+
+    Args:
+        method: Override of the configured method
+
+    Returns:
+        Partitions in creation order (empty when partitioning is off)
+    """
+    method = partition_method(method)
+
+    if method == "range":
+        step = settings.partition_range_years
+        result = []
+        for year in range(RANGE_START_YEAR, RANGE_END_YEAR, step):
+            low, high = f"'{year}-01-01'", f"'{year + step}-01-01'"
+            result.append(Partition(
+                suffix=f"y{year}",
+                bound=f"FOR VALUES FROM ({low}) TO ({high})",
+                condition=f"{{column}} >= {low} AND {{column}} < {high}",
+            ))
+        low, high = f"'{RANGE_START_YEAR}-01-01'", f"'{RANGE_START_YEAR + len(result) * step}-01-01'"
+        result.append(Partition(
+            suffix="default",
+            bound="DEFAULT",
+            condition=f"({{column}} < {low} OR {{column}} >= {high})",
+        ))
+        return result
+
+    if method == "hash":
+        modulus = settings.partition_hash_modulus
+        return [
+            Partition(
+                suffix=f"h{remainder:02d}",
+                bound=f"FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder})",
+                condition=f"satisfies_hash_partition('{{parent}}'::regclass, {modulus}, {remainder}, {{column}})",
+            )
+            for remainder in range(modulus)
+        ]
+
+    return []
+
+
+def get_partition(suffix: str, method: Optional[str] = None) -> Partition:
+    """
+    Look up a partition by suffix (e.g. 'y2130' or 'h03').
+
+    Raises:
+        ValueError: If no partition of the configured scheme has that suffix
+    """
+    for partition in partitions(method):
+        if partition.suffix == suffix:
+            return partition
+    raise ValueError(f"Unknown partition '{suffix}' for {partition_method(method)} partitioning")
+
+
+def key_columns(columns: Sequence[str], range_column: str, method: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Extend a primary or unique key with the partition key.
+
+    Args:
+        columns: Natural key columns
+        range_column: Chart time column used for range partitioning
+        method: Override of the configured method
+
+    Returns:
+        Key columns, with the partition column appended when partitioned
+    """
+    column = partition_column(range_column, method)
+    if column is None or column in columns:
+        return tuple(columns)
+    return (*columns, column)
+
+
+def event_table_args(
+    schema: str,
+    range_column: str,
+    primary_key: Sequence[str],
+    unique: Sequence[str] = (),
+    method: Optional[str] = None,
+) -> Tuple[Any, ...]:
+    """
+    Build __table_args__ for a (possibly) partitioned event table.
+
+    Args:
+        schema: Schema name
+        range_column: Chart time column used for range partitioning
+        primary_key: Natural primary key columns
+        unique: Natural unique key columns (e.g. the silver row_id on gold facts)
+        method: Override of the configured method
+
+    Returns:
+        Tuple of constraints followed by the table keyword dict.
+        When partitioned, both keys include the partition column, so they
+        no longer make the natural key unique on their own (see the module
+        docstring)
+    """
+    args: List[Any] = [PrimaryKeyConstraint(*key_columns(primary_key, range_column, method))]
+    if unique:
+        args.append(UniqueConstraint(*key_columns(unique, range_column, method)))
+
+    options: Dict[str, Any] = {"schema": schema}
+    column = partition_column(range_column, method)
+    if column is not None:
+        kind = "RANGE" if partition_method(method) == "range" else "HASH"
+        options["postgresql_partition_by"] = f"{kind} ({column})"
+
+    return (*args, options)
+
+
+def is_partitioned(table: Table) -> bool:
+    """Check whether a table is declared with PostgreSQL partitioning."""
+    return bool(table.kwargs.get("postgresql_partition_by"))
+
+
+def table_partition_column(table: Table) -> Optional[str]:
+    """Partition key column of a partitioned table, or None."""
+    clause = table.kwargs.get("postgresql_partition_by")
+    if not clause:
+        return None
+    return clause[clause.index("(") + 1:clause.rindex(")")].strip()
+
+
+def moved_rows_delete(table: Table, key: Sequence[str], source: str, criteria: str = "") -> Optional[str]:
+    """
+    DELETE of the rows an upsert moves to another partition key value.
+
+    Removes every row of `table` that matches a source row on the key
+    without the partition column but has a different partition key, so the
+    upsert that follows leaves one row per natural key.
+
+    Args:
+        table: Table about to be upserted into
+        key: Conflict target of the upsert, including the partition column
+        source: Relation holding the new rows (table name or parenthesized
+            subquery), read under the alias src
+        criteria: Extra SQL condition on src (e.g. a watermark window)
+
+    Returns:
+        DELETE statement, or None when the table is not partitioned
+    """
+    column = table_partition_column(table)
+    if column is None:
+        return None
+    target = table.fullname
+    conditions = [f"src.{name} = {target}.{name}" for name in key if name != column]
+    conditions.append(f"src.{column} IS DISTINCT FROM {target}.{column}")
+    if criteria:
+        conditions.append(criteria)
+    return f"DELETE FROM {target} WHERE EXISTS (SELECT 1 FROM {source} AS src WHERE {' AND '.join(conditions)})"
+
+
+@event.listens_for(Table, "after_create")
+def create_partitions(table: Table, connection, **kw):
+    """
+    Create the child partitions of a partitioned table.
+
+    Runs after every CREATE TABLE; does nothing for plain tables or other
+    databases. Partitions that already exist are left alone, so calling it
+    again after widening the range scheme only adds the new ones. Children
+    are created in the schema the parent was created in.
+    """
+    if connection.dialect.name != "postgresql" or not is_partitioned(table):
+        return
+
+    # Honour schema_translate_map, e.g. when creating a staging copy
+    parent = f"{connection.schema_for_object(table)}.{table.name}"
+    for partition in partitions():
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition.name(parent)} "
+            f"PARTITION OF {parent} {partition.bound}"
+        ))
@@ -11,6 +11,8 @@ from .inputevents import SilverInputEvent
 from .outputevents import SilverOutputEvent
 from .procedureevents import SilverProcedureEvent
 from .microbiologyevents import SilverMicrobiologyEvent
+from .watermarks import SilverWatermark
+from .rejected_rows import SilverRejectedRow
 
 __all__ = [
     "SilverBase",
@@ -27,4 +29,7 @@ __all__ = [
     "SilverOutputEvent",
     "SilverProcedureEvent",
     "SilverMicrobiologyEvent",
+    # Control tables
+    "SilverWatermark",
+    "SilverRejectedRow",
 ]
@@ -23,5 +23,6 @@ class SilverBase(DeclarativeBase):
         DateTime, 
         server_default=func.now(), 
         onupdate=func.now(),
-        comment="When record was last updated"
+        index=True,
+        comment="When record was last updated (incremental gold watermark)"
     )
@@ -5,6 +5,7 @@ from typing import Optional
 from sqlalchemy import DateTime, Integer, String, Float, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..partitioning import event_table_args
 from .base import SilverBase
 
 
@@ -16,21 +17,22 @@ class SilverInputEvent(SilverBase):
     - Unified both CV and MV systems into single table
     - Standardized units of measurement
     - Calculated infusion rates
-    - Added source system flag
+    - Added source system flag, part of the key since CareVue and
+      MetaVision number their rows independently
     """
     
     __tablename__ = "inputevents"
-    __table_args__ = {"schema": "silver"}
+    __table_args__ = event_table_args("silver", "charttime", primary_key=("row_id", "source_system"))
     
-    # Primary key
-    row_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment="Row ID")
+    # Primary key (with source_system)
+    row_id: Mapped[int] = mapped_column(Integer, comment="Row ID in the source system's table")
     
     # Foreign keys
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="Patient ID")
     hadm_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Hospital admission ID")
     icustay_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="ICU stay ID")
     
-    # Source system
+    # Source system (part of the primary key)
     source_system: Mapped[str] = mapped_column(String(20), nullable=False, comment="Source: CareVue or MetaVision")
     
     # Item information
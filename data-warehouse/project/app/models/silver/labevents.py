@@ -5,6 +5,7 @@ from typing import Optional
 from sqlalchemy import DateTime, Integer, String, Float, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..partitioning import event_table_args
 from .base import SilverBase
 
 
@@ -20,10 +21,10 @@ class SilverLabEvent(SilverBase):
     """
     
     __tablename__ = "labevents"
-    __table_args__ = {"schema": "silver"}
+    __table_args__ = event_table_args("silver", "charttime", primary_key=("row_id",))
     
     # Primary key (composite in bronze, simplified here)
-    row_id: Mapped[int] = mapped_column(Integer, primary_key=True, comment="Row ID")
+    row_id: Mapped[int] = mapped_column(Integer, comment="Row ID")
     
     # Foreign keys
     subject_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True, comment="Patient ID")
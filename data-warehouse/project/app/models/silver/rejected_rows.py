@@ -0,0 +1,28 @@
+"""Silver layer quarantine of bronze records that could not be transformed."""
+from typing import Optional
+
+from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import SilverBase
+
+
+class SilverRejectedRow(SilverBase):
+    """
+    Bronze record rejected while transforming it into a silver table.
+    
+    Written in bulk with the silver batch it was read in.
+    """
+    
+    __tablename__ = "etl_rejected_rows"
+    __table_args__ = {"schema": "silver"}
+    
+    rejected_row_key: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, comment="Silver table name")
+    source_table: Mapped[str] = mapped_column(String(100), nullable=False, comment="Bronze table name")
+    source_key: Mapped[Optional[str]] = mapped_column(String(200), nullable=True, comment="Bronze primary key")
+    raw_row: Mapped[str] = mapped_column(Text, nullable=False, comment="Bronze record, JSON")
+    error: Mapped[str] = mapped_column(Text, nullable=False, comment="Why the record was rejected")
+
+    def __repr__(self) -> str:
+        return f"<SilverRejectedRow({self.table_name} <- {self.source_table} {self.source_key}: {self.error})>"
@@ -0,0 +1,32 @@
+"""Silver layer control table for incremental transformation."""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import SilverBase
+
+
+class SilverWatermark(SilverBase):
+    """
+    High-water mark of bronze rows already transformed into silver.
+    
+    One row per (silver table, bronze source) pair. Incremental runs only
+    read bronze rows whose updated_at is later than the stored watermark.
+    Deleted bronze rows are not propagated; a full run is needed for those.
+    """
+    
+    __tablename__ = "etl_watermarks"
+    __table_args__ = {"schema": "silver"}
+    
+    target_table: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Silver table name")
+    source_table: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Bronze table name")
+    
+    watermark: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+        comment="Latest bronze updated_at included in silver"
+    )
+
+    def __repr__(self) -> str:
+        return f"<SilverWatermark({self.target_table} <- {self.source_table} @ {self.watermark})>"
@@ -1,8 +1,13 @@
 """Shared utilities and infrastructure."""
+from .bulk_load import initial_load
 from .config import Settings, settings
 from .db_engine import SessionLocal, dispose_engine, engine, get_db, test_connection
 from .ioc_container import Container, container
 from .logger import logger, setup_logger
+from .metrics import PipelineMetrics, StageStats, instrument_engine, metrics
+from .quarantine import Quarantine, SampledWarnings
+from .query_cache import QueryCache, bump_table_versions, bump_versions_on_commit, get_query_cache
+from .scheduler import TaskResult, critical_path, format_timeline, run_dag
 
 __all__ = [
     # Config
@@ -17,7 +22,27 @@ __all__ = [
     # Logging
     "logger",
     "setup_logger",
+    # Instrumentation
+    "metrics",
+    "PipelineMetrics",
+    "StageStats",
+    "instrument_engine",
+    # Rejected rows
+    "Quarantine",
+    "SampledWarnings",
     # Container
     "container",
     "Container",
+    # Bulk loading
+    "initial_load",
+    # Query cache
+    "QueryCache",
+    "get_query_cache",
+    "bump_table_versions",
+    "bump_versions_on_commit",
+    # Scheduling
+    "run_dag",
+    "critical_path",
+    "format_timeline",
+    "TaskResult",
 ]
@@ -0,0 +1,191 @@
+"""Initial-load mode: deferred index and FK builds with bulk-load session tuning."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, Iterable, List, Optional
+
+from sqlalchemy import Index, Table, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import AddConstraint, CreateIndex, DropIndex, ForeignKeyConstraint
+
+from .config import settings
+from .logger import logger
+
+
+@dataclass
+class DeferredSchema:
+    """Secondary indexes and foreign keys dropped for the duration of a load."""
+
+    tables: List[Table]
+    indexes: List[Index] = field(default_factory=list)
+    foreign_keys: List[ForeignKeyConstraint] = field(default_factory=list)
+
+
+def bulk_load_options() -> Dict[str, str]:
+    """
+    Session settings applied to every connection during an initial load.
+
+    synchronous_commit=off lets commits return before the WAL is flushed
+    (a crash can lose the last few transactions, never corrupt data), and a
+    large maintenance_work_mem speeds up the index and FK builds at the end.
+    """
+    return {
+        "synchronous_commit": "off",
+        "maintenance_work_mem": settings.bulk_maintenance_work_mem,
+    }
+
+
+def session_options_hook(options: Dict[str, str]) -> Callable:
+    """
+    Build a pool 'connect' listener that applies session settings.
+
+    The settings are committed so the pool's reset-on-return rollback does
+    not undo them.
+    """
+    def apply_options(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        for name, value in options.items():
+            cursor.execute(f"SET {name} = '{value}'")
+        cursor.close()
+        dbapi_conn.commit()
+
+    return apply_options
+
+
+def secondary_indexes(tables: Iterable[Table]) -> List[Index]:
+    """
+    Non-unique indexes declared on the given tables.
+
+    Primary keys and unique indexes are kept during a load: upserts need
+    them as ON CONFLICT targets.
+    """
+    return [
+        index
+        for table in tables
+        for index in sorted(table.indexes, key=lambda index: index.name)
+        if not index.unique
+    ]
+
+
+def drop_deferred(engine: Engine, tables: List[Table]) -> DeferredSchema:
+    """
+    Drop the secondary indexes and foreign keys of existing tables.
+
+    Args:
+        engine: Database engine
+        tables: Tables about to be bulk loaded
+
+    Returns:
+        What was dropped, for rebuild_deferred
+    """
+    inspector = inspect(engine)
+    existing = [table for table in tables if inspector.has_table(table.name, schema=table.schema)]
+    deferred = DeferredSchema(tables=existing, indexes=secondary_indexes(existing))
+
+    with engine.begin() as conn:
+        for table in existing:
+            for fk in inspector.get_foreign_keys(table.name, schema=table.schema):
+                conn.execute(text(f'ALTER TABLE {table.fullname} DROP CONSTRAINT IF EXISTS "{fk["name"]}"'))
+            deferred.foreign_keys.extend(table.foreign_key_constraints)
+        for index in deferred.indexes:
+            conn.execute(DropIndex(index, if_exists=True))
+
+    logger.info(
+        f"Deferred {len(deferred.indexes)} indexes and {len(deferred.foreign_keys)} "
+        f"foreign keys on {len(existing)} tables"
+    )
+    return deferred
+
+
+def _execute(engine: Engine, statement) -> None:
+    """Run one DDL statement in its own connection and transaction."""
+    with engine.begin() as conn:
+        conn.execute(statement)
+
+
+def rebuild_deferred(engine: Engine, deferred: DeferredSchema, workers: int, foreign_keys: bool = True) -> None:
+    """
+    Recreate deferred indexes in parallel, re-add foreign keys, then ANALYZE.
+
+    Indexes are built concurrently, one connection per worker (keep within
+    the pool size). Foreign keys are added one at a time because adding
+    two that reference the same table would block each other anyway.
+
+    Args:
+        engine: Database engine
+        deferred: Output of drop_deferred
+        workers: Number of concurrent index builds
+        foreign_keys: Re-add the foreign keys (otherwise they are only logged)
+    """
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(
+            lambda index: _execute(engine, CreateIndex(index, if_not_exists=True)), deferred.indexes
+        ))
+    logger.info(f"Rebuilt {len(deferred.indexes)} indexes in {time.time() - start:.2f}s")
+
+    if foreign_keys:
+        start = time.time()
+        for fk in deferred.foreign_keys:
+            _execute(engine, AddConstraint(fk))
+        logger.info(f"Re-added {len(deferred.foreign_keys)} foreign keys in {time.time() - start:.2f}s")
+    elif deferred.foreign_keys:
+        names = ", ".join(f"{fk.table.fullname}.{fk.name}" for fk in deferred.foreign_keys)
+        logger.warning(f"Foreign keys left dropped: {names}")
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(
+            lambda table: _execute(engine, text(f"ANALYZE {table.fullname}")), deferred.tables
+        ))
+    logger.info(f"Analyzed {len(deferred.tables)} tables in {time.time() - start:.2f}s")
+
+
+@contextmanager
+def initial_load(
+    engine: Engine, tables: List[Table], workers: Optional[int] = None
+) -> Generator[DeferredSchema, None, None]:
+    """
+    Run a bulk load with secondary indexes and foreign keys deferred.
+
+    On entry, pooled connections are discarded so every new connection gets
+    the bulk-load session settings, and the tables' secondary indexes and
+    foreign keys are dropped. On exit they are rebuilt in parallel and the
+    tables analyzed. After a failed load only the indexes are rebuilt: the
+    partial data may violate the foreign keys, which are logged and left
+    dropped, and the load's exception is re-raised even if the rebuild
+    fails. Meant for loading empty tables; on populated ones the rebuild
+    costs more than it saves.
+
+    Args:
+        engine: Database engine the loaders use
+        tables: Tables about to be loaded
+        workers: Concurrent index builds (default: settings.index_build_workers)
+
+    Yields:
+        The deferred indexes and foreign keys
+
+    Example:
+        with initial_load(engine, SilverBase.metadata.sorted_tables):
+            run_transformers()
+    """
+    hook = session_options_hook(bulk_load_options())
+    event.listen(engine, "connect", hook)
+    engine.dispose()
+
+    try:
+        deferred = drop_deferred(engine, tables)
+        workers = workers or settings.index_build_workers
+        try:
+            yield deferred
+        except BaseException:
+            try:
+                rebuild_deferred(engine, deferred, workers, foreign_keys=False)
+            except Exception:
+                logger.error("Rebuilding the deferred indexes after the failed load failed", exc_info=True)
+            raise
+        rebuild_deferred(engine, deferred, workers)
+    finally:
+        event.remove(engine, "connect", hook)
+        engine.dispose()
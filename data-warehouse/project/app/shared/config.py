@@ -36,13 +36,60 @@ class Settings(BaseSettings):
     # Data Configuration
     csv_data_path: Path = Field(default=Path("./dataset"), description="Path to CSV data files")
     batch_size: int = Field(default=1000, description="Batch size for data loading")
+    export_path: Path = Field(default=Path("./exports/gold"), description="Root directory of gold Parquet exports")
+    analytics_backend: str = Field(
+        default="postgres", description="Backend for gold analytics queries: postgres or duckdb (Parquet export)"
+    )
+    query_cache: str = Field(default="memory", description="Gold query result cache: memory, disk or none")
+    query_cache_path: Path = Field(default=Path("./.cache/queries"), description="Directory of the disk query cache")
+    query_cache_size: int = Field(default=256, description="Maximum cached query results")
+
+    # Initial-load mode (--initial-load)
+    bulk_maintenance_work_mem: str = Field(
+        default="1GB", description="maintenance_work_mem for index and FK builds after an initial load"
+    )
+    index_build_workers: int = Field(default=4, description="Indexes rebuilt concurrently after an initial load")
 
-    @field_validator("csv_data_path", mode="before")
+    # Partitioning of high-volume event tables (labevents, inputevents)
+    event_partitioning: str = Field(
+        default="none", description="Event table partitioning: none, range (chart time) or hash (subject_id)"
+    )
+    partition_range_years: int = Field(default=10, description="Years per chart time range partition")
+    partition_hash_modulus: int = Field(default=16, description="Number of subject_id hash partitions")
+
+    @field_validator("csv_data_path", "export_path", "query_cache_path", mode="before")
     @classmethod
     def validate_csv_path(cls, v):
         """Convert string path to Path object."""
         return Path(v) if isinstance(v, str) else v
 
+    @field_validator("event_partitioning")
+    @classmethod
+    def validate_event_partitioning(cls, v):
+        """Accept only the supported partitioning methods."""
+        v = v.lower()
+        if v not in ("none", "range", "hash"):
+            raise ValueError("event_partitioning must be one of: none, range, hash")
+        return v
+
+    @field_validator("analytics_backend")
+    @classmethod
+    def validate_analytics_backend(cls, v):
+        """Accept only the supported query backends."""
+        v = v.lower()
+        if v not in ("postgres", "duckdb"):
+            raise ValueError("analytics_backend must be one of: postgres, duckdb")
+        return v
+
+    @field_validator("query_cache")
+    @classmethod
+    def validate_query_cache(cls, v):
+        """Accept only the supported cache stores."""
+        v = v.lower()
+        if v not in ("memory", "disk", "none"):
+            raise ValueError("query_cache must be one of: memory, disk, none")
+        return v
+
     @property
     def database_url(self) -> str:
         """Construct PostgreSQL database URL."""
@@ -9,6 +9,7 @@ from sqlalchemy.pool import QueuePool
 
 from .config import settings
 from .logger import logger
+from .metrics import instrument_engine
 
 # Create SQLAlchemy engine
 engine: Engine = create_engine(
@@ -21,6 +22,9 @@ engine: Engine = create_engine(
     echo=not settings.is_production,  # Log SQL in development
 )
 
+# Count round trips and database time per pipeline stage
+instrument_engine(engine)
+
 # Session factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -0,0 +1,277 @@
+"""
+Stage-level instrumentation for the ETL pipeline.
+
+metrics.stage(name) times a block of work and accumulates, per stage name,
+its calls, wall time, rows and bytes. instrument_engine() hooks the
+engine's cursor events so every statement executed while a stage is active
+counts as a database round trip and its duration as database time; the
+rest of the stage's wall time is time spent in Python. Stages nest (a
+statement counts towards every stage active on its thread), and raw DBAPI
+calls that bypass cursor events, like COPY, are recorded with
+metrics.database_call().
+
+Stages run in worker processes are recorded in those processes only.
+
+Example:
+    with metrics.stage("bronze.LABEVENTS") as stage:
+        ...
+        stage.count(rows=loaded, nbytes=csv_size)
+    metrics.write(Path("logs/metrics.prom"))
+"""
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .logger import logger
+
+# Statements whose cursor rowcount is a number of rows written
+WRITE_STATEMENT = re.compile(r"^\s*(WITH\b.*?\)\s*)?(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE | re.DOTALL)
+
+# File suffixes written in the Prometheus text format (anything else is JSON)
+PROMETHEUS_SUFFIXES = (".prom", ".txt")
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements of one pipeline stage."""
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    db_seconds: float = 0.0
+    db_round_trips: int = 0
+    db_rows_written: int = 0
+    rows: int = 0
+    nbytes: int = 0
+    errors: int = 0
+
+    @property
+    def python_seconds(self) -> float:
+        """Wall time not spent waiting on the database."""
+        return max(0.0, self.seconds - self.db_seconds)
+
+    def count(self, rows: int = 0, nbytes: int = 0):
+        """Add processed rows and bytes."""
+        self.rows += rows
+        self.nbytes += nbytes
+
+    def merge(self, other: "StageStats"):
+        """Add another measurement of the same stage."""
+        for name in ("calls", "seconds", "db_seconds", "db_round_trips", "db_rows_written", "rows", "nbytes", "errors"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable view of the stage."""
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 3),
+            "python_seconds": round(self.python_seconds, 3),
+            "db_seconds": round(self.db_seconds, 3),
+            "db_round_trips": self.db_round_trips,
+            "db_rows_written": self.db_rows_written,
+            "rows": self.rows,
+            "bytes": self.nbytes,
+            "errors": self.errors,
+            "rows_per_sec": round(self.rows / self.seconds, 1) if self.seconds > 0 else 0.0,
+        }
+
+
+class PipelineMetrics:
+    """Process-wide registry of stage measurements."""
+
+    def __init__(self):
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.db_seconds = 0.0
+        self.db_round_trips = 0
+
+    def _active(self) -> List[StageStats]:
+        """Stages currently open on this thread, outermost first."""
+        if not hasattr(self._local, "active"):
+            self._local.active = []
+        return self._local.active
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """
+        Measure one call of a stage.
+
+        Args:
+            name: Stage name, conventionally '<layer>.<table>'
+
+        Yields:
+            This call's StageStats; use count() to record rows and bytes.
+            It is added to the stage's totals on exit.
+        """
+        current = StageStats(name, calls=1)
+        active = self._active()
+        active.append(current)
+        start = time.perf_counter()
+        try:
+            yield current
+        except Exception:
+            current.errors += 1
+            raise
+        finally:
+            current.seconds = time.perf_counter() - start
+            active.remove(current)
+            with self._lock:
+                self._stages.setdefault(name, StageStats(name)).merge(current)
+
+    def record_statement(self, seconds: float, rows_written: int = 0):
+        """
+        Record one database round trip against every active stage.
+
+        Args:
+            seconds: Time spent in the call
+            rows_written: Rows inserted, updated or deleted by it
+        """
+        for current in self._active():
+            current.db_seconds += seconds
+            current.db_round_trips += 1
+            current.db_rows_written += rows_written
+        with self._lock:
+            self.db_seconds += seconds
+            self.db_round_trips += 1
+
+    @contextmanager
+    def database_call(self) -> Iterator[None]:
+        """Record a raw DBAPI call (e.g. COPY) that cursor events do not see."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_statement(time.perf_counter() - start)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_start"].pop()
+        written = cursor.rowcount if cursor.rowcount > 0 and WRITE_STATEMENT.match(statement) else 0
+        self.record_statement(elapsed, written)
+
+    def _handle_error(self, context):
+        # A failed statement never reaches after_cursor_execute
+        starts = context.connection.info.get("metrics_start") if context.connection is not None else None
+        if starts:
+            self.record_statement(time.perf_counter() - starts.pop())
+
+    def stages(self) -> Dict[str, StageStats]:
+        """Snapshot of the accumulated stages, by name."""
+        with self._lock:
+            snapshot = {}
+            for name, stats in self._stages.items():
+                snapshot[name] = StageStats(name)
+                snapshot[name].merge(stats)
+            return snapshot
+
+    def reset(self):
+        """Forget every measurement."""
+        with self._lock:
+            self._stages.clear()
+            self.db_seconds = 0.0
+            self.db_round_trips = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable view of the registry."""
+        return {
+            "db_seconds": round(self.db_seconds, 3),
+            "db_round_trips": self.db_round_trips,
+            "stages": [stats.to_dict() for stats in self.stages().values()],
+        }
+
+    def to_json(self) -> str:
+        """Measurements as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix: str = "mimic_pipeline") -> str:
+        """
+        Measurements in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text, one sample per stage and metric
+        """
+        stages = self.stages().values()
+        series = [
+            ("stage_calls_total", "counter", "Completed stage calls", lambda s: s.calls),
+            ("stage_seconds_total", "counter", "Wall time spent in the stage", lambda s: s.seconds),
+            ("stage_python_seconds_total", "counter", "Stage time not spent in the database", lambda s: s.python_seconds),
+            ("stage_db_seconds_total", "counter", "Stage time spent in database calls", lambda s: s.db_seconds),
+            ("stage_db_round_trips_total", "counter", "Database round trips made by the stage", lambda s: s.db_round_trips),
+            ("stage_db_rows_written_total", "counter", "Rows written by the stage's statements", lambda s: s.db_rows_written),
+            ("stage_rows_total", "counter", "Rows processed by the stage", lambda s: s.rows),
+            ("stage_bytes_total", "counter", "Bytes processed by the stage", lambda s: s.nbytes),
+            ("stage_errors_total", "counter", "Stage calls that raised", lambda s: s.errors),
+        ]
+
+        lines = []
+        for metric, kind, help_text, value in series:
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for stats in stages:
+                lines.append(f'{prefix}_{metric}{{stage="{_escape_label(stats.name)}"}} {_format_sample(value(stats))}')
+        lines.append(f"# HELP {prefix}_db_round_trips_total Database round trips made by the process")
+        lines.append(f"# TYPE {prefix}_db_round_trips_total counter")
+        lines.append(f"{prefix}_db_round_trips_total {self.db_round_trips}")
+        lines.append(f"# HELP {prefix}_db_seconds_total Time the process spent in database calls")
+        lines.append(f"# TYPE {prefix}_db_seconds_total counter")
+        lines.append(f"{prefix}_db_seconds_total {_format_sample(self.db_seconds)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path):
+        """
+        Write the measurements to a file.
+
+        Files ending in .prom or .txt get the Prometheus text format (for the
+        node exporter's textfile collector), anything else JSON.
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_prometheus() if path.suffix in PROMETHEUS_SUFFIXES else self.to_json())
+        logger.info(f"Stage metrics written to {path}")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(value: float) -> str:
+    return str(value) if isinstance(value, int) else f"{value:.6f}"
+
+
+# Process-wide registry
+metrics = PipelineMetrics()
+
+
+def instrument_engine(engine: Engine, registry: PipelineMetrics = metrics):
+    """
+    Count every statement run through an engine in a metrics registry.
+
+    Safe to call more than once for the same engine.
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+        registry: Registry receiving the measurements
+    """
+    if event.contains(engine, "before_cursor_execute", registry._before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", registry._before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", registry._after_cursor_execute)
+    event.listen(engine, "handle_error", registry._handle_error)
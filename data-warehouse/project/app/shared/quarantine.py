@@ -0,0 +1,144 @@
+"""
+Quarantine of rejected rows.
+
+Rows the pipeline cannot load are buffered in memory and bulk-inserted into
+a per-layer quarantine table (bronze.etl_rejected_rows,
+silver.etl_rejected_rows) in the transaction of the batch they came from,
+instead of being logged one warning at a time. The log only gets the first
+few rejections of each kind and a summary with the totals.
+
+Example:
+    quarantine = Quarantine(BronzeRejectedRow.__table__, "bronze.labevents")
+    ...
+    quarantine.reject(error, table_name="labevents", line_number=12, raw_row=row)
+    quarantine.flush(session)
+    session.commit()
+    quarantine.summary()
+"""
+import json
+from collections import Counter
+from typing import Any, Dict, List
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+
+from .logger import logger
+
+# Warnings of each kind logged in full before only counting them
+LOG_SAMPLE_SIZE = 5
+
+
+class SampledWarnings:
+    """Log the first few warnings of each kind and count the rest."""
+
+    def __init__(self, sample_size: int = LOG_SAMPLE_SIZE):
+        """
+        Args:
+            sample_size: Warnings of each kind logged before suppressing them
+        """
+        self.sample_size = sample_size
+        self.counts: Counter = Counter()
+
+    def warn(self, kind: str, message: str, count: int = 1):
+        """
+        Count a warning, logging it while its kind is under the sample size.
+
+        Args:
+            kind: Grouping key for sampling and the summary
+            message: Full warning message
+            count: Occurrences the message stands for (e.g. a whole column's)
+        """
+        previous = self.counts[kind]
+        self.counts[kind] += count
+        if previous < self.sample_size:
+            logger.warning(message)
+            if self.counts[kind] >= self.sample_size:
+                logger.warning(f"Further '{kind}' warnings are counted, not logged")
+
+    def total(self) -> int:
+        """Warnings counted since the last summary."""
+        return sum(self.counts.values())
+
+    def summary(self, message: str):
+        """
+        Log one line with the counts per kind, then start counting afresh.
+
+        Does nothing if nothing was counted.
+
+        Args:
+            message: Leading text of the summary line
+        """
+        if not self.counts:
+            return
+        kinds = ", ".join(f"{kind}: {count:,}" for kind, count in self.counts.most_common())
+        logger.warning(f"{message}: {self.total():,} ({kinds})")
+        self.counts.clear()
+
+
+class Quarantine:
+    """
+    In-memory buffer of rejected rows bound for one quarantine table.
+
+    Not thread-safe: give each thread its own instance.
+    """
+
+    def __init__(self, table: Table, source: str, sample_size: int = LOG_SAMPLE_SIZE):
+        """
+        Args:
+            table: Quarantine table; every reject() must supply its
+                non-defaulted columns, plus raw_row and error
+            source: What is being loaded, for log messages (e.g. 'bronze.labevents')
+            sample_size: Rejections of each error type logged individually
+        """
+        self.table = table
+        self.source = source
+        self.pending: List[Dict[str, Any]] = []
+        self.rejected = 0
+        self.warnings = SampledWarnings(sample_size)
+
+    def reject(self, error: Exception, raw_row: Dict[str, Any], **columns):
+        """
+        Buffer a rejected row.
+
+        Args:
+            error: Why the row was rejected
+            raw_row: The row as read, stored as JSON
+            **columns: Other quarantine table columns (table name, line number, ...)
+        """
+        kind = type(error).__name__
+        self.pending.append({**columns, "raw_row": json.dumps(raw_row, default=str), "error": f"{kind}: {error}"})
+        self.rejected += 1
+        where = ", ".join(f"{name} {value}" for name, value in columns.items() if value is not None)
+        self.warnings.warn(kind, f"Rejected row from {self.source} ({where}): {kind}: {error}")
+
+    def flush(self, session: Session) -> int:
+        """
+        Insert the buffered rows in the session's transaction, without committing.
+
+        The INSERT names the table literally, so rows land in the real
+        quarantine table even on a session whose schema_translate_map
+        redirects the layer's tables (e.g. a staging load).
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            Number of rows written
+        """
+        if not self.pending:
+            return 0
+        columns = list(self.pending[0])
+        session.execute(
+            text(
+                f"INSERT INTO {self.table.fullname} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(':' + column for column in columns)})"
+            ),
+            self.pending,
+        )
+        written = len(self.pending)
+        self.pending = []
+        return written
+
+    def summary(self):
+        """Log how many rows were rejected since the last summary, by error type."""
+        self.warnings.summary(f"Rows from {self.source} quarantined in {self.table.fullname}")
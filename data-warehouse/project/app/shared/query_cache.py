@@ -0,0 +1,432 @@
+"""
+Result cache for repeated gold analytics queries.
+
+Results are keyed on the normalized SQL, the bind parameters and the current
+version of every gold table the query reads. load_gold.py and
+refresh_aggregates.py reload tables inside bump_versions_on_commit(), which
+bumps a table's version (gold.etl_table_versions) in every transaction the
+loader commits, so a reloaded table changes the key and stale entries are
+simply never hit again; the LRU bound evicts them.
+
+settings.query_cache picks the store:
+    memory  in-process LRU (per Python process / notebook kernel)
+    disk    pickled results under settings.query_cache_path, shared by
+            every process on the machine
+    none    caching disabled
+
+Only queries whose tables all live in the gold schema are cached; anything
+else has no version counter and always goes to the database. So do queries
+whose table sources cannot all be resolved to schema-qualified names (see
+referenced_tables), unless the caller declares the tables, and every query
+on a database without the version table.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import bindparam, event, inspect, text
+
+from .config import settings
+from .logger import logger
+
+VERSION_TABLE = "gold.etl_table_versions"
+CACHED_SCHEMA = "gold"
+
+# Quoted literals and identifiers, kept verbatim by normalize_sql
+QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+# Words, optionally schema-qualified, and single punctuation characters
+TOKEN = re.compile(r"[a-z_]\w*(?:\.[a-z_]\w*)?|''|\S")
+QUALIFIED_NAME = re.compile(r"[a-z_]\w*\.[a-z_]\w*")
+CTE_NAME = re.compile(r"(?:\bwith(?:\s+recursive)?|,)\s*([a-z_]\w*)\s+as\s*(?:(?:not\s+)?materialized\s*)?\(")
+# Keywords ending a FROM list at its own parenthesis depth
+FROM_LIST_END = frozenset((
+    "where", "group", "having", "window", "order", "limit", "offset", "fetch",
+    "union", "intersect", "except", "returning", "for",
+))
+
+
+class QueryResult:
+    """Fully fetched query result with the Result methods the analytics code uses."""
+
+    def __init__(self, rows: List[tuple], keys: List[str]):
+        self.rows = rows
+        self._keys = keys
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def fetchall(self) -> List[tuple]:
+        return list(self.rows)
+
+    def all(self) -> List[tuple]:
+        return list(self.rows)
+
+    def first(self) -> Optional[tuple]:
+        return self.rows[0] if self.rows else None
+
+    def scalar(self) -> Any:
+        return self.rows[0][0] if self.rows else None
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Canonical form of a query for cache keys.
+
+    Comments are dropped, whitespace is collapsed and keywords/identifiers
+    are lower-cased; quoted literals and identifiers are left untouched.
+    """
+    parts = []
+    for i, part in enumerate(QUOTED.split(sql)):
+        if i % 2:
+            parts.append(part)
+        else:
+            part = re.sub(r"--[^\n]*", " ", part)
+            parts.append(re.sub(r"\s+", " ", part).lower())
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def referenced_tables(sql: str) -> Optional[List[str]]:
+    """
+    Tables a query reads, or None when they cannot all be resolved.
+
+    Every table source is checked: FROM and JOIN targets and each item of a
+    comma-separated FROM list. Sources that are subqueries are scanned in
+    turn, and names defined by a WITH clause are allowed. Any other source
+    that is not a schema-qualified name (an unqualified or quoted table, a
+    function call, a FROM inside an expression such as EXTRACT) makes the
+    result None, so callers skip the cache rather than risk missing a table.
+    Every other schema-qualified gold name in the query is included too.
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        Sorted schema-qualified table names, or None
+    """
+    unquoted = QUOTED.sub("''", normalize_sql(sql))
+    ctes = set(CTE_NAME.findall(unquoted))
+    tables = {name for name in QUALIFIED_NAME.findall(unquoted) if name.startswith(f"{CACHED_SCHEMA}.")}
+
+    depth = 0
+    from_depths = []  # parenthesis depths of the FROM lists being read
+    expect_source = False
+    for token in TOKEN.findall(unquoted):
+        if expect_source and token != "(":
+            expect_source = token == "lateral"
+            if expect_source:
+                continue
+            if QUALIFIED_NAME.fullmatch(token):
+                tables.add(token)
+            elif token not in ctes:
+                return None
+            continue
+
+        expect_source = False
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            while from_depths and from_depths[-1] > depth:
+                from_depths.pop()
+        elif token == "from":
+            expect_source = True
+            if not from_depths or from_depths[-1] != depth:
+                from_depths.append(depth)
+        elif token == "join":
+            expect_source = True
+        elif from_depths and from_depths[-1] == depth and token == ",":
+            expect_source = True
+        elif from_depths and from_depths[-1] == depth and token in FROM_LIST_END:
+            from_depths.pop()
+
+    return sorted(tables)
+
+
+def cache_key(sql: str, params: Optional[Dict[str, Any]], versions: Dict[str, Any]) -> str:
+    """Hash of normalized SQL, bind values and table versions."""
+    payload = json.dumps(
+        [normalize_sql(sql), sorted((params or {}).items()), sorted(versions.items())],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def table_versions(session, tables: Iterable[str]) -> Dict[str, Any]:
+    """
+    Current version of each table (0 if never bumped).
+
+    Sessions that track versions themselves (DuckDBSession reads them from
+    the export manifest) provide a table_versions(tables) method.
+    """
+    tables = sorted(set(tables))
+    if not tables:
+        return {}
+    own_versions = getattr(session, "table_versions", None)
+    if own_versions is not None:
+        return own_versions(tables)
+
+    query = text(f"SELECT table_name, version FROM {VERSION_TABLE} WHERE table_name IN :names").bindparams(
+        bindparam("names", expanding=True)
+    )
+    versions = dict.fromkeys(tables, 0)
+    versions.update(session.execute(query, {"names": tables}).fetchall())
+    return versions
+
+
+def has_version_table(session) -> bool:
+    """Whether the version table exists (databases loaded before it was added lack it)."""
+    schema, name = VERSION_TABLE.split(".")
+    return inspect(session.connection()).has_table(name, schema=schema)
+
+
+def bump_table_versions(session, tables: Iterable[str]):
+    """
+    Increment the version of each table, invalidating cached results.
+
+    Call inside the transaction that reloads the tables, before it commits,
+    so readers never see new data under an old version (see
+    bump_versions_on_commit).
+
+    Args:
+        session: SQLAlchemy session
+        tables: Schema-qualified table names (e.g. gold.agg_icu_performance)
+    """
+    names = sorted(set(tables))
+    if not names:
+        return
+    session.execute(
+        text(f"""
+            INSERT INTO {VERSION_TABLE} (table_name, version, updated_at)
+            VALUES (:name, 1, now())
+            ON CONFLICT (table_name) DO UPDATE
+            SET version = etl_table_versions.version + 1, updated_at = now()
+        """),
+        [{"name": name} for name in names],
+    )
+    logger.info(f"Bumped cache versions of {len(names)} tables")
+
+
+@contextmanager
+def bump_versions_on_commit(session, tables: Iterable[str]) -> Iterator[None]:
+    """
+    Bump the tables' versions in every transaction the session commits inside the block.
+
+    Loaders commit on their own, possibly several times; hooking the commit
+    puts each bump in the same transaction as the data it versions, so a
+    crash can never leave new data under an old version.
+
+    Example:
+        with bump_versions_on_commit(session, ["gold.agg_icu_performance"]):
+            load_agg_icu_performance(session)
+
+    Args:
+        session: SQLAlchemy session
+        tables: Schema-qualified table names (e.g. gold.agg_icu_performance)
+    """
+    names = sorted(set(tables))
+
+    def bump(committing):
+        bump_table_versions(committing, names)
+
+    event.listen(session, "before_commit", bump)
+    try:
+        yield
+    finally:
+        event.remove(session, "before_commit", bump)
+
+
+class MemoryStore:
+    """In-process LRU of query results."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, QueryResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[QueryResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: str, result: QueryResult):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _mtime(path: Path) -> float:
+    """Modification time, or 0 for a file removed by another process."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+class DiskStore:
+    """
+    Query results pickled to one file per key.
+
+    Reads refresh a file's mtime, so pruning by oldest mtime keeps the
+    most recently used max_entries results.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(self, path: Path, max_entries: int = 256):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[QueryResult]:
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key: str, result: QueryResult):
+        path = self._file(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self._prune()
+
+    def _prune(self):
+        entries = list(self.path.glob(f"*{self.SUFFIX}"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=_mtime)
+        for stale in entries[: len(entries) - self.max_entries]:
+            stale.unlink(missing_ok=True)
+
+    def clear(self):
+        for entry in self.path.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob(f"*{self.SUFFIX}"))
+
+
+class QueryCache:
+    """
+    Version-checked result cache in front of session.execute().
+
+    Example:
+        cache = QueryCache(MemoryStore())
+        rows = cache.execute(session, "SELECT * FROM gold.agg_icu_performance").fetchall()
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._version_table_found = False
+
+    def execute(
+        self,
+        session,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None,
+        tables: Optional[Iterable[str]] = None,
+    ) -> QueryResult:
+        """
+        Return the cached result of a query, running it on a miss.
+
+        The version lookup is one primary-key read, so a hit costs a few
+        milliseconds regardless of how expensive the query is. Queries whose
+        tables are unknown, or not all in gold, bypass the cache, as does
+        every query while the database has no version table.
+
+        Args:
+            session: SQLAlchemy session or DuckDBSession
+            sql: SQL text with :name binds
+            params: Bind values
+            tables: Schema-qualified tables the query reads, when the caller
+                knows them (default: parsed from the SQL)
+        """
+        tables = referenced_tables(sql) if tables is None else sorted(set(tables))
+        if not tables or any(not t.startswith(f"{CACHED_SCHEMA}.") for t in tables):
+            return self._run(session, sql, params)
+        if not self._has_versions(session):
+            return self._run(session, sql, params)
+
+        key = cache_key(sql, params, table_versions(session, tables))
+        result = self.store.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._run(session, sql, params)
+        self.store.set(key, result)
+        return result
+
+    def _has_versions(self, session) -> bool:
+        """Whether the session can provide table versions; only a positive answer is remembered."""
+        if not self._version_table_found:
+            self._version_table_found = hasattr(session, "table_versions") or has_version_table(session)
+            if not self._version_table_found:
+                logger.debug(f"{VERSION_TABLE} does not exist; query results are not cached")
+        return self._version_table_found
+
+    @staticmethod
+    def _run(session, sql: str, params: Optional[Dict[str, Any]]) -> QueryResult:
+        result = session.execute(text(sql), params or {})
+        return QueryResult([tuple(row) for row in result.fetchall()], list(result.keys()))
+
+    def clear(self):
+        """Drop every cached result."""
+        self.store.clear()
+
+
+_query_cache: Optional[QueryCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> Optional[QueryCache]:
+    """
+    Process-wide cache configured by settings.query_cache.
+
+    Returns:
+        QueryCache, or None when caching is disabled
+    """
+    global _query_cache
+    if settings.query_cache == "none":
+        return None
+    with _query_cache_lock:
+        if _query_cache is None:
+            if settings.query_cache == "disk":
+                store = DiskStore(settings.query_cache_path, settings.query_cache_size)
+            else:
+                store = MemoryStore(settings.query_cache_size)
+            _query_cache = QueryCache(store)
+        return _query_cache
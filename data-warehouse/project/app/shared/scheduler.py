@@ -0,0 +1,184 @@
+"""Dependency-aware task scheduler for parallel pipeline stages."""
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .logger import logger
+
+
+@dataclass
+class TaskResult:
+    """Outcome and wall-clock timing of one scheduled task."""
+
+    name: str
+    start: float = 0.0
+    end: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+    skipped: bool = False
+
+    @property
+    def duration(self) -> float:
+        """Task run time in seconds."""
+        return self.end - self.start
+
+
+def _timed_call(func: Callable[[], Any]) -> Tuple[float, float, Any]:
+    """Run a task and return (start, end, result) wall-clock timestamps."""
+    start = time.time()
+    result = func()
+    return start, time.time(), result
+
+
+def _check_acyclic(dependencies: Dict[str, List[str]]):
+    """
+    Raise if the dependency graph contains a cycle.
+
+    Raises:
+        ValueError: If a cycle is found
+    """
+    visiting, done = set(), set()
+
+    def visit(name: str, path: List[str]):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for dep in dependencies.get(name, []):
+            visit(dep, path + [name])
+        visiting.discard(name)
+        done.add(name)
+
+    for name in dependencies:
+        visit(name, [])
+
+
+def run_dag(
+    tasks: Dict[str, Callable[[], Any]],
+    dependencies: Dict[str, Iterable[str]],
+    executor: Executor,
+) -> Dict[str, TaskResult]:
+    """
+    Run tasks on an executor as soon as their dependencies have finished.
+
+    Dependencies that are not part of ``tasks`` are ignored, so a subset of
+    a larger graph can be scheduled. When a task fails, every task that
+    depends on it (directly or transitively) is skipped.
+
+    Args:
+        tasks: Map of task name -> zero-argument callable (must be picklable
+            for process pools, e.g. a functools.partial of a module function)
+        dependencies: Map of task name -> names it must wait for
+        executor: Thread or process pool to run tasks on
+
+    Returns:
+        TaskResult per task, in the order tasks were given. Timestamps are
+        relative to the scheduler start.
+
+    Raises:
+        ValueError: If the dependency graph has a cycle
+    """
+    pending = {
+        name: [dep for dep in dependencies.get(name, []) if dep in tasks]
+        for name in tasks
+    }
+    _check_acyclic(pending)
+
+    origin = time.time()
+    results = {name: TaskResult(name=name) for name in tasks}
+    finished, failed = set(), set()
+    running = {}
+
+    while pending or running:
+        for name in list(pending):
+            deps = pending[name]
+            if any(dep in failed for dep in deps):
+                results[name].skipped = True
+                results[name].error = f"skipped: dependency failed ({', '.join(d for d in deps if d in failed)})"
+                failed.add(name)
+                del pending[name]
+                logger.warning(f"{name}: {results[name].error}")
+            elif all(dep in finished for dep in deps):
+                running[executor.submit(partial(_timed_call, tasks[name]))] = name
+                del pending[name]
+
+        if not running:
+            continue
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            try:
+                start, end, result = future.result()
+                results[name].start = start - origin
+                results[name].end = end - origin
+                results[name].result = result
+                finished.add(name)
+            except Exception as e:
+                results[name].end = time.time() - origin
+                results[name].error = str(e)
+                failed.add(name)
+                logger.error(f"{name} failed: {e}")
+
+    return results
+
+
+def critical_path(results: Dict[str, TaskResult], dependencies: Dict[str, Iterable[str]]) -> List[str]:
+    """
+    Reconstruct the chain of tasks that determined total wall-clock time.
+
+    Starts from the task that finished last and repeatedly steps to the
+    dependency that finished last before it.
+
+    Args:
+        results: Output of run_dag
+        dependencies: Dependency map passed to run_dag
+
+    Returns:
+        Task names from first to last on the critical path
+    """
+    ran = {name: r for name, r in results.items() if not r.skipped and r.error is None}
+    if not ran:
+        return []
+
+    current = max(ran.values(), key=lambda r: r.end).name
+    path = [current]
+    while True:
+        deps = [ran[d] for d in dependencies.get(current, []) if d in ran]
+        if not deps:
+            break
+        current = max(deps, key=lambda r: r.end).name
+        path.append(current)
+
+    return list(reversed(path))
+
+
+def format_timeline(results: Dict[str, TaskResult], width: int = 50) -> str:
+    """
+    Render task timings as a text Gantt chart.
+
+    Args:
+        results: Output of run_dag
+        width: Number of characters for the bar area
+
+    Returns:
+        Multi-line timeline string
+    """
+    total = max((r.end for r in results.values()), default=0.0) or 1.0
+    name_width = max((len(name) for name in results), default=4)
+
+    lines = [f"{'TASK':<{name_width}}  {'START':>8}  {'END':>8}  {'SECS':>8}  TIMELINE"]
+    for r in sorted(results.values(), key=lambda r: (r.start, r.name)):
+        if r.skipped:
+            lines.append(f"{r.name:<{name_width}}  {'-':>8}  {'-':>8}  {'-':>8}  (skipped)")
+            continue
+        begin = int(r.start / total * width)
+        length = max(1, int(round(r.duration / total * width)))
+        bar = " " * begin + ("x" if r.error else "#") * length
+        lines.append(
+            f"{r.name:<{name_width}}  {r.start:>8.2f}  {r.end:>8.2f}  {r.duration:>8.2f}  |{bar:<{width}}|"
+        )
+    return "\n".join(lines)
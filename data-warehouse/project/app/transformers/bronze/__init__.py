@@ -1,11 +1,30 @@
 """Bronze transformers package."""
-from .base_loader import BaseCSVLoader
-from .table_loaders import FIELD_MAPPINGS, MODEL_CLASSES, load_all_tables, load_table
+from .base_loader import CSV_READERS, BaseCSVLoader, CopyCSVLoader
+from .compressed import BackgroundGzipReader, find_csv, open_csv_text
+from .staging import create_staging_schema
+from .table_loaders import (
+    FIELD_MAPPINGS,
+    LOADER_ENGINES,
+    MODEL_CLASSES,
+    TABLE_DEPENDENCIES,
+    load_all_tables,
+    load_table,
+    load_tables_parallel,
+)
 
 __all__ = [
     "BaseCSVLoader",
+    "CopyCSVLoader",
+    "CSV_READERS",
+    "BackgroundGzipReader",
+    "find_csv",
+    "open_csv_text",
+    "create_staging_schema",
     "load_table",
     "load_all_tables",
+    "load_tables_parallel",
     "MODEL_CLASSES",
     "FIELD_MAPPINGS",
+    "LOADER_ENGINES",
+    "TABLE_DEPENDENCIES",
 ]
@@ -0,0 +1,274 @@
+"""
+PyArrow CSV reader for Bronze loading.
+
+An alternative to csv.DictReader plus the per-cell parsers: the input is
+cut into blocks that end on record boundaries, each block is parsed by
+pyarrow.csv on all cores, and every column is converted to its
+FIELD_MAPPINGS type with pyarrow.compute. Batches are pyarrow Tables rather
+than lists of row dicts, and no Python object is created per row or cell.
+
+Because blocks end on record boundaries, the byte offset after every
+batch is known exactly, so checkpoints and resumed loads work as with the
+csv reader.
+
+Values are converted like the per-cell parsers: whitespace is stripped,
+empty values become NULL, and values that cannot be converted become NULL
+and are counted in parse_warnings. Rows with the wrong number of fields
+are passed to a callback (the loader quarantines them, with their byte
+offset and line number) instead of being padded with NULLs. CRLF line
+endings inside values are read as LF, as with the csv reader. Requires
+pyarrow (see requirements.txt).
+"""
+import io
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .parsers import DATE_FORMAT, DATETIME_FORMAT, TRUE_VALUES, parse_warnings
+
+# Initial guess of the CSV bytes per row, refined after every block
+INITIAL_ROW_BYTES = 128
+
+# Upper bound on the bytes read per block
+MAX_BLOCK_BYTES = 256 * 1024 * 1024
+
+# Bytes of a block each pyarrow parsing thread takes on
+PARSE_BLOCK_BYTES = 1024 * 1024
+
+# Larger integers do not fit int64 and would fail the cast
+INT_PATTERN = r"^[+-]?\d{1,18}$"
+FLOAT_PATTERN = r"^[+-]?((\d+\.?\d*|\.\d+)([eE][+-]?\d+)?|inf|infinity|nan)$"
+
+InvalidRowHandler = Callable[[str, int, int, int, Optional[int]], None]
+
+
+def require_pyarrow() -> Tuple[Any, Any, Any]:
+    """
+    Import pyarrow on demand.
+
+    Returns:
+        Tuple of (pyarrow, pyarrow.compute, pyarrow.csv)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError as e:
+        raise ImportError("The arrow CSV reader requires pyarrow: pip install pyarrow") from e
+    return pa, pc, pacsv
+
+
+def last_record_end(buffer: bytes) -> int:
+    """
+    Find the end of the last complete record in a buffer that starts on a record.
+
+    A newline ends a record only if the number of quote characters before
+    it is even; see find_record_boundaries.
+
+    Args:
+        buffer: Bytes starting at a record boundary
+
+    Returns:
+        Offset just past the last record-ending newline, or 0 if none
+    """
+    end = buffer.rfind(b"\n")
+    if end == -1:
+        return 0
+    in_quotes = buffer.count(b'"', 0, end) & 1
+    while in_quotes:
+        previous = buffer.rfind(b"\n", 0, end)
+        if previous == -1:
+            return 0
+        in_quotes ^= buffer.count(b'"', previous, end) & 1
+        end = previous
+    return end + 1
+
+
+def _convert_column(pa, pc, raw, field_type: str):
+    """
+    Convert a column of raw strings to its field type.
+
+    Returns:
+        Tuple of (converted array, number of non-empty values that failed)
+    """
+    stripped = pc.utf8_trim_whitespace(raw)
+    present = pc.not_equal(stripped, "")
+    null = pa.scalar(None, pa.string())
+
+    if field_type == "int":
+        valid = pc.match_substring_regex(stripped, INT_PATTERN)
+        values = pc.cast(pc.if_else(valid, stripped, null), pa.int64())
+    elif field_type == "float":
+        valid = pc.match_substring_regex(stripped, FLOAT_PATTERN, ignore_case=True)
+        values = pc.cast(pc.if_else(valid, stripped, null), pa.float64())
+    elif field_type == "bool":
+        values = pc.if_else(present, pc.is_in(stripped, value_set=pa.array(sorted(TRUE_VALUES))), None)
+    elif field_type == "datetime":
+        values = pc.strptime(stripped, format=DATETIME_FORMAT, unit="s", error_is_null=True)
+    elif field_type == "date":
+        values = pc.cast(pc.strptime(stripped, format=DATE_FORMAT, unit="s", error_is_null=True), pa.date32())
+    else:
+        if pc.any(pc.match_substring(stripped, "\r")).as_py():
+            stripped = pc.replace_substring_regex(stripped, "\r\n?", "\n")
+        return pc.if_else(present, stripped, null), 0
+
+    failed = pc.sum(pc.and_(present, pc.is_null(values))).as_py() or 0
+    return values, failed
+
+
+def convert_table(table, field_mapping: Dict[str, str]):
+    """
+    Convert a table of raw string columns to the types of a field mapping.
+
+    Args:
+        table: pyarrow Table of string columns named after mapped fields
+        field_mapping: Map of field_name -> field_type
+
+    Returns:
+        pyarrow Table with one typed column per input column
+    """
+    pa, pc, _ = require_pyarrow()
+    columns = []
+    for name in table.column_names:
+        field_type = field_mapping[name]
+        values, failed = _convert_column(pa, pc, table[name], field_type)
+        if failed:
+            parse_warnings.warn(
+                field_type, f"Failed to parse {failed} values of {name} as {field_type}", count=failed
+            )
+        columns.append(values)
+    return pa.Table.from_arrays(columns, names=table.column_names)
+
+
+def read_record_blocks(lines, block_bytes: Callable[[], int]) -> Iterator[bytes]:
+    """
+    Read a CountedLines stream in blocks that end on record boundaries.
+
+    lines.position (and lines.lines, if counted) is advanced past each
+    block before it is yielded.
+
+    Args:
+        lines: CountedLines positioned at the start of a record
+        block_bytes: Returns the number of bytes to read next
+
+    Yields:
+        Blocks of complete records
+    """
+    pending = b""
+    while True:
+        size = block_bytes()
+        if lines.end is not None:
+            size = min(size, lines.end - lines.position - len(pending))
+        data = lines.f.read(size) if size > 0 else b""
+        if not data:
+            if pending:
+                lines.position += len(pending)
+                if lines.lines is not None:
+                    lines.lines += pending.count(b"\n")
+                yield pending
+            return
+
+        pending += data
+        cut = last_record_end(pending)
+        if cut:
+            block, pending = pending[:cut], pending[cut:]
+            lines.position += len(block)
+            if lines.lines is not None:
+                lines.lines += block.count(b"\n")
+            yield block
+
+
+def read_arrow_batches(
+    lines,
+    fieldnames: List[str],
+    field_mapping: Dict[str, str],
+    batch_size: int,
+    on_invalid_row: Optional[InvalidRowHandler] = None,
+) -> Iterator[Any]:
+    """
+    Parse a CSV stream into typed pyarrow Tables of about batch_size rows.
+
+    Block sizes are adjusted to the bytes per row seen so far, so batches
+    come close to batch_size rows; each batch ends on a record boundary and
+    lines.position is the offset just past it when it is yielded.
+
+    Args:
+        lines: CountedLines positioned after the header (or at a byte range)
+        fieldnames: CSV header
+        field_mapping: Map of field_name -> field_type
+        batch_size: Target rows per batch
+        on_invalid_row: Called with (row text, expected fields, actual
+            fields, byte offset, lines before the row) for rows with the
+            wrong number of fields, which are skipped; by default they
+            fail the load. The row is located by the first occurrence of
+            its text in its block; if it cannot be found the offset is the
+            block's and the line count is None, which it also is when the
+            load did not start at the beginning of the file
+
+    Yields:
+        pyarrow Tables with the mapped columns present in the header
+    """
+    pa, _, pacsv = require_pyarrow()
+    columns = [name for name in fieldnames if name in field_mapping]
+
+    block, block_start, block_lines = b"", lines.position, lines.lines
+
+    def invalid_row(row) -> str:
+        if on_invalid_row is None:
+            return "error"
+        offset = block.find(row.text.encode("utf-8"))
+        if offset == -1:
+            byte_offset, lines_before = block_start, None
+        else:
+            byte_offset = block_start + offset
+            lines_before = None if block_lines is None else block_lines + block.count(b"\n", 0, offset)
+        on_invalid_row(row.text, row.expected_columns, row.actual_columns, byte_offset, lines_before)
+        return "skip"
+
+    read_options = pacsv.ReadOptions(column_names=fieldnames, use_threads=True, block_size=PARSE_BLOCK_BYTES)
+    parse_options = pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=invalid_row)
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in columns},
+        include_columns=columns,
+        strings_can_be_null=False,
+        quoted_strings_can_be_null=False,
+    )
+
+    row_bytes = INITIAL_ROW_BYTES
+
+    def block_bytes() -> int:
+        return max(1, min(MAX_BLOCK_BYTES, int(batch_size * row_bytes)))
+
+    for block in read_record_blocks(lines, block_bytes):
+        block_start = lines.position - len(block)
+        block_lines = None if lines.lines is None else lines.lines - block.count(b"\n")
+        table = pacsv.read_csv(
+            pa.py_buffer(block),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        if table.num_rows:
+            row_bytes = len(block) / table.num_rows
+            yield convert_table(table, field_mapping)
+
+
+def serialize_arrow_batch(table) -> io.BytesIO:
+    """
+    Write a pyarrow Table as a COPY-compatible CSV buffer without a header.
+
+    NULLs are written as unquoted empty fields, which COPY reads as NULL;
+    the reader never produces empty strings, which would be quoted.
+
+    Args:
+        table: pyarrow Table
+
+    Returns:
+        Buffer positioned at the start
+    """
+    _, _, pacsv = require_pyarrow()
+    buffer = io.BytesIO()
+    pacsv.write_csv(table, buffer, write_options=pacsv.WriteOptions(include_header=False))
+    buffer.seek(0)
+    return buffer
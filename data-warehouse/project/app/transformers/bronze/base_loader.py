@@ -1,12 +1,209 @@
 """Base loader for CSV data ingestion."""
 import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional, Type
+from typing import IO, Any, BinaryIO, Callable, Dict, Generator, Iterator, List, Optional, Tuple, Type
 
 from sqlalchemy.orm import Session
 
-from app.shared import logger
+from app.models.bronze import BronzeRejectedRow
+from app.shared import Quarantine, logger, metrics
+
+from .arrow_reader import read_arrow_batches, serialize_arrow_batch
+from .checkpoints import check_resumable, file_identity, get_checkpoint, save_checkpoint
+from .compressed import is_gzip, open_csv_binary
+from .parsers import coerce_batch, compile_field_mapping, get_parser, parse_warnings
+
+# Files smaller than this are never split across worker processes
+MIN_CHUNK_BYTES = 16 * 1024 * 1024
+
+_SCAN_BLOCK_BYTES = 4 * 1024 * 1024
+
+# CSV reader engines: 'csv' (csv.DictReader and per-cell parsers) or
+# 'arrow' (pyarrow.csv, batches are typed pyarrow Tables)
+CSV_READERS = ("csv", "arrow")
+
+
+def find_record_boundaries(csv_path: Path, targets: List[int]) -> List[int]:
+    """
+    Find the record boundary at or after each target byte offset.
+
+    A newline ends a record only if it is outside a quoted field, i.e. the
+    number of quote characters before it is even (escaped quotes "" count
+    twice and cancel out). Quote parity is tracked from the start of the
+    file, so newlines embedded in quoted values are never split. Only the
+    newlines right after each target are inspected one by one; everything
+    else is counted in bulk.
+
+    Args:
+        csv_path: Path to CSV file
+        targets: Byte offsets to align
+
+    Returns:
+        Sorted, de-duplicated offsets of the byte just past each
+        record-ending newline (targets past the last record are dropped)
+    """
+    pending = sorted(targets)
+    boundaries = []
+    in_quotes = 0
+    base = 0
+
+    with open(csv_path, "rb") as f:
+        while pending:
+            block = f.read(_SCAN_BLOCK_BYTES)
+            if not block:
+                break
+
+            pos = 0
+            end = len(block)
+            while pending:
+                target = pending[0] - base
+                if target >= end:
+                    break
+                if target > pos:
+                    in_quotes ^= block.count(b'"', pos, target) & 1
+                    pos = target
+                newline = block.find(b"\n", pos)
+                if newline == -1:
+                    break
+                in_quotes ^= block.count(b'"', pos, newline) & 1
+                pos = newline + 1
+                if not in_quotes:
+                    boundary = base + pos
+                    boundaries.append(boundary)
+                    while pending and pending[0] < boundary:
+                        pending.pop(0)
+
+            in_quotes ^= block.count(b'"', pos, end) & 1
+            base += end
+
+    return sorted(set(boundaries))
+
+
+def split_csv(csv_path: Path, num_chunks: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a CSV file into byte ranges aligned on record boundaries.
+
+    Args:
+        csv_path: Path to CSV file
+        num_chunks: Desired number of chunks
+
+    Returns:
+        Tuple of (header fieldnames, list of (start, end) byte ranges
+        covering every data row exactly once)
+    """
+    size = os.path.getsize(csv_path)
+    targets = [0] + [size * i // num_chunks for i in range(1, num_chunks)]
+    boundaries = find_record_boundaries(csv_path, targets)
+    if not boundaries:
+        return [], []
+
+    with open(csv_path, "rb") as f:
+        header = f.read(boundaries[0]).decode("utf-8")
+    fieldnames = next(csv.reader(io.StringIO(header)))
+
+    edges = boundaries + ([size] if boundaries[-1] < size else [])
+    return fieldnames, list(zip(edges[:-1], edges[1:]))
+
+
+class CountedLines:
+    """
+    Decoded lines of a binary stream that track their byte offset.
+
+    csv readers pull exactly the lines of one record before returning it,
+    so after each row `position` is the offset just past that record and
+    `lines` the number of lines read so far (None once the count is lost
+    by starting or skipping past the beginning of the file).
+
+    Line endings are translated to "\\n" as a text-mode file would, so
+    CRLF inside quoted values is stored as LF. Records still end only on
+    "\\n", as in split_csv.
+    """
+
+    def __init__(self, f: BinaryIO, position: int = 0, end: Optional[int] = None):
+        """
+        Args:
+            f: Binary stream positioned at `position`
+            position: Offset of the stream's current position
+            end: Stop once this offset is reached (default: end of stream)
+        """
+        self.f = f
+        self.position = position
+        self.end = end
+        self.lines = 0 if position == 0 else None
+
+    def __iter__(self) -> "CountedLines":
+        return self
+
+    def __next__(self) -> str:
+        if self.end is not None and self.position >= self.end:
+            raise StopIteration
+        line = self.f.readline()
+        if not line:
+            raise StopIteration
+        self.position += len(line)
+        if self.lines is not None:
+            self.lines += 1
+        return line.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    def skip_to(self, offset: int):
+        """Move forward to an offset, reading and discarding when the stream cannot seek."""
+        if self.f.seekable():
+            self.f.seek(offset)
+        else:
+            remaining = offset - self.position
+            while remaining > 0:
+                block = self.f.read(min(remaining, _SCAN_BLOCK_BYTES))
+                if not block:
+                    break
+                remaining -= len(block)
+        self.position = offset
+        self.lines = None
+
+
+def _init_worker():
+    """Drop pooled connections inherited from the parent process."""
+    from app.shared.db_engine import engine
+
+    engine.dispose(close=False)
+
+
+def _load_chunk(
+    loader_class: Type["BaseCSVLoader"],
+    model_class: Type,
+    csv_path: Path,
+    batch_size: int,
+    skip_errors: bool,
+    field_mapping: Dict[str, str],
+    byte_range: Tuple[int, int],
+    fieldnames: List[str],
+    vectorized: bool = False,
+    reader: str = "csv",
+) -> Dict[str, Any]:
+    """Load one byte range of a CSV in a worker process with its own session."""
+    from app.shared import get_db
+
+    loader = loader_class(
+        model_class=model_class,
+        csv_path=csv_path,
+        batch_size=batch_size,
+        skip_errors=skip_errors,
+        byte_range=byte_range,
+        fieldnames=fieldnames,
+        vectorized=vectorized,
+        reader=reader,
+    )
+    with get_db() as session:
+        for batch in loader.read_csv_batches(field_mapping):
+            loader.load_batch(session, batch)
+        loader.quarantine.flush(session)
+        session.commit()
+    loader.log_rejections()
+    return loader.get_stats()
 
 
 class BaseCSVLoader:
@@ -22,6 +219,12 @@ class BaseCSVLoader:
         csv_path: Path,
         batch_size: int = 1000,
         skip_errors: bool = True,
+        byte_range: Optional[Tuple[int, int]] = None,
+        fieldnames: Optional[List[str]] = None,
+        vectorized: bool = False,
+        checkpoint: bool = False,
+        resume: bool = False,
+        reader: str = "csv",
     ):
         """
         Initialize CSV loader.
@@ -31,12 +234,43 @@ class BaseCSVLoader:
             csv_path: Path to CSV file
             batch_size: Number of rows per batch
             skip_errors: Whether to skip rows with errors
+            byte_range: Optional (start, end) byte range to read instead of
+                the whole file; must be aligned on record boundaries
+            fieldnames: CSV header, required with byte_range
+            vectorized: Coerce whole batches column by column with pandas
+                instead of parsing cell by cell
+            checkpoint: Record the byte offset and row count of every
+                committed batch in bronze.etl_load_checkpoints (load() only)
+            resume: Continue from the table's last checkpoint instead of
+                the start of the file (implies checkpoint)
+            reader: CSV reader engine, one of CSV_READERS; 'arrow' parses
+                with pyarrow on all cores and yields pyarrow Tables
+
+        Raises:
+            ValueError: If the reader is unknown or combined with vectorized
         """
+        if reader not in CSV_READERS:
+            raise ValueError(f"Unknown CSV reader '{reader}'. Available: {', '.join(CSV_READERS)}")
+        if reader != "csv" and vectorized:
+            raise ValueError("vectorized coercion only applies to the csv reader")
         self.model_class = model_class
         self.csv_path = csv_path
         self.batch_size = batch_size
         self.skip_errors = skip_errors
-        self.stats = {"total": 0, "loaded": 0, "errors": 0}
+        self.byte_range = byte_range
+        self.fieldnames = fieldnames
+        self.vectorized = vectorized
+        self.checkpoint = checkpoint or resume
+        self.resume = resume
+        self.reader = reader
+        self.stats = {"total": 0, "loaded": 0, "errors": 0, "resumed_rows": 0, "rows_per_sec": 0.0}
+        self.start_offset = 0
+        self.batch_end = 0
+        self._identity = None
+        self._lines: Optional[CountedLines] = None
+        self._compiled_mapping = None
+        self._parsers = ()
+        self.quarantine = Quarantine(BronzeRejectedRow.__table__, f"bronze.{model_class.__tablename__}")
 
     def parse_value(self, value: str, field_type: str) -> Any:
         """
@@ -49,31 +283,15 @@ class BaseCSVLoader:
         Returns:
             Parsed value or None
         """
-        # Handle empty strings
-        if not value or value.strip() == "":
-            return None
-
-        try:
-            if field_type == "int":
-                return int(value)
-            elif field_type == "float":
-                return float(value)
-            elif field_type == "bool":
-                return value.strip() in ("1", "true", "True", "TRUE")
-            elif field_type == "datetime":
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            elif field_type == "date":
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            else:  # string
-                return value.strip()
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Failed to parse value '{value}' as {field_type}: {e}")
-            return None
+        return get_parser(field_type)(value)
 
     def transform_row(self, row: Dict[str, str], field_mapping: Dict[str, str]) -> Dict[str, Any]:
         """
         Transform CSV row to model-compatible dictionary.
 
+        The field mapping is compiled into per-column parsers once and
+        reused for every following row.
+
         Args:
             row: Raw CSV row (strings)
             field_mapping: Map of field_name -> field_type
@@ -81,11 +299,55 @@ class BaseCSVLoader:
         Returns:
             Transformed row dict
         """
-        transformed = {}
-        for field_name, field_type in field_mapping.items():
-            if field_name in row:
-                transformed[field_name] = self.parse_value(row[field_name], field_type)
-        return transformed
+        if field_mapping is not self._compiled_mapping:
+            self._compiled_mapping = field_mapping
+            self._parsers = compile_field_mapping(field_mapping)
+
+        return {field_name: parse(row[field_name]) for field_name, parse in self._parsers if field_name in row}
+
+    @contextmanager
+    def open_input(self) -> Iterator[Tuple[List[str], CountedLines]]:
+        """
+        Open the CSV file, or this loader's byte range of it, positioned at the first row to read.
+
+        Reading starts at start_offset (after the header) when it is set.
+        Gzip-compressed files (.csv.gz) are decompressed on a background
+        thread while the rows are parsed; their offsets count decompressed
+        bytes. The stream is also kept as self._lines.
+
+        Yields:
+            Tuple of (header fieldnames, CountedLines stream)
+
+        Raises:
+            ValueError: If a byte range is requested from a compressed file
+        """
+        if self.byte_range is None:
+            with open_csv_binary(self.csv_path) as f:
+                self._lines = CountedLines(f)
+                header = next(self._lines, None)
+                fieldnames = next(csv.reader([header])) if header else []
+                if self.start_offset > self._lines.position:
+                    self._lines.skip_to(self.start_offset)
+                yield fieldnames, self._lines
+        elif is_gzip(self.csv_path):
+            raise ValueError(f"Byte ranges cannot be read from compressed file {self.csv_path}")
+        else:
+            start, end = self.byte_range
+            with open(self.csv_path, "rb") as f:
+                f.seek(start)
+                self._lines = CountedLines(f, start, end)
+                yield self.fieldnames, self._lines
+
+    @contextmanager
+    def open_rows(self) -> Iterator[Iterator[Dict[str, str]]]:
+        """
+        Open the CSV input (see open_input) as a DictReader.
+
+        Yields:
+            Iterator of raw CSV rows
+        """
+        with self.open_input() as (fieldnames, lines):
+            yield csv.DictReader(lines, fieldnames=fieldnames)
 
     def read_csv_batches(
         self, field_mapping: Dict[str, str]
@@ -97,51 +359,132 @@ class BaseCSVLoader:
             field_mapping: Map of field_name -> field_type
 
         Yields:
-            Batches of transformed rows
+            Batches of transformed rows (pyarrow Tables with the arrow reader)
         """
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
 
-        logger.info(f"Reading CSV: {self.csv_path}")
+        if self.byte_range:
+            logger.info(f"Reading CSV: {self.csv_path} bytes {self.byte_range[0]}-{self.byte_range[1]}")
+        else:
+            logger.info(f"Reading CSV: {self.csv_path}")
 
-        with open(self.csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        if self.vectorized:
+            yield from self._read_vectorized_batches(field_mapping)
+            return
+        if self.reader == "arrow":
+            yield from self._read_arrow_batches(field_mapping)
+            return
+
+        with self.open_rows() as reader:
             batch = []
+            lines = self._lines
+            row_start, lines_before = lines.position, lines.lines
 
             for row in reader:
                 self.stats["total"] += 1
 
                 try:
-                    transformed = self.transform_row(row, field_mapping)
-                    batch.append(transformed)
-
-                    if len(batch) >= self.batch_size:
-                        yield batch
-                        batch = []
-
+                    batch.append(self.transform_row(row, field_mapping))
                 except Exception as e:
                     self.stats["errors"] += 1
-                    if self.skip_errors:
-                        logger.warning(f"Error transforming row {self.stats['total']}: {e}")
-                        continue
-                    else:
+                    if not self.skip_errors:
                         raise
+                    self.reject_row(e, row, row_start, lines_before)
+                row_start, lines_before = lines.position, lines.lines
+
+                if len(batch) >= self.batch_size:
+                    self.batch_end = lines.position
+                    yield batch
+                    batch = []
 
             # Yield remaining rows
+            self.batch_end = self._lines.position
             if batch:
                 yield batch
 
+    def _read_vectorized_batches(
+        self, field_mapping: Dict[str, str]
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Read raw rows in batches and coerce each batch with coerce_batch."""
+        with self.open_rows() as reader:
+            raw_batch = []
+            for row in reader:
+                self.stats["total"] += 1
+                raw_batch.append(row)
+                if len(raw_batch) >= self.batch_size:
+                    self.batch_end = self._lines.position
+                    yield coerce_batch(raw_batch, field_mapping)
+                    raw_batch = []
+
+            self.batch_end = self._lines.position
+            if raw_batch:
+                yield coerce_batch(raw_batch, field_mapping)
+
+    def _read_arrow_batches(self, field_mapping: Dict[str, str]) -> Generator[Any, None, None]:
+        """Parse typed pyarrow Tables with read_arrow_batches, quarantining malformed rows."""
+
+        def reject_malformed(text: str, expected: int, actual: int, byte_offset: int, lines_before: Optional[int]):
+            self.stats["total"] += 1
+            self.stats["errors"] += 1
+            error = ValueError(f"Expected {expected} fields, got {actual}")
+            if not self.skip_errors:
+                raise error
+            self.reject_row(error, {"row": text}, byte_offset, lines_before)
+
+        with self.open_input() as (fieldnames, lines):
+            for batch in read_arrow_batches(lines, fieldnames, field_mapping, self.batch_size, reject_malformed):
+                self.stats["total"] += batch.num_rows
+                self.batch_end = lines.position
+                yield batch
+            self.batch_end = lines.position
+
+    def reject_row(
+        self,
+        error: Exception,
+        row: Dict[str, Any],
+        byte_offset: Optional[int] = None,
+        lines_before: Optional[int] = None,
+    ):
+        """
+        Quarantine a row; it is written to bronze.etl_rejected_rows with the next batch.
+
+        Args:
+            error: Why the row was rejected
+            row: Row as read from the CSV
+            byte_offset: Offset the row starts at, if known
+            lines_before: Lines of the file before the row, if known
+        """
+        self.quarantine.reject(
+            error,
+            row,
+            table_name=self.model_class.__tablename__,
+            line_number=None if lines_before is None else lines_before + 1,
+            byte_offset=byte_offset,
+        )
+
+    def log_rejections(self):
+        """Log summaries of the rows quarantined and values that failed to parse."""
+        self.quarantine.summary()
+        parse_warnings.summary(f"Unparseable values loaded as NULL into bronze.{self.model_class.__tablename__}")
+
     def load_batch(self, session: Session, batch: List[Dict[str, Any]]) -> int:
         """
         Load a batch of rows into database.
 
+        Rows quarantined since the previous batch are written in the same
+        transaction.
+
         Args:
             session: SQLAlchemy session
-            batch: List of transformed row dicts
+            batch: List of transformed row dicts, or a pyarrow Table
 
         Returns:
             Number of rows loaded
         """
+        if hasattr(batch, "to_pylist"):
+            batch = batch.to_pylist()
+
         loaded = 0
         for row in batch:
             try:
@@ -150,14 +493,13 @@ class BaseCSVLoader:
                 loaded += 1
             except Exception as e:
                 self.stats["errors"] += 1
-                if self.skip_errors:
-                    logger.warning(f"Error loading row: {e}")
-                    session.rollback()
-                    continue
-                else:
+                if not self.skip_errors:
                     raise
+                self.reject_row(e, row)
 
         try:
+            self.quarantine.flush(session)
+            self.write_checkpoint(session, loaded)
             session.commit()
             self.stats["loaded"] += loaded
             return loaded
@@ -166,10 +508,73 @@ class BaseCSVLoader:
             logger.error(f"Batch commit failed: {e}")
             raise
 
+    def start_checkpoints(self, session: Session) -> bool:
+        """
+        Prepare checkpointing, positioning a resumed load after its last commit.
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            False if a resumed file was already loaded completely
+
+        Raises:
+            ValueError: If resuming and the file changed since the checkpoint
+        """
+        table_name = self.model_class.__tablename__
+        self._identity = file_identity(self.csv_path)
+        if not self.resume:
+            return True
+
+        checkpoint = get_checkpoint(session, table_name)
+        if checkpoint is None:
+            logger.info(f"No checkpoint for {table_name}; loading from the start")
+            return True
+
+        check_resumable(checkpoint, self.csv_path, self._identity)
+        self.stats["resumed_rows"] = checkpoint.rows_loaded
+        if checkpoint.completed:
+            logger.info(f"{self.csv_path.name} was already loaded completely ({checkpoint.rows_loaded:,} rows)")
+            return False
+
+        self.start_offset = checkpoint.byte_offset
+        logger.info(
+            f"Resuming {table_name} at byte {checkpoint.byte_offset:,} "
+            f"after {checkpoint.rows_loaded:,} committed rows"
+        )
+        return True
+
+    def write_checkpoint(self, session: Session, loaded: int, completed: bool = False):
+        """
+        Record progress up to the end of the current batch, in the batch's transaction.
+
+        Does nothing unless start_checkpoints() was called.
+
+        Args:
+            session: SQLAlchemy session
+            loaded: Rows of the current batch about to be committed
+            completed: Whether the whole file has been loaded
+        """
+        if self._identity is None:
+            return
+        save_checkpoint(
+            session,
+            self.model_class.__tablename__,
+            self.csv_path,
+            self._identity,
+            self.batch_end,
+            self.stats["resumed_rows"] + self.stats["loaded"] + loaded,
+            completed,
+        )
+
     def load(self, session: Session, field_mapping: Dict[str, str]):
         """
         Execute full CSV load process.
 
+        With checkpointing, every batch commits its byte offset along with
+        its rows, and a resumed load skips the part of the file already in
+        the table.
+
         Args:
             session: SQLAlchemy session
             field_mapping: Map of field_name -> field_type
@@ -178,21 +583,190 @@ class BaseCSVLoader:
         start_time = datetime.now()
 
         try:
-            for batch in self.read_csv_batches(field_mapping):
-                loaded = self.load_batch(session, batch)
-                logger.debug(f"Loaded batch: {loaded} rows")
+            with metrics.stage(f"bronze.{self.model_class.__tablename__}") as stage:
+                pending = self.start_checkpoints(session) if self.checkpoint else True
+                if pending:
+                    for batch in self.read_csv_batches(field_mapping):
+                        loaded = self.load_batch(session, batch)
+                        logger.debug(f"Loaded batch: {loaded} rows")
+                    self.quarantine.flush(session)
+                    self.write_checkpoint(session, 0, completed=True)
+                    session.commit()
+                stage.count(rows=self.stats["loaded"], nbytes=self.input_bytes())
+            self.log_rejections()
 
             duration = (datetime.now() - start_time).total_seconds()
+            self.stats["rows_per_sec"] = round(self.stats["loaded"] / duration, 2) if duration > 0 else 0.0
             logger.info(
                 f"Load complete for {self.model_class.__tablename__}: "
                 f"{self.stats['loaded']}/{self.stats['total']} rows in {duration:.2f}s "
-                f"({self.stats['errors']} errors)"
+                f"({self.stats['errors']} errors, {self.stats['rows_per_sec']:.0f} rows/sec)"
             )
 
         except Exception as e:
             logger.error(f"Load failed for {self.model_class.__tablename__}: {e}")
             raise
 
-    def get_stats(self) -> Dict[str, int]:
+    def load_parallel(self, field_mapping: Dict[str, str], workers: int):
+        """
+        Load the CSV by splitting it into byte-range chunks across processes.
+
+        Each chunk is parsed and loaded by its own worker process with its
+        own database session; per-chunk statistics are merged into this
+        loader's stats. Small files fall back to a single chunk, and
+        compressed files, which cannot be split, are loaded sequentially.
+
+        Args:
+            field_mapping: Map of field_name -> field_type
+            workers: Number of worker processes
+        """
+        if not self.csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+
+        if is_gzip(self.csv_path):
+            from app.shared import get_db
+
+            logger.info(f"{self.csv_path.name} is compressed and cannot be split; loading it sequentially")
+            with get_db() as session:
+                self.load(session, field_mapping)
+            return
+
+        table_name = self.model_class.__tablename__
+        size = os.path.getsize(self.csv_path)
+        num_chunks = max(1, min(workers, size // MIN_CHUNK_BYTES))
+        fieldnames, ranges = split_csv(self.csv_path, num_chunks)
+
+        logger.info(f"Starting parallel load for {table_name}: {len(ranges)} chunks, {workers} workers")
+        start_time = datetime.now()
+
+        with metrics.stage(f"bronze.{table_name}") as stage:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [
+                    executor.submit(
+                        _load_chunk,
+                        type(self),
+                        self.model_class,
+                        self.csv_path,
+                        self.batch_size,
+                        self.skip_errors,
+                        field_mapping,
+                        byte_range,
+                        fieldnames,
+                        self.vectorized,
+                        self.reader,
+                    )
+                    for byte_range in ranges
+                ]
+                for future in futures:
+                    chunk_stats = future.result()
+                    for key in ("total", "loaded", "errors"):
+                        self.stats[key] += chunk_stats[key]
+            stage.count(rows=self.stats["loaded"], nbytes=size)
+
+        duration = (datetime.now() - start_time).total_seconds()
+        self.stats["rows_per_sec"] = round(self.stats["loaded"] / duration, 2) if duration > 0 else 0.0
+        logger.info(
+            f"Load complete for {table_name}: "
+            f"{self.stats['loaded']}/{self.stats['total']} rows in {duration:.2f}s "
+            f"({self.stats['errors']} errors, {self.stats['rows_per_sec']:.0f} rows/sec)"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
         """Get loading statistics."""
         return self.stats.copy()
+
+    def input_bytes(self) -> int:
+        """Size of the CSV input this loader reads (its byte range, if any)."""
+        if self.byte_range is not None:
+            return self.byte_range[1] - self.byte_range[0]
+        return os.path.getsize(self.csv_path) if self.csv_path.exists() else 0
+
+
+class CopyCSVLoader(BaseCSVLoader):
+    """
+    CSV loader that streams batches into PostgreSQL with COPY FROM STDIN.
+
+    Rows are parsed and type-coerced exactly like BaseCSVLoader, but each
+    batch is serialized to an in-memory CSV buffer and sent with a single
+    COPY instead of building one ORM object per row. A COPY batch is
+    all-or-nothing: a row rejected by the database fails the whole batch.
+    """
+
+    def copy_statement(self, columns: List[str], schema: Optional[str] = None) -> str:
+        """
+        Build the COPY statement for the target Bronze table.
+
+        Args:
+            columns: Column names, in the order they appear in the buffer
+            schema: Schema to load into instead of the model's (e.g. staging)
+
+        Returns:
+            COPY ... FROM STDIN SQL string
+        """
+        table = self.model_class.__table__
+        return (
+            f"COPY {schema or table.schema}.{table.name} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv)"
+        )
+
+    def serialize_batch(self, batch: List[Dict[str, Any]], columns: List[str]) -> IO:
+        """
+        Serialize transformed rows to a COPY-compatible CSV buffer.
+
+        None is written as an unquoted empty field, which COPY reads as NULL.
+        pyarrow Tables are written by pyarrow.csv without building rows.
+
+        Args:
+            batch: List of transformed row dicts, or a pyarrow Table
+            columns: Column order for the buffer
+
+        Returns:
+            Buffer positioned at the start
+        """
+        if hasattr(batch, "to_pylist"):
+            return serialize_arrow_batch(batch.select(columns))
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for row in batch:
+            writer.writerow([row.get(column) for column in columns])
+        buffer.seek(0)
+        return buffer
+
+    def load_batch(self, session: Session, batch: List[Dict[str, Any]]) -> int:
+        """
+        Load a batch of rows with COPY FROM STDIN.
+
+        Args:
+            session: SQLAlchemy session
+            batch: List of transformed row dicts, or a pyarrow Table
+
+        Returns:
+            Number of rows loaded
+        """
+        if not len(batch):
+            return 0
+
+        columns = batch.column_names if hasattr(batch, "column_names") else list(batch[0].keys())
+        buffer = self.serialize_batch(batch, columns)
+
+        try:
+            connection = session.connection()
+            # COPY is raw SQL, so apply the session's schema_translate_map by hand
+            statement = self.copy_statement(columns, connection.schema_for_object(self.model_class.__table__))
+            cursor = connection.connection.cursor()
+            try:
+                with metrics.database_call():
+                    cursor.copy_expert(statement, buffer)
+            finally:
+                cursor.close()
+            self.quarantine.flush(session)
+            self.write_checkpoint(session, len(batch))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"COPY batch failed: {e}")
+            raise
+
+        self.stats["loaded"] += len(batch)
+        return len(batch)
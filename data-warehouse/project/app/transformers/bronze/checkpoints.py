@@ -0,0 +1,111 @@
+"""Byte-offset checkpoints for resumable bronze CSV loads."""
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.bronze import BronzeLoadCheckpoint
+
+CHECKPOINT_TABLE = BronzeLoadCheckpoint.__table__.fullname
+
+
+def file_identity(path: Path) -> Tuple[int, int]:
+    """
+    Size and modification time identifying one version of a file.
+
+    Returns:
+        (size in bytes, mtime in nanoseconds)
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_checkpoint(session: Session, table_name: str) -> Optional[BronzeLoadCheckpoint]:
+    """
+    Latest checkpoint of a bronze table's load, if any.
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Bronze table name (e.g. 'labevents')
+    """
+    return session.get(BronzeLoadCheckpoint, table_name)
+
+
+def save_checkpoint(
+    session: Session,
+    table_name: str,
+    csv_path: Path,
+    identity: Tuple[int, int],
+    byte_offset: int,
+    rows_loaded: int,
+    completed: bool = False,
+):
+    """
+    Record load progress in the caller's transaction.
+
+    Call right before committing a batch so the checkpoint and the rows it
+    covers are committed (or rolled back) together.
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Bronze table name
+        csv_path: File being loaded
+        identity: file_identity() of the file when the load started
+        byte_offset: Offset just past the last row of the batch
+        rows_loaded: Rows committed including this batch
+        completed: Whether the whole file has been loaded
+    """
+    session.execute(
+        text(f"""
+            INSERT INTO {CHECKPOINT_TABLE}
+                (table_name, file_path, file_size, file_mtime_ns, byte_offset, rows_loaded, completed, updated_at)
+            VALUES
+                (:table_name, :file_path, :file_size, :file_mtime_ns, :byte_offset, :rows_loaded, :completed,
+                 CURRENT_TIMESTAMP)
+            ON CONFLICT (table_name) DO UPDATE SET
+                file_path = EXCLUDED.file_path,
+                file_size = EXCLUDED.file_size,
+                file_mtime_ns = EXCLUDED.file_mtime_ns,
+                byte_offset = EXCLUDED.byte_offset,
+                rows_loaded = EXCLUDED.rows_loaded,
+                completed = EXCLUDED.completed,
+                updated_at = CURRENT_TIMESTAMP
+        """),
+        {
+            "table_name": table_name,
+            "file_path": str(csv_path),
+            "file_size": identity[0],
+            "file_mtime_ns": identity[1],
+            "byte_offset": byte_offset,
+            "rows_loaded": rows_loaded,
+            "completed": completed,
+        },
+    )
+
+
+def delete_checkpoint(session: Session, table_name: str):
+    """
+    Forget a bronze table's load progress, in the caller's transaction.
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Bronze table name
+    """
+    session.execute(text(f"DELETE FROM {CHECKPOINT_TABLE} WHERE table_name = :table_name"), {"table_name": table_name})
+
+
+def check_resumable(checkpoint: BronzeLoadCheckpoint, csv_path: Path, identity: Tuple[int, int]):
+    """
+    Make sure a checkpoint was taken from this exact file.
+
+    Raises:
+        ValueError: If the file was replaced or changed since the checkpoint
+    """
+    if (checkpoint.file_size, checkpoint.file_mtime_ns) != identity or Path(checkpoint.file_path).name != csv_path.name:
+        raise ValueError(
+            f"Checkpoint for {checkpoint.table_name} was taken from {checkpoint.file_path} "
+            f"({checkpoint.file_size} bytes); {csv_path} has changed since. "
+            f"Truncate the table and load without --resume."
+        )
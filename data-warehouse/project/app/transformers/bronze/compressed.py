@@ -0,0 +1,177 @@
+"""Streaming input for gzip-compressed CSV files (the MIMIC-III .csv.gz distribution)."""
+import gzip
+import io
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, TextIO
+
+GZIP_SUFFIX = ".gz"
+
+# Decompressed bytes handed from the decompression thread to the parser at a time
+DECOMPRESS_BLOCK_BYTES = 1024 * 1024
+
+# Decompressed blocks buffered ahead of the parser; bounds memory per open file
+DECOMPRESS_QUEUE_BLOCKS = 16
+
+_END = object()
+
+
+def is_gzip(path: Path) -> bool:
+    """Whether a path names a gzip-compressed file."""
+    return Path(path).suffix == GZIP_SUFFIX
+
+
+def find_csv(csv_dir: Path, table_name: str) -> Path:
+    """
+    Locate a table's CSV file, plain or gzip-compressed.
+
+    <TABLE>.csv is preferred when both exist; when neither does, the plain
+    path is returned so the caller reports it as missing.
+
+    Args:
+        csv_dir: Directory containing CSV files
+        table_name: Table name (e.g. 'LABEVENTS')
+
+    Returns:
+        Path to <TABLE>.csv or <TABLE>.csv.gz
+    """
+    plain = csv_dir / f"{table_name}.csv"
+    compressed = plain.with_name(plain.name + GZIP_SUFFIX)
+    if not plain.exists() and compressed.exists():
+        return compressed
+    return plain
+
+
+class BackgroundGzipReader(io.RawIOBase):
+    """
+    Raw binary stream of a gzip file decompressed on a background thread.
+
+    The thread inflates the file block by block into a bounded queue that
+    readinto() drains, so decompression overlaps with CSV parsing (zlib
+    releases the GIL while inflating) and at most max_blocks decompressed
+    blocks are held in memory. Nothing is written to disk. Errors raised
+    while decompressing, such as a truncated file, are re-raised by the
+    reader.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        block_bytes: int = DECOMPRESS_BLOCK_BYTES,
+        max_blocks: int = DECOMPRESS_QUEUE_BLOCKS,
+    ):
+        """
+        Start decompressing a file.
+
+        Args:
+            path: Path to a .gz file
+            block_bytes: Decompressed bytes per queued block
+            max_blocks: Blocks buffered ahead of the reader
+        """
+        super().__init__()
+        self.path = Path(path)
+        self._blocks: queue.Queue = queue.Queue(maxsize=max_blocks)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._decompress,
+            args=(block_bytes,),
+            name=f"gunzip-{self.path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _decompress(self, block_bytes: int):
+        try:
+            with gzip.open(self.path, "rb") as f:
+                while not self._stop.is_set():
+                    block = f.read(block_bytes)
+                    if not block:
+                        break
+                    self._put(block)
+            self._put(_END)
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        # Time out periodically so close() can stop a thread blocked on a full queue
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if self._finished:
+                return 0
+            item = self._blocks.get()
+            if item is _END:
+                self._finished = True
+                return 0
+            if isinstance(item, Exception):
+                self._finished = True
+                raise item
+            self._pending = memoryview(item)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        """Stop the decompression thread and release the file."""
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+        super().close()
+
+
+@contextmanager
+def open_csv_binary(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a plain or gzip-compressed CSV file for reading as bytes.
+
+    Compressed files give a non-seekable stream of the decompressed bytes.
+
+    Args:
+        path: Path to a .csv or .csv.gz file
+
+    Yields:
+        Binary stream of the decompressed CSV
+    """
+    if not is_gzip(path):
+        with open(path, "rb") as f:
+            yield f
+        return
+
+    with io.BufferedReader(BackgroundGzipReader(path), DECOMPRESS_BLOCK_BYTES) as f:
+        yield f
+
+
+@contextmanager
+def open_csv_text(path: Path) -> Iterator[TextIO]:
+    """
+    Open a plain or gzip-compressed CSV file for reading as text.
+
+    Args:
+        path: Path to a .csv or .csv.gz file
+
+    Yields:
+        Text stream of the decompressed CSV
+    """
+    if not is_gzip(path):
+        with open(path, "r", encoding="utf-8") as f:
+            yield f
+        return
+
+    raw = BackgroundGzipReader(path)
+    with io.TextIOWrapper(io.BufferedReader(raw, DECOMPRESS_BLOCK_BYTES), encoding="utf-8") as f:
+        yield f
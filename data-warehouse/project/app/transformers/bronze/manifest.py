@@ -0,0 +1,179 @@
+"""Source file fingerprints for skipping unchanged bronze reloads."""
+import hashlib
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.bronze import BronzeFileManifest
+
+MANIFEST_TABLE = BronzeFileManifest.__table__.fullname
+
+# Bytes hashed at the start, middle and end of a file for its sample hash
+SAMPLE_BLOCK_BYTES = 1024 * 1024
+
+_READ_BYTES = 8 * 1024 * 1024
+
+
+def new_hash():
+    """
+    Hash object for file fingerprints.
+
+    xxh3-128 when the optional xxhash package is installed (several times
+    faster than hashlib), BLAKE2b otherwise. Digests are prefixed with the
+    algorithm, so fingerprints taken with the other one never match.
+    """
+    try:
+        import xxhash
+    except ImportError:
+        return hashlib.blake2b(digest_size=16)
+    return xxhash.xxh3_128()
+
+
+def _digest(hasher) -> str:
+    name = getattr(hasher, "name", None) or type(hasher).__name__
+    return f"{name.lower()}:{hasher.hexdigest()}"
+
+
+def sample_hash(path: Path, size: int) -> str:
+    """
+    Hash a file's size and its first, middle and last blocks.
+
+    Reads at most 3 * SAMPLE_BLOCK_BYTES however large the file is.
+
+    Args:
+        path: File to fingerprint
+        size: Its size in bytes
+    """
+    hasher = new_hash()
+    hasher.update(str(size).encode("ascii"))
+    offsets = sorted({0, max(0, (size - SAMPLE_BLOCK_BYTES) // 2), max(0, size - SAMPLE_BLOCK_BYTES)})
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            hasher.update(f.read(SAMPLE_BLOCK_BYTES))
+    return _digest(hasher)
+
+
+def content_hash(path: Path) -> str:
+    """Hash the whole file."""
+    hasher = new_hash()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_READ_BYTES)
+            if not block:
+                break
+            hasher.update(block)
+    return _digest(hasher)
+
+
+def hash_in_background(path: Path) -> Future:
+    """
+    Start hashing a whole file on a background thread.
+
+    Hashing releases the GIL on large blocks, so it overlaps with loading
+    the same file.
+
+    Returns:
+        Future resolving to content_hash(path)
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"hash-{Path(path).name}")
+    future = executor.submit(content_hash, path)
+    executor.shutdown(wait=False)
+    return future
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Cheap identity of one version of a source file."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    sample_hash: str
+
+    @classmethod
+    def of(cls, path: Path) -> "FileFingerprint":
+        """
+        Fingerprint a file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = os.stat(path)
+        return cls(Path(path), stat.st_size, stat.st_mtime_ns, sample_hash(path, stat.st_size))
+
+
+def get_manifest(session: Session, table_name: str) -> Optional[BronzeFileManifest]:
+    """
+    Manifest entry of the file a bronze table was last reloaded from, if any.
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Bronze table name (e.g. 'labevents')
+    """
+    return session.get(BronzeFileManifest, table_name)
+
+
+def is_unchanged(entry: BronzeFileManifest, fingerprint: FileFingerprint) -> bool:
+    """
+    Whether a file still has the contents recorded in the manifest.
+
+    The size and sampled blocks must match. If the modification time
+    matches too the file is taken as unchanged; if only the time differs
+    (the file was touched or copied again), the whole file is hashed and
+    compared with the recorded content hash.
+
+    Args:
+        entry: Manifest entry of the table
+        fingerprint: Fingerprint of the file on disk
+    """
+    if (entry.file_size, entry.sample_hash) != (fingerprint.size, fingerprint.sample_hash):
+        return False
+    if entry.file_mtime_ns == fingerprint.mtime_ns:
+        return True
+    return entry.content_hash is not None and content_hash(fingerprint.path) == entry.content_hash
+
+
+def save_manifest(
+    session: Session,
+    table_name: str,
+    fingerprint: FileFingerprint,
+    full_hash: Optional[str],
+):
+    """
+    Record the file behind a table's contents, in the caller's transaction.
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Bronze table name
+        fingerprint: Fingerprint of the loaded file
+        full_hash: content_hash() of the loaded file
+    """
+    session.execute(
+        text(f"""
+            INSERT INTO {MANIFEST_TABLE}
+                (table_name, file_path, file_size, file_mtime_ns, sample_hash, content_hash, loaded_at)
+            VALUES
+                (:table_name, :file_path, :file_size, :file_mtime_ns, :sample_hash, :content_hash, CURRENT_TIMESTAMP)
+            ON CONFLICT (table_name) DO UPDATE SET
+                file_path = EXCLUDED.file_path,
+                file_size = EXCLUDED.file_size,
+                file_mtime_ns = EXCLUDED.file_mtime_ns,
+                sample_hash = EXCLUDED.sample_hash,
+                content_hash = EXCLUDED.content_hash,
+                loaded_at = CURRENT_TIMESTAMP
+        """),
+        {
+            "table_name": table_name,
+            "file_path": str(fingerprint.path),
+            "file_size": fingerprint.size,
+            "file_mtime_ns": fingerprint.mtime_ns,
+            "sample_hash": fingerprint.sample_hash,
+            "content_hash": full_hash,
+        },
+    )
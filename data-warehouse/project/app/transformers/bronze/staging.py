@@ -0,0 +1,109 @@
+"""
+Staging copies of bronze tables for truncate-and-swap reloads.
+
+A changed source file is loaded into an empty copy of its table in the
+bronze_staging schema, created without secondary indexes, while readers
+keep querying the live table. The indexes are then built in one pass, and
+a single transaction drops the live table and moves the copy (and its
+partitions) into bronze, so readers see either the old contents or the
+new, never a half-loaded table.
+"""
+from typing import List
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from app.models.partitioning import is_partitioned, partitions
+from app.shared.bulk_load import secondary_indexes
+
+STAGING_SCHEMA = "bronze_staging"
+
+
+def staging_bind(bind: Engine) -> Engine:
+    """
+    Engine that reads and writes bronze tables in the staging schema.
+
+    Statements written as literal SQL (checkpoints, quarantine, manifest)
+    are not redirected.
+    """
+    return bind.execution_options(schema_translate_map={"bronze": STAGING_SCHEMA})
+
+
+def create_staging_schema(bind: Engine):
+    """
+    Create the staging schema.
+
+    Called once before any reload starts: concurrent CREATE SCHEMA IF NOT
+    EXISTS statements can fail with a unique violation.
+
+    Args:
+        bind: Engine of the warehouse
+    """
+    with bind.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {STAGING_SCHEMA}"))
+
+
+def create_staging_table(bind: Engine, table: Table):
+    """
+    Create an empty staging copy of a bronze table, replacing any left by an earlier failed reload.
+
+    Primary key and unique indexes are kept so loads behave as on the live
+    table; secondary indexes are left for build_staging_indexes.
+
+    Args:
+        bind: Engine of the warehouse
+        table: Live bronze table
+    """
+    with bind.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {STAGING_SCHEMA}.{table.name}"))
+        staged = conn.execution_options(schema_translate_map={"bronze": STAGING_SCHEMA})
+        table.create(staged)
+        for index in secondary_indexes([table]):
+            staged.execute(DropIndex(index))
+
+
+def build_staging_indexes(bind: Engine, table: Table):
+    """Build the secondary indexes of a loaded staging table and analyze it."""
+    with staging_bind(bind).begin() as conn:
+        for index in secondary_indexes([table]):
+            conn.execute(CreateIndex(index))
+        conn.execute(text(f"ANALYZE {STAGING_SCHEMA}.{table.name}"))
+
+
+def swap_statements(table: Table) -> List[str]:
+    """
+    SQL replacing a live bronze table with its staging copy.
+
+    Index and constraint names are per schema, so the moved copy keeps the
+    names the live table had.
+
+    Args:
+        table: Live bronze table
+
+    Returns:
+        Statements to run in one transaction
+    """
+    staged = f"{STAGING_SCHEMA}.{table.name}"
+    statements = [
+        f"DROP TABLE IF EXISTS {table.fullname}",
+        f"ALTER TABLE {staged} SET SCHEMA {table.schema}",
+    ]
+    if is_partitioned(table):
+        statements += [f"ALTER TABLE {partition.name(staged)} SET SCHEMA {table.schema}" for partition in partitions()]
+    return statements
+
+
+def swap_staging_table(session: Session, table: Table):
+    """
+    Replace a live bronze table with its staging copy in the session's transaction.
+
+    Nothing is visible to other sessions until the caller commits.
+
+    Args:
+        session: SQLAlchemy session on the live schema
+        table: Live bronze table
+    """
+    for statement in swap_statements(table):
+        session.execute(text(statement))
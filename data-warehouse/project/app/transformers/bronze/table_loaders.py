@@ -1,6 +1,8 @@
 """Table-specific loaders for Bronze layer."""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -22,9 +24,13 @@ from app.models.bronze import (
     BronzeServices,
     BronzeTransfers,
 )
-from app.shared import logger
+from app.shared import TaskResult, logger, run_dag
 
-from .base_loader import BaseCSVLoader
+from .base_loader import BaseCSVLoader, CopyCSVLoader, _init_worker
+from .checkpoints import delete_checkpoint, file_identity, save_checkpoint
+from .compressed import find_csv
+from .manifest import FileFingerprint, get_manifest, hash_in_background, is_unchanged, save_manifest
+from .staging import STAGING_SCHEMA, build_staging_indexes, create_staging_table, staging_bind, swap_staging_table
 
 
 # Field mappings for each table (field_name -> field_type)
@@ -307,50 +313,202 @@ MODEL_CLASSES = {
     "NOTEEVENTS": BronzeNoteEvents,
 }
 
+# Load order constraints (table -> tables that must be loaded first).
+# Dictionaries and core entities come before the events that reference them.
+TABLE_DEPENDENCIES = {
+    "PATIENTS": [],
+    "CAREGIVERS": [],
+    "D_ITEMS": [],
+    "D_LABITEMS": [],
+    "ADMISSIONS": ["PATIENTS"],
+    "ICUSTAYS": ["ADMISSIONS"],
+    "SERVICES": ["ADMISSIONS"],
+    "TRANSFERS": ["ADMISSIONS"],
+    "PRESCRIPTIONS": ["ADMISSIONS"],
+    "MICROBIOLOGYEVENTS": ["ADMISSIONS"],
+    "NOTEEVENTS": ["ADMISSIONS", "CAREGIVERS"],
+    "LABEVENTS": ["ADMISSIONS", "D_LABITEMS"],
+    "INPUTEVENTS_CV": ["ICUSTAYS", "D_ITEMS", "CAREGIVERS"],
+    "INPUTEVENTS_MV": ["ICUSTAYS", "D_ITEMS", "CAREGIVERS"],
+    "OUTPUTEVENTS": ["ICUSTAYS", "D_ITEMS", "CAREGIVERS"],
+    "PROCEDUREEVENTS_MV": ["ICUSTAYS", "D_ITEMS", "CAREGIVERS"],
+}
+
+# Loading engines (engine name -> loader class)
+LOADER_ENGINES = {
+    "orm": BaseCSVLoader,
+    "copy": CopyCSVLoader,
+}
+
+
+def reload_if_changed(session: Session, loader: BaseCSVLoader, field_mapping: Dict[str, str]) -> Dict[str, int]:
+    """
+    Replace a bronze table's contents with its CSV, unless the CSV is unchanged.
+
+    The file is compared with the manifest entry of the table's last
+    reload. A changed file is loaded into a staging copy of the table,
+    hashed in full on a background thread meanwhile, and swapped in; the
+    swap, the new manifest entry and a completed checkpoint are committed
+    together. The staging schema must exist (see create_staging_schema).
+
+    Args:
+        session: SQLAlchemy session
+        loader: Loader for the table (without checkpointing)
+        field_mapping: Map of field_name -> field_type
+
+    Returns:
+        Loading statistics, with "unchanged" telling whether the load was skipped
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+    """
+    table = loader.model_class.__table__
+    fingerprint = FileFingerprint.of(loader.csv_path)
+    entry = get_manifest(session, table.name)
+    if entry is not None:
+        session.expunge(entry)
+    # End the read's transaction: hashing and loading the file take a while
+    session.commit()
+
+    if entry is not None and is_unchanged(entry, fingerprint):
+        if entry.file_mtime_ns != fingerprint.mtime_ns:
+            save_manifest(session, table.name, fingerprint, entry.content_hash)
+            session.commit()
+        logger.info(f"{loader.csv_path.name} is unchanged since {entry.loaded_at}; skipping {table.fullname}")
+        return {**loader.get_stats(), "unchanged": True}
+
+    logger.info(f"{loader.csv_path.name} changed; reloading {table.fullname} through {STAGING_SCHEMA}")
+    full_hash = hash_in_background(loader.csv_path)
+    bind = session.get_bind()
+    create_staging_table(bind, table)
+    with Session(bind=staging_bind(bind)) as staging:
+        loader.load(staging, field_mapping)
+    build_staging_indexes(bind, table)
+
+    swap_staging_table(session, table)
+    save_manifest(session, table.name, fingerprint, full_hash.result())
+    save_checkpoint(
+        session,
+        table.name,
+        loader.csv_path,
+        (fingerprint.size, fingerprint.mtime_ns),
+        loader.batch_end,
+        loader.stats["loaded"],
+        completed=True,
+    )
+    session.commit()
+    logger.info(f"Swapped the reloaded {table.fullname} in")
+    return {**loader.get_stats(), "unchanged": False}
+
 
 def load_table(
     session: Session,
     table_name: str,
     csv_dir: Path,
     batch_size: int = 1000,
+    engine: str = "orm",
+    chunk_workers: int = 1,
+    vectorized: bool = False,
+    resume: bool = False,
+    skip_unchanged: bool = False,
+    reader: str = "csv",
 ) -> Dict[str, int]:
     """
     Load a specific table from CSV.
 
+    Sequential loads checkpoint every committed batch, so an interrupted
+    load can continue with resume=True. Byte-range chunked loads only
+    record a completed checkpoint at the end; an interrupted one must be
+    truncated and reloaded. With skip_unchanged the table is
+    instead replaced wholesale, and only if its CSV changed since the last
+    such reload (see reload_if_changed).
+
     Args:
         session: SQLAlchemy session
         table_name: Name of table to load (e.g., 'PATIENTS')
-        csv_dir: Directory containing CSV files
+        csv_dir: Directory containing <TABLE>.csv or <TABLE>.csv.gz files
         batch_size: Batch size for loading
+        engine: Loading engine ('orm' or 'copy')
+        chunk_workers: Worker processes for splitting a large CSV into
+            byte-range chunks (1 = read the file sequentially; compressed
+            files are always read sequentially)
+        vectorized: Coerce batches column by column with pandas
+        resume: Continue from the table's last checkpoint (loads sequentially)
+        skip_unchanged: Skip the table if its CSV is unchanged, otherwise
+            reload it through a staging table (loads sequentially; resume
+            does not apply)
+        reader: CSV reader engine ('csv' or 'arrow', see CSV_READERS)
 
     Returns:
         Loading statistics
 
     Raises:
-        ValueError: If table name is invalid
+        ValueError: If table name or engine is invalid
         FileNotFoundError: If CSV file doesn't exist
     """
     if table_name not in MODEL_CLASSES:
         raise ValueError(f"Invalid table name: {table_name}. Available: {list(MODEL_CLASSES.keys())}")
+    if engine not in LOADER_ENGINES:
+        raise ValueError(f"Invalid engine: {engine}. Available: {list(LOADER_ENGINES.keys())}")
 
-    csv_path = csv_dir / f"{table_name}.csv"
+    csv_path = find_csv(csv_dir, table_name)
     model_class = MODEL_CLASSES[table_name]
     field_mapping = FIELD_MAPPINGS[table_name]
 
-    logger.info(f"Loading table: {table_name} from {csv_path}")
+    logger.info(f"Loading table: {table_name} from {csv_path} (engine: {engine})")
 
-    loader = BaseCSVLoader(
+    loader_class = LOADER_ENGINES[engine]
+    loader = loader_class(
         model_class=model_class,
         csv_path=csv_path,
         batch_size=batch_size,
         skip_errors=True,
+        vectorized=vectorized,
+        checkpoint=not skip_unchanged,
+        resume=resume and not skip_unchanged,
+        reader=reader,
     )
 
-    loader.load(session, field_mapping)
+    if skip_unchanged:
+        if chunk_workers > 1:
+            logger.info(f"Reloading {table_name} sequentially; byte-range chunks cannot write to staging")
+        return reload_if_changed(session, loader, field_mapping)
+    if resume and chunk_workers > 1:
+        logger.info(f"Resuming {table_name} sequentially; byte-range chunks are not checkpointed")
+    if chunk_workers > 1 and not resume:
+        # Chunks are not checkpointed: drop any earlier checkpoint first and
+        # mark the file complete once loaded, so a later resume cannot
+        # continue from an old offset and load rows twice
+        identity = file_identity(csv_path)
+        delete_checkpoint(session, model_class.__tablename__)
+        session.commit()
+        loader.load_parallel(field_mapping, chunk_workers)
+        save_checkpoint(
+            session,
+            model_class.__tablename__,
+            csv_path,
+            identity,
+            identity[0],
+            loader.stats["loaded"],
+            completed=True,
+        )
+        session.commit()
+    else:
+        loader.load(session, field_mapping)
     return loader.get_stats()
 
 
-def load_all_tables(session: Session, csv_dir: Path, batch_size: int = 1000) -> Dict[str, Dict[str, int]]:
+def load_all_tables(
+    session: Session,
+    csv_dir: Path,
+    batch_size: int = 1000,
+    engine: str = "orm",
+    chunk_workers: int = 1,
+    vectorized: bool = False,
+    resume: bool = False,
+    skip_unchanged: bool = False,
+    reader: str = "csv",
+) -> Dict[str, Dict[str, int]]:
     """
     Load all tables from CSVs.
 
@@ -358,6 +516,12 @@ def load_all_tables(session: Session, csv_dir: Path, batch_size: int = 1000) ->
         session: SQLAlchemy session
         csv_dir: Directory containing CSV files
         batch_size: Batch size for loading
+        engine: Loading engine ('orm' or 'copy')
+        chunk_workers: Worker processes per table for byte-range chunking
+        vectorized: Coerce batches column by column with pandas
+        resume: Continue each table from its last checkpoint
+        skip_unchanged: Only reload tables whose CSV changed
+        reader: CSV reader engine ('csv' or 'arrow')
 
     Returns:
         Statistics for each table
@@ -366,7 +530,18 @@ def load_all_tables(session: Session, csv_dir: Path, batch_size: int = 1000) ->
 
     for table_name in MODEL_CLASSES.keys():
         try:
-            stats = load_table(session, table_name, csv_dir, batch_size)
+            stats = load_table(
+                session,
+                table_name,
+                csv_dir,
+                batch_size,
+                engine,
+                chunk_workers,
+                vectorized,
+                resume,
+                skip_unchanged,
+                reader,
+            )
             all_stats[table_name] = stats
         except FileNotFoundError:
             logger.warning(f"CSV not found for {table_name}, skipping")
@@ -375,3 +550,96 @@ def load_all_tables(session: Session, csv_dir: Path, batch_size: int = 1000) ->
             all_stats[table_name] = {"error": str(e)}
 
     return all_stats
+
+
+def _load_table_worker(
+    table_name: str,
+    csv_dir: Path,
+    batch_size: int,
+    engine: str,
+    chunk_workers: int = 1,
+    vectorized: bool = False,
+    resume: bool = False,
+    skip_unchanged: bool = False,
+    reader: str = "csv",
+) -> Optional[Dict[str, int]]:
+    """
+    Load one table in a worker process with its own session.
+
+    Returns:
+        Loading statistics, or None if the CSV file is missing
+    """
+    from app.shared import get_db
+
+    try:
+        with get_db() as session:
+            return load_table(
+                session,
+                table_name,
+                csv_dir,
+                batch_size,
+                engine,
+                chunk_workers,
+                vectorized,
+                resume,
+                skip_unchanged,
+                reader,
+            )
+    except FileNotFoundError:
+        logger.warning(f"CSV not found for {table_name}, skipping")
+        return None
+
+
+def load_tables_parallel(
+    csv_dir: Path,
+    batch_size: int = 1000,
+    engine: str = "orm",
+    workers: int = 4,
+    tables: Optional[List[str]] = None,
+    chunk_workers: int = 1,
+    vectorized: bool = False,
+    resume: bool = False,
+    skip_unchanged: bool = False,
+    reader: str = "csv",
+) -> Dict[str, TaskResult]:
+    """
+    Load tables concurrently in a process pool, respecting TABLE_DEPENDENCIES.
+
+    Each worker process opens its own database connection. A table starts
+    as soon as every table it depends on has finished.
+
+    Args:
+        csv_dir: Directory containing CSV files
+        batch_size: Batch size for loading
+        engine: Loading engine ('orm' or 'copy')
+        workers: Number of worker processes
+        tables: Tables to load (default: all MODEL_CLASSES)
+        chunk_workers: Worker processes per table for byte-range chunking
+        vectorized: Coerce batches column by column with pandas
+        resume: Continue each table from its last checkpoint
+        skip_unchanged: Only reload tables whose CSV changed
+        reader: CSV reader engine ('csv' or 'arrow')
+
+    Returns:
+        TaskResult per table; ``result`` holds the loading statistics
+    """
+    table_names = tables or list(MODEL_CLASSES.keys())
+    tasks = {
+        table_name: partial(
+            _load_table_worker,
+            table_name,
+            csv_dir,
+            batch_size,
+            engine,
+            chunk_workers,
+            vectorized,
+            resume,
+            skip_unchanged,
+            reader,
+        )
+        for table_name in table_names
+    }
+
+    logger.info(f"Loading {len(tasks)} tables with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return run_dag(tasks, TABLE_DEPENDENCIES, executor)
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from app.models.bronze import BronzeAdmissions
 from app.models.silver import SilverAdmission
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import BaseSilverTransformer, duration_sql
 
 
 class AdmissionTransformer(BaseSilverTransformer):
@@ -18,6 +18,21 @@ class AdmissionTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverAdmission
     
+    @property
+    def sql_select(self) -> str:
+        return f"""
+            SELECT
+                b.hadm_id, b.subject_id,
+                b.admission_type, b.admission_location, b.discharge_location,
+                b.admittime, b.dischtime, b.edregtime, b.edouttime,
+                {duration_sql("b.admittime", "b.dischtime", 86400)} AS los_days,
+                {duration_sql("b.admittime", "b.dischtime", 3600)} AS los_hours,
+                b.diagnosis,
+                COALESCE(b.hospital_expire_flag, FALSE) AS hospital_expire_flag,
+                b.insurance, b.language, b.religion, b.marital_status, b.ethnicity
+            FROM {{source}} AS b
+        """
+    
     def calculate_los(self, admittime: datetime, dischtime: Optional[datetime]) -> tuple:
         """
         Calculate length of stay in days and hours.
@@ -1,10 +1,326 @@
 """Base transformer for Bronze to Silver layer."""
+import re
 from abc import ABC, abstractmethod
-from typing import Generator, List, Dict, Any
+from typing import Generator, Iterable, List, Dict, Any, Optional, Sequence
 
+from sqlalchemy import delete, select, text, tuple_
 from sqlalchemy.orm import Session
 
-from app.shared import logger
+from app.models.partitioning import get_partition, moved_rows_delete, table_partition_column
+from app.models.silver import SilverRejectedRow
+from app.shared import Quarantine, logger, metrics
+from .watermarks import open_window, save_watermark, window_criteria, window_sql
+
+# Numeric text accepted by both transformation modes: plain decimals with
+# an optional exponent (no inf/nan or digit separators), matched with the
+# PostgreSQL ~ operator in SQL mode and by parse_numeric in Python mode,
+# after NUMERIC_WHITESPACE is stripped from both ends.
+NUMERIC_PATTERN = r"^[+-]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][+-]?[0-9]+)?$"
+NUMERIC_WHITESPACE = " \t\r\n"
+
+AUDIT_COLUMNS = ("created_at", "updated_at")
+
+
+def quarantine_record(quarantine: Quarantine, silver_model, bronze_model, record, error: Exception):
+    """
+    Buffer a bronze record that failed to transform for silver.etl_rejected_rows.
+
+    Args:
+        quarantine: Quarantine of the running transformation
+        silver_model: Silver model being written
+        bronze_model: Bronze model the record was read from
+        record: Model instance, or Row in streaming mode
+        error: Why the record was rejected
+    """
+    if hasattr(record, "_asdict"):
+        values = record._asdict()
+    else:
+        values = {column.key: getattr(record, column.key) for column in bronze_model.__table__.columns}
+    source_key = ",".join(str(values.get(column.key)) for column in bronze_model.__table__.primary_key.columns)
+    quarantine.reject(
+        error,
+        values,
+        table_name=silver_model.__tablename__,
+        source_table=bronze_model.__tablename__,
+        source_key=source_key,
+    )
+
+
+def keyset_batches(
+    session: Session, model, batch_size: int, criteria: Sequence = ()
+) -> Generator[List, None, None]:
+    """
+    Read all rows of a table in primary key order using keyset pagination.
+
+    Each batch seeks past the last key of the previous batch
+    (WHERE pk > :last ORDER BY pk LIMIT n) instead of using OFFSET, so every
+    query is an index range scan and rows are neither skipped nor repeated.
+    Composite primary keys are compared as row values.
+
+    Args:
+        session: SQLAlchemy session
+        model: Model class to read
+        batch_size: Number of rows per batch
+        criteria: Optional filter criteria applied to every batch
+
+    Yields:
+        Batches of model instances
+    """
+    pk_columns = list(model.__table__.primary_key.columns)
+    pk_attrs = [getattr(model, column.key) for column in pk_columns]
+    seek_key = pk_attrs[0] if len(pk_attrs) == 1 else tuple_(*pk_attrs)
+
+    last_key = None
+    while True:
+        query = session.query(model).filter(*criteria)
+        if last_key is not None:
+            query = query.filter(seek_key > last_key)
+        batch = query.order_by(*pk_attrs).limit(batch_size).all()
+
+        if not batch:
+            break
+
+        # Capture the seek key before yielding: the caller commits between
+        # batches, which expires the loaded instances.
+        last_values = [getattr(batch[-1], column.key) for column in pk_columns]
+        last_key = last_values[0] if len(last_values) == 1 else tuple_(*last_values)
+
+        yield batch
+
+
+def stream_batches(
+    session: Session, model, batch_size: int, criteria: Sequence = ()
+) -> Generator[List, None, None]:
+    """
+    Stream all rows of a table through one server-side cursor.
+
+    Rows come back as lightweight Row tuples (attribute access by column
+    name) rather than ORM instances, so nothing accumulates in the session
+    identity map and memory stays flat regardless of table size. The cursor
+    runs on its own connection because the session commits after each
+    written batch, which would close a cursor opened in its transaction.
+
+    Args:
+        session: SQLAlchemy session (its bind provides the connection)
+        model: Model class to read
+        batch_size: Number of rows fetched per round trip
+        criteria: Optional filter criteria
+
+    Yields:
+        Batches of Row objects
+    """
+    with session.get_bind().connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            select(model.__table__).where(*criteria)
+        )
+        for partition in result.partitions():
+            yield partition
+
+
+def sql_in_list(values: Iterable[str]) -> str:
+    """
+    Render string constants as a SQL IN list body.
+
+    Args:
+        values: Constant strings (quotes are escaped)
+
+    Returns:
+        Comma-separated quoted literals, e.g. "'A', 'B'"
+    """
+    return ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+
+
+def parse_numeric(value: Optional[str]) -> Optional[float]:
+    """
+    Parse numeric text the way SQL mode does.
+
+    Args:
+        value: Raw text
+
+    Returns:
+        The number, or None if the stripped text does not match NUMERIC_PATTERN
+    """
+    if value is None:
+        return None
+    value = value.strip(NUMERIC_WHITESPACE)
+    return float(value) if re.fullmatch(NUMERIC_PATTERN, value) else None
+
+
+def strip_sql(expression: str) -> str:
+    """
+    SQL equivalent of str.strip(NUMERIC_WHITESPACE).
+
+    Args:
+        expression: Text expression
+
+    Returns:
+        SQL expression string
+    """
+    return f"BTRIM({expression}, E' \\t\\r\\n')"
+
+
+def duration_sql(start: str, end: str, seconds: int) -> str:
+    """
+    SQL expression for the rounded interval between two timestamps.
+
+    Mirrors round((end - start).total_seconds() / seconds, 2) and is NULL
+    when either bound is NULL.
+
+    Args:
+        start: Start timestamp expression
+        end: End timestamp expression
+        seconds: Seconds per output unit (3600 for hours, 86400 for days)
+
+    Returns:
+        SQL expression string
+    """
+    return f"ROUND((EXTRACT(EPOCH FROM ({end} - {start})) / {seconds})::numeric, 2)"
+
+
+def upsert_batch(session: Session, silver_model, silver_data: List[Dict[str, Any]]):
+    """
+    Upsert a batch of rows into a silver table with one statement.
+
+    Executes a multi-row INSERT ... ON CONFLICT (pk) DO UPDATE of every
+    non-key column. On partitioned tables, rows of the batch whose
+    partition key changed are first deleted under their old key (see
+    app.models.partitioning). The caller commits.
+
+    Args:
+        session: SQLAlchemy session
+        silver_model: Silver model class to write to
+        silver_data: Row dictionaries keyed by column name
+    """
+    from sqlalchemy.dialects.postgresql import insert
+    
+    stmt = insert(silver_model).values(silver_data)
+    
+    # Get primary key column name
+    pk_columns = [c.name for c in silver_model.__table__.primary_key.columns]
+    
+    delete_moved_rows(session, silver_model.__table__, silver_data)
+    
+    # Create update dict for all non-pk columns
+    update_dict = {
+        c.name: stmt.excluded[c.name]
+        for c in silver_model.__table__.columns
+        if c.name not in pk_columns
+    }
+    
+    # Upsert: insert or update on conflict
+    stmt = stmt.on_conflict_do_update(
+        index_elements=pk_columns,
+        set_=update_dict
+    )
+    
+    session.execute(stmt)
+
+
+def delete_moved_rows(session: Session, table, silver_data: List[Dict[str, Any]]):
+    """
+    Delete the rows a batch moves to another partition key value.
+
+    Does nothing unless the table is partitioned.
+
+    Args:
+        session: SQLAlchemy session
+        table: Silver table about to be upserted into
+        silver_data: Row dictionaries keyed by column name
+    """
+    column = table_partition_column(table)
+    if column is None:
+        return
+    pk_columns = list(table.primary_key.columns)
+    natural = [c for c in pk_columns if c.name != column]
+    session.execute(delete(table).where(
+        tuple_(*natural).in_([tuple(row[c.name] for c in natural) for row in silver_data]),
+        tuple_(*pk_columns).not_in([tuple(row[c.name] for c in pk_columns) for row in silver_data]),
+    ))
+
+
+def upsert_from_select(
+    session: Session, silver_model, select_sql: str, params: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Upsert the rows of a SELECT into a silver table in one statement.
+
+    Runs INSERT ... SELECT ... ON CONFLICT (pk) DO UPDATE, the set-based
+    equivalent of write_silver_batch. The SELECT must produce one column per
+    silver column (audit columns excluded) under the same names. On
+    partitioned tables, rows whose partition key changed are first deleted
+    under their old key.
+
+    Args:
+        session: SQLAlchemy session
+        silver_model: Silver model class to write to
+        select_sql: SELECT statement producing silver rows
+        params: Bind parameters used by select_sql
+
+    Returns:
+        Number of rows inserted or updated
+    """
+    table = silver_model.__table__
+    pk_columns = [c.name for c in table.primary_key.columns]
+    columns = [c.name for c in table.columns if c.name not in AUDIT_COLUMNS]
+    updates = [f"{name} = EXCLUDED.{name}" for name in columns if name not in pk_columns]
+    if "updated_at" in table.columns:
+        updates.append("updated_at = now()")
+
+    moved = moved_rows_delete(table, pk_columns, f"(\n{select_sql}\n)")
+    if moved is not None:
+        session.execute(text(moved), params or {})
+
+    column_list = ", ".join(columns)
+    statement = (
+        f"INSERT INTO {table.fullname} ({column_list})\n"
+        f"SELECT {column_list} FROM (\n{select_sql}\n) AS src\n"
+        f"ON CONFLICT ({', '.join(pk_columns)}) DO UPDATE SET {', '.join(updates)}"
+    )
+    return session.execute(text(statement), params or {}).rowcount
+
+
+def rebuild_partition(session: Session, silver_model, sources: List[tuple], suffix: str) -> int:
+    """
+    Truncate one partition of a silver table and rebuild it from bronze.
+
+    Runs the set-based transformation of every source restricted to rows
+    that belong in the partition, so a single chart time range or subject_id
+    hash bucket can be reloaded without touching the rest of the table.
+
+    Args:
+        session: SQLAlchemy session
+        silver_model: Partitioned silver model class
+        sources: (bronze model, sql_select) pairs feeding the table
+        suffix: Partition suffix (e.g. 'y2130' or 'h03')
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the silver table is not partitioned or the partition
+            does not exist
+    """
+    table = silver_model.__table__
+    column = table_partition_column(table)
+    if column is None:
+        raise ValueError(f"{table.fullname} is not partitioned")
+    partition = get_partition(suffix)
+    name = partition.name(table.fullname)
+
+    logger.info(f"Rebuilding partition {name}")
+    session.execute(text(f"TRUNCATE {name}"))
+
+    written = 0
+    for bronze_model, sql_select in sources:
+        select_sql = (
+            f"SELECT * FROM (\n{sql_select.replace('{source}', bronze_model.__table__.fullname)}\n) AS partition_rows\n"
+            f"WHERE {partition.predicate(table.fullname, column)}"
+        )
+        written += upsert_from_select(session, silver_model, select_sql)
+    session.commit()
+
+    logger.info(f"Rebuilt {name}: {written} records")
+    return written
 
 
 class BaseSilverTransformer(ABC):
@@ -18,17 +334,24 @@ class BaseSilverTransformer(ABC):
     - Error handling and logging
     """
     
-    def __init__(self, session: Session, batch_size: int = 1000):
+    def __init__(self, session: Session, batch_size: int = 1000, stream: bool = False, incremental: bool = False):
         """
         Initialize transformer.
         
         Args:
             session: SQLAlchemy session
             batch_size: Number of rows per batch
+            stream: Read bronze through a server-side cursor instead of
+                keyset-paginated ORM queries
+            incremental: Only process bronze rows updated since the last
+                run's watermark
         """
         self.session = session
         self.batch_size = batch_size
+        self.stream = stream
+        self.incremental = incremental
         self.stats = {"total": 0, "transformed": 0, "errors": 0}
+        self.quarantine = Quarantine(SilverRejectedRow.__table__, f"silver.{self.silver_model.__tablename__}")
     
     @property
     @abstractmethod
@@ -42,45 +365,56 @@ class BaseSilverTransformer(ABC):
         """Silver model class to write to."""
         pass
     
+    @property
+    @abstractmethod
+    def sql_select(self) -> str:
+        """
+        Set-based equivalent of transform_record.
+
+        A PostgreSQL SELECT over the bronze table, referenced as {source},
+        producing the same rows and column names transform_record would.
+        Used by transform_sql.
+        """
+        pass
+    
     @abstractmethod
     def transform_record(self, bronze_record) -> Dict[str, Any]:
         """
         Transform a single bronze record to silver format.
         
         Args:
-            bronze_record: SQLAlchemy model instance from bronze
+            bronze_record: SQLAlchemy model instance from bronze, or a Row
+                with the same attribute names in streaming mode
             
         Returns:
             Dictionary of silver field values
         """
         pass
     
-    def read_bronze_batches(self) -> Generator[List, None, None]:
+    def read_bronze_batches(self, criteria: Sequence = ()) -> Generator[List, None, None]:
         """
         Read bronze records in batches.
         
+        Uses a single server-side cursor in streaming mode, otherwise keyset
+        pagination in primary key order.
+        
+        Args:
+            criteria: Optional filter criteria (e.g. a watermark window)
+        
         Yields:
             Batches of bronze records
         """
-        offset = 0
-        while True:
-            batch = (
-                self.session.query(self.bronze_model)
-                .offset(offset)
-                .limit(self.batch_size)
-                .all()
-            )
-            
-            if not batch:
-                break
-                
-            yield batch
-            offset += self.batch_size
+        if self.stream:
+            yield from stream_batches(self.session, self.bronze_model, self.batch_size, criteria)
+        else:
+            yield from keyset_batches(self.session, self.bronze_model, self.batch_size, criteria)
     
     def transform_batch(self, bronze_batch: List) -> List[Dict[str, Any]]:
         """
         Transform a batch of bronze records.
         
+        Records that fail are quarantined and written with the batch.
+        
         Args:
             bronze_batch: List of bronze records
             
@@ -98,55 +432,100 @@ class BaseSilverTransformer(ABC):
                     self.stats["transformed"] += 1
             except Exception as e:
                 self.stats["errors"] += 1
-                logger.warning(f"Error transforming record: {e}")
+                quarantine_record(self.quarantine, self.silver_model, self.bronze_model, record, e)
         
         return transformed
     
     def write_silver_batch(self, silver_data: List[Dict[str, Any]]):
         """
-        Write transformed data to silver table using bulk insert.
+        Write transformed data, and the batch's quarantined records, in one transaction.
         
         Args:
             silver_data: List of transformed dictionaries
         """
-        from sqlalchemy.dialects.postgresql import insert
-        
-        if not silver_data:
+        if not silver_data and not self.quarantine.pending:
             return
         
-        # Use bulk insert with upsert (ON CONFLICT DO UPDATE)
-        stmt = insert(self.silver_model).values(silver_data)
+        if silver_data:
+            upsert_batch(self.session, self.silver_model, silver_data)
+        self.quarantine.flush(self.session)
+        self.session.commit()
+    
+    def transform_sql(self):
+        """
+        Execute the transformation inside the database.
         
-        # Get primary key column name
-        pk_columns = [c.name for c in self.silver_model.__table__.primary_key.columns]
+        Runs sql_select as a single INSERT ... SELECT upsert so no rows travel
+        to Python. Rows the SELECT filters out count as not transformed, as
+        skipped records do in transform().
+        """
+        silver_name = self.silver_model.__tablename__
+        logger.info(f"Starting set-based Bronze → Silver transformation for {silver_name}")
         
-        # Create update dict for all non-pk columns
-        update_dict = {
-            c.name: stmt.excluded[c.name] 
-            for c in self.silver_model.__table__.columns 
-            if c.name not in pk_columns
-        }
+        with metrics.stage(f"silver.{silver_name}") as stage:
+            window = open_window(self.session, self.silver_model, self.bronze_model, self.incremental)
+            source, params = window_sql(self.bronze_model, window)
+            self.stats["total"] += self.session.execute(
+                text(f"SELECT COUNT(*) FROM {source} AS counted"), params
+            ).scalar()
+            transformed = upsert_from_select(
+                self.session, self.silver_model, self.sql_select.replace("{source}", source), params
+            )
+            self.stats["transformed"] += transformed
+            save_watermark(self.session, self.silver_model, self.bronze_model, window)
+            self.session.commit()
+            stage.count(rows=transformed)
         
-        # Upsert: insert or update on conflict
-        stmt = stmt.on_conflict_do_update(
-            index_elements=pk_columns,
-            set_=update_dict
+        logger.info(
+            f"Transformation complete for {silver_name}: "
+            f"{self.stats['transformed']}/{self.stats['total']} records"
         )
         
-        self.session.execute(stmt)
-        self.session.commit()
+        return self.stats
+    
+    def sql_sources(self) -> List[tuple]:
+        """Bronze (model, sql_select) pairs feeding the silver table."""
+        return [(self.bronze_model, self.sql_select)]
+    
+    def rebuild_partition(self, suffix: str):
+        """
+        Truncate one partition of the silver table and rebuild it from bronze.
+        
+        The watermark is left unchanged.
+        
+        Args:
+            suffix: Partition suffix (e.g. 'y2130' or 'h03')
+        """
+        with metrics.stage(f"silver.{self.silver_model.__tablename__}") as stage:
+            transformed = rebuild_partition(self.session, self.silver_model, self.sql_sources(), suffix)
+            stage.count(rows=transformed)
+        self.stats["transformed"] += transformed
+        return self.stats
     
     def transform(self):
-        """Execute full transformation process."""
+        """
+        Execute full transformation process.
+        
+        Every run records the bronze high-water mark it processed up to; in
+        incremental mode only rows updated after the previous mark are read.
+        """
         silver_name = self.silver_model.__tablename__
         logger.info(f"Starting Bronze → Silver transformation for {silver_name}")
         
-        for batch in self.read_bronze_batches():
-            silver_data = self.transform_batch(batch)
-            if silver_data:
+        with metrics.stage(f"silver.{silver_name}") as stage:
+            transformed = self.stats["transformed"]
+            window = open_window(self.session, self.silver_model, self.bronze_model, self.incremental)
+            
+            for batch in self.read_bronze_batches(window_criteria(self.bronze_model, window)):
+                silver_data = self.transform_batch(batch)
                 self.write_silver_batch(silver_data)
-            logger.debug(f"Processed batch: {len(batch)} records")
+                logger.debug(f"Processed batch: {len(batch)} records")
+            
+            save_watermark(self.session, self.silver_model, self.bronze_model, window)
+            self.session.commit()
+            stage.count(rows=self.stats["transformed"] - transformed)
         
+        self.quarantine.summary()
         logger.info(
             f"Transformation complete for {silver_name}: "
             f"{self.stats['transformed']}/{self.stats['total']} records "
@@ -3,7 +3,17 @@ from typing import Dict, Any, Optional
 
 from app.models.bronze import BronzeCaregivers
 from app.models.silver import SilverCaregiver
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import BaseSilverTransformer, sql_in_list
+
+
+# Role category -> upper-cased label codes
+ROLE_CATEGORIES = [
+    ('Nursing', ('RN', 'RN-BSN', 'RN-MSN', 'LPN', 'CNA', 'NURSE')),
+    ('Physician', ('MD', 'DO', 'RES', 'RESIDENT', 'FELLOW', 'PA', 'NP')),
+    ('Respiratory', ('RT', 'RRT', 'RESPIRATORY')),
+    ('Pharmacy', ('PHARM', 'PHARMD', 'RPH')),
+    ('System', ('RO', 'READ ONLY', 'SYSTEM')),  # Read-only / system accounts
+]
 
 
 class CaregiverTransformer(BaseSilverTransformer):
@@ -17,40 +27,41 @@ class CaregiverTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverCaregiver
     
+    @property
+    def sql_select(self) -> str:
+        cases = "\n".join(
+            f"                    WHEN UPPER(TRIM(b.label)) IN ({sql_in_list(labels)}) THEN '{category}'"
+            for category, labels in ROLE_CATEGORIES
+        )
+        return f"""
+            SELECT
+                b.cgid,
+                CASE WHEN b.label <> '' THEN TRIM(b.label) END AS label,
+                CASE WHEN b.description <> '' THEN TRIM(b.description) END AS description,
+                CASE
+                    WHEN COALESCE(TRIM(b.label), '') = '' THEN NULL
+{cases}
+                    ELSE 'Other'
+                END AS role_category
+            FROM {{source}} AS b
+            WHERE b.cgid IS NOT NULL AND b.cgid <> 0
+        """
+    
     def _categorize_role(self, label: Optional[str]) -> Optional[str]:
         """
         Categorize caregiver role based on label code.
         
-        Categories:
-        - Nursing: RN, RN-BSN, RN-MSN, LPN, CNA
-        - Physician: MD, DO, Res (Resident)
-        - Respiratory: RT, RRT
-        - Other: RO (Read Only), etc.
+        Categories are checked in ROLE_CATEGORIES order; unmatched labels
+        are 'Other'.
         """
         if not label:
             return None
             
         label_upper = label.upper().strip()
         
-        # Nursing staff
-        if label_upper in ('RN', 'RN-BSN', 'RN-MSN', 'LPN', 'CNA', 'NURSE'):
-            return 'Nursing'
-        
-        # Physicians
-        if label_upper in ('MD', 'DO', 'RES', 'RESIDENT', 'FELLOW', 'PA', 'NP'):
-            return 'Physician'
-        
-        # Respiratory
-        if label_upper in ('RT', 'RRT', 'RESPIRATORY'):
-            return 'Respiratory'
-        
-        # Pharmacy
-        if label_upper in ('PHARM', 'PHARMD', 'RPH'):
-            return 'Pharmacy'
-        
-        # Read-only / System accounts
-        if label_upper in ('RO', 'READ ONLY', 'SYSTEM'):
-            return 'System'
+        for category, labels in ROLE_CATEGORIES:
+            if label_upper in labels:
+                return category
             
         return 'Other'
     
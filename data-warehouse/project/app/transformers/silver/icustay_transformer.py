@@ -4,7 +4,7 @@ from datetime import datetime
 
 from app.models.bronze import BronzeICUStays
 from app.models.silver import SilverICUStay
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import BaseSilverTransformer, duration_sql
 
 
 class ICUStayTransformer(BaseSilverTransformer):
@@ -18,6 +18,18 @@ class ICUStayTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverICUStay
     
+    @property
+    def sql_select(self) -> str:
+        return f"""
+            SELECT
+                b.icustay_id, b.subject_id, b.hadm_id,
+                b.first_careunit, b.last_careunit, b.first_wardid, b.last_wardid,
+                b.intime, b.outtime,
+                {duration_sql("b.intime", "b.outtime", 86400)} AS los_icu_days,
+                {duration_sql("b.intime", "b.outtime", 3600)} AS los_icu_hours
+            FROM {{source}} AS b
+        """
+    
     def calculate_icu_los(self, intime: datetime, outtime: Optional[datetime]) -> tuple:
         """
         Calculate ICU length of stay.
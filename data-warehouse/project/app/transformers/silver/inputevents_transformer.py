@@ -1,12 +1,24 @@
 """Input events transformer: Bronze → Silver (unified CV + MV)."""
-from typing import Dict, Any, Optional, Generator, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Generator, List, Sequence
 from datetime import datetime
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.models.bronze import BronzeInputEventsCareVue, BronzeInputEventsMetaVision
-from app.models.silver import SilverInputEvent
-from app.shared import logger
+from app.models.silver import SilverInputEvent, SilverRejectedRow
+from app.shared import Quarantine, logger, metrics
+from .base_transformer import (
+    duration_sql,
+    keyset_batches,
+    quarantine_record,
+    rebuild_partition,
+    stream_batches,
+    upsert_batch,
+    upsert_from_select,
+)
+from .watermarks import open_window, save_watermark, window_criteria, window_sql
 
 
 class InputEventsTransformer:
@@ -14,17 +26,73 @@ class InputEventsTransformer:
     Transform input events from Bronze to Silver layer.
     
     Merges CareVue and MetaVision data into a single unified table.
+    Both systems number their rows from 1, so silver rows keep the source
+    row ID and are keyed on (row_id, source_system). The two sources
+    therefore never write the same key, and they are transformed
+    concurrently unless `parallel` is off.
     """
     
-    def __init__(self, session: Session, batch_size: int = 1000):
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = 1000,
+        stream: bool = False,
+        parallel: bool = True,
+        incremental: bool = False,
+    ):
+        """
+        Initialize transformer.
+        
+        Args:
+            session: SQLAlchemy session
+            batch_size: Number of rows per batch
+            stream: Read bronze through a server-side cursor
+            parallel: Process the CV and MV sources concurrently, each in
+                its own thread and session
+            incremental: Only process bronze rows updated since each
+                source's last watermark
+        """
         self.session = session
         self.batch_size = batch_size
+        self.stream = stream
+        self.parallel = parallel
+        self.incremental = incremental
         self.stats = {"total": 0, "transformed": 0, "errors": 0}
+        self.quarantine = Quarantine(SilverRejectedRow.__table__, "silver.inputevents")
     
     @property
     def silver_model(self):
         return SilverInputEvent
     
+    @property
+    def cv_sql_select(self) -> str:
+        """Set-based equivalent of transform_cv_record over {source}."""
+        return """
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id,
+                'CareVue' AS source_system,
+                b.itemid, b.charttime,
+                NULL::timestamp AS starttime, NULL::timestamp AS endtime,
+                b.amount, b.amountuom, b.rate, b.rateuom, b.cgid,
+                NULL::double precision AS duration_hours,
+                (b.rate IS NULL OR b.rate = 0) AS is_bolus
+            FROM {source} AS b
+        """
+    
+    @property
+    def mv_sql_select(self) -> str:
+        """Set-based equivalent of transform_mv_record over {source}."""
+        return f"""
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id,
+                'MetaVision' AS source_system,
+                b.itemid, b.starttime AS charttime, b.starttime, b.endtime,
+                b.amount, b.amountuom, b.rate, b.rateuom, b.cgid,
+                {duration_sql("b.starttime", "b.endtime", 3600)} AS duration_hours,
+                (b.orderid IS NULL) AS is_bolus
+            FROM {{source}} AS b
+        """
+    
     def calculate_duration(self, start: datetime, end: datetime) -> Optional[float]:
         """Calculate duration in hours."""
         if not start or not end:
@@ -58,7 +126,7 @@ class InputEventsTransformer:
         duration = self.calculate_duration(bronze.starttime, bronze.endtime)
         
         return {
-            "row_id": bronze.row_id + 1000000,  # Offset to avoid ID conflicts
+            "row_id": bronze.row_id,
             "subject_id": bronze.subject_id,
             "hadm_id": bronze.hadm_id,
             "icustay_id": bronze.icustay_id,
@@ -76,72 +144,177 @@ class InputEventsTransformer:
             "is_bolus": bronze.orderid is None,
         }
     
-    def read_batches(self) -> Generator[List[Dict[str, Any]], None, None]:
-        """Read and transform both CV and MV records."""
-        # Process CareVue
-        offset = 0
-        while True:
-            batch = (
-                self.session.query(BronzeInputEventsCareVue)
-                .offset(offset)
-                .limit(self.batch_size)
-                .all()
-            )
-            if not batch:
-                break
-            
-            transformed = []
-            for record in batch:
-                self.stats["total"] += 1
-                try:
-                    transformed.append(self.transform_cv_record(record))
-                    self.stats["transformed"] += 1
-                except Exception as e:
-                    self.stats["errors"] += 1
-                    logger.warning(f"Error transforming CV record: {e}")
-            
-            yield transformed
-            offset += self.batch_size
+    @property
+    def sources(self) -> List[tuple]:
+        """(bronze model, record transform, label) for each source system."""
+        return [
+            (BronzeInputEventsCareVue, self.transform_cv_record, "CV"),
+            (BronzeInputEventsMetaVision, self.transform_mv_record, "MV"),
+        ]
+    
+    def read_source_batches(
+        self,
+        session: Session,
+        bronze_model,
+        transform_record,
+        label: str,
+        stats: Dict[str, int],
+        criteria: Sequence = (),
+        quarantine: Optional[Quarantine] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Read and transform one source system.
         
-        # Process MetaVision
-        offset = 0
-        while True:
-            batch = (
-                self.session.query(BronzeInputEventsMetaVision)
-                .offset(offset)
-                .limit(self.batch_size)
-                .all()
-            )
-            if not batch:
-                break
+        Args:
+            session: Session to read with
+            bronze_model: Bronze model class to read
+            transform_record: Record transform for this source
+            label: Source label for log messages
+            stats: Stats dictionary to update
+            criteria: Optional filter criteria (e.g. a watermark window)
+            quarantine: Quarantine for records that fail to transform
+                (defaults to the transformer's)
             
+        Yields:
+            Batches of silver row dictionaries
+        """
+        reader = stream_batches if self.stream else keyset_batches
+        quarantine = quarantine or self.quarantine
+        
+        for batch in reader(session, bronze_model, self.batch_size, criteria):
             transformed = []
             for record in batch:
-                self.stats["total"] += 1
+                stats["total"] += 1
                 try:
-                    transformed.append(self.transform_mv_record(record))
-                    self.stats["transformed"] += 1
+                    transformed.append(transform_record(record))
+                    stats["transformed"] += 1
                 except Exception as e:
-                    self.stats["errors"] += 1
-                    logger.warning(f"Error transforming MV record: {e}")
+                    stats["errors"] += 1
+                    quarantine_record(quarantine, self.silver_model, bronze_model, record, e)
             
+            logger.debug(f"inputevents {label}: processed batch of {len(batch)} records")
             yield transformed
-            offset += self.batch_size
     
-    def write_batch(self, silver_data: List[Dict[str, Any]]):
-        """Write transformed data to silver table."""
-        for data in silver_data:
-            silver_record = self.silver_model(**data)
-            self.session.merge(silver_record)
-        self.session.commit()
+    def read_batches(self) -> Generator[List[Dict[str, Any]], None, None]:
+        """Read and transform both CV and MV records."""
+        for bronze_model, transform_record, label in self.sources:
+            yield from self.read_source_batches(self.session, bronze_model, transform_record, label, self.stats)
+    
+    def write_batch(
+        self,
+        silver_data: List[Dict[str, Any]],
+        session: Optional[Session] = None,
+        quarantine: Optional[Quarantine] = None,
+    ):
+        """
+        Write transformed data with one batched upsert, along with the records quarantined while reading it.
+        
+        Args:
+            silver_data: Silver row dictionaries
+            session: Session to write with (defaults to the transformer's)
+            quarantine: Quarantine to flush (defaults to the transformer's)
+        """
+        session = session or self.session
+        if silver_data:
+            upsert_batch(session, self.silver_model, silver_data)
+        (quarantine or self.quarantine).flush(session)
+        session.commit()
+    
+    def transform_source(
+        self, bronze_model, transform_record, label: str, own_session: bool = False
+    ) -> Dict[str, int]:
+        """
+        Transform and write one source system.
+        
+        With own_session the source gets its own session, bound to the same
+        engine, so it can run on a separate thread. Each source is measured
+        as its own stage, on the thread that runs it.
+        
+        Returns:
+            Stats for this source
+        """
+        stats = {"total": 0, "transformed": 0, "errors": 0}
+        session = Session(bind=self.session.get_bind()) if own_session else self.session
+        quarantine = Quarantine(SilverRejectedRow.__table__, f"silver.inputevents.{label}")
+        
+        try:
+            with metrics.stage(f"silver.inputevents.{label}") as stage:
+                window = open_window(session, self.silver_model, bronze_model, self.incremental)
+                criteria = window_criteria(bronze_model, window)
+                for batch in self.read_source_batches(
+                    session, bronze_model, transform_record, label, stats, criteria, quarantine
+                ):
+                    if batch or quarantine.pending:
+                        self.write_batch(batch, session, quarantine)
+                save_watermark(session, self.silver_model, bronze_model, window)
+                session.commit()
+                stage.count(rows=stats["transformed"])
+        finally:
+            if session is not self.session:
+                session.close()
+        
+        quarantine.summary()
+        logger.info(f"inputevents {label}: {stats['transformed']}/{stats['total']} records")
+        return stats
+    
+    def sql_sources(self) -> List[tuple]:
+        """Bronze (model, sql_select) pairs feeding the silver table."""
+        return [
+            (BronzeInputEventsCareVue, self.cv_sql_select),
+            (BronzeInputEventsMetaVision, self.mv_sql_select),
+        ]
+    
+    def rebuild_partition(self, suffix: str):
+        """Truncate one partition of silver.inputevents and rebuild it from both sources."""
+        with metrics.stage("silver.inputevents") as stage:
+            transformed = rebuild_partition(self.session, self.silver_model, self.sql_sources(), suffix)
+            stage.count(rows=transformed)
+        self.stats["transformed"] += transformed
+        return self.stats
+    
+    def transform_sql(self):
+        """Execute the transformation inside the database, one upsert per source."""
+        logger.info("Starting set-based Bronze → Silver transformation for inputevents (CV + MV)")
+        
+        with metrics.stage("silver.inputevents") as stage:
+            for bronze_model, sql_select in self.sql_sources():
+                window = open_window(self.session, self.silver_model, bronze_model, self.incremental)
+                source, params = window_sql(bronze_model, window)
+                self.stats["total"] += self.session.execute(
+                    text(f"SELECT COUNT(*) FROM {source} AS counted"), params
+                ).scalar()
+                transformed = upsert_from_select(
+                    self.session, self.silver_model, sql_select.replace("{source}", source), params
+                )
+                self.stats["transformed"] += transformed
+                save_watermark(self.session, self.silver_model, bronze_model, window)
+                self.session.commit()
+                stage.count(rows=transformed)
+        
+        logger.info(
+            f"Transformation complete for inputevents: "
+            f"{self.stats['transformed']}/{self.stats['total']} records"
+        )
+        
+        return self.stats
     
     def transform(self):
         """Execute full transformation."""
         logger.info("Starting Bronze → Silver transformation for inputevents (CV + MV)")
         
-        for batch in self.read_batches():
-            if batch:
-                self.write_batch(batch)
+        with metrics.stage("silver.inputevents") as stage:
+            if self.parallel:
+                with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+                    results = list(executor.map(
+                        lambda source: self.transform_source(*source, own_session=True), self.sources
+                    ))
+            else:
+                results = [self.transform_source(*source) for source in self.sources]
+            
+            for stats in results:
+                for key, value in stats.items():
+                    self.stats[key] += value
+                stage.count(rows=stats["transformed"])
         
         logger.info(
             f"Transformation complete for inputevents: "
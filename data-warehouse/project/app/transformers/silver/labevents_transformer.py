@@ -3,7 +3,20 @@ from typing import Dict, Any
 
 from app.models.bronze import BronzeLabEvents
 from app.models.silver import SilverLabEvent
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import (
+    BaseSilverTransformer,
+    NUMERIC_PATTERN,
+    NUMERIC_WHITESPACE,
+    parse_numeric,
+    sql_in_list,
+    strip_sql,
+)
+
+
+ABNORMAL_FLAGS = ['ABNORMAL', 'DELTA', 'HIGH', 'LOW', 'H', 'L', 'A']
+
+# Comparison prefixes stripped, in order, before parsing a numeric value
+NUMERIC_PREFIXES = ['>', '<', '>=', '<=', '~']
 
 
 class LabEventsTransformer(BaseSilverTransformer):
@@ -17,6 +30,30 @@ class LabEventsTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverLabEvent
     
+    @property
+    def sql_select(self) -> str:
+        # One anchored replace per prefix, applied in the same order as
+        # parse_numeric_value (a single alternation would match differently).
+        num_text = strip_sql("b.value")
+        for prefix in NUMERIC_PREFIXES:
+            num_text = f"REGEXP_REPLACE({num_text}, '^{prefix}', '')"
+        
+        return f"""
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.itemid, b.charttime,
+                b.value,
+                COALESCE(
+                    b.valuenum,
+                    CASE WHEN v.num_text ~ '{NUMERIC_PATTERN}' THEN v.num_text::double precision END
+                ) AS valuenum,
+                b.valueuom, b.flag,
+                COALESCE(UPPER(b.flag) IN ({sql_in_list(ABNORMAL_FLAGS)}), FALSE) AS is_abnormal
+            FROM {{source}} AS b
+            CROSS JOIN LATERAL (
+                SELECT {strip_sql(num_text)} AS num_text
+            ) AS v
+        """
+    
     def parse_numeric_value(self, value: str) -> float:
         """
         Parse numeric value from string.
@@ -26,21 +63,20 @@ class LabEventsTransformer(BaseSilverTransformer):
         - ">10" → 10.0
         - "<0.5" → 0.5
         - "NEGATIVE" → None
+        
+        Follows the same rules as sql_select (see NUMERIC_PATTERN).
         """
         if not value:
             return None
         
-        value = value.strip()
+        value = value.strip(NUMERIC_WHITESPACE)
         
         # Remove common prefixes
-        for prefix in ['>', '<', '>=', '<=', '~']:
+        for prefix in NUMERIC_PREFIXES:
             if value.startswith(prefix):
                 value = value[len(prefix):]
         
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        return parse_numeric(value)
     
     def determine_abnormal(self, flag: str) -> bool:
         """
@@ -55,8 +91,7 @@ class LabEventsTransformer(BaseSilverTransformer):
         if not flag:
             return False
         
-        abnormal_flags = ['abnormal', 'delta', 'high', 'low', 'H', 'L', 'A']
-        return flag.upper() in [f.upper() for f in abnormal_flags]
+        return flag.upper() in ABNORMAL_FLAGS
     
     def transform_record(self, bronze: BronzeLabEvents) -> Dict[str, Any]:
         """
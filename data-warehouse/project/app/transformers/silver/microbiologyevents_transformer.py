@@ -17,6 +17,18 @@ class MicrobiologyEventsTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverMicrobiologyEvent
     
+    @property
+    def sql_select(self) -> str:
+        return """
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.chartdate, b.charttime,
+                b.spec_itemid, b.spec_type_desc, b.org_itemid, b.org_name,
+                b.ab_itemid, b.ab_name, b.dilution_text, b.interpretation,
+                COALESCE(TRIM(b.org_name) <> '', FALSE) AS is_positive,
+                COALESCE(UPPER(b.interpretation) = 'R', FALSE) AS is_resistant
+            FROM {source} AS b
+        """
+    
     def transform_record(self, bronze: BronzeMicrobiologyEvents) -> Dict[str, Any]:
         """Transform bronze microbiology event to silver format."""
         # Positive culture if organism was found
@@ -17,6 +17,15 @@ class OutputEventsTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverOutputEvent
     
+    @property
+    def sql_select(self) -> str:
+        return """
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id, b.itemid,
+                b.charttime, b.value, b.valueuom, b.cgid
+            FROM {source} AS b
+        """
+    
     def transform_record(self, bronze: BronzeOutputEvents) -> Dict[str, Any]:
         """Transform bronze output event to silver format."""
         return {
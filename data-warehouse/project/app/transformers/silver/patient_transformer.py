@@ -17,6 +17,20 @@ class PatientTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverPatient
     
+    @property
+    def sql_select(self) -> str:
+        return """
+            SELECT
+                b.subject_id,
+                UPPER(b.gender) AS gender,
+                b.dob::date AS date_of_birth,
+                b.dod::date AS date_of_death,
+                (b.dod IS NOT NULL OR b.dod_hosp IS NOT NULL) AS is_deceased,
+                NULL::integer AS dob_shift_years
+            FROM {source} AS b
+            WHERE UPPER(b.gender) IN ('M', 'F')
+        """
+    
     def transform_record(self, bronze: BronzePatients) -> Dict[str, Any]:
         """
         Transform bronze patient to silver format.
@@ -4,7 +4,14 @@ from datetime import datetime
 
 from app.models.bronze import BronzePrescriptions
 from app.models.silver import SilverPrescription
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import (
+    BaseSilverTransformer,
+    NUMERIC_PATTERN,
+    NUMERIC_WHITESPACE,
+    duration_sql,
+    parse_numeric,
+    strip_sql,
+)
 
 
 class PrescriptionTransformer(BaseSilverTransformer):
@@ -18,16 +25,30 @@ class PrescriptionTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverPrescription
     
+    @property
+    def sql_select(self) -> str:
+        def dose(column: str) -> str:
+            cleaned = strip_sql(f"REPLACE({strip_sql(column)}, ',', '')")
+            return f"CASE WHEN {cleaned} ~ '{NUMERIC_PATTERN}' THEN {cleaned}::double precision END"
+        
+        return f"""
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id,
+                b.startdate, b.enddate,
+                b.drug_type, b.drug, b.drug_name_generic, b.formulary_drug_cd,
+                {dose("b.dose_val_rx")} AS dose_val_rx,
+                b.dose_unit_rx,
+                {dose("b.form_val_disp")} AS form_val_disp,
+                b.form_unit_disp, b.route,
+                {duration_sql("b.startdate", "b.enddate", 86400)} AS duration_days
+            FROM {{source}} AS b
+        """
+    
     def parse_dose_value(self, value: str) -> Optional[float]:
-        """Parse dose value from string."""
+        """Parse dose value from string, following the same rules as sql_select."""
         if not value:
             return None
-        try:
-            # Remove common prefixes/suffixes
-            cleaned = value.strip().replace(',', '')
-            return float(cleaned)
-        except (ValueError, TypeError):
-            return None
+        return parse_numeric(value.strip(NUMERIC_WHITESPACE).replace(',', ''))
     
     def calculate_duration(self, start: datetime, end: datetime) -> Optional[float]:
         """Calculate duration in days."""
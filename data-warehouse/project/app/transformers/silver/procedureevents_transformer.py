@@ -4,7 +4,7 @@ from datetime import datetime
 
 from app.models.bronze import BronzeProcedureEventsMetaVision
 from app.models.silver import SilverProcedureEvent
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import BaseSilverTransformer, duration_sql
 
 
 class ProcedureEventsTransformer(BaseSilverTransformer):
@@ -18,6 +18,22 @@ class ProcedureEventsTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverProcedureEvent
     
+    @property
+    def sql_select(self) -> str:
+        return f"""
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id, b.itemid,
+                b.starttime, b.endtime, b.value, b.valueuom, b.location,
+                b.statusdescription AS status_description,
+                (NOT canceled AND b.endtime IS NOT NULL) AS is_completed,
+                canceled AS is_canceled,
+                {duration_sql("b.starttime", "b.endtime", 3600)} AS duration_hours
+            FROM {{source}} AS b
+            CROSS JOIN LATERAL (
+                SELECT COALESCE(UPPER(b.statusdescription) LIKE '%CANCEL%', FALSE) AS canceled
+            ) AS s
+        """
+    
     def calculate_duration(self, start: datetime, end: datetime) -> Optional[float]:
         """Calculate duration in hours."""
         if not start or not end:
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from app.models.bronze import BronzeTransfers
 from app.models.silver import SilverTransfer
-from .base_transformer import BaseSilverTransformer
+from .base_transformer import BaseSilverTransformer, sql_in_list, duration_sql
 
 
 ICU_UNITS = ['MICU', 'SICU', 'CCU', 'CSRU', 'TSICU', 'NICU', 'NWARD']
@@ -21,6 +21,20 @@ class TransferTransformer(BaseSilverTransformer):
     def silver_model(self):
         return SilverTransfer
     
+    @property
+    def sql_select(self) -> str:
+        icu_units = sql_in_list(ICU_UNITS)
+        return f"""
+            SELECT
+                b.row_id, b.subject_id, b.hadm_id, b.icustay_id, b.eventtype,
+                b.prev_careunit, b.curr_careunit, b.prev_wardid, b.curr_wardid,
+                b.intime, b.outtime,
+                {duration_sql("b.intime", "b.outtime", 3600)} AS duration_hours,
+                (COALESCE(UPPER(b.curr_careunit) IN ({icu_units}), FALSE)
+                    OR COALESCE(UPPER(b.prev_careunit) IN ({icu_units}), FALSE)) AS is_icu_transfer
+            FROM {{source}} AS b
+        """
+    
     def calculate_duration(self, intime: datetime, outtime: datetime) -> Optional[float]:
         """Calculate duration in hours."""
         if not intime or not outtime:
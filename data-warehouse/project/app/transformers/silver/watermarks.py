@@ -0,0 +1,152 @@
+"""
+High-water marks for incremental Bronze → Silver transformation.
+
+Bronze updated_at is now() of the writing transaction, i.e. its start
+time, and rows only become visible when that transaction commits. A window
+therefore never extends past the start of the oldest transaction still
+open: rows it has yet to commit will be stamped at or after that time and
+are picked up by a later run instead of falling behind the watermark.
+
+Only inserted and updated bronze rows are propagated. Rows deleted from
+bronze stay in silver until a full (non-incremental) rebuild.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.models.silver import SilverWatermark
+
+# (exclusive lower bound, inclusive upper bound) on bronze updated_at;
+# a None lower bound means "from the beginning".
+Window = Tuple[Optional[datetime], Optional[datetime]]
+
+# Resolution of PostgreSQL timestamps
+TIMESTAMP_RESOLUTION = timedelta(microseconds=1)
+
+
+def open_transactions_start(session: Session) -> Optional[datetime]:
+    """
+    Start time of the oldest open transaction, including the caller's own.
+
+    Transactions of other roles are only visible to superusers and members
+    of pg_read_all_stats, so the ETL should write bronze as the same role.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Oldest transaction start, or None if the database is not PostgreSQL
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    return session.execute(
+        text("SELECT min(xact_start) FROM pg_stat_activity WHERE xact_start IS NOT NULL")
+    ).scalar()
+
+
+def open_window(session: Session, silver_model, bronze_model, incremental: bool) -> Window:
+    """
+    Determine which bronze rows a run should process.
+
+    The upper bound is the bronze table's current MAX(updated_at), captured
+    before reading, so rows written while the run is in progress are left
+    for the next run instead of being half-processed. It is kept below the
+    start of the oldest open transaction, whose rows are not visible yet
+    but will be stamped with that start time. The open transactions are
+    read first: any transaction missing from them has either committed
+    before MAX(updated_at) is read or started after them.
+
+    Args:
+        session: SQLAlchemy session
+        silver_model: Silver model class being written
+        bronze_model: Bronze model class being read
+        incremental: Start after the stored watermark instead of from the
+            beginning
+
+    Returns:
+        (low, high) window on bronze updated_at
+    """
+    horizon = open_transactions_start(session)
+    high = session.execute(select(func.max(bronze_model.updated_at))).scalar()
+    if high is not None and horizon is not None and high >= horizon:
+        high = horizon - TIMESTAMP_RESOLUTION
+
+    low = None
+    if incremental:
+        mark = session.get(SilverWatermark, (silver_model.__tablename__, bronze_model.__tablename__))
+        low = mark.watermark if mark else None
+        if low is not None and high is not None and high < low:
+            high = low
+
+    return low, high
+
+
+def window_criteria(bronze_model, window: Window) -> List:
+    """
+    ORM filter criteria selecting the bronze rows inside a window.
+
+    Args:
+        bronze_model: Bronze model class being read
+        window: (low, high) from open_window
+
+    Returns:
+        List of SQLAlchemy criteria
+    """
+    low, high = window
+    criteria = []
+    if low is not None:
+        criteria.append(bronze_model.updated_at > low)
+    if high is not None:
+        criteria.append(bronze_model.updated_at <= high)
+    return criteria
+
+
+def window_sql(bronze_model, window: Window) -> Tuple[str, Dict[str, Any]]:
+    """
+    SQL relation selecting the bronze rows inside a window.
+
+    Args:
+        bronze_model: Bronze model class being read
+        window: (low, high) from open_window
+
+    Returns:
+        (relation, bind parameters): the bare table name when the window is
+        unbounded, otherwise a parenthesized filtered subquery
+    """
+    low, high = window
+    table = bronze_model.__table__.fullname
+
+    conditions, params = [], {}
+    if low is not None:
+        conditions.append("updated_at > :watermark_low")
+        params["watermark_low"] = low
+    if high is not None:
+        conditions.append("updated_at <= :watermark_high")
+        params["watermark_high"] = high
+
+    if not conditions:
+        return table, params
+    return f"(SELECT * FROM {table} WHERE {' AND '.join(conditions)})", params
+
+
+def save_watermark(session: Session, silver_model, bronze_model, window: Window):
+    """
+    Record the upper bound of a completed window. The caller commits.
+
+    Args:
+        session: SQLAlchemy session
+        silver_model: Silver model class written
+        bronze_model: Bronze model class read
+        window: (low, high) from open_window
+    """
+    _, high = window
+    if high is None:
+        return
+
+    session.merge(SilverWatermark(
+        target_table=silver_model.__tablename__,
+        source_table=bronze_model.__tablename__,
+        watermark=high,
+    ))
@@ -0,0 +1,307 @@
+"""Benchmark every pipeline stage on deterministic synthetic MIMIC data."""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.benchmarks import SyntheticMimic, compare_to_baseline, measure_stage
+from app.models.bronze import Base as BronzeBase
+from app.models.gold import GoldBase
+from app.models.silver import SilverBase
+from app.shared import engine, get_db, logger, metrics
+from app.transformers.bronze import CSV_READERS, FIELD_MAPPINGS, MODEL_CLASSES, BaseCSVLoader, find_csv, load_table
+from app.transformers.bronze.arrow_reader import require_pyarrow
+
+try:
+    from scripts.load_gold import GOLD_LOADERS, create_gold_schema, create_gold_tables, run_loader
+    from scripts.load_silver import ALL_TABLES, SPECIAL_TRANSFORMERS, STANDARD_TRANSFORMERS, create_silver_schema
+except ImportError:
+    # Fallback if running as script vs module
+    from load_gold import GOLD_LOADERS, create_gold_schema, create_gold_tables, run_loader
+    from load_silver import ALL_TABLES, SPECIAL_TRANSFORMERS, STANDARD_TRANSFORMERS, create_silver_schema
+
+STAGES = ["parse", "bronze", "silver", "gold"]
+DATABASE_STAGES = ["bronze", "silver", "gold"]
+DATA_MARKER = "_synthetic.json"
+
+
+def prepare_data(data_dir: Path, rows: int, seed: int) -> Dict[str, int]:
+    """
+    Generate the synthetic CSVs, reusing an existing set with the same size and seed.
+
+    Returns:
+        Rows per table
+    """
+    marker = data_dir / DATA_MARKER
+    if marker.exists():
+        meta = json.loads(marker.read_text())
+        if meta["rows"] == rows and meta["seed"] == seed:
+            logger.info(f"Reusing synthetic data in {data_dir}")
+            return meta["tables"]
+
+    logger.info(f"Generating synthetic data ({rows:,} rows per event table, seed {seed}) in {data_dir}")
+    counts = SyntheticMimic(rows, seed).write(data_dir)
+    marker.write_text(json.dumps({"rows": rows, "seed": seed, "tables": counts}, indent=2))
+    return counts
+
+
+def layers_to_reset(stages: List[str]) -> List[str]:
+    """
+    Layers a run must empty: the earliest database stage selected and every later one.
+
+    Earlier layers are kept, since they hold the input of the selected stages.
+    """
+    selected = [stage for stage in DATABASE_STAGES if stage in stages]
+    return DATABASE_STAGES[DATABASE_STAGES.index(selected[0]):] if selected else []
+
+
+def reset_layers(layers: List[str]):
+    """
+    Empty the tables (including ETL control tables) of the given layers.
+
+    Args:
+        layers: Layer names from DATABASE_STAGES
+    """
+    bases = {"bronze": BronzeBase, "silver": SilverBase, "gold": GoldBase}
+    with get_db() as session:
+        with engine.connect() as conn:
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS bronze"))
+            conn.commit()
+        create_silver_schema(session)
+        create_gold_schema(session)
+        BronzeBase.metadata.create_all(engine)
+        SilverBase.metadata.create_all(engine)
+        create_gold_tables(engine)
+
+        tables = [t.fullname for layer in layers for t in bases[layer].metadata.sorted_tables]
+        session.execute(text(f"TRUNCATE {', '.join(tables)} CASCADE"))
+    logger.info(f"Truncated {len(tables)} {', '.join(layers)} tables")
+
+
+def parse_result_name(table_name: str, reader: str) -> str:
+    """Result name of a parse run; the csv reader keeps the bare table name so older baselines still compare."""
+    return table_name if reader == "csv" else f"{table_name}[{reader}]"
+
+
+def benchmark_parse(data_dir: Path, batch_size: int, readers: List[str]) -> List[Dict]:
+    """Time CSV parsing and type coercion alone, without a database, with each reader."""
+    if "arrow" in readers:
+        require_pyarrow()  # keep the one-off import out of the first table's time
+    results = []
+    for table_name, field_mapping in FIELD_MAPPINGS.items():
+        csv_path = find_csv(data_dir, table_name)
+        for reader in readers:
+            with measure_stage("parse", parse_result_name(table_name, reader)) as result:
+                results.append(result)
+                loader = BaseCSVLoader(MODEL_CLASSES[table_name], csv_path, batch_size, reader=reader)
+                result["rows"] = sum(len(batch) for batch in loader.read_csv_batches(field_mapping))
+    return results
+
+
+def benchmark_bronze(data_dir: Path, batch_size: int, loader_engine: str, reader: str) -> List[Dict]:
+    """Time loading each CSV into its bronze table."""
+    results = []
+    for table_name in FIELD_MAPPINGS:
+        with measure_stage("bronze", table_name, engine) as result:
+            results.append(result)
+            with get_db() as session:
+                stats = load_table(session, table_name, data_dir, batch_size, loader_engine, reader=reader)
+            result["rows"] = stats["loaded"]
+    return results
+
+
+def benchmark_silver(batch_size: int, mode: str) -> List[Dict]:
+    """Time each silver transformer."""
+    results = []
+    for table_name in ALL_TABLES:
+        transformer_class = STANDARD_TRANSFORMERS.get(table_name) or SPECIAL_TRANSFORMERS[table_name]
+        with measure_stage("silver", table_name, engine) as result:
+            results.append(result)
+            with get_db() as session:
+                transformer = transformer_class(session, batch_size=batch_size)
+                stats = transformer.transform_sql() if mode == "sql" else transformer.transform()
+            result["rows"] = stats["transformed"]
+    return results
+
+
+def benchmark_gold() -> List[Dict]:
+    """Time each gold loader on its own, in dependency order."""
+    results = []
+    for name in GOLD_LOADERS:
+        with measure_stage("gold", name, engine) as result:
+            results.append(result)
+            run_loader(name)
+        with get_db() as session:
+            result["rows"] = session.execute(text(f"SELECT COUNT(*) FROM gold.{name}")).scalar()
+        result["rows_per_sec"] = round(result["rows"] / result["seconds"], 1) if result["seconds"] > 0 else 0.0
+    return results
+
+
+def run_stage(stage: str, runner, *args) -> List[Dict]:
+    """Run one stage, logging instead of aborting when it fails."""
+    logger.info(f"\n--- Benchmarking {stage} ---")
+    try:
+        return runner(*args)
+    except Exception as e:
+        logger.error(f"Stage {stage} failed: {e}", exc_info=True)
+        return [{"stage": stage, "name": "*", "rows": 0, "error": str(e)}]
+
+
+def print_results(results: List[Dict]):
+    """Print one line per stage result."""
+    print(f"\n{'STAGE':<8} {'NAME':<26} {'ROWS':>11} {'SECS':>9} {'ROWS/SEC':>11} {'DB SECS':>9} {'RSS MB':>8}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['stage']:<8} {r['name']:<26} ERROR: {r['error']}")
+            continue
+        db_seconds = f"{r['db_seconds']:.2f}" if r.get("db_seconds") is not None else "-"
+        rss = f"{r['peak_rss_mb']:.0f}" if r.get("peak_rss_mb") is not None else "-"
+        print(
+            f"{r['stage']:<8} {r['name']:<26} {r['rows']:>11,} {r['seconds']:>9.2f} "
+            f"{r['rows_per_sec']:>11,.0f} {db_seconds:>9} {rss:>8}"
+        )
+
+
+def print_reader_comparison(results: List[Dict], readers: List[str]):
+    """Print each reader's parse throughput relative to the first reader, per table."""
+    by_name = {r["name"]: r for r in results if r["stage"] == "parse" and "error" not in r}
+    base_reader = readers[0]
+    print(f"\nParse throughput relative to the {base_reader} reader")
+    print(f"{'TABLE':<22} " + " ".join(f"{reader:>10}" for reader in readers))
+    for table_name in FIELD_MAPPINGS:
+        base = by_name.get(parse_result_name(table_name, base_reader))
+        if not base or not base["rows_per_sec"]:
+            continue
+        ratios = []
+        for reader in readers:
+            result = by_name.get(parse_result_name(table_name, reader))
+            ratios.append(f"{result['rows_per_sec'] / base['rows_per_sec']:>9.2f}x" if result else f"{'-':>10}")
+        print(f"{table_name:<22} " + " ".join(ratios))
+
+
+def main():
+    """Run the pipeline benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark bronze, silver and gold stages on synthetic data")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows per event table (default: 10000)")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed (default: 42)")
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="Where to write the synthetic CSVs (default: benchmarks/data/<rows>)",
+    )
+    parser.add_argument(
+        "--stage",
+        action="append",
+        choices=STAGES,
+        help="Stage to run (repeatable, default: all). Database stages need the earlier ones' data.",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000, help="Loader/transformer batch size (default: 5000)")
+    parser.add_argument("--engine", choices=["orm", "copy"], default="copy", help="Bronze loading engine (default: copy)")
+    parser.add_argument(
+        "--reader",
+        action="append",
+        choices=CSV_READERS,
+        help="CSV reader (repeatable, default: csv). The parse stage runs every reader and compares them "
+             "with the first; the bronze stage loads with the first.",
+    )
+    parser.add_argument("--silver-mode", choices=["python", "sql"], default="sql", help="Silver mode (default: sql)")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Required for database stages: empties the earliest selected layer and all later ones first "
+             "(e.g. --stage silver keeps bronze and empties silver and gold)",
+    )
+    parser.add_argument("--output", type=Path, help="Results JSON (default: benchmarks/results/pipeline_<rows>.json)")
+    parser.add_argument("--baseline", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed rows/sec drop versus the baseline before flagging a regression (default: 0.10)",
+    )
+    args = parser.parse_args()
+
+    stages = args.stage or STAGES
+    readers = list(dict.fromkeys(args.reader or ["csv"]))
+    data_dir = args.data_dir or Path("benchmarks/data") / str(args.rows)
+    output = args.output or Path("benchmarks/results") / f"pipeline_{args.rows}.json"
+
+    reset = layers_to_reset(stages)
+    if reset and not args.truncate:
+        logger.error(f"Database stages empty the {', '.join(reset)} tables; pass --truncate to confirm")
+        return 2
+
+    logger.info("=== Pipeline Benchmark ===")
+    table_rows = prepare_data(data_dir, args.rows, args.seed)
+
+    if args.truncate and reset:
+        reset_layers(reset)
+
+    results = []
+    if "parse" in stages:
+        results += run_stage("parse", benchmark_parse, data_dir, args.batch_size, readers)
+    if "bronze" in stages:
+        results += run_stage("bronze", benchmark_bronze, data_dir, args.batch_size, args.engine, readers[0])
+    if "silver" in stages:
+        results += run_stage("silver", benchmark_silver, args.batch_size, args.silver_mode)
+    if "gold" in stages:
+        results += run_stage("gold", benchmark_gold)
+
+    print_results(results)
+    if "parse" in stages and len(readers) > 1:
+        print_reader_comparison(results, readers)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "rows": args.rows,
+        "seed": args.seed,
+        "table_rows": table_rows,
+        "settings": {
+            "batch_size": args.batch_size,
+            "engine": args.engine,
+            "readers": readers,
+            "silver_mode": args.silver_mode,
+            "python": platform.python_version(),
+        },
+        "stages": results,
+        "pipeline_metrics": metrics.to_dict(),
+    }
+
+    status = 1 if any("error" in r for r in results) else 0
+    if args.baseline and args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("rows") != args.rows:
+            logger.warning(f"Baseline was recorded at {baseline.get('rows'):,} rows, this run at {args.rows:,}")
+        report["regressions"] = compare_to_baseline(results, baseline["stages"], args.tolerance)
+        for regression in report["regressions"]:
+            logger.warning(
+                f"Regression in {regression['stage']}: {regression['rows_per_sec']:,.0f} rows/sec vs "
+                f"{regression['baseline_rows_per_sec']:,.0f} baseline ({regression['change_pct']}%)"
+            )
+        if report["regressions"]:
+            status = 1
+        else:
+            logger.info(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"Results written to {output}")
+    if args.save_baseline and args.baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        logger.info(f"Baseline saved to {args.baseline}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Compare gold query latency on PostgreSQL and the DuckDB Parquet export."""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.analytics import ANALYTICS_BACKENDS, GOLD_QUERIES, analytics_session, run_query
+from app.shared import logger
+
+
+def benchmark_backend(backend: str, names: List[str], repeat: int, cache: bool = False) -> Dict:
+    """
+    Time each named gold query on one backend.
+
+    One warm-up run per query is not counted, so both backends are measured
+    with warm caches and an already open session.
+
+    Args:
+        backend: 'postgres' or 'duckdb'
+        names: GOLD_QUERIES keys to run
+        repeat: Timed runs per query
+        cache: Serve the timed runs from the query result cache
+
+    Returns:
+        Per-query stats (median/min milliseconds and row count)
+    """
+    results = {}
+    with analytics_session(backend) as session:
+        for name in names:
+            try:
+                rows = len(run_query(name, session, cache=cache))
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run_query(name, session, cache=cache)
+                    timings.append((time.perf_counter() - start) * 1000)
+                results[name] = {
+                    "median_ms": round(statistics.median(timings), 2),
+                    "min_ms": round(min(timings), 2),
+                    "rows": rows,
+                }
+            except Exception as e:
+                logger.error(f"{backend}: {name} failed: {e}")
+                results[name] = {"error": str(e)}
+    return results
+
+
+def speedups(results: Dict[str, Dict]) -> Dict[str, float]:
+    """Median PostgreSQL latency divided by median DuckDB latency, per query."""
+    postgres, duckdb = results.get("postgres", {}), results.get("duckdb", {})
+    return {
+        name: round(postgres[name]["median_ms"] / duckdb[name]["median_ms"], 2)
+        for name in postgres
+        if "median_ms" in postgres[name] and "median_ms" in duckdb.get(name, {}) and duckdb[name]["median_ms"] > 0
+    }
+
+
+def main():
+    """Run the query latency benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark gold queries on PostgreSQL vs DuckDB")
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=ANALYTICS_BACKENDS,
+        help="Backend to benchmark (repeatable, default: both)",
+    )
+    parser.add_argument(
+        "--query",
+        action="append",
+        choices=sorted(GOLD_QUERIES),
+        help="Query to run (repeatable, default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query (default: 5)")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Time cache hits (settings.query_cache) instead of the backends themselves",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    backends = args.backend or list(ANALYTICS_BACKENDS)
+    names = args.query or list(GOLD_QUERIES)
+
+    logger.info("=== Gold Query Benchmark ===")
+    results = {}
+    for backend in backends:
+        logger.info(f"\nBenchmarking {backend} ({len(names)} queries x {args.repeat})")
+        try:
+            results[backend] = benchmark_backend(backend, names, args.repeat, args.cache)
+        except Exception as e:
+            logger.error(f"Backend {backend} unavailable: {e}")
+
+    ratios = speedups(results)
+
+    print("\n=== Median latency (ms) ===")
+    print(f"{'QUERY':<26}" + "".join(f"  {b.upper():>10}" for b in results) + f"  {'SPEEDUP':>8}")
+    for name in names:
+        cells = "".join(f"  {results[b][name].get('median_ms', 'error'):>10}" for b in results)
+        speedup = f"{ratios[name]:.2f}x" if name in ratios else "-"
+        print(f"{name:<26}{cells}  {speedup:>8}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"results": results, "speedup": ratios}, indent=2))
+        logger.info(f"Results written to {args.output}")
+
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 """Quick query examples for Bronze layer."""
+import argparse
 import sys
 from pathlib import Path
 
@@ -85,17 +86,41 @@ def example_join_patients_admissions(limit=5):
         return results
 
 
+def run_gold_examples(backend):
+    """Run the same examples on the gold star schema via the chosen backend."""
+    from app.analytics import queries
+
+    logger.info(f"=== Gold Layer Query Examples ({backend}) ===\n")
+    queries.example_count_patients(backend=backend)
+    queries.example_get_first_patients(backend=backend)
+    queries.example_count_admissions(backend=backend)
+    queries.example_emergency_admissions(backend=backend)
+    queries.example_join_patients_admissions(backend=backend)
+
+
 def main():
     """Run example queries."""
-    logger.info("=== Bronze Layer Query Examples ===\n")
-    
+    parser = argparse.ArgumentParser(description="Run example queries")
+    parser.add_argument(
+        "--backend",
+        choices=["postgres", "duckdb"],
+        default=None,
+        help="Run the gold equivalents on PostgreSQL or the DuckDB Parquet export instead of the Bronze examples",
+    )
+    args = parser.parse_args()
+
     try:
-        # Run examples
-        example_count_patients()
-        example_get_first_patients()
-        example_count_admissions()
-        example_emergency_admissions()
-        example_join_patients_admissions()
+        if args.backend:
+            run_gold_examples(args.backend)
+        else:
+            logger.info("=== Bronze Layer Query Examples ===\n")
+
+            # Run examples
+            example_count_patients()
+            example_get_first_patients()
+            example_count_admissions()
+            example_emergency_admissions()
+            example_join_patients_admissions()
         
         logger.info("\n✓ All example queries completed successfully")
         
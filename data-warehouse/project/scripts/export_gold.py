@@ -0,0 +1,80 @@
+"""Export Gold tables to partitioned Parquet files."""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.analytics import export_gold, export_tables
+from app.shared import get_db, logger, settings
+
+
+def main():
+    """Main entry point for the Parquet export."""
+    parser = argparse.ArgumentParser(description="Export Gold tables to partitioned Parquet files")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=settings.export_path,
+        help=f"Export root directory (default: {settings.export_path})",
+    )
+    parser.add_argument(
+        "--table",
+        action="append",
+        choices=[table.name for table in export_tables()],
+        help="Table to export (repeatable). If not specified, exports all gold tables.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rewrite partitions whose contents changed since the last export",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50000,
+        help="Rows per Arrow batch and Parquet row group (default: 50000)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["zstd", "snappy", "gzip", "none"],
+        default="zstd",
+        help="Parquet compression codec (default: zstd)",
+    )
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("GOLD → PARQUET EXPORT")
+    logger.info("=" * 60)
+    logger.info(f"Output: {args.output} ({'incremental' if args.incremental else 'full'})")
+
+    try:
+        with get_db() as session:
+            results = export_gold(
+                session,
+                args.output,
+                tables=args.table,
+                incremental=args.incremental,
+                batch_size=args.batch_size,
+                compression=args.compression,
+            )
+
+        print("\n=== Export Summary ===")
+        print(f"{'TABLE':<24}  {'ROWS':>12}  {'WRITTEN':>7}  {'KEPT':>5}  {'SECS':>8}")
+        for table_name, stats in results.items():
+            print(
+                f"{table_name:<24}  {stats['rows']:>12,}  {stats['written']:>7}  "
+                f"{stats['unchanged']:>5}  {stats['seconds']:>8.2f}"
+            )
+
+        logger.info("Gold export complete")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Gold export failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
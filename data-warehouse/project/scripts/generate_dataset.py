@@ -0,0 +1,97 @@
+"""Generate a synthetic MIMIC-III extract of any size for scale testing."""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.benchmarks.synthetic import CHUNK_ROWS, EVENT_TABLES, SyntheticMimic
+from app.shared import logger, settings
+from app.transformers.bronze import FIELD_MAPPINGS
+
+
+def parse_size(value: str):
+    """Parse a TABLE=ROWS override."""
+    table, sep, rows = value.partition("=")
+    table = table.strip().upper()
+    if not sep or table not in EVENT_TABLES or not rows.strip().isdigit():
+        raise argparse.ArgumentTypeError(f"expected EVENT_TABLE=ROWS with one of {', '.join(EVENT_TABLES)}")
+    return table, int(rows)
+
+
+def main():
+    """Main entry point for synthetic data generation."""
+    parser = argparse.ArgumentParser(description="Generate referentially consistent synthetic MIMIC-III CSVs")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=settings.csv_data_path,
+        help=f"Directory for the CSV files (default: {settings.csv_data_path})",
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per event table (default: 100000)")
+    parser.add_argument(
+        "--table-rows",
+        type=parse_size,
+        action="append",
+        default=[],
+        metavar="TABLE=ROWS",
+        help="Row count for one event table, e.g. LABEVENTS=100000000 (repeatable)",
+    )
+    parser.add_argument(
+        "--table",
+        action="append",
+        choices=list(FIELD_MAPPINGS),
+        help="Table to generate (repeatable). If not specified, generates all tables.",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count(),
+        help=f"Worker processes rendering event chunks (default: {os.cpu_count()})",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=CHUNK_ROWS,
+        help=f"Event rows per worker task; part of what the seed reproduces (default: {CHUNK_ROWS})",
+    )
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("SYNTHETIC MIMIC-III GENERATION")
+    logger.info("=" * 60)
+    logger.info(f"Output: {args.output} ({args.processes} processes, seed {args.seed})")
+
+    try:
+        start = time.perf_counter()
+        generator = SyntheticMimic(args.rows, args.seed, sizes=dict(args.table_rows), chunk_rows=args.chunk_rows)
+        logger.info(
+            f"Cohort: {len(generator.patients):,} patients, {len(generator.admissions):,} admissions, "
+            f"{len(generator.icustays):,} ICU stays"
+        )
+        counts = generator.write(args.output, args.table, args.processes)
+        elapsed = time.perf_counter() - start
+
+        print("\n=== Generation Summary ===")
+        print(f"{'TABLE':<22}  {'ROWS':>13}  {'MB':>10}")
+        total_mb = 0.0
+        for table, rows in counts.items():
+            size_mb = (args.output / f"{table}.csv").stat().st_size / (1024 * 1024)
+            total_mb += size_mb
+            print(f"{table:<22}  {rows:>13,}  {size_mb:>10,.1f}")
+        total_rows = sum(counts.values())
+        print(f"{'TOTAL':<22}  {total_rows:>13,}  {total_mb:>10,.1f}")
+        print(f"\n{elapsed:.1f}s ({total_rows / elapsed:,.0f} rows/sec)")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Generation failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
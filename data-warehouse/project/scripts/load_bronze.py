@@ -1,13 +1,68 @@
 """Load CSV data into Bronze tables."""
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.shared import get_db, logger, settings
-from app.transformers.bronze import load_all_tables, load_table
+from app.models.bronze import BronzeFileManifest, BronzeLoadCheckpoint, BronzeRejectedRow
+from app.shared import critical_path, engine, format_timeline, get_db, initial_load, logger, metrics, settings
+from app.transformers.bronze import (
+    CSV_READERS,
+    LOADER_ENGINES,
+    MODEL_CLASSES,
+    TABLE_DEPENDENCIES,
+    create_staging_schema,
+    load_all_tables,
+    load_table,
+    load_tables_parallel,
+)
+
+
+def print_table_stats(table_name, stats):
+    """Print loading statistics for one table."""
+    if "error" in stats:
+        print(f"\n{table_name}: ERROR - {stats['error']}")
+    elif stats.get("unchanged"):
+        print(f"\n{table_name}: unchanged, skipped")
+    else:
+        print(f"\n{table_name}:")
+        print(f"  Total rows: {stats['total']}")
+        print(f"  Loaded: {stats['loaded']}")
+        if stats.get("resumed_rows"):
+            print(f"  Already loaded (resumed): {stats['resumed_rows']}")
+        print(f"  Errors: {stats['errors']}")
+        print(f"  Rows/sec: {stats['rows_per_sec']:.0f}")
+
+
+def run_parallel(args):
+    """Load all tables concurrently and print the per-table timeline."""
+    results = load_tables_parallel(
+        args.csv_dir,
+        args.batch_size,
+        args.engine,
+        args.workers,
+        chunk_workers=args.chunk_workers,
+        vectorized=args.vectorized,
+        resume=args.resume,
+        skip_unchanged=args.skip_unchanged,
+        reader=args.reader,
+    )
+
+    print("\n=== Loading Statistics ===")
+    for table_name, result in results.items():
+        if result.error:
+            print_table_stats(table_name, {"error": result.error})
+        elif result.result is not None:
+            print_table_stats(table_name, result.result)
+
+    print("\n=== Timeline ===")
+    print(format_timeline(results))
+    print(f"\nCritical path: {' -> '.join(critical_path(results, TABLE_DEPENDENCIES))}")
+
+    return 1 if any(r.error for r in results.values()) else 0
 
 
 def main():
@@ -22,7 +77,7 @@ def main():
         "--csv-dir",
         type=Path,
         default=settings.csv_data_path,
-        help=f"Directory containing CSV files (default: {settings.csv_data_path})",
+        help=f"Directory containing <TABLE>.csv or <TABLE>.csv.gz files (default: {settings.csv_data_path})",
     )
     parser.add_argument(
         "--batch-size",
@@ -30,8 +85,67 @@ def main():
         default=settings.batch_size,
         help=f"Batch size for loading (default: {settings.batch_size})",
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=list(LOADER_ENGINES.keys()),
+        default="orm",
+        help="Loading engine: 'orm' (per-row ORM inserts) or 'copy' (PostgreSQL COPY FROM STDIN)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of tables to load concurrently when loading all tables (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=1,
+        help="Split each large CSV into byte-range chunks loaded by N processes (default: 1)",
+    )
+    parser.add_argument(
+        "--reader",
+        type=str,
+        choices=CSV_READERS,
+        default="csv",
+        help="CSV reader: 'csv' (csv module, parsed cell by cell) or 'arrow' "
+             "(pyarrow.csv on all cores, typed column by column; requires pyarrow)",
+    )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Coerce CSV batches column by column with pandas instead of cell by cell",
+    )
+    parser.add_argument(
+        "--initial-load",
+        action="store_true",
+        help="Drop secondary indexes during the load and rebuild them in parallel afterwards, "
+             "with synchronous_commit=off (for loading empty tables)",
+    )
+    reload_mode = parser.add_mutually_exclusive_group()
+    reload_mode.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue each table from the byte offset of its last committed batch instead of "
+             "reloading the file (fails if the file changed since)",
+    )
+    reload_mode.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip tables whose CSV is unchanged since their last --skip-unchanged load; reload the "
+             "others into a staging table and swap it in",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        type=Path,
+        help="Write per-stage timings, row/byte counts and database round trips to this file "
+             "(.prom/.txt: Prometheus text format, otherwise JSON). Tables loaded by --workers processes are not included.",
+    )
 
     args = parser.parse_args()
+    if args.vectorized and args.reader != "csv":
+        parser.error("--vectorized only applies to --reader csv")
 
     # Validate CSV directory
     if not args.csv_dir.exists():
@@ -40,41 +154,85 @@ def main():
 
     logger.info(f"CSV directory: {args.csv_dir}")
     logger.info(f"Batch size: {args.batch_size}")
+    logger.info(f"Engine: {args.engine}")
+    logger.info(f"Reader: {args.reader}")
+
+    tables = [MODEL_CLASSES[args.table].__table__] if args.table in MODEL_CLASSES else [
+        model.__table__ for model in MODEL_CLASSES.values()
+    ]
+    load_mode = initial_load(engine, tables) if args.initial_load else nullcontext()
 
     try:
-        with get_db() as session:
-            if args.table:
-                # Load specific table
-                logger.info(f"Loading table: {args.table}")
-                stats = load_table(session, args.table, args.csv_dir, args.batch_size)
-                
-                print("\n=== Loading Statistics ===")
-                print(f"Table: {args.table}")
-                print(f"Total rows: {stats['total']}")
-                print(f"Loaded: {stats['loaded']}")
-                print(f"Errors: {stats['errors']}")
-            else:
-                # Load all tables
-                logger.info("Loading all tables...")
-                all_stats = load_all_tables(session, args.csv_dir, args.batch_size)
+        for control_table in (BronzeLoadCheckpoint, BronzeRejectedRow, BronzeFileManifest):
+            control_table.__table__.create(engine, checkfirst=True)
+        if args.skip_unchanged:
+            # Before any worker starts, so concurrent reloads do not race to create it
+            create_staging_schema(engine)
+
+        with load_mode:
+            if args.workers > 1 and not args.table:
+                status = run_parallel(args)
+                logger.info("Data loading completed" + (" with errors" if status else " successfully"))
+                return status
+
+            with get_db() as session:
+                if args.table:
+                    # Load specific table
+                    logger.info(f"Loading table: {args.table}")
+                    stats = load_table(
+                        session,
+                        args.table,
+                        args.csv_dir,
+                        args.batch_size,
+                        args.engine,
+                        args.chunk_workers,
+                        args.vectorized,
+                        args.resume,
+                        args.skip_unchanged,
+                        args.reader,
+                    )
                 
-                print("\n=== Loading Statistics ===")
-                for table_name, stats in all_stats.items():
-                    if "error" in stats:
-                        print(f"\n{table_name}: ERROR - {stats['error']}")
+                    print("\n=== Loading Statistics ===")
+                    print(f"Table: {args.table}")
+                    if stats.get("unchanged"):
+                        print("Unchanged, skipped")
                     else:
-                        print(f"\n{table_name}:")
-                        print(f"  Total rows: {stats['total']}")
-                        print(f"  Loaded: {stats['loaded']}")
-                        print(f"  Errors: {stats['errors']}")
+                        print(f"Total rows: {stats['total']}")
+                        print(f"Loaded: {stats['loaded']}")
+                        if stats["resumed_rows"]:
+                            print(f"Already loaded (resumed): {stats['resumed_rows']}")
+                        print(f"Errors: {stats['errors']}")
+                        print(f"Rows/sec: {stats['rows_per_sec']:.0f}")
+                else:
+                    # Load all tables
+                    logger.info("Loading all tables...")
+                    all_stats = load_all_tables(
+                        session,
+                        args.csv_dir,
+                        args.batch_size,
+                        args.engine,
+                        args.chunk_workers,
+                        args.vectorized,
+                        args.resume,
+                        args.skip_unchanged,
+                        args.reader,
+                    )
+                
+                    print("\n=== Loading Statistics ===")
+                    for table_name, stats in all_stats.items():
+                        print_table_stats(table_name, stats)
 
-        logger.info("Data loading completed successfully")
-        return 0
+            logger.info("Data loading completed successfully")
+            return 0
 
     except Exception as e:
         logger.error(f"Data loading failed: {e}", exc_info=True)
         return 1
 
+    finally:
+        if args.metrics_output:
+            metrics.write(args.metrics_output)
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,14 +1,31 @@
 """Load Silver data to Gold layer."""
 import argparse
+import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 from datetime import date, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
-from app.shared import get_db, logger
+from sqlalchemy import UniqueConstraint, text
+from app.shared import (
+    TaskResult,
+    bump_versions_on_commit,
+    engine,
+    format_timeline,
+    get_db,
+    initial_load,
+    logger,
+    metrics,
+    run_dag,
+)
 from app.models.gold import GoldBase
+from app.models.partitioning import get_partition, moved_rows_delete, table_partition_column
+from app.transformers.silver.watermarks import TIMESTAMP_RESOLUTION, open_transactions_start
 
 
 def create_gold_schema(session):
@@ -24,6 +41,258 @@ def create_gold_tables(engine):
     logger.info("Gold tables created")
 
 
+# ============================================================
+# INCREMENTAL REFRESH
+# ============================================================
+
+# Silver tables scanned for changed keys: (table, has hadm_id)
+SILVER_CHANGE_SOURCES = [
+    ("patients", False),
+    ("admissions", True),
+    ("icustays", True),
+    ("labevents", True),
+    ("prescriptions", True),
+    ("transfers", True),
+    ("inputevents", True),
+    ("outputevents", True),
+    ("procedureevents", True),
+    ("microbiologyevents", True),
+]
+
+# Aggregates grouped on something other than a patient or admission:
+# name -> (group key on silver rows and the fact, silver table, gold fact
+# holding each row's previous group, column joining the two, group key on
+# the aggregate). Keys are text expressions valid in PostgreSQL and SQLite.
+GROUPED_AGGREGATES = {
+    "agg_icu_performance": ("first_careunit", "icustays", "fact_icu_stay", "icustay_id", "careunit"),
+    "agg_daily_census": (
+        "CAST(DATE(admittime) AS TEXT)", "admissions", "fact_admission", "hadm_id", "CAST(date_key AS TEXT)"
+    ),
+    "agg_lab_summary": (
+        "subject_id || ':' || itemid", "labevents", "fact_lab_event", "row_id", "subject_id || ':' || itemid"
+    ),
+    "agg_medication_usage": ("drug", "prescriptions", "fact_prescription", "row_id", "drug"),
+    "agg_infection_stats": ("org_name", "microbiologyevents", "fact_microbiology", "row_id", "organism_name"),
+}
+
+GOLD_WATERMARK_NAME = "silver"
+
+
+def get_gold_watermark(session):
+    """Return the silver updated_at already reflected in gold, or None."""
+    return session.execute(
+        text("SELECT watermark FROM gold.etl_watermarks WHERE name = :name"),
+        {"name": GOLD_WATERMARK_NAME},
+    ).scalar()
+
+
+def get_silver_high_water(session):
+    """
+    Return the latest updated_at across the silver tables gold reads.
+
+    Silver rows are stamped with their transaction's start time and only
+    become visible at commit, so the mark is kept below the start of the
+    oldest open transaction, like the silver watermarks (see
+    app.transformers.silver.watermarks.open_window).
+    """
+    horizon = open_transactions_start(session)
+    maxima = " UNION ALL ".join(
+        f"SELECT MAX(updated_at) AS updated_at FROM silver.{table}"
+        for table, _ in SILVER_CHANGE_SOURCES
+    )
+    high = session.execute(text(f"SELECT MAX(updated_at) FROM ({maxima}) m")).scalar()
+    if high is not None and horizon is not None and high >= horizon:
+        high = horizon - TIMESTAMP_RESOLUTION
+    return high
+
+
+def save_gold_watermark(session, watermark):
+    """Record the silver high-water mark a completed load covered."""
+    if watermark is None:
+        return
+    session.execute(text("""
+        INSERT INTO gold.etl_watermarks (name, watermark)
+        VALUES (:name, :watermark)
+        ON CONFLICT (name) DO UPDATE SET watermark = EXCLUDED.watermark
+    """), {"name": GOLD_WATERMARK_NAME, "watermark": watermark})
+    session.commit()
+
+
+def collect_changed_keys(session, since, high):
+    """
+    Rebuild the changed-key tables from silver rows updated in (since, high].
+
+    Must run before the facts are refreshed: the groups changed rows were in
+    before are read from the facts (see GROUPED_AGGREGATES).
+
+    Args:
+        session: SQLAlchemy session
+        since: Previous gold watermark
+        high: Silver high-water mark this load covers
+    """
+    logger.info(f"Collecting keys changed since {since}...")
+    
+    subjects = " UNION ".join(
+        f"SELECT subject_id FROM silver.{table} WHERE updated_at > :since AND updated_at <= :high"
+        for table, _ in SILVER_CHANGE_SOURCES
+    )
+    admissions = " UNION ".join(
+        f"SELECT hadm_id FROM silver.{table} "
+        f"WHERE updated_at > :since AND updated_at <= :high AND hadm_id IS NOT NULL"
+        for table, has_hadm in SILVER_CHANGE_SOURCES if has_hadm
+    )
+    
+    for table in ("etl_changed_subjects", "etl_changed_admissions", "etl_changed_groups"):
+        session.execute(text(f"DELETE FROM gold.{table}"))
+    window = {"since": since, "high": high}
+    session.execute(text(f"INSERT INTO gold.etl_changed_subjects (subject_id) {subjects}"), window)
+    session.execute(text(f"INSERT INTO gold.etl_changed_admissions (hadm_id) {admissions}"), window)
+    for aggregate, (group_key, table, fact, join_column, _) in GROUPED_AGGREGATES.items():
+        changed_rows = f"SELECT {join_column} FROM silver.{table} WHERE updated_at > :since AND updated_at <= :high"
+        session.execute(text(f"""
+            INSERT INTO gold.etl_changed_groups (aggregate, group_key)
+            SELECT '{aggregate}', {group_key} FROM silver.{table}
+            WHERE updated_at > :since AND updated_at <= :high AND {group_key} IS NOT NULL
+            UNION
+            SELECT '{aggregate}', {group_key} FROM gold.{fact}
+            WHERE {join_column} IN ({changed_rows}) AND {group_key} IS NOT NULL
+        """), window)
+    session.commit()
+    
+    subject_count = session.execute(text("SELECT COUNT(*) FROM gold.etl_changed_subjects")).scalar()
+    admission_count = session.execute(text("SELECT COUNT(*) FROM gold.etl_changed_admissions")).scalar()
+    logger.info(f"Changed: {subject_count} patients, {admission_count} admissions")
+
+
+def changed_subjects(since, column="subject_id", keyword="WHERE"):
+    """SQL filter restricting `column` to changed patients (empty on full loads)."""
+    if since is None:
+        return ""
+    return f"{keyword} {column} IN (SELECT subject_id FROM gold.etl_changed_subjects)"
+
+
+def changed_admissions(since, column="hadm_id", keyword="WHERE"):
+    """SQL filter restricting `column` to changed admissions (empty on full loads)."""
+    if since is None:
+        return ""
+    return f"{keyword} {column} IN (SELECT hadm_id FROM gold.etl_changed_admissions)"
+
+
+def updated_since(since, column="updated_at", keyword="WHERE"):
+    """SQL filter keeping silver rows updated in (:since, :high] (empty on full loads)."""
+    if since is None:
+        return ""
+    return f"{keyword} {column} > :since AND {column} <= :high"
+
+
+def changed_groups(since, aggregate, keyword="AND"):
+    """
+    SQL filter restricting a grouped aggregate's silver rows to changed groups.
+
+    Every group a changed silver row is in now or was in before is
+    recomputed in full. Empty on full loads.
+
+    Args:
+        since: Previous gold watermark, or None for a full load
+        aggregate: Key of GROUPED_AGGREGATES
+        keyword: 'WHERE' or 'AND'
+    """
+    if since is None:
+        return ""
+    group_key = GROUPED_AGGREGATES[aggregate][0]
+    return (
+        f"{keyword} {group_key} IN "
+        f"(SELECT group_key FROM gold.etl_changed_groups WHERE aggregate = '{aggregate}')"
+    )
+
+
+def clear_groups(session, since, aggregate):
+    """
+    Delete the rows of a grouped aggregate that a load is about to recompute.
+
+    Full loads delete every row and incremental loads the changed groups,
+    so a group left without silver rows disappears. The caller commits,
+    together with the recomputed rows.
+
+    Args:
+        session: SQLAlchemy session
+        since: Previous gold watermark, or None for a full load
+        aggregate: Key of GROUPED_AGGREGATES
+    """
+    if since is None:
+        session.execute(text(f"DELETE FROM gold.{aggregate}"))
+        return
+    aggregate_key = GROUPED_AGGREGATES[aggregate][4]
+    session.execute(text(
+        f"DELETE FROM gold.{aggregate} WHERE {aggregate_key} IN "
+        f"(SELECT group_key FROM gold.etl_changed_groups WHERE aggregate = '{aggregate}')"
+    ))
+
+
+# ============================================================
+# PARTITIONED FACTS
+# ============================================================
+
+def row_key(target):
+    """
+    ON CONFLICT target for a fact keyed on the silver row id.
+
+    The fact's unique key on row_id, e.g. (row_id, source_system) for input
+    events. Partitioned tables can only enforce uniqueness together with
+    their partition key, so it is included when the target is partitioned.
+    """
+    for constraint in GoldBase.metadata.tables[target].constraints:
+        columns = [column.name for column in getattr(constraint, "columns", ())]
+        if isinstance(constraint, UniqueConstraint) and "row_id" in columns:
+            return ", ".join(columns)
+    raise ValueError(f"{target} has no unique key on row_id")
+
+
+def delete_moved_facts(session, target, source, since=None, high=None):
+    """
+    Delete fact rows whose silver row moved to another partition key value.
+
+    Run before upserting a partitioned fact on row_key(target), which would
+    otherwise insert a corrected row next to the stale one. Does nothing
+    for plain tables.
+
+    Args:
+        session: SQLAlchemy session
+        target: Fact table being loaded
+        source: Silver relation the fact is loaded from
+        since: Previous gold watermark, or None for a full load
+        high: Upper bound of the silver window
+    """
+    table = GoldBase.metadata.tables[target]
+    criteria = updated_since(since, "src.updated_at", keyword="").strip()
+    statement = moved_rows_delete(table, row_key(target).split(", "), source, criteria)
+    if statement is not None:
+        session.execute(text(statement), {"since": since, "high": high})
+
+
+def partition_source(table, target, suffix=None):
+    """
+    Silver relation restricted to the rows of one partition of a gold table.
+
+    Args:
+        table: Silver table to read
+        target: Partitioned gold table being loaded
+        suffix: Partition suffix, or None to read the whole table
+
+    Returns:
+        Table name or parenthesized subquery usable in a FROM clause
+
+    Raises:
+        ValueError: If the target is not partitioned or has no such partition
+    """
+    if suffix is None:
+        return table
+    column = table_partition_column(GoldBase.metadata.tables[target])
+    if column is None:
+        raise ValueError(f"{target} is not partitioned")
+    return f"(SELECT * FROM {table} WHERE {get_partition(suffix).predicate(target, column)})"
+
+
 def generate_dim_time(session, start_year=2100, end_year=2205):
     """Generate time dimension for MIMIC shifted dates."""
     from sqlalchemy.dialects.postgresql import insert
@@ -75,11 +344,11 @@ def generate_dim_time(session, start_year=2100, end_year=2205):
     logger.info(f"Generated {(end_date - start_date).days + 1} days")
 
 
-def load_dim_patient(session):
-    """Load patient dimension from silver.patients."""
+def load_dim_patient(session, since=None, high=None):
+    """Load patient dimension from silver.patients (only changed patients when `since` is set)."""
     logger.info("Loading dim_patient...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.dim_patient (subject_id, gender, is_deceased, total_admissions, total_icu_stays, first_admission, last_admission)
         SELECT 
             p.subject_id,
@@ -96,13 +365,16 @@ def load_dim_patient(session):
                    MIN(admittime) as first_admission,
                    MAX(admittime) as last_admission
             FROM silver.admissions
+            {changed_subjects(since)}
             GROUP BY subject_id
         ) a ON p.subject_id = a.subject_id
         LEFT JOIN (
             SELECT subject_id, COUNT(*) as total_icu_stays
             FROM silver.icustays
+            {changed_subjects(since)}
             GROUP BY subject_id
         ) i ON p.subject_id = i.subject_id
+        {changed_subjects(since, "p.subject_id")}
         ON CONFLICT (subject_id) DO UPDATE SET
             gender = EXCLUDED.gender,
             is_deceased = EXCLUDED.is_deceased,
@@ -185,11 +457,65 @@ def load_dim_careunit(session):
     logger.info(f"Loaded {count} care units to dim_careunit")
 
 
-def load_fact_admission(session):
-    """Load admission facts from silver."""
+# Silver tables counted per admission: (table, rollup column)
+ROLLUP_SOURCES = [
+    ("icustays", "num_icu_stays"),
+    ("labevents", "num_lab_tests"),
+    ("prescriptions", "num_prescriptions"),
+    ("procedureevents", "num_procedures"),
+    ("transfers", "num_transfers"),
+]
+
+
+def load_agg_admission_rollup(session, since=None, high=None):
+    """
+    Load per-admission event counts with one scan of each silver table.
+    
+    Counts are grouped by (subject_id, hadm_id); events without an admission
+    are kept under hadm_id 0 so patient totals stay complete. The affected
+    slice (everything on a full load, changed patients on an incremental
+    one) is deleted and rebuilt in the same transaction.
+    """
+    logger.info("Loading agg_admission_rollup...")
+    
+    columns = [column for _, column in ROLLUP_SOURCES]
+    branches = "\n            UNION ALL\n".join(
+        f"""            SELECT subject_id, hadm_id, {', '.join(
+                'COUNT(*)' if other == column else '0' for other in columns
+            )}
+            FROM silver.{table} {changed_subjects(since)}
+            GROUP BY subject_id, hadm_id"""
+        for table, column in ROLLUP_SOURCES
+    )
+    
+    if since is None:
+        session.execute(text("TRUNCATE gold.agg_admission_rollup"))
+    else:
+        session.execute(text(f"DELETE FROM gold.agg_admission_rollup {changed_subjects(since)}"))
+    
+    session.execute(text(f"""
+        INSERT INTO gold.agg_admission_rollup (subject_id, hadm_id, {', '.join(columns)})
+        SELECT subject_id, COALESCE(hadm_id, 0), {', '.join(f'SUM({c})' for c in columns)}
+        FROM (
+{branches}
+        ) AS counts ({'subject_id, hadm_id, ' + ', '.join(columns)})
+        GROUP BY subject_id, COALESCE(hadm_id, 0)
+    """))
+    session.commit()
+    
+    count = session.execute(text("SELECT COUNT(*) FROM gold.agg_admission_rollup")).scalar()
+    logger.info(f"Loaded {count} admission rollup records")
+
+
+def load_fact_admission(session, since=None, high=None):
+    """
+    Load admission facts from silver (only changed admissions when `since` is set).
+    
+    Event counts come from agg_admission_rollup, which must be loaded first.
+    """
     logger.info("Loading fact_admission...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_admission (
             hadm_id, subject_id, admission_type, admission_location, discharge_location,
             insurance, admittime, dischtime, los_days, los_hours,
@@ -207,44 +533,37 @@ def load_fact_admission(session):
             a.dischtime,
             a.los_days,
             a.los_hours,
-            COALESCE(i.num_icu_stays, 0),
-            COALESCE(l.num_lab_tests, 0),
-            COALESCE(p.num_prescriptions, 0),
-            COALESCE(pr.num_procedures, 0),
-            COALESCE(t.num_transfers, 0),
+            COALESCE(r.num_icu_stays, 0),
+            COALESCE(r.num_lab_tests, 0),
+            COALESCE(r.num_prescriptions, 0),
+            COALESCE(r.num_procedures, 0),
+            COALESCE(r.num_transfers, 0),
             a.hospital_expire_flag,
             dp.patient_key,
             DATE(a.admittime),
             DATE(a.dischtime)
         FROM silver.admissions a
         LEFT JOIN gold.dim_patient dp ON a.subject_id = dp.subject_id
-        LEFT JOIN (
-            SELECT hadm_id, COUNT(*) as num_icu_stays
-            FROM silver.icustays GROUP BY hadm_id
-        ) i ON a.hadm_id = i.hadm_id
-        LEFT JOIN (
-            SELECT hadm_id, COUNT(*) as num_lab_tests
-            FROM silver.labevents GROUP BY hadm_id
-        ) l ON a.hadm_id = l.hadm_id
-        LEFT JOIN (
-            SELECT hadm_id, COUNT(*) as num_prescriptions
-            FROM silver.prescriptions GROUP BY hadm_id
-        ) p ON a.hadm_id = p.hadm_id
-        LEFT JOIN (
-            SELECT hadm_id, COUNT(*) as num_procedures
-            FROM silver.procedureevents GROUP BY hadm_id
-        ) pr ON a.hadm_id = pr.hadm_id
-        LEFT JOIN (
-            SELECT hadm_id, COUNT(*) as num_transfers
-            FROM silver.transfers GROUP BY hadm_id
-        ) t ON a.hadm_id = t.hadm_id
+        LEFT JOIN gold.agg_admission_rollup r ON r.subject_id = a.subject_id AND r.hadm_id = a.hadm_id
+        {changed_admissions(since, "a.hadm_id")}
         ON CONFLICT (hadm_id) DO UPDATE SET
+            admission_type = EXCLUDED.admission_type,
+            admission_location = EXCLUDED.admission_location,
+            discharge_location = EXCLUDED.discharge_location,
+            insurance = EXCLUDED.insurance,
+            admittime = EXCLUDED.admittime,
+            dischtime = EXCLUDED.dischtime,
             los_days = EXCLUDED.los_days,
+            los_hours = EXCLUDED.los_hours,
             num_icu_stays = EXCLUDED.num_icu_stays,
             num_lab_tests = EXCLUDED.num_lab_tests,
             num_prescriptions = EXCLUDED.num_prescriptions,
             num_procedures = EXCLUDED.num_procedures,
-            num_transfers = EXCLUDED.num_transfers
+            num_transfers = EXCLUDED.num_transfers,
+            hospital_expire = EXCLUDED.hospital_expire,
+            patient_key = EXCLUDED.patient_key,
+            admit_date_key = EXCLUDED.admit_date_key,
+            disch_date_key = EXCLUDED.disch_date_key
     """))
     session.commit()
     
@@ -252,15 +571,19 @@ def load_fact_admission(session):
     logger.info(f"Loaded {count} admissions to fact_admission")
 
 
-def load_agg_patient_summary(session):
-    """Load patient summary aggregate."""
+def load_agg_patient_summary(session, since=None, high=None):
+    """
+    Load patient summary aggregate (only changed patients when `since` is set).
+    
+    Event totals are summed from agg_admission_rollup, which must be loaded first.
+    """
     logger.info("Loading agg_patient_summary...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.agg_patient_summary (
             subject_id, patient_key, gender, is_deceased,
             total_admissions, total_icu_stays, total_lab_tests, total_prescriptions,
-            total_los_days, avg_los_days, first_admission, last_admission
+            total_procedures, total_los_days, avg_los_days, first_admission, last_admission
         )
         SELECT 
             p.subject_id,
@@ -268,9 +591,10 @@ def load_agg_patient_summary(session):
             p.gender,
             p.is_deceased,
             COALESCE(a.total_admissions, 0),
-            COALESCE(i.total_icu_stays, 0),
-            COALESCE(l.total_lab_tests, 0),
-            COALESCE(pr.total_prescriptions, 0),
+            COALESCE(r.total_icu_stays, 0),
+            COALESCE(r.total_lab_tests, 0),
+            COALESCE(r.total_prescriptions, 0),
+            COALESCE(r.total_procedures, 0),
             COALESCE(a.total_los_days, 0),
             a.avg_los_days,
             a.first_admission,
@@ -284,27 +608,30 @@ def load_agg_patient_summary(session):
                    AVG(los_days) as avg_los_days,
                    MIN(admittime) as first_admission,
                    MAX(admittime) as last_admission
-            FROM silver.admissions GROUP BY subject_id
+            FROM silver.admissions {changed_subjects(since)} GROUP BY subject_id
         ) a ON p.subject_id = a.subject_id
         LEFT JOIN (
-            SELECT subject_id, COUNT(*) as total_icu_stays
-            FROM silver.icustays GROUP BY subject_id
-        ) i ON p.subject_id = i.subject_id
-        LEFT JOIN (
-            SELECT subject_id, COUNT(*) as total_lab_tests
-            FROM silver.labevents GROUP BY subject_id
-        ) l ON p.subject_id = l.subject_id
-        LEFT JOIN (
-            SELECT subject_id, COUNT(*) as total_prescriptions
-            FROM silver.prescriptions GROUP BY subject_id
-        ) pr ON p.subject_id = pr.subject_id
+            SELECT subject_id,
+                   SUM(num_icu_stays) as total_icu_stays,
+                   SUM(num_lab_tests) as total_lab_tests,
+                   SUM(num_prescriptions) as total_prescriptions,
+                   SUM(num_procedures) as total_procedures
+            FROM gold.agg_admission_rollup {changed_subjects(since)} GROUP BY subject_id
+        ) r ON p.subject_id = r.subject_id
+        {changed_subjects(since, "p.subject_id")}
         ON CONFLICT (subject_id) DO UPDATE SET
+            patient_key = EXCLUDED.patient_key,
+            gender = EXCLUDED.gender,
+            is_deceased = EXCLUDED.is_deceased,
             total_admissions = EXCLUDED.total_admissions,
             total_icu_stays = EXCLUDED.total_icu_stays,
             total_lab_tests = EXCLUDED.total_lab_tests,
             total_prescriptions = EXCLUDED.total_prescriptions,
+            total_procedures = EXCLUDED.total_procedures,
             total_los_days = EXCLUDED.total_los_days,
-            avg_los_days = EXCLUDED.avg_los_days
+            avg_los_days = EXCLUDED.avg_los_days,
+            first_admission = EXCLUDED.first_admission,
+            last_admission = EXCLUDED.last_admission
     """))
     session.commit()
     
@@ -312,11 +639,12 @@ def load_agg_patient_summary(session):
     logger.info(f"Loaded {count} patient summaries")
 
 
-def load_agg_icu_performance(session):
-    """Load ICU performance aggregate."""
+def load_agg_icu_performance(session, since=None, high=None):
+    """Load ICU performance aggregate (only care units with changed stays when `since` is set)."""
     logger.info("Loading agg_icu_performance...")
     
-    session.execute(text("""
+    clear_groups(session, since, "agg_icu_performance")
+    session.execute(text(f"""
         INSERT INTO gold.agg_icu_performance (
             careunit, total_stays, total_patients,
             avg_los_days, max_los_days
@@ -329,6 +657,7 @@ def load_agg_icu_performance(session):
             MAX(los_icu_days) as max_los_days
         FROM silver.icustays
         WHERE first_careunit IS NOT NULL
+        {changed_groups(since, "agg_icu_performance")}
         GROUP BY first_careunit
         ON CONFLICT (careunit) DO UPDATE SET
             total_stays = EXCLUDED.total_stays,
@@ -414,11 +743,11 @@ def load_dim_caregiver(session):
 # ADDITIONAL FACT LOADERS
 # ============================================================
 
-def load_fact_icu_stay(session):
-    """Load ICU stay facts from silver."""
+def load_fact_icu_stay(session, since=None, high=None):
+    """Load ICU stay facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_icu_stay...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_icu_stay (
             icustay_id, subject_id, hadm_id, first_careunit, last_careunit,
             intime, outtime, los_icu_days, los_icu_hours, patient_key, in_date_key
@@ -429,19 +758,33 @@ def load_fact_icu_stay(session):
             dp.patient_key, DATE(i.intime)
         FROM silver.icustays i
         LEFT JOIN gold.dim_patient dp ON i.subject_id = dp.subject_id
-        ON CONFLICT (icustay_id) DO NOTHING
-    """))
+        {updated_since(since, "i.updated_at")}
+        ON CONFLICT (icustay_id) DO UPDATE SET
+            first_careunit = EXCLUDED.first_careunit,
+            last_careunit = EXCLUDED.last_careunit,
+            outtime = EXCLUDED.outtime,
+            los_icu_days = EXCLUDED.los_icu_days,
+            los_icu_hours = EXCLUDED.los_icu_hours,
+            patient_key = EXCLUDED.patient_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_icu_stay")).scalar()
     logger.info(f"Loaded {count} ICU stays to fact_icu_stay")
 
 
-def load_fact_lab_event(session):
-    """Load lab event facts from silver (sample for performance)."""
+def load_fact_lab_event(session, since=None, high=None, partition=None):
+    """
+    Load lab event facts from silver (only changed rows when `since` is set).
+    
+    With `partition`, only rows belonging in that partition of
+    gold.fact_lab_event are read.
+    """
     logger.info("Loading fact_lab_event...")
     
-    session.execute(text("""
+    source = partition_source("silver.labevents", "gold.fact_lab_event", partition)
+    delete_moved_facts(session, "gold.fact_lab_event", source, since, high)
+    session.execute(text(f"""
         INSERT INTO gold.fact_lab_event (
             row_id, subject_id, hadm_id, itemid, charttime, value, valuenum, valueuom,
             is_abnormal, patient_key, labitem_key, chart_date_key
@@ -450,21 +793,34 @@ def load_fact_lab_event(session):
             l.row_id, l.subject_id, l.hadm_id, l.itemid, l.charttime, l.value, l.valuenum, l.valueuom,
             COALESCE(l.is_abnormal, false),
             dp.patient_key, dl.labitem_key, DATE(l.charttime)
-        FROM silver.labevents l
+        FROM {source} l
         LEFT JOIN gold.dim_patient dp ON l.subject_id = dp.subject_id
         LEFT JOIN gold.dim_labitem dl ON l.itemid = dl.itemid
-    """))
+        {updated_since(since, "l.updated_at")}
+        ON CONFLICT ({row_key("gold.fact_lab_event")}) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            itemid = EXCLUDED.itemid,
+            charttime = EXCLUDED.charttime,
+            value = EXCLUDED.value,
+            valuenum = EXCLUDED.valuenum,
+            valueuom = EXCLUDED.valueuom,
+            is_abnormal = EXCLUDED.is_abnormal,
+            patient_key = EXCLUDED.patient_key,
+            labitem_key = EXCLUDED.labitem_key,
+            chart_date_key = EXCLUDED.chart_date_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_lab_event")).scalar()
     logger.info(f"Loaded {count} lab events to fact_lab_event")
 
 
-def load_fact_prescription(session):
-    """Load prescription facts from silver."""
+def load_fact_prescription(session, since=None, high=None):
+    """Load prescription facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_prescription...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_prescription (
             row_id, subject_id, hadm_id, drug, drug_name_generic, drug_type,
             startdate, enddate, dose_unit, route,
@@ -477,18 +833,31 @@ def load_fact_prescription(session):
             dp.patient_key, DATE(p.startdate)
         FROM silver.prescriptions p
         LEFT JOIN gold.dim_patient dp ON p.subject_id = dp.subject_id
-    """))
+        {updated_since(since, "p.updated_at")}
+        ON CONFLICT (row_id) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            drug = EXCLUDED.drug,
+            drug_name_generic = EXCLUDED.drug_name_generic,
+            drug_type = EXCLUDED.drug_type,
+            startdate = EXCLUDED.startdate,
+            enddate = EXCLUDED.enddate,
+            dose_unit = EXCLUDED.dose_unit,
+            route = EXCLUDED.route,
+            patient_key = EXCLUDED.patient_key,
+            start_date_key = EXCLUDED.start_date_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_prescription")).scalar()
     logger.info(f"Loaded {count} prescriptions to fact_prescription")
 
 
-def load_fact_transfer(session):
-    """Load transfer facts from silver."""
+def load_fact_transfer(session, since=None, high=None):
+    """Load transfer facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_transfer...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_transfer (
             row_id, subject_id, hadm_id, eventtype, prev_careunit, curr_careunit,
             intime, outtime, is_icu_transfer, patient_key
@@ -500,18 +869,36 @@ def load_fact_transfer(session):
             dp.patient_key
         FROM silver.transfers t
         LEFT JOIN gold.dim_patient dp ON t.subject_id = dp.subject_id
-    """))
+        {updated_since(since, "t.updated_at")}
+        ON CONFLICT (row_id) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            eventtype = EXCLUDED.eventtype,
+            prev_careunit = EXCLUDED.prev_careunit,
+            curr_careunit = EXCLUDED.curr_careunit,
+            intime = EXCLUDED.intime,
+            outtime = EXCLUDED.outtime,
+            is_icu_transfer = EXCLUDED.is_icu_transfer,
+            patient_key = EXCLUDED.patient_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_transfer")).scalar()
     logger.info(f"Loaded {count} transfers to fact_transfer")
 
 
-def load_fact_input_event(session):
-    """Load input event facts from silver."""
+def load_fact_input_event(session, since=None, high=None, partition=None):
+    """
+    Load input event facts from silver (only changed rows when `since` is set).
+    
+    With `partition`, only rows belonging in that partition of
+    gold.fact_input_event are read.
+    """
     logger.info("Loading fact_input_event...")
     
-    session.execute(text("""
+    source = partition_source("silver.inputevents", "gold.fact_input_event", partition)
+    delete_moved_facts(session, "gold.fact_input_event", source, since, high)
+    session.execute(text(f"""
         INSERT INTO gold.fact_input_event (
             row_id, subject_id, hadm_id, icustay_id, itemid, cgid, source_system,
             charttime, amount, amountuom, rate, rateuom,
@@ -521,22 +908,38 @@ def load_fact_input_event(session):
             i.row_id, i.subject_id, i.hadm_id, i.icustay_id, i.itemid, i.cgid, i.source_system,
             i.charttime, i.amount, i.amountuom, i.rate, i.rateuom,
             dp.patient_key, di.item_key, dc.caregiver_key
-        FROM silver.inputevents i
+        FROM {source} i
         LEFT JOIN gold.dim_patient dp ON i.subject_id = dp.subject_id
         LEFT JOIN gold.dim_item di ON i.itemid = di.itemid
         LEFT JOIN gold.dim_caregiver dc ON i.cgid = dc.cgid
-    """))
+        {updated_since(since, "i.updated_at")}
+        ON CONFLICT ({row_key("gold.fact_input_event")}) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            icustay_id = EXCLUDED.icustay_id,
+            itemid = EXCLUDED.itemid,
+            cgid = EXCLUDED.cgid,
+            source_system = EXCLUDED.source_system,
+            charttime = EXCLUDED.charttime,
+            amount = EXCLUDED.amount,
+            amountuom = EXCLUDED.amountuom,
+            rate = EXCLUDED.rate,
+            rateuom = EXCLUDED.rateuom,
+            patient_key = EXCLUDED.patient_key,
+            item_key = EXCLUDED.item_key,
+            caregiver_key = EXCLUDED.caregiver_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_input_event")).scalar()
     logger.info(f"Loaded {count} input events to fact_input_event")
 
 
-def load_fact_output_event(session):
-    """Load output event facts from silver."""
+def load_fact_output_event(session, since=None, high=None):
+    """Load output event facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_output_event...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_output_event (
             row_id, subject_id, hadm_id, icustay_id, itemid, charttime, value,
             patient_key, item_key
@@ -547,18 +950,28 @@ def load_fact_output_event(session):
         FROM silver.outputevents o
         LEFT JOIN gold.dim_patient dp ON o.subject_id = dp.subject_id
         LEFT JOIN gold.dim_item di ON o.itemid = di.itemid
-    """))
+        {updated_since(since, "o.updated_at")}
+        ON CONFLICT (row_id) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            icustay_id = EXCLUDED.icustay_id,
+            itemid = EXCLUDED.itemid,
+            charttime = EXCLUDED.charttime,
+            value = EXCLUDED.value,
+            patient_key = EXCLUDED.patient_key,
+            item_key = EXCLUDED.item_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_output_event")).scalar()
     logger.info(f"Loaded {count} output events to fact_output_event")
 
 
-def load_fact_procedure(session):
-    """Load procedure facts from silver."""
+def load_fact_procedure(session, since=None, high=None):
+    """Load procedure facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_procedure...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_procedure (
             row_id, subject_id, hadm_id, icustay_id, itemid, starttime, endtime,
             value, valueuom,
@@ -571,18 +984,30 @@ def load_fact_procedure(session):
         FROM silver.procedureevents p
         LEFT JOIN gold.dim_patient dp ON p.subject_id = dp.subject_id
         LEFT JOIN gold.dim_item di ON p.itemid = di.itemid
-    """))
+        {updated_since(since, "p.updated_at")}
+        ON CONFLICT (row_id) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            icustay_id = EXCLUDED.icustay_id,
+            itemid = EXCLUDED.itemid,
+            starttime = EXCLUDED.starttime,
+            endtime = EXCLUDED.endtime,
+            value = EXCLUDED.value,
+            valueuom = EXCLUDED.valueuom,
+            patient_key = EXCLUDED.patient_key,
+            item_key = EXCLUDED.item_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_procedure")).scalar()
     logger.info(f"Loaded {count} procedures to fact_procedure")
 
 
-def load_fact_microbiology(session):
-    """Load microbiology facts from silver."""
+def load_fact_microbiology(session, since=None, high=None):
+    """Load microbiology facts from silver (only changed rows when `since` is set)."""
     logger.info("Loading fact_microbiology...")
     
-    session.execute(text("""
+    session.execute(text(f"""
         INSERT INTO gold.fact_microbiology (
             row_id, subject_id, hadm_id, chartdate, charttime, spec_type_desc,
             org_name, ab_name, interpretation, is_positive, is_resistant,
@@ -596,7 +1021,20 @@ def load_fact_microbiology(session):
             dp.patient_key
         FROM silver.microbiologyevents m
         LEFT JOIN gold.dim_patient dp ON m.subject_id = dp.subject_id
-    """))
+        {updated_since(since, "m.updated_at")}
+        ON CONFLICT (row_id) DO UPDATE SET
+            subject_id = EXCLUDED.subject_id,
+            hadm_id = EXCLUDED.hadm_id,
+            chartdate = EXCLUDED.chartdate,
+            charttime = EXCLUDED.charttime,
+            spec_type_desc = EXCLUDED.spec_type_desc,
+            org_name = EXCLUDED.org_name,
+            ab_name = EXCLUDED.ab_name,
+            interpretation = EXCLUDED.interpretation,
+            is_positive = EXCLUDED.is_positive,
+            is_resistant = EXCLUDED.is_resistant,
+            patient_key = EXCLUDED.patient_key
+    """), {"since": since, "high": high})
     session.commit()
     
     count = session.execute(text("SELECT COUNT(*) FROM gold.fact_microbiology")).scalar()
@@ -607,11 +1045,12 @@ def load_fact_microbiology(session):
 # ADDITIONAL AGGREGATE LOADERS (from Silver layer)
 # ============================================================
 
-def load_agg_daily_census(session):
-    """Load daily census aggregate from Silver layer."""
+def load_agg_daily_census(session, since=None, high=None):
+    """Load daily census aggregate from Silver layer (only changed days when `since` is set)."""
     logger.info("Loading agg_daily_census...")
     
-    session.execute(text("""
+    clear_groups(session, since, "agg_daily_census")
+    session.execute(text(f"""
         INSERT INTO gold.agg_daily_census (
             date_key, active_patients, new_admissions, discharges
         )
@@ -622,6 +1061,7 @@ def load_agg_daily_census(session):
             0 as discharges
         FROM silver.admissions a
         WHERE a.admittime IS NOT NULL
+        {changed_groups(since, "agg_daily_census")}
         GROUP BY DATE(a.admittime)
         ON CONFLICT (date_key) DO UPDATE SET
             active_patients = EXCLUDED.active_patients,
@@ -633,12 +1073,13 @@ def load_agg_daily_census(session):
     logger.info(f"Loaded {count} daily census records to agg_daily_census")
 
 
-def load_agg_lab_summary(session):
-    """Load lab summary aggregate from Silver layer."""
+def load_agg_lab_summary(session, since=None, high=None):
+    """Load lab summary aggregate from Silver layer (only changed patient/item pairs when `since` is set)."""
     logger.info("Loading agg_lab_summary...")
     
     # agg_lab_summary uses: subject_id, itemid, test_count, abnormal_count, abnormal_rate
-    session.execute(text("""
+    clear_groups(session, since, "agg_lab_summary")
+    session.execute(text(f"""
         INSERT INTO gold.agg_lab_summary (
             subject_id, itemid, test_count, abnormal_count, abnormal_rate,
             min_value, max_value, avg_value, first_test, last_test
@@ -656,7 +1097,17 @@ def load_agg_lab_summary(session):
             MAX(l.charttime) as last_test
         FROM silver.labevents l
         WHERE l.subject_id IS NOT NULL AND l.itemid IS NOT NULL
+        {changed_groups(since, "agg_lab_summary")}
         GROUP BY l.subject_id, l.itemid
+        ON CONFLICT (subject_id, itemid) DO UPDATE SET
+            test_count = EXCLUDED.test_count,
+            abnormal_count = EXCLUDED.abnormal_count,
+            abnormal_rate = EXCLUDED.abnormal_rate,
+            min_value = EXCLUDED.min_value,
+            max_value = EXCLUDED.max_value,
+            avg_value = EXCLUDED.avg_value,
+            first_test = EXCLUDED.first_test,
+            last_test = EXCLUDED.last_test
     """))
     session.commit()
     
@@ -664,12 +1115,13 @@ def load_agg_lab_summary(session):
     logger.info(f"Loaded {count} lab summary records to agg_lab_summary")
 
 
-def load_agg_medication_usage(session):
-    """Load medication usage aggregate from Silver layer."""
+def load_agg_medication_usage(session, since=None, high=None):
+    """Load medication usage aggregate from Silver layer (only changed drugs when `since` is set)."""
     logger.info("Loading agg_medication_usage...")
     
     # agg_medication_usage uses: drug, prescription_count, patient_count
-    session.execute(text("""
+    clear_groups(session, since, "agg_medication_usage")
+    session.execute(text(f"""
         INSERT INTO gold.agg_medication_usage (
             drug, prescription_count, patient_count
         )
@@ -679,6 +1131,7 @@ def load_agg_medication_usage(session):
             COUNT(DISTINCT p.subject_id) as patient_count
         FROM silver.prescriptions p
         WHERE p.drug IS NOT NULL
+        {changed_groups(since, "agg_medication_usage")}
         GROUP BY p.drug
         ON CONFLICT (drug) DO UPDATE SET
             prescription_count = EXCLUDED.prescription_count,
@@ -690,12 +1143,13 @@ def load_agg_medication_usage(session):
     logger.info(f"Loaded {count} medication usage records to agg_medication_usage")
 
 
-def load_agg_infection_stats(session):
-    """Load infection statistics aggregate from Silver layer."""
+def load_agg_infection_stats(session, since=None, high=None):
+    """Load infection statistics aggregate from Silver layer (only changed organisms when `since` is set)."""
     logger.info("Loading agg_infection_stats...")
     
     # agg_infection_stats uses: organism_name, total_cultures, positive_cultures, resistance_tests, resistant_count
-    session.execute(text("""
+    clear_groups(session, since, "agg_infection_stats")
+    session.execute(text(f"""
         INSERT INTO gold.agg_infection_stats (
             organism_name, total_cultures, positive_cultures, resistance_tests, resistant_count
         )
@@ -707,6 +1161,7 @@ def load_agg_infection_stats(session):
             SUM(CASE WHEN m.interpretation = 'R' THEN 1 ELSE 0 END) as resistant_count
         FROM silver.microbiologyevents m
         WHERE m.org_name IS NOT NULL
+        {changed_groups(since, "agg_infection_stats")}
         GROUP BY m.org_name
         ON CONFLICT (organism_name) DO UPDATE SET
             total_cultures = EXCLUDED.total_cultures,
@@ -720,9 +1175,224 @@ def load_agg_infection_stats(session):
     logger.info(f"Loaded {count} infection stats records to agg_infection_stats")
 
 
+# ============================================================
+# PARALLEL ORCHESTRATION
+# ============================================================
+
+GOLD_PHASES = ["dimensions", "facts", "aggregates"]
+
+# Loader name -> (phase, loader function, accepts `since`)
+GOLD_LOADERS = {
+    "dim_time": ("dimensions", generate_dim_time, False),
+    "dim_patient": ("dimensions", load_dim_patient, True),
+    "dim_labitem": ("dimensions", load_dim_labitem, False),
+    "dim_item": ("dimensions", load_dim_item, False),
+    "dim_careunit": ("dimensions", load_dim_careunit, False),
+    "dim_service": ("dimensions", load_dim_service, False),
+    "dim_procedure_icd": ("dimensions", load_dim_procedure_icd, False),
+    "dim_caregiver": ("dimensions", load_dim_caregiver, False),
+    # Reads silver only, so it runs alongside the dimensions
+    "agg_admission_rollup": ("dimensions", load_agg_admission_rollup, True),
+    "fact_admission": ("facts", load_fact_admission, True),
+    "fact_icu_stay": ("facts", load_fact_icu_stay, True),
+    "fact_lab_event": ("facts", load_fact_lab_event, True),
+    "fact_prescription": ("facts", load_fact_prescription, True),
+    "fact_transfer": ("facts", load_fact_transfer, True),
+    "fact_input_event": ("facts", load_fact_input_event, True),
+    "fact_output_event": ("facts", load_fact_output_event, True),
+    "fact_procedure": ("facts", load_fact_procedure, True),
+    "fact_microbiology": ("facts", load_fact_microbiology, True),
+    "agg_patient_summary": ("aggregates", load_agg_patient_summary, True),
+    "agg_icu_performance": ("aggregates", load_agg_icu_performance, True),
+    "agg_daily_census": ("aggregates", load_agg_daily_census, True),
+    "agg_lab_summary": ("aggregates", load_agg_lab_summary, True),
+    "agg_medication_usage": ("aggregates", load_agg_medication_usage, True),
+    "agg_infection_stats": ("aggregates", load_agg_infection_stats, True),
+}
+
+# Loader name -> gold tables (loaders) it reads. Loaders without an entry
+# read only silver/bronze.
+GOLD_DEPENDENCIES = {
+    "fact_admission": ["dim_patient", "dim_time", "agg_admission_rollup"],
+    "fact_icu_stay": ["dim_patient", "dim_time"],
+    "fact_lab_event": ["dim_patient", "dim_labitem", "dim_time"],
+    "fact_prescription": ["dim_patient", "dim_time"],
+    "fact_transfer": ["dim_patient"],
+    "fact_input_event": ["dim_patient", "dim_item", "dim_caregiver"],
+    "fact_output_event": ["dim_patient", "dim_item"],
+    "fact_procedure": ["dim_patient", "dim_item"],
+    "fact_microbiology": ["dim_patient"],
+    "agg_patient_summary": ["dim_patient", "agg_admission_rollup"],
+    "agg_daily_census": ["dim_time"],
+}
+
+
+def run_loader(name, since=None, high=None):
+    """
+    Run one gold loader in its own session (and pooled connection).
+
+    The table's cache version is bumped in every transaction the loader
+    commits, so cached query results over the old data are never served
+    again. The load is measured as stage gold.<name>, counting the rows its
+    statements wrote.
+    """
+    _, loader, incremental = GOLD_LOADERS[name]
+    with get_db() as session:
+        with metrics.stage(f"gold.{name}") as stage, bump_versions_on_commit(session, [f"gold.{name}"]):
+            if incremental:
+                loader(session, since=since, high=high)
+            else:
+                loader(session)
+            stage.count(rows=stage.db_rows_written)
+
+
+# Fact loaders that can rebuild a single partition of their (partitioned) table
+PARTITIONED_LOADERS = {
+    "fact_lab_event": load_fact_lab_event,
+    "fact_input_event": load_fact_input_event,
+}
+
+
+def rebuild_gold_partition(name, suffix):
+    """
+    Truncate one partition of a partitioned fact table and reload it from silver.
+
+    Args:
+        name: Key of PARTITIONED_LOADERS
+        suffix: Partition suffix (e.g. 'y2130' or 'h03')
+    """
+    target = f"gold.{name}"
+    partition = get_partition(suffix)
+    with get_db() as session:
+        with metrics.stage(f"gold.{name}") as stage, bump_versions_on_commit(session, [target]):
+            session.execute(text(f"TRUNCATE {partition.name(target)}"))
+            PARTITIONED_LOADERS[name](session, partition=suffix)
+            stage.count(rows=stage.db_rows_written)
+
+
+def run_gold_phases(names, since=None, high=None, workers=4):
+    """
+    Run gold loaders phase by phase, in parallel within each phase.
+
+    Every phase finishes before the next one starts. Inside a phase, loaders
+    start as soon as their dependencies in the same phase are done, on up to
+    `workers` threads with one pooled connection each. A loader is skipped
+    when any loader it depends on failed, including in an earlier phase.
+
+    Args:
+        names: Loader names to run (keys of GOLD_LOADERS)
+        since: Previous gold watermark for incremental loads, or None
+        high: Silver high-water mark the incremental load reads up to
+        workers: Maximum concurrent loaders (keep within the pool size)
+
+    Returns:
+        Dict of loader name -> TaskResult, times relative to the run start
+    """
+    origin = time.time()
+    results, failed = {}, set()
+
+    for phase in GOLD_PHASES:
+        tasks = {}
+        for name in names:
+            if GOLD_LOADERS[name][0] != phase:
+                continue
+            blocked = [dep for dep in GOLD_DEPENDENCIES.get(name, []) if dep in failed]
+            if blocked:
+                results[name] = TaskResult(
+                    name=name, skipped=True, error=f"skipped: dependency failed ({', '.join(blocked)})"
+                )
+                failed.add(name)
+                logger.warning(f"{name}: {results[name].error}")
+            else:
+                tasks[name] = partial(run_loader, name, since, high)
+
+        if not tasks:
+            continue
+
+        logger.info(f"\n--- Loading {phase.title()} ({len(tasks)} loaders, {workers} workers) ---")
+        offset = time.time() - origin
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            phase_results = run_dag(tasks, GOLD_DEPENDENCIES, executor)
+
+        for name, result in phase_results.items():
+            if not result.skipped:
+                result.start += offset
+                result.end += offset
+            if result.error:
+                failed.add(name)
+        results.update(phase_results)
+
+    return results
+
+
+def write_timing_report(results, path):
+    """
+    Write per-loader timings as JSON.
+
+    Args:
+        results: Output of run_gold_phases
+        path: Report file path
+    """
+    loaders = [
+        {
+            "name": r.name,
+            "phase": GOLD_LOADERS[r.name][0],
+            "start": round(r.start, 3),
+            "end": round(r.end, 3),
+            "seconds": round(r.duration, 3),
+            "status": "skipped" if r.skipped else "failed" if r.error else "ok",
+            "error": r.error,
+        }
+        for r in results.values()
+    ]
+    report = {
+        "total_seconds": round(max((r.end for r in results.values()), default=0.0), 3),
+        "loaders": loaders,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    logger.info(f"Timing report written to {path}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Load Silver data to Gold layer")
     parser.add_argument("--skip-time", action="store_true", help="Skip dim_time generation")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute rows affected by silver changes since the last gold load",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Loaders run concurrently within a phase, one pooled connection each (default: 4)",
+    )
+    parser.add_argument(
+        "--initial-load",
+        action="store_true",
+        help="Drop gold secondary indexes and foreign keys during the load and rebuild them in "
+             "parallel afterwards, with synchronous_commit=off (for loading empty tables)",
+    )
+    parser.add_argument(
+        "--partition",
+        metavar="SUFFIX",
+        help="Only rebuild this partition (e.g. y2130 or h03) of the partitioned fact tables",
+    )
+    parser.add_argument(
+        "--timing-report",
+        type=Path,
+        default=Path("logs/gold_timing.json"),
+        help="Where to write per-loader timings (default: logs/gold_timing.json)",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        type=Path,
+        help="Write per-stage timings, row/byte counts and database round trips to this file "
+             "(.prom/.txt: Prometheus text format, otherwise JSON)",
+    )
     args = parser.parse_args()
     
     logger.info("=" * 60)
@@ -735,42 +1405,43 @@ def main():
             create_gold_schema(session)
             create_gold_tables(session.get_bind())
             
-            # Phase 1: Dimensions
-            logger.info("\n--- Loading Dimensions ---")
-            if not args.skip_time:
-                generate_dim_time(session)
-            load_dim_patient(session)
-            load_dim_labitem(session)
-            load_dim_item(session)
-            load_dim_careunit(session)
-            load_dim_service(session)
-            load_dim_procedure_icd(session)
-            load_dim_caregiver(session)
-            
-            # Phase 2: Facts
-            logger.info("\n--- Loading Facts ---")
-            load_fact_admission(session)
-            load_fact_icu_stay(session)
-            load_fact_lab_event(session)
-            load_fact_prescription(session)
-            load_fact_transfer(session)
-            load_fact_input_event(session)
-            load_fact_output_event(session)
-            load_fact_procedure(session)
-            load_fact_microbiology(session)
-            
-            # Phase 3: Aggregates
-            logger.info("\n--- Loading Aggregates ---")
-            load_agg_patient_summary(session)
-            load_agg_icu_performance(session)
-            load_agg_daily_census(session)
-            load_agg_lab_summary(session)
-            load_agg_medication_usage(session)
-            load_agg_infection_stats(session)
-            
-            logger.info("\n" + "=" * 60)
-            logger.info("Gold layer loading complete!")
-            logger.info("=" * 60)
+            # Capture the silver high-water mark before reading anything, so
+            # rows written during this load are picked up by the next one
+            high_water = get_silver_high_water(session)
+            since = get_gold_watermark(session) if args.incremental else None
+            if since is not None and high_water is not None and high_water < since:
+                high_water = since
+            if since is not None:
+                collect_changed_keys(session, since, high_water)
+            elif args.incremental:
+                logger.info("No previous gold load recorded; running a full load")
+        
+        if args.partition:
+            for name in PARTITIONED_LOADERS:
+                rebuild_gold_partition(name, args.partition)
+            logger.info(f"Rebuilt partition {args.partition} of {', '.join(PARTITIONED_LOADERS)}")
+            return 0
+        
+        names = [name for name in GOLD_LOADERS if not (args.skip_time and name == "dim_time")]
+        load_mode = initial_load(engine, GoldBase.metadata.sorted_tables) if args.initial_load else nullcontext()
+        with load_mode:
+            results = run_gold_phases(names, since=since, high=high_water, workers=args.workers)
+        
+        print("\n=== Gold Loader Timeline ===")
+        print(format_timeline(results))
+        write_timing_report(results, args.timing_report)
+        
+        failures = [name for name, result in results.items() if result.error]
+        if failures:
+            logger.error(f"Gold layer loading failed for: {', '.join(failures)}")
+            return 1
+        
+        with get_db() as session:
+            save_gold_watermark(session, high_water)
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("Gold layer loading complete!")
+        logger.info("=" * 60)
             
         return 0
         
@@ -778,8 +1449,10 @@ def main():
         logger.error(f"Gold layer loading failed: {e}", exc_info=True)
         return 1
 
+    finally:
+        if args.metrics_output:
+            metrics.write(args.metrics_output)
+
 
 if __name__ == "__main__":
     sys.exit(main())
-
-
@@ -1,12 +1,13 @@
 """Transform Bronze data to Silver layer."""
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.shared import get_db, logger
+from app.shared import engine, get_db, initial_load, logger, metrics
 from app.models.silver import SilverBase
 from app.transformers.silver import (
     PatientTransformer,
@@ -59,6 +60,9 @@ SPECIAL_TRANSFORMERS = {
 ALL_TABLES = list(STANDARD_TRANSFORMERS.keys()) + list(SPECIAL_TRANSFORMERS.keys())
 # ALL_TABLES = list(STANDARD_TRANSFORMERS.keys()) + list(SPECIAL_TRANSFORMERS.keys())
 
+# Tables declared with partitioning (see app/models/partitioning.py)
+PARTITIONED_TABLES = ["labevents", "inputevents"]
+
 
 def main():
     """Main entry point for silver layer transformation."""
@@ -75,6 +79,48 @@ def main():
         default=1000,
         help="Batch size for transformation (default: 1000)",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read bronze through a server-side streaming cursor instead of paginated queries",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only transform bronze rows inserted or updated since the last run (per-table "
+             "watermark); rows deleted from bronze are kept until a full run",
+    )
+    parser.add_argument(
+        "--partition",
+        metavar="SUFFIX",
+        help="Only rebuild this partition (e.g. y2130 or h03) of the partitioned tables "
+             "(labevents, inputevents); requires EVENT_PARTITIONING",
+    )
+    parser.add_argument(
+        "--initial-load",
+        action="store_true",
+        help="Drop silver secondary indexes during the load and rebuild them in parallel "
+             "afterwards, with synchronous_commit=off (for loading empty tables)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["python", "sql"],
+        default="python",
+        help="python: transform rows in batches; sql: run each transformation as one "
+             "INSERT ... SELECT inside the database (default: python)",
+    )
+    parser.add_argument(
+        "--serial-sources",
+        action="store_true",
+        help="Transform the CareVue and MetaVision sources of inputevents one after the other "
+             "(default: concurrently, one connection each)",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        type=Path,
+        help="Write per-stage timings, row/byte counts and database round trips to this file "
+             "(.prom/.txt: Prometheus text format, otherwise JSON)",
+    )
     
     args = parser.parse_args()
     
@@ -87,8 +133,13 @@ def main():
             # Create schema and tables
             create_silver_schema(session)
             create_silver_tables(session.get_bind())
-            
+        
+        load_mode = initial_load(engine, SilverBase.metadata.sorted_tables) if args.initial_load else nullcontext()
+        
+        with load_mode, get_db() as session:
             tables_to_transform = [args.table] if args.table else ALL_TABLES
+            if args.partition:
+                tables_to_transform = [t for t in tables_to_transform if t in PARTITIONED_TABLES]
             all_stats = {}
             
             for table_name in tables_to_transform:
@@ -97,12 +148,23 @@ def main():
                 # Use appropriate transformer
                 if table_name in STANDARD_TRANSFORMERS:
                     transformer_class = STANDARD_TRANSFORMERS[table_name]
-                    transformer = transformer_class(session, batch_size=args.batch_size)
                 else:
                     transformer_class = SPECIAL_TRANSFORMERS[table_name]
-                    transformer = transformer_class(session, batch_size=args.batch_size)
+                options = {"parallel": not args.serial_sources} if transformer_class is InputEventsTransformer else {}
+                transformer = transformer_class(
+                    session,
+                    batch_size=args.batch_size,
+                    stream=args.stream,
+                    incremental=args.incremental,
+                    **options,
+                )
                 
-                stats = transformer.transform()
+                if args.partition:
+                    stats = transformer.rebuild_partition(args.partition)
+                elif args.mode == "sql":
+                    stats = transformer.transform_sql()
+                else:
+                    stats = transformer.transform()
                 all_stats[table_name] = stats
             
             # Print summary
@@ -131,6 +193,10 @@ def main():
         logger.error(f"Transformation failed: {e}", exc_info=True)
         return 1
 
+    finally:
+        if args.metrics_output:
+            metrics.write(args.metrics_output)
+
 
 if __name__ == "__main__":
     sys.exit(main())
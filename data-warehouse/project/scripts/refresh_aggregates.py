@@ -6,12 +6,14 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.shared import get_db, logger
+from app.shared import bump_versions_on_commit, get_db, logger
 # Import aggregate loaders from load_gold script
 # Note: This assumes load_gold.py is in the same directory and accessible
 try:
     from scripts.load_gold import (
         create_gold_schema,
+        create_gold_tables,
+        load_agg_admission_rollup,
         load_agg_patient_summary,
         load_agg_icu_performance,
         load_agg_daily_census,
@@ -23,6 +25,8 @@ except ImportError:
     # Fallback if running as script vs module
     from load_gold import (
         create_gold_schema,
+        create_gold_tables,
+        load_agg_admission_rollup,
         load_agg_patient_summary,
         load_agg_icu_performance,
         load_agg_daily_census,
@@ -31,6 +35,19 @@ except ImportError:
         load_agg_infection_stats
     )
 
+# Aggregate tables rebuilt by this script, in order: title and loader.
+# The admission rollup comes first: the patient summary reads its totals.
+REFRESHED_AGGREGATES = {
+    "agg_admission_rollup": ("Admission Rollup", load_agg_admission_rollup),
+    "agg_patient_summary": ("Patient Summary", load_agg_patient_summary),
+    "agg_icu_performance": ("ICU Performance", load_agg_icu_performance),
+    "agg_daily_census": ("Daily Census", load_agg_daily_census),
+    "agg_lab_summary": ("Lab Summary", load_agg_lab_summary),
+    "agg_medication_usage": ("Medication Usage", load_agg_medication_usage),
+    "agg_infection_stats": ("Infection Stats", load_agg_infection_stats),
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Refresh Gold Layer Aggregates")
     parser.parse_args()
@@ -43,25 +60,14 @@ def main():
         with get_db() as session:
             # Ensure schema exists
             create_gold_schema(session)
+            create_gold_tables(session.get_bind())
 
-            # Reload all aggregates
-            logger.info("\n--- Refreshing Patient Summary ---")
-            load_agg_patient_summary(session)
-
-            logger.info("\n--- Refreshing ICU Performance ---")
-            load_agg_icu_performance(session)
-
-            logger.info("\n--- Refreshing Daily Census ---")
-            load_agg_daily_census(session)
-
-            logger.info("\n--- Refreshing Lab Summary ---")
-            load_agg_lab_summary(session)
-
-            logger.info("\n--- Refreshing Medication Usage ---")
-            load_agg_medication_usage(session)
-            
-            logger.info("\n--- Refreshing Infection Stats ---")
-            load_agg_infection_stats(session)
+            # Reload all aggregates, invalidating cached dashboard queries
+            # over each one in the transactions that rewrite it
+            for name, (title, loader) in REFRESHED_AGGREGATES.items():
+                logger.info(f"\n--- Refreshing {title} ---")
+                with bump_versions_on_commit(session, [f"gold.{name}"]):
+                    loader(session)
 
             logger.info("\n" + "=" * 60)
             logger.info("Aggregate refresh complete!")
@@ -41,3 +41,57 @@ def temp_csv_file(tmp_path):
 """
     csv_file.write_text(csv_content)
     return csv_file
+
+
+@pytest.fixture
+def bronze_session():
+    """In-memory SQLite session with the bronze and silver schemas attached."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.models.bronze import Base
+    from app.models.silver import SilverBase
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def attach_schemas(dbapi_conn, connection_record):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS bronze")
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS silver")
+
+    Base.metadata.create_all(engine)
+    SilverBase.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def gold_session():
+    """In-memory SQLite session with the silver and gold schemas attached."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.models.gold import GoldBase
+    from app.models.silver import SilverBase
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def attach_schemas(dbapi_conn, connection_record):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS silver")
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS gold")
+
+    SilverBase.metadata.create_all(engine)
+    GoldBase.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
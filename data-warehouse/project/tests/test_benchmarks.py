@@ -0,0 +1,156 @@
+"""Unit tests for the pipeline benchmark helpers."""
+import csv
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.benchmarks import SyntheticMimic, compare_to_baseline, measure_stage
+from app.transformers.bronze import FIELD_MAPPINGS
+from app.transformers.bronze.parsers import compile_field_mapping
+
+
+def read_csv(path):
+    """Rows of a generated CSV as dicts."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    """Small synthetic extract written once for the module."""
+    output = tmp_path_factory.mktemp("synthetic")
+    counts = SyntheticMimic(event_rows=500, seed=3).write(output)
+    return output, counts
+
+
+class TestSyntheticMimic:
+    """Test the synthetic MIMIC generator."""
+
+    def test_every_table_written(self, dataset):
+        """Test each FIELD_MAPPINGS table gets a CSV with the mapped header."""
+        output, counts = dataset
+
+        assert set(counts) == set(FIELD_MAPPINGS)
+        for table, columns in FIELD_MAPPINGS.items():
+            with open(output / f"{table}.csv", encoding="utf-8") as f:
+                assert next(csv.reader(f)) == list(columns)
+        assert counts["LABEVENTS"] == counts["INPUTEVENTS_MV"] == 500
+
+    def test_deterministic(self, dataset, tmp_path):
+        """Test the same seed reproduces identical files."""
+        output, _ = dataset
+        SyntheticMimic(event_rows=500, seed=3).write(tmp_path, ["ADMISSIONS", "LABEVENTS"])
+
+        for table in ("ADMISSIONS", "LABEVENTS"):
+            assert (tmp_path / f"{table}.csv").read_bytes() == (output / f"{table}.csv").read_bytes()
+
+    def test_parallel_matches_in_process(self, tmp_path):
+        """Test chunks rendered by worker processes are written in order, byte for byte."""
+        generator = SyntheticMimic(event_rows=500, seed=3, sizes={"LABEVENTS": 1234}, chunk_rows=200)
+        generator.write(tmp_path / "serial", ["LABEVENTS"], processes=1)
+        counts = generator.write(tmp_path / "parallel", ["LABEVENTS"], processes=2)
+
+        serial = (tmp_path / "serial" / "LABEVENTS.csv").read_bytes()
+        assert (tmp_path / "parallel" / "LABEVENTS.csv").read_bytes() == serial
+        assert counts == {"LABEVENTS": 1234}
+        row_ids = [int(r["row_id"]) for r in read_csv(tmp_path / "parallel" / "LABEVENTS.csv")]
+        assert row_ids == list(range(1, 1235))
+
+    def test_only_event_tables_sized(self):
+        """Test sizing a table that follows from the cohort is rejected."""
+        with pytest.raises(ValueError, match="ADMISSIONS"):
+            SyntheticMimic(event_rows=100, sizes={"ADMISSIONS": 10})
+
+    def test_referential_integrity(self, dataset):
+        """Test events point at existing admissions, ICU stays and items."""
+        output, _ = dataset
+        subjects = {r["subject_id"] for r in read_csv(output / "PATIENTS.csv")}
+        admissions = {r["hadm_id"]: r for r in read_csv(output / "ADMISSIONS.csv")}
+        stays = {r["icustay_id"]: r for r in read_csv(output / "ICUSTAYS.csv")}
+        labitems = {r["itemid"] for r in read_csv(output / "D_LABITEMS.csv")}
+
+        assert {a["subject_id"] for a in admissions.values()} <= subjects
+        assert all(s["hadm_id"] in admissions for s in stays.values())
+        for row in read_csv(output / "LABEVENTS.csv"):
+            admission = admissions[row["hadm_id"]]
+            assert row["subject_id"] == admission["subject_id"]
+            assert row["itemid"] in labitems
+            assert admission["admittime"] <= row["charttime"] <= admission["dischtime"]
+        for row in read_csv(output / "OUTPUTEVENTS.csv"):
+            assert stays[row["icustay_id"]]["hadm_id"] == row["hadm_id"]
+
+    def test_values_parse_cleanly(self, dataset):
+        """Test every cell parses with the bronze parsers and dates stay in 2100-2200."""
+        output, _ = dataset
+        for table, mapping in FIELD_MAPPINGS.items():
+            parsers = compile_field_mapping(mapping)
+            for row in read_csv(output / f"{table}.csv"):
+                for column, parse in parsers:
+                    value = parse(row[column])
+                    assert value is not None or row[column] == "", (table, column, row[column])
+                    if mapping[column] in ("datetime", "date") and value is not None:
+                        assert 2100 <= value.year <= 2200
+
+
+class TestMeasurements:
+    """Test stage measurement and regression detection."""
+
+    def test_stage_metrics(self, tmp_path):
+        """Test throughput, database time and statement counts are recorded."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+
+        with measure_stage("bronze", "T", engine) as result:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            result["rows"] = 2
+
+        assert result["db_statements"] == 2
+        assert 0 <= result["db_seconds"] <= result["seconds"]
+        assert result["rows_per_sec"] > 0
+        assert "peak_rss_mb" in result
+
+    def test_failure_recorded(self):
+        """Test a failing stage keeps its error in the result."""
+        with pytest.raises(RuntimeError):
+            with measure_stage("parse", "T") as result:
+                raise RuntimeError("bad csv")
+
+        assert result["error"] == "bad csv"
+
+    def test_regressions_flagged(self):
+        """Test only comparable stages slower than the tolerance are reported."""
+        baseline = [
+            {"stage": "silver", "name": "labevents", "rows": 10, "seconds": 2.0, "rows_per_sec": 1000.0},
+            {"stage": "silver", "name": "patients", "rows": 10, "seconds": 2.0, "rows_per_sec": 1000.0},
+            {"stage": "parse", "name": "PATIENTS", "rows": 10, "seconds": 0.01, "rows_per_sec": 1000.0},
+        ]
+        results = [
+            {"stage": "silver", "name": "labevents", "rows": 10, "seconds": 4.0, "rows_per_sec": 500.0},
+            {"stage": "silver", "name": "patients", "rows": 10, "seconds": 2.1, "rows_per_sec": 950.0},
+            {"stage": "parse", "name": "PATIENTS", "rows": 10, "seconds": 0.1, "rows_per_sec": 100.0},
+        ]
+
+        regressions = compare_to_baseline(results, baseline, tolerance=0.10)
+
+        assert [r["stage"] for r in regressions] == ["silver:labevents"]
+        assert regressions[0]["change_pct"] == -50.0
+
+
+class TestLayerReset:
+    """Test which layers a benchmark run empties."""
+
+    @pytest.mark.parametrize(
+        "stages,expected",
+        [
+            (["parse", "bronze", "silver", "gold"], ["bronze", "silver", "gold"]),
+            (["silver"], ["silver", "gold"]),
+            (["gold"], ["gold"]),
+            (["parse"], []),
+        ],
+    )
+    def test_resets_selected_layer_and_later(self, stages, expected):
+        """Test only the earliest selected layer and its successors are emptied."""
+        from scripts.benchmark_pipeline import layers_to_reset
+
+        assert layers_to_reset(stages) == expected
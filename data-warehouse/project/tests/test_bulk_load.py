@@ -0,0 +1,122 @@
+"""Unit tests for initial-load mode."""
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect
+
+from app.shared import bulk_load
+from app.shared.bulk_load import initial_load, secondary_indexes, session_options_hook
+
+
+@pytest.fixture
+def events():
+    """Table with a primary key, a unique index and two secondary indexes."""
+    return Table(
+        "events",
+        MetaData(),
+        Column("row_id", Integer, primary_key=True),
+        Column("code", String(20), unique=True, index=True),
+        Column("subject_id", Integer, index=True),
+        Column("itemid", Integer, index=True),
+    )
+
+
+@pytest.fixture
+def engine(tmp_path, events, monkeypatch):
+    """File-backed SQLite engine with the events table created."""
+    # SQLite has no PostgreSQL session settings to apply
+    monkeypatch.setattr(bulk_load, "bulk_load_options", lambda: {})
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.db'}")
+    events.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine):
+    """Names of the indexes currently on the events table."""
+    return sorted(index["name"] for index in inspect(engine).get_indexes("events"))
+
+
+class TestDeferredIndexes:
+    """Test secondary indexes are dropped and rebuilt around a load."""
+
+    def test_unique_indexes_kept(self, events):
+        """Test only non-unique indexes are deferred."""
+        names = [index.name for index in secondary_indexes([events])]
+
+        assert names == ["ix_events_itemid", "ix_events_subject_id"]
+
+    def test_indexes_rebuilt_after_load(self, engine, events):
+        """Test indexes are absent during the load and back afterwards."""
+        with initial_load(engine, [events], workers=2) as deferred:
+            during = index_names(engine)
+
+        assert len(deferred.indexes) == 2
+        assert during == ["ix_events_code"]
+        assert index_names(engine) == ["ix_events_code", "ix_events_itemid", "ix_events_subject_id"]
+
+    def test_indexes_rebuilt_after_failure(self, engine, events):
+        """Test a failed load still restores the indexes."""
+        with pytest.raises(RuntimeError):
+            with initial_load(engine, [events]):
+                raise RuntimeError("load failed")
+
+        assert "ix_events_subject_id" in index_names(engine)
+
+    def test_foreign_keys_not_restored_after_failure(self, engine, events, monkeypatch):
+        """Test a failed load rebuilds the indexes but leaves the foreign keys dropped."""
+        calls = []
+        monkeypatch.setattr(
+            bulk_load, "rebuild_deferred",
+            lambda engine, deferred, workers, foreign_keys=True: calls.append(foreign_keys),
+        )
+
+        with initial_load(engine, [events]):
+            pass
+        with pytest.raises(RuntimeError):
+            with initial_load(engine, [events]):
+                raise RuntimeError("load failed")
+
+        assert calls == [True, False]
+
+    def test_rebuild_error_does_not_hide_load_error(self, engine, events, monkeypatch):
+        """Test the load's exception is raised even if the rebuild fails too."""
+        def rebuild_deferred(engine, deferred, workers, foreign_keys=True):
+            raise OSError("rebuild failed")
+
+        monkeypatch.setattr(bulk_load, "rebuild_deferred", rebuild_deferred)
+
+        with pytest.raises(RuntimeError, match="load failed"):
+            with initial_load(engine, [events]):
+                raise RuntimeError("load failed")
+
+
+class TestSessionOptions:
+    """Test bulk-load session settings."""
+
+    def test_options_applied_and_committed(self):
+        """Test every option is SET and committed on new connections."""
+        executed = []
+
+        class Cursor:
+            def execute(self, sql):
+                executed.append(sql)
+
+            def close(self):
+                pass
+
+        class Connection:
+            committed = False
+
+            def cursor(self):
+                return Cursor()
+
+            def commit(self):
+                Connection.committed = True
+
+        session_options_hook({"synchronous_commit": "off", "maintenance_work_mem": "1GB"})(Connection(), None)
+
+        assert executed == ["SET synchronous_commit = 'off'", "SET maintenance_work_mem = '1GB'"]
+        assert Connection.committed
+
+    def test_default_options(self):
+        """Test initial loads turn off synchronous commit."""
+        assert bulk_load.bulk_load_options()["synchronous_commit"] == "off"
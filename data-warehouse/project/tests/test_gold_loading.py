@@ -0,0 +1,324 @@
+"""Unit tests for Gold layer loading."""
+import pytest
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.models.gold import AggLabSummary, FactLabEvent, FactPrescription
+from scripts import load_gold
+
+
+class RecordingSession:
+    """Session stand-in that records executed SQL and parameters."""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((" ".join(str(statement).split()), params))
+
+        class Result:
+            def scalar(self):
+                return 0
+
+        return Result()
+
+    def commit(self):
+        pass
+
+
+SINCE = datetime(2024, 1, 1)
+HIGH = datetime(2024, 1, 2)
+
+
+class TestGoldIdempotency:
+    """Test reruns cannot duplicate gold rows."""
+
+    def test_event_facts_have_unique_row_id(self):
+        """Test event facts are keyed on the silver row id."""
+        unique_keys = [
+            [c.name for c in constraint.columns]
+            for constraint in FactLabEvent.__table__.constraints
+            if constraint.__class__.__name__ == "UniqueConstraint"
+        ]
+        assert ["row_id"] in unique_keys
+        assert FactPrescription.__table__.c.row_id.unique
+
+    def test_lab_summary_unique_per_patient_item(self):
+        """Test agg_lab_summary has a (subject_id, itemid) conflict target."""
+        constraints = [
+            [c.name for c in constraint.columns]
+            for constraint in AggLabSummary.__table__.constraints
+            if constraint.__class__.__name__ == "UniqueConstraint"
+        ]
+        assert ["subject_id", "itemid"] in constraints
+
+    @pytest.mark.parametrize("loader", [load_gold.load_fact_lab_event, load_gold.load_fact_prescription])
+    def test_fact_loaders_upsert_on_row_id(self, loader):
+        """Test full fact loads upsert instead of appending."""
+        session = RecordingSession()
+
+        loader(session)
+
+        sql, params = session.executed[0]
+        assert "ON CONFLICT (row_id) DO UPDATE" in sql
+        assert "updated_at >" not in sql
+
+
+class TestIncrementalGold:
+    """Test delta filters applied when a watermark is given."""
+
+    def test_fact_filters_on_silver_updated_at(self):
+        """Test event facts only read rows changed since the watermark."""
+        session = RecordingSession()
+
+        load_gold.load_fact_lab_event(session, since=SINCE, high=HIGH)
+
+        sql, params = session.executed[0]
+        assert "WHERE l.updated_at > :since AND l.updated_at <= :high ON CONFLICT (row_id)" in sql
+        assert params == {"since": SINCE, "high": HIGH}
+
+    def test_fact_admission_limited_to_changed_admissions(self):
+        """Test admission facts and their counts only cover changed admissions."""
+        session = RecordingSession()
+
+        load_gold.load_fact_admission(session, since=SINCE)
+
+        sql, _ = session.executed[0]
+        assert sql.count("IN (SELECT hadm_id FROM gold.etl_changed_admissions)") == 1
+        assert "WHERE a.hadm_id IN" in sql
+
+    def test_patient_summary_limited_to_changed_subjects(self):
+        """Test patient summary only recomputes changed patients."""
+        session = RecordingSession()
+
+        load_gold.load_agg_patient_summary(session, since=SINCE)
+
+        sql, _ = session.executed[0]
+        assert sql.count("IN (SELECT subject_id FROM gold.etl_changed_subjects)") == 3
+
+    def test_lab_summary_recomputes_changed_pairs(self):
+        """Test lab summary recomputes whole (subject, item) groups that changed."""
+        session = RecordingSession()
+
+        load_gold.load_agg_lab_summary(session, since=SINCE)
+
+        delete, insert = [sql for sql, _ in session.executed[:2]]
+        changed = "(SELECT group_key FROM gold.etl_changed_groups WHERE aggregate = 'agg_lab_summary')"
+        assert delete == f"DELETE FROM gold.agg_lab_summary WHERE subject_id || ':' || itemid IN {changed}"
+        assert f"AND subject_id || ':' || itemid IN {changed}" in insert
+        assert "ON CONFLICT (subject_id, itemid) DO UPDATE" in insert
+
+    def test_full_load_has_no_filters(self):
+        """Test loads without a watermark read all of silver."""
+        session = RecordingSession()
+
+        load_gold.load_fact_admission(session)
+        load_gold.load_agg_lab_summary(session)
+
+        assert not any("etl_changed" in sql or ":since" in sql for sql, _ in session.executed)
+
+    def test_collect_changed_keys(self):
+        """Test changed keys are rebuilt from every silver source."""
+        session = RecordingSession()
+
+        load_gold.collect_changed_keys(session, SINCE, HIGH)
+
+        statements = [sql for sql, _ in session.executed]
+        assert statements[:3] == [
+            "DELETE FROM gold.etl_changed_subjects",
+            "DELETE FROM gold.etl_changed_admissions",
+            "DELETE FROM gold.etl_changed_groups",
+        ]
+        assert statements[3].count("UNION") == len(load_gold.SILVER_CHANGE_SOURCES) - 1
+        assert "silver.patients" not in statements[4]
+        assert "updated_at <= :high" in statements[3]
+        assert session.executed[3][1] == {"since": SINCE, "high": HIGH}
+
+    def test_collect_changed_groups_before_and_after(self):
+        """Test each grouped aggregate records the current silver group and the previous gold group."""
+        session = RecordingSession()
+
+        load_gold.collect_changed_keys(session, SINCE, HIGH)
+
+        groups = [sql for sql, _ in session.executed if "etl_changed_groups (aggregate" in sql]
+        assert len(groups) == len(load_gold.GROUPED_AGGREGATES)
+        medication = next(sql for sql in groups if "'agg_medication_usage'" in sql)
+        assert "FROM silver.prescriptions" in medication
+        assert "FROM gold.fact_prescription WHERE row_id IN (SELECT row_id FROM silver.prescriptions" in medication
+
+    def test_high_water_below_open_transactions(self, monkeypatch):
+        """Test the gold watermark stops before rows of silver transactions not yet committed."""
+        class MaxSession(RecordingSession):
+            def execute(self, statement, params=None):
+                class Result:
+                    def scalar(self):
+                        return HIGH
+
+                return Result()
+
+        monkeypatch.setattr(load_gold, "open_transactions_start", lambda session: SINCE)
+        assert load_gold.get_silver_high_water(MaxSession()) == SINCE - load_gold.TIMESTAMP_RESOLUTION
+
+        monkeypatch.setattr(load_gold, "open_transactions_start", lambda session: None)
+        assert load_gold.get_silver_high_water(MaxSession()) == HIGH
+
+
+class TestChangedGroups:
+    """Test incremental grouped aggregates match a full rebuild."""
+
+    @staticmethod
+    def write_prescription(session, row_id, drug, updated_at):
+        session.execute(text("""
+            INSERT INTO silver.prescriptions (row_id, subject_id, hadm_id, drug, updated_at)
+            VALUES (:row_id, :row_id, :row_id, :drug, :updated_at)
+            ON CONFLICT (row_id) DO UPDATE SET drug = excluded.drug, updated_at = excluded.updated_at
+        """), {"row_id": row_id, "drug": drug, "updated_at": updated_at})
+        session.commit()
+
+    @staticmethod
+    def load_incremental(session, since, high):
+        load_gold.collect_changed_keys(session, since, high)
+        session.commit()
+        load_gold.load_fact_prescription(session, since=since, high=high)
+        load_gold.load_agg_medication_usage(session, since=since, high=high)
+
+    @staticmethod
+    def medication_usage(session):
+        return session.execute(text(
+            "SELECT drug, prescription_count, patient_count FROM gold.agg_medication_usage ORDER BY drug"
+        )).all()
+
+    def test_row_moved_between_groups(self, gold_session):
+        """Test a prescription moved to another drug updates both drugs and drops the emptied one."""
+        self.write_prescription(gold_session, 1, "ASPIRIN", SINCE)
+        self.write_prescription(gold_session, 2, "HEPARIN", SINCE)
+        self.load_incremental(gold_session, datetime(2023, 1, 1), SINCE)
+
+        self.write_prescription(gold_session, 2, "ASPIRIN", HIGH)
+        self.load_incremental(gold_session, SINCE, HIGH)
+
+        incremental = self.medication_usage(gold_session)
+        load_gold.load_agg_medication_usage(gold_session)
+        assert incremental == self.medication_usage(gold_session) == [("ASPIRIN", 2, 2)]
+
+
+class TestAdmissionRollup:
+    """Test event counts are computed once per admission and reused."""
+
+    def test_rollup_scans_each_source_once(self):
+        """Test the rollup reads every counted silver table exactly once."""
+        session = RecordingSession()
+
+        load_gold.load_agg_admission_rollup(session)
+
+        statements = [sql for sql, _ in session.executed]
+        assert statements[0] == "TRUNCATE gold.agg_admission_rollup"
+        for table, _ in load_gold.ROLLUP_SOURCES:
+            assert statements[1].count(f"FROM silver.{table} ") == 1
+        assert "COALESCE(hadm_id, 0)" in statements[1]
+
+    def test_incremental_rollup_rebuilds_changed_subjects(self):
+        """Test incremental runs delete and recount only changed patients."""
+        session = RecordingSession()
+
+        load_gold.load_agg_admission_rollup(session, since=SINCE)
+
+        statements = [sql for sql, _ in session.executed]
+        assert statements[0].startswith("DELETE FROM gold.agg_admission_rollup WHERE subject_id IN")
+        assert statements[1].count("etl_changed_subjects") == len(load_gold.ROLLUP_SOURCES)
+
+    @pytest.mark.parametrize("loader", [load_gold.load_fact_admission, load_gold.load_agg_patient_summary])
+    def test_consumers_read_rollup(self, loader):
+        """Test admission facts and patient summary no longer scan event tables."""
+        session = RecordingSession()
+
+        loader(session)
+
+        sql, _ = session.executed[0]
+        assert "gold.agg_admission_rollup" in sql
+        assert "silver.labevents" not in sql
+        assert "silver.icustays" not in sql
+
+    def test_consumers_depend_on_rollup(self):
+        """Test the scheduler runs the rollup before its consumers."""
+        assert load_gold.GOLD_LOADERS["agg_admission_rollup"][0] == "dimensions"
+        for name in ("fact_admission", "agg_patient_summary"):
+            assert "agg_admission_rollup" in load_gold.GOLD_DEPENDENCIES[name]
+
+    def test_refresh_rebuilds_rollup_first(self):
+        """Test refresh_aggregates rebuilds the rollup before the patient summary reads it."""
+        from scripts import refresh_aggregates
+
+        names = list(refresh_aggregates.REFRESHED_AGGREGATES)
+        assert names.index("agg_admission_rollup") < names.index("agg_patient_summary")
+
+
+class TestParallelPhases:
+    """Test phased, dependency-aware gold loading."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Replace run_loader with a recorder of (name, since, start, end)."""
+        import time
+
+        calls = []
+
+        def fake_run_loader(name, since=None, high=None):
+            start = time.time()
+            time.sleep(0.01)
+            calls.append((name, since, start, time.time()))
+
+        monkeypatch.setattr(load_gold, "run_loader", fake_run_loader)
+        return calls
+
+    def test_every_loader_registered(self):
+        """Test registry phases and dependencies refer to known loaders."""
+        assert {phase for phase, _, _ in load_gold.GOLD_LOADERS.values()} == set(load_gold.GOLD_PHASES)
+        for name, deps in load_gold.GOLD_DEPENDENCIES.items():
+            assert name in load_gold.GOLD_LOADERS
+            assert all(dep in load_gold.GOLD_LOADERS for dep in deps)
+
+    def test_phases_run_in_order(self, calls):
+        """Test each phase finishes before the next starts."""
+        results = load_gold.run_gold_phases(list(load_gold.GOLD_LOADERS), since=SINCE, workers=4)
+
+        assert all(r.error is None for r in results.values())
+        assert all(since == SINCE for _, since, _, _ in calls)
+
+        timing = {name: (start, end) for name, _, start, end in calls}
+        phase_of = {name: load_gold.GOLD_LOADERS[name][0] for name in timing}
+        for earlier, later in [("dimensions", "facts"), ("facts", "aggregates")]:
+            last_end = max(end for name, (_, end) in timing.items() if phase_of[name] == earlier)
+            first_start = min(start for name, (start, _) in timing.items() if phase_of[name] == later)
+            assert last_end <= first_start
+
+    def test_failed_dimension_skips_dependents(self, monkeypatch):
+        """Test loaders depending on a failed loader are skipped in later phases."""
+        def fake_run_loader(name, since=None, high=None):
+            if name == "dim_patient":
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(load_gold, "run_loader", fake_run_loader)
+
+        results = load_gold.run_gold_phases(list(load_gold.GOLD_LOADERS), workers=2)
+
+        assert results["dim_patient"].error == "boom"
+        assert results["fact_admission"].skipped
+        assert results["agg_patient_summary"].skipped
+        assert results["fact_lab_event"].skipped
+        assert results["agg_icu_performance"].error is None
+
+    def test_timing_report(self, calls, tmp_path):
+        """Test the JSON report lists every loader with its status."""
+        import json
+
+        results = load_gold.run_gold_phases(["dim_patient", "fact_admission"], workers=2)
+        load_gold.write_timing_report(results, tmp_path / "timing.json")
+
+        report = json.loads((tmp_path / "timing.json").read_text())
+        assert [(l["name"], l["phase"], l["status"]) for l in report["loaders"]] == [
+            ("dim_patient", "dimensions", "ok"),
+            ("fact_admission", "facts", "ok"),
+        ]
+        assert report["total_seconds"] >= report["loaders"][1]["end"] > 0
@@ -1,11 +1,31 @@
 """Unit tests for CSV loader."""
+import gzip
+import json
+import os
+import threading
+
 import pytest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from app.transformers.bronze.base_loader import BaseCSVLoader
-from app.models.bronze import BronzePatients
+from app.transformers.bronze import base_loader, table_loaders
+from app.transformers.bronze.base_loader import BaseCSVLoader, CopyCSVLoader, split_csv
+from app.transformers.bronze.checkpoints import file_identity, get_checkpoint, save_checkpoint
+from app.transformers.bronze.compressed import BackgroundGzipReader, find_csv
+from app.transformers.bronze.manifest import (
+    SAMPLE_BLOCK_BYTES,
+    FileFingerprint,
+    content_hash,
+    get_manifest,
+    is_unchanged,
+    save_manifest,
+)
+from app.transformers.bronze.staging import swap_statements
+from app.transformers.bronze.parsers import coerce_batch, compile_field_mapping, get_parser
+from app.models.bronze import BronzeLabEvents, BronzePatients, BronzeRejectedRow
+from app.shared import SampledWarnings
+from app.transformers.bronze import FIELD_MAPPINGS
 
 
 class TestBaseCSVLoader:
@@ -84,3 +104,617 @@ class TestBaseCSVLoader:
         assert "loaded" in stats
         assert "errors" in stats
         assert stats["total"] == 0
+
+
+class TestCopyCSVLoader:
+    """Test CopyCSVLoader functionality."""
+
+    def test_copy_statement(self):
+        """Test COPY statement targets the bronze table and columns."""
+        loader = CopyCSVLoader(BronzePatients, Path("dummy.csv"))
+
+        sql = loader.copy_statement(["subject_id", "gender"])
+        assert sql.startswith("COPY bronze.patients (subject_id, gender) FROM STDIN")
+        assert "FORMAT csv" in sql
+
+    def test_serialize_batch(self):
+        """Test rows are serialized with NULLs as empty fields."""
+        loader = CopyCSVLoader(BronzePatients, Path("dummy.csv"))
+        batch = [
+            {"subject_id": 10001, "gender": "M", "dob": datetime(1980, 1, 1), "expire_flag": False},
+            {"subject_id": 10002, "gender": 'F, "quoted"', "dob": None, "expire_flag": True},
+        ]
+
+        buffer = loader.serialize_batch(batch, ["subject_id", "gender", "dob", "expire_flag"])
+        lines = buffer.read().splitlines()
+
+        assert lines[0] == "10001,M,1980-01-01 00:00:00,False"
+        assert lines[1] == '10002,"F, ""quoted""",,True'
+
+    def test_load_batch_uses_copy(self):
+        """Test a batch is sent through a single COPY and counted."""
+        loader = CopyCSVLoader(BronzePatients, Path("dummy.csv"))
+        session = Mock()
+        cursor = session.connection.return_value.connection.cursor.return_value
+
+        loaded = loader.load_batch(session, [{"subject_id": 1}, {"subject_id": 2}])
+
+        assert loaded == 2
+        assert loader.get_stats()["loaded"] == 2
+        cursor.copy_expert.assert_called_once()
+        session.commit.assert_called_once()
+
+
+class TestCsvChunking:
+    """Test byte-range splitting of CSV files."""
+
+    FIELD_MAPPING = {"row_id": "int", "subject_id": "int", "text": "str"}
+
+    @pytest.fixture
+    def quoted_csv(self, tmp_path):
+        """CSV whose values contain quoted newlines, commas and quotes."""
+        csv_file = tmp_path / "NOTEEVENTS.csv"
+        lines = ["row_id,subject_id,text"]
+        for i in range(1, 201):
+            if i % 3 == 0:
+                text = f'"line one\nline ""two"", {i}\n"'
+            else:
+                text = f"plain {i}"
+            lines.append(f"{i},{10000 + i},{text}")
+        csv_file.write_text("\n".join(lines) + "\n")
+        return csv_file
+
+    def read_rows(self, loader):
+        """Collect all transformed rows from a loader."""
+        return [row for batch in loader.read_csv_batches(self.FIELD_MAPPING) for row in batch]
+
+    @pytest.mark.parametrize("num_chunks", [1, 2, 7, 50])
+    def test_chunks_cover_file_exactly(self, quoted_csv, monkeypatch, num_chunks):
+        """Test chunks reproduce the sequential read, row for row."""
+        monkeypatch.setattr(base_loader, "_SCAN_BLOCK_BYTES", 64)
+        expected = self.read_rows(BaseCSVLoader(BronzePatients, quoted_csv))
+
+        fieldnames, ranges = split_csv(quoted_csv, num_chunks)
+        rows = []
+        for byte_range in ranges:
+            loader = BaseCSVLoader(BronzePatients, quoted_csv, byte_range=byte_range, fieldnames=fieldnames)
+            rows.extend(self.read_rows(loader))
+
+        assert fieldnames == ["row_id", "subject_id", "text"]
+        assert 1 <= len(ranges) <= num_chunks
+        assert rows == expected
+        assert len(rows) == 200
+
+    def test_crlf_translated(self, tmp_path):
+        """Test CRLF line endings, also inside quoted values, are read as LF."""
+        csv_file = tmp_path / "NOTEEVENTS.csv"
+        csv_file.write_bytes(b'row_id,subject_id,text\r\n1,10001,"line one\r\nline two"\r\n2,10002,plain\r\n')
+
+        rows = self.read_rows(BaseCSVLoader(BronzePatients, csv_file))
+
+        assert [row["text"] for row in rows] == ["line one\nline two", "plain"]
+
+    def test_boundaries_skip_quoted_newlines(self, quoted_csv):
+        """Test no chunk starts inside a quoted value."""
+        _, ranges = split_csv(quoted_csv, 20)
+        data = quoted_csv.read_bytes()
+
+        for start, _ in ranges:
+            assert data[start - 1:start] == b"\n"
+            assert data[start:start + 1].isdigit()
+            assert data[:start].count(b'"') % 2 == 0
+
+
+class TestCompressedInput:
+    """Test streaming .csv.gz input."""
+
+    FIELD_MAPPING = {"row_id": "int", "subject_id": "int", "text": "str"}
+
+    @pytest.fixture
+    def csv_pair(self, tmp_path):
+        """The same CSV written plain and gzip-compressed."""
+        lines = ["row_id,subject_id,text"]
+        lines += [f'{i},{10000 + i},"note {i}\nwith, comma"' for i in range(1, 3001)]
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+        plain = tmp_path / "plain" / "NOTEEVENTS.csv"
+        plain.parent.mkdir()
+        plain.write_bytes(content)
+        compressed = tmp_path / "gz" / "NOTEEVENTS.csv.gz"
+        compressed.parent.mkdir()
+        compressed.write_bytes(gzip.compress(content))
+        return plain, compressed
+
+    def read_rows(self, path):
+        """Collect all transformed rows read from a file."""
+        loader = BaseCSVLoader(BronzePatients, path, batch_size=500)
+        return [row for batch in loader.read_csv_batches(self.FIELD_MAPPING) for row in batch]
+
+    def test_gzip_matches_plain(self, csv_pair):
+        """Test a compressed file parses to the same rows as the plain one."""
+        plain, compressed = csv_pair
+
+        rows = self.read_rows(compressed)
+
+        assert rows == self.read_rows(plain)
+        assert len(rows) == 3000
+
+    def test_bounded_blocks_reassemble(self, csv_pair):
+        """Test small blocks through a short queue reproduce the file byte for byte."""
+        plain, compressed = csv_pair
+        reader = BackgroundGzipReader(compressed, block_bytes=1000, max_blocks=2)
+        try:
+            data = b"".join(iter(lambda: reader.read(777), b""))
+        finally:
+            reader.close()
+
+        assert data == plain.read_bytes()
+
+    def test_close_stops_thread_early(self, csv_pair):
+        """Test closing before the end stops a decompression thread blocked on a full queue."""
+        _, compressed = csv_pair
+        reader = BackgroundGzipReader(compressed, block_bytes=100, max_blocks=1)
+        reader.read(10)
+        reader.close()
+
+        assert not any(t.name == "gunzip-NOTEEVENTS.csv.gz" for t in threading.enumerate())
+
+    def test_corrupt_file_raises(self, tmp_path):
+        """Test a truncated archive surfaces as an error in the reader."""
+        path = tmp_path / "PATIENTS.csv.gz"
+        archive = gzip.compress("".join(f"{i}\n" for i in range(100000)).encode())
+        path.write_bytes(archive[: len(archive) // 2])
+
+        with pytest.raises(EOFError):
+            self.read_rows(path)
+
+    def test_find_csv(self, csv_pair, tmp_path):
+        """Test .csv is preferred and .csv.gz used when it is the only file."""
+        plain, compressed = csv_pair
+
+        assert find_csv(plain.parent, "NOTEEVENTS") == plain
+        assert find_csv(compressed.parent, "NOTEEVENTS") == compressed
+        assert find_csv(tmp_path, "NOTEEVENTS") == tmp_path / "NOTEEVENTS.csv"
+
+    def test_byte_range_rejected(self, csv_pair):
+        """Test compressed files cannot be split into byte ranges."""
+        _, compressed = csv_pair
+        loader = BaseCSVLoader(BronzePatients, compressed, byte_range=(0, 10), fieldnames=["row_id"])
+
+        with pytest.raises(ValueError, match="compressed"):
+            list(loader.read_csv_batches(self.FIELD_MAPPING))
+
+
+class FailingLoader(BaseCSVLoader):
+    """Loader that dies before committing its n-th batch."""
+
+    fail_at = 4
+
+    def load_batch(self, session, batch):
+        self.batches = getattr(self, "batches", 0) + 1
+        if self.batches == self.fail_at:
+            raise ConnectionError("connection reset")
+        return super().load_batch(session, batch)
+
+
+class TestCheckpoints:
+    """Test resumable loads."""
+
+    @pytest.fixture(params=["PATIENTS.csv", "PATIENTS.csv.gz"])
+    def patients_csv(self, request, tmp_path):
+        """1000 patients, plain and gzip-compressed."""
+        lines = [",".join(FIELD_MAPPINGS["PATIENTS"])]
+        lines += [f"{i},{i},{'MF'[i % 2]},2100-01-01 00:00:00,,,,0" for i in range(1, 1001)]
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+        path = tmp_path / request.param
+        path.write_bytes(gzip.compress(content) if path.suffix == ".gz" else content)
+        return path
+
+    def count(self, session):
+        return session.query(BronzePatients).count()
+
+    def test_resume_continues_after_last_commit(self, bronze_session, patients_csv):
+        """Test a resumed load inserts only the rows the failed load did not commit."""
+        with pytest.raises(ConnectionError):
+            FailingLoader(BronzePatients, patients_csv, batch_size=100, checkpoint=True).load(
+                bronze_session, FIELD_MAPPINGS["PATIENTS"]
+            )
+        checkpoint = get_checkpoint(bronze_session, "patients")
+        assert (checkpoint.rows_loaded, checkpoint.completed) == (300, False)
+        assert self.count(bronze_session) == 300
+
+        loader = BaseCSVLoader(BronzePatients, patients_csv, batch_size=100, resume=True)
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        bronze_session.expire_all()
+        checkpoint = get_checkpoint(bronze_session, "patients")
+        assert (loader.stats["loaded"], loader.stats["resumed_rows"]) == (700, 300)
+        assert (checkpoint.rows_loaded, checkpoint.completed) == (1000, True)
+        assert self.count(bronze_session) == 1000
+
+    def test_completed_load_not_repeated(self, bronze_session, patients_csv):
+        """Test resuming a finished load does nothing."""
+        BaseCSVLoader(BronzePatients, patients_csv, batch_size=400, checkpoint=True).load(
+            bronze_session, FIELD_MAPPINGS["PATIENTS"]
+        )
+
+        loader = BaseCSVLoader(BronzePatients, patients_csv, resume=True)
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        assert (loader.stats["loaded"], loader.stats["resumed_rows"]) == (0, 1000)
+        assert self.count(bronze_session) == 1000
+
+    def test_chunked_load_replaces_unfinished_checkpoint(self, bronze_session, patients_csv, monkeypatch):
+        """Test a byte-range load marks the file complete, so resuming does not load rows again."""
+        save_checkpoint(bronze_session, "patients", patients_csv, file_identity(patients_csv), 100, 3)
+        bronze_session.commit()
+
+        def load_parallel(loader, field_mapping, workers):
+            loader.checkpoint = False  # as in byte-range chunks
+            loader.load(bronze_session, field_mapping)
+
+        monkeypatch.setattr(BaseCSVLoader, "load_parallel", load_parallel)
+        table_loaders.load_table(bronze_session, "PATIENTS", patients_csv.parent, chunk_workers=2)
+        bronze_session.expire_all()
+        checkpoint = get_checkpoint(bronze_session, "patients")
+        assert (checkpoint.rows_loaded, checkpoint.completed) == (1000, True)
+
+        stats = table_loaders.load_table(bronze_session, "PATIENTS", patients_csv.parent, resume=True)
+        assert stats["loaded"] == 0
+        assert self.count(bronze_session) == 1000
+
+    def test_changed_file_refused(self, bronze_session, patients_csv):
+        """Test a checkpoint is not applied to a file that changed since."""
+        with pytest.raises(ConnectionError):
+            FailingLoader(BronzePatients, patients_csv, batch_size=100, checkpoint=True).load(
+                bronze_session, FIELD_MAPPINGS["PATIENTS"]
+            )
+        patients_csv.write_bytes(patients_csv.read_bytes() + b"\n")
+
+        with pytest.raises(ValueError, match="changed"):
+            BaseCSVLoader(BronzePatients, patients_csv, resume=True).load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+
+class StrictGenderLoader(BaseCSVLoader):
+    """Loader rejecting patients whose gender is neither M nor F."""
+
+    def transform_row(self, row, field_mapping):
+        if row["gender"] not in ("M", "F"):
+            raise ValueError(f"unknown gender {row['gender']!r}")
+        return super().transform_row(row, field_mapping)
+
+
+class TestQuarantine:
+    """Test rejected rows are quarantined instead of logged one by one."""
+
+    @pytest.fixture
+    def dirty_csv(self, tmp_path):
+        """Ten patients, two of them with an invalid gender."""
+        lines = [",".join(FIELD_MAPPINGS["PATIENTS"])]
+        lines += [f"{i},{i},{'X' if i in (4, 7) else 'F'},2100-01-01 00:00:00,,,,0" for i in range(1, 11)]
+        path = tmp_path / "PATIENTS.csv"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def test_rejected_rows_written_with_batches(self, bronze_session, dirty_csv):
+        """Test rejected rows land in bronze.etl_rejected_rows with their position."""
+        loader = StrictGenderLoader(BronzePatients, dirty_csv, batch_size=3)
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        rejected = bronze_session.query(BronzeRejectedRow).order_by(BronzeRejectedRow.line_number).all()
+        content = dirty_csv.read_bytes()
+        assert (loader.stats["loaded"], loader.stats["errors"]) == (8, 2)
+        assert bronze_session.query(BronzePatients).count() == 8
+        assert [r.line_number for r in rejected] == [5, 8]
+        assert [r.byte_offset for r in rejected] == [content.index(b"\n4,") + 1, content.index(b"\n7,") + 1]
+        assert json.loads(rejected[0].raw_row)["subject_id"] == "4"
+        assert rejected[0].table_name == "patients"
+        assert rejected[0].error == "ValueError: unknown gender 'X'"
+        assert not loader.quarantine.pending
+
+    def test_resumed_rows_have_no_line_number(self, bronze_session, dirty_csv):
+        """Test rows read after skipping to a checkpoint keep their offset but not a line number."""
+        loader = StrictGenderLoader(BronzePatients, dirty_csv, batch_size=100)
+        loader.start_offset = dirty_csv.read_bytes().index(b"\n5,") + 1
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        rejected = bronze_session.query(BronzeRejectedRow).one()
+        assert rejected.line_number is None
+        assert json.loads(rejected.raw_row)["row_id"] == "7"
+
+    def test_warnings_sampled(self, monkeypatch):
+        """Test only the first warnings of each kind are logged, then summarized."""
+        logged = []
+        monkeypatch.setattr("app.shared.quarantine.logger.warning", logged.append)
+        warnings = SampledWarnings(sample_size=2)
+
+        for i in range(5):
+            warnings.warn("int", f"bad int {i}")
+        warnings.warn("date", "bad date")
+        warnings.summary("Unparseable values")
+
+        assert logged[:2] == ["bad int 0", "bad int 1"]
+        assert "bad int 2" not in logged and "bad date" in logged
+        assert logged[-1] == "Unparseable values: 6 (int: 5, date: 1)"
+        assert warnings.total() == 0
+
+
+class TestSkipUnchanged:
+    """Test manifest-based skipping and staged reloads."""
+
+    @pytest.fixture
+    def big_file(self, tmp_path):
+        """File spanning more than the three sampled blocks."""
+        path = tmp_path / "LABEVENTS.csv"
+        path.write_bytes(bytes(range(256)) * (SAMPLE_BLOCK_BYTES // 64))
+        return path
+
+    def rewrite_byte(self, path, offset):
+        """Flip one byte in place and move the modification time forward."""
+        data = bytearray(path.read_bytes())
+        data[offset] ^= 0xFF
+        path.write_bytes(bytes(data))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_sample_covers_head_middle_tail(self, big_file):
+        """Test the sample hash sees edits in sampled blocks only, the content hash sees all."""
+        size = big_file.stat().st_size
+        original = FileFingerprint.of(big_file)
+        full = content_hash(big_file)
+
+        self.rewrite_byte(big_file, size // 2)
+        assert FileFingerprint.of(big_file).sample_hash != original.sample_hash
+
+        self.rewrite_byte(big_file, size // 2)
+        self.rewrite_byte(big_file, SAMPLE_BLOCK_BYTES + 1)
+        assert FileFingerprint.of(big_file).sample_hash == original.sample_hash
+        assert content_hash(big_file) != full
+
+    def test_touched_file_checked_in_full(self, bronze_session, big_file):
+        """Test a newer mtime falls back to the content hash."""
+        save_manifest(bronze_session, "labevents", FileFingerprint.of(big_file), content_hash(big_file))
+        entry = get_manifest(bronze_session, "labevents")
+        stat = os.stat(big_file)
+
+        os.utime(big_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert is_unchanged(entry, FileFingerprint.of(big_file))
+
+        self.rewrite_byte(big_file, SAMPLE_BLOCK_BYTES + 1)
+        assert not is_unchanged(entry, FileFingerprint.of(big_file))
+
+    def test_reload_then_skip(self, bronze_session, tmp_path, monkeypatch):
+        """Test a changed file is reloaded and recorded, and skipped on the next run."""
+        swapped = []
+        monkeypatch.setattr(table_loaders, "staging_bind", lambda bind: bind)
+        idle_in_transaction = []
+        monkeypatch.setattr(
+            table_loaders, "create_staging_table",
+            lambda bind, table: idle_in_transaction.append(bronze_session.in_transaction()),
+        )
+        monkeypatch.setattr(table_loaders, "build_staging_indexes", lambda bind, table: None)
+        monkeypatch.setattr(table_loaders, "swap_staging_table", lambda session, table: swapped.append(table.name))
+        lines = [",".join(FIELD_MAPPINGS["PATIENTS"])]
+        lines += [f"{i},{i},F,2100-01-01 00:00:00,,,,0" for i in range(1, 6)]
+        csv_path = tmp_path / "PATIENTS.csv"
+        csv_path.write_text("\n".join(lines) + "\n")
+
+        stats = table_loaders.load_table(bronze_session, "PATIENTS", tmp_path, skip_unchanged=True)
+
+        entry = get_manifest(bronze_session, "patients")
+        checkpoint = get_checkpoint(bronze_session, "patients")
+        assert (stats["unchanged"], stats["loaded"], swapped) == (False, 5, ["patients"])
+        assert idle_in_transaction == [False]
+        assert entry.content_hash == content_hash(csv_path)
+        assert (checkpoint.completed, checkpoint.rows_loaded) == (True, 5)
+
+        stats = table_loaders.load_table(bronze_session, "PATIENTS", tmp_path, skip_unchanged=True)
+
+        assert (stats["unchanged"], stats["loaded"], swapped) == (True, 0, ["patients"])
+        assert bronze_session.query(BronzePatients).count() == 5
+
+    def test_swap_statements(self):
+        """Test the swap drops the live table and moves the staging copy into bronze."""
+        assert swap_statements(BronzeLabEvents.__table__) == [
+            "DROP TABLE IF EXISTS bronze.labevents",
+            "ALTER TABLE bronze_staging.labevents SET SCHEMA bronze",
+        ]
+
+
+class TestParsers:
+    """Test precompiled and vectorized value parsers."""
+
+    def test_datetime_fast_path_and_fallback(self):
+        """Test canonical and non-padded timestamps both parse."""
+        parse = get_parser("datetime")
+
+        assert parse("2150-03-04 05:06:07") == datetime(2150, 3, 4, 5, 6, 7)
+        assert parse("2150-3-4 5:06:07") == datetime(2150, 3, 4, 5, 6, 7)
+        assert parse("not a date") is None
+        assert parse("   ") is None
+
+    def test_compile_field_mapping(self, sample_field_mapping):
+        """Test a mapping compiles to ordered (name, parser) pairs."""
+        compiled = compile_field_mapping(sample_field_mapping)
+
+        assert [name for name, _ in compiled] == list(sample_field_mapping)
+        assert compiled[0][1] is get_parser("int")
+
+    def test_transform_row_skips_missing_fields(self, sample_csv_row, sample_field_mapping):
+        """Test compiled transform keeps only fields present in the row."""
+        loader = BaseCSVLoader(BronzePatients, Path("dummy.csv"))
+        row = dict(sample_csv_row)
+        del row["gender"]
+
+        result = loader.transform_row(row, sample_field_mapping)
+
+        assert result == {
+            "row_id": 1,
+            "subject_id": 10001,
+            "dob": datetime(1980, 1, 1),
+            "expire_flag": False,
+        }
+
+    def test_coerce_batch_matches_cell_parsers(self):
+        """Test the pandas batch path agrees with the per-cell parsers."""
+        pytest.importorskip("pandas")
+        field_mapping = {
+            "row_id": "int",
+            "valuenum": "float",
+            "flag": "bool",
+            "charttime": "datetime",
+            "chartdate": "date",
+            "value": "str",
+        }
+        rows = [
+            {"row_id": "1", "valuenum": "1.5", "flag": "1", "charttime": "2150-01-01 08:00:00",
+             "chartdate": "2150-01-01", "value": "  POS "},
+            {"row_id": "", "valuenum": "", "flag": "", "charttime": "", "chartdate": "", "value": ""},
+            {"row_id": "x", "valuenum": "abc", "flag": "0", "charttime": "bad",
+             "chartdate": "bad", "value": "NEG"},
+        ]
+        loader = BaseCSVLoader(BronzePatients, Path("dummy.csv"))
+
+        expected = [loader.transform_row(row, field_mapping) for row in rows]
+
+        assert coerce_batch(rows, field_mapping) == expected
+
+
+class TestArrowReader:
+    """Test the pyarrow CSV reader engine."""
+
+    FIELD_MAPPING = {
+        "row_id": "int",
+        "valuenum": "float",
+        "flag": "bool",
+        "charttime": "datetime",
+        "chartdate": "date",
+        "value": "str",
+    }
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def dirty_csv(self, tmp_path):
+        """CSV mixing clean, empty, invalid and quoted multi-line values."""
+        lines = ["row_id,valuenum,flag,charttime,chartdate,value,unmapped"]
+        for i in range(1, 301):
+            if i % 7 == 0:
+                lines.append(f'x{i}, abc ,0,bad,2150-13-01,"line one\nline ""two"", {i}",u')
+            elif i % 5 == 0:
+                lines.append(f"{i},,,,,   ,u")
+            else:
+                lines.append(f" {i} ,{i}.5,1,2150-01-01 08:00:{i % 60:02d},2150-01-02,  POS {i} ,u")
+        path = tmp_path / "LABEVENTS.csv"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def read_rows(self, loader):
+        """Collect all rows from a loader as dicts."""
+        rows = []
+        for batch in loader.read_csv_batches(self.FIELD_MAPPING):
+            rows.extend(batch.to_pylist() if hasattr(batch, "to_pylist") else batch)
+        return rows
+
+    def test_matches_csv_reader(self, dirty_csv):
+        """Test arrow batches hold the same values as the per-cell parsers."""
+        expected = self.read_rows(BaseCSVLoader(BronzeLabEvents, dirty_csv, batch_size=50))
+        loader = BaseCSVLoader(BronzeLabEvents, dirty_csv, batch_size=50, reader="arrow")
+
+        assert self.read_rows(loader) == expected
+        assert loader.stats["total"] == 300
+        assert loader.batch_end == dirty_csv.stat().st_size
+
+    def test_crlf_matches_csv_reader(self, dirty_csv):
+        """Test CRLF line endings, also inside quoted values, are read as by the csv reader."""
+        dirty_csv.write_bytes(dirty_csv.read_bytes().replace(b"\n", b"\r\n"))
+        expected = self.read_rows(BaseCSVLoader(BronzeLabEvents, dirty_csv, batch_size=50))
+
+        rows = self.read_rows(BaseCSVLoader(BronzeLabEvents, dirty_csv, batch_size=50, reader="arrow"))
+
+        assert rows == expected
+        assert rows[6]["value"] == 'line one\nline "two", 7'
+
+    def test_batches_end_on_records(self, dirty_csv):
+        """Test batches stay near the batch size and each ends at an exact offset."""
+        loader = BaseCSVLoader(BronzeLabEvents, dirty_csv, batch_size=40, reader="arrow")
+        content = dirty_csv.read_bytes()
+
+        sizes = []
+        for batch in loader.read_csv_batches(self.FIELD_MAPPING):
+            sizes.append(batch.num_rows)
+            assert content[loader.batch_end - 1:loader.batch_end] == b"\n"
+            assert content[:loader.batch_end].count(b'"') % 2 == 0
+        assert sum(sizes) == 300
+        assert max(sizes[1:]) < 80
+
+    def test_byte_ranges_cover_file(self, dirty_csv):
+        """Test byte-range chunks read with arrow reproduce the whole file."""
+        expected = self.read_rows(BaseCSVLoader(BronzeLabEvents, dirty_csv, reader="arrow"))
+        fieldnames, ranges = split_csv(dirty_csv, 5)
+        rows = []
+        for byte_range in ranges:
+            loader = BaseCSVLoader(
+                BronzeLabEvents, dirty_csv, byte_range=byte_range, fieldnames=fieldnames, reader="arrow"
+            )
+            rows.extend(self.read_rows(loader))
+
+        assert rows == expected
+
+    def test_malformed_rows_quarantined(self, bronze_session, tmp_path):
+        """Test rows with the wrong number of fields are quarantined, not padded."""
+        lines = [",".join(FIELD_MAPPINGS["PATIENTS"])]
+        lines += [f"{i},{i},F,2100-01-01 00:00:00,,,,0" for i in range(1, 6)]
+        lines.insert(3, "99,99,F")
+        path = tmp_path / "PATIENTS.csv"
+        path.write_text("\n".join(lines) + "\n")
+        content = path.read_bytes()
+
+        loader = BaseCSVLoader(BronzePatients, path, reader="arrow")
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        rejected = bronze_session.query(BronzeRejectedRow).one()
+        assert (loader.stats["total"], loader.stats["loaded"], loader.stats["errors"]) == (6, 5, 1)
+        assert json.loads(rejected.raw_row) == {"row": "99,99,F"}
+        assert rejected.error == "ValueError: Expected 8 fields, got 3"
+        assert (rejected.line_number, rejected.byte_offset) == (4, content.index(b"\n99,") + 1)
+
+    @pytest.mark.parametrize("name", ["PATIENTS.csv", "PATIENTS.csv.gz"])
+    def test_resume(self, bronze_session, tmp_path, name):
+        """Test an arrow load resumes after its last committed batch."""
+        lines = [",".join(FIELD_MAPPINGS["PATIENTS"])]
+        lines += [f"{i},{i},{'MF'[i % 2]},2100-01-01 00:00:00,,,,0" for i in range(1, 1001)]
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+        path = tmp_path / name
+        path.write_bytes(gzip.compress(content) if path.suffix == ".gz" else content)
+
+        with pytest.raises(ConnectionError):
+            FailingLoader(BronzePatients, path, batch_size=100, checkpoint=True, reader="arrow").load(
+                bronze_session, FIELD_MAPPINGS["PATIENTS"]
+            )
+        committed = get_checkpoint(bronze_session, "patients").rows_loaded
+        assert 0 < committed == bronze_session.query(BronzePatients).count()
+
+        loader = BaseCSVLoader(BronzePatients, path, batch_size=100, resume=True, reader="arrow")
+        loader.load(bronze_session, FIELD_MAPPINGS["PATIENTS"])
+
+        assert loader.stats["loaded"] == 1000 - committed
+        assert bronze_session.query(BronzePatients).count() == 1000
+
+    def test_copy_serializes_table(self, dirty_csv):
+        """Test COPY buffers are written from arrow tables with NULLs as empty fields."""
+        loader = CopyCSVLoader(BronzeLabEvents, dirty_csv, batch_size=10, reader="arrow")
+        batch = next(loader.read_csv_batches(self.FIELD_MAPPING))
+
+        lines = loader.serialize_batch(batch, ["row_id", "value", "charttime", "flag"]).read().splitlines()
+
+        assert lines[0] == b'1,"POS 1",2150-01-01 08:00:01,true'
+        assert lines[4] == b"5,,,"
+
+    def test_unknown_reader(self):
+        """Test an unknown reader or one combined with vectorized is refused."""
+        with pytest.raises(ValueError, match="Unknown CSV reader"):
+            BaseCSVLoader(BronzePatients, Path("dummy.csv"), reader="polars")
+        with pytest.raises(ValueError, match="vectorized"):
+            BaseCSVLoader(BronzePatients, Path("dummy.csv"), reader="arrow", vectorized=True)
@@ -0,0 +1,112 @@
+"""Unit tests for the pipeline stage instrumentation."""
+import json
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.shared.metrics import PipelineMetrics, instrument_engine
+
+
+@pytest.fixture
+def registry():
+    return PipelineMetrics()
+
+
+@pytest.fixture
+def engine(tmp_path, registry):
+    """SQLite engine instrumented into the test registry."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    instrument_engine(engine, registry)
+    instrument_engine(engine, registry)  # idempotent
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+    registry.reset()
+    return engine
+
+
+class TestStages:
+    """Test stage timing, counters and database attribution."""
+
+    def test_counts_accumulate_per_stage(self, registry):
+        """Test repeated calls of a stage add up."""
+        for _ in range(2):
+            with registry.stage("bronze.PATIENTS") as stage:
+                stage.count(rows=10, nbytes=100)
+
+        stats = registry.stages()["bronze.PATIENTS"]
+        assert (stats.calls, stats.rows, stats.nbytes) == (2, 20, 200)
+        assert stats.seconds > 0
+
+    def test_database_time_and_round_trips(self, registry, engine):
+        """Test statements count towards every active stage, with rows written."""
+        with registry.stage("silver") as outer:
+            with registry.stage("silver.patients") as inner:
+                with engine.begin() as conn:
+                    conn.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+                    conn.execute(text("SELECT COUNT(*) FROM t"))
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert (inner.db_round_trips, inner.db_rows_written) == (2, 3)
+        assert (outer.db_round_trips, outer.db_rows_written) == (3, 3)
+        assert 0 < inner.db_seconds <= inner.seconds
+        assert inner.python_seconds == pytest.approx(inner.seconds - inner.db_seconds)
+        assert registry.db_round_trips == 3
+
+    def test_other_threads_not_attributed(self, registry, engine):
+        """Test statements on another thread do not count towards this thread's stage."""
+        def query():
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        with registry.stage("gold.dim_patient") as stage:
+            worker = threading.Thread(target=query)
+            worker.start()
+            worker.join()
+
+        assert stage.db_round_trips == 0
+        assert registry.db_round_trips == 1
+
+    def test_failed_statement_and_stage(self, registry, engine):
+        """Test a failing statement is still timed and the stage records the error."""
+        with pytest.raises(Exception):
+            with registry.stage("gold.bad"):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT * FROM missing_table"))
+
+        stats = registry.stages()["gold.bad"]
+        assert (stats.errors, stats.db_round_trips) == (1, 1)
+
+    def test_raw_database_call(self, registry):
+        """Test calls that bypass cursor events can be recorded explicitly."""
+        with registry.stage("bronze.LABEVENTS") as stage:
+            with registry.database_call():
+                pass
+
+        assert stage.db_round_trips == 1
+
+
+class TestOutput:
+    """Test JSON and Prometheus output."""
+
+    def test_json(self, registry, tmp_path):
+        """Test the JSON document lists every stage."""
+        with registry.stage("bronze.PATIENTS") as stage:
+            stage.count(rows=5)
+        registry.write(tmp_path / "metrics.json")
+
+        report = json.loads((tmp_path / "metrics.json").read_text())
+        assert report["stages"][0]["stage"] == "bronze.PATIENTS"
+        assert report["stages"][0]["rows"] == 5
+
+    def test_prometheus(self, registry, tmp_path):
+        """Test the text exposition format has typed, labelled samples."""
+        with registry.stage('silver."odd"') as stage:
+            stage.count(rows=7, nbytes=70)
+        registry.write(tmp_path / "metrics.prom")
+
+        lines = (tmp_path / "metrics.prom").read_text().splitlines()
+        assert "# TYPE mimic_pipeline_stage_rows_total counter" in lines
+        assert 'mimic_pipeline_stage_rows_total{stage="silver.\\"odd\\""} 7' in lines
+        assert 'mimic_pipeline_stage_bytes_total{stage="silver.\\"odd\\""} 70' in lines
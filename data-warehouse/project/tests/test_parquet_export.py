@@ -0,0 +1,117 @@
+"""Unit tests for the gold Parquet export."""
+from pathlib import Path
+
+import pytest
+
+from app.analytics import parquet_export
+from app.analytics.parquet_export import (
+    changed_partitions,
+    export_table,
+    export_tables,
+    fingerprint_sql,
+    partition_path,
+    select_partition_sql,
+)
+from app.models.gold import DimPatient, FactLabEvent
+
+
+class FingerprintSession:
+    """Session stand-in returning fixed (year, count, hash) fingerprint rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append(str(statement))
+        return iter(self.rows)
+
+
+class TestExportLayout:
+    """Test which tables are exported and where they go."""
+
+    def test_control_tables_skipped(self):
+        """Test ETL bookkeeping tables are not exported."""
+        names = [table.name for table in export_tables()]
+
+        assert "fact_lab_event" in names
+        assert "dim_patient" in names
+        assert not any(name.startswith("etl_") for name in names)
+
+    def test_unknown_table_rejected(self):
+        """Test requesting a non-gold table fails."""
+        with pytest.raises(ValueError):
+            export_tables(["etl_watermarks"])
+
+    def test_facts_partitioned_by_year(self):
+        """Test facts get Hive-style year directories and dimensions one file."""
+        root = Path("/exports")
+
+        assert partition_path(root, FactLabEvent.__table__, "year=2150") == root / "fact_lab_event/year=2150/data.parquet"
+        assert partition_path(root, DimPatient.__table__, "") == root / "dim_patient/data.parquet"
+
+    def test_partition_select_is_sargable(self):
+        """Test a year partition is read with a range on the raw column."""
+        sql = select_partition_sql(FactLabEvent.__table__, "year=2150")
+
+        assert "WHERE charttime >= make_date(:year, 1, 1) AND charttime < make_date(:year + 1, 1, 1)" in sql
+        assert select_partition_sql(FactLabEvent.__table__, "year=0").endswith("WHERE charttime IS NULL")
+
+
+class TestIncrementalExport:
+    """Test change detection between exports."""
+
+    def test_fingerprint_grouped_by_year(self):
+        """Test facts are fingerprinted per event year inside the database."""
+        sql = fingerprint_sql(FactLabEvent.__table__)
+
+        assert "EXTRACT(YEAR FROM t.charttime)" in sql
+        assert "hashtextextended(t::text, 0)" in sql
+        assert sql.endswith("GROUP BY 1")
+
+    def test_changed_partitions(self):
+        """Test new, changed, removed and unchanged partitions are told apart."""
+        previous = {"year=2150": "10:1", "year=2151": "5:2", "year=2152": "1:3"}
+        current = {"year=2150": "10:1", "year=2151": "6:9", "year=2153": "2:4"}
+
+        assert changed_partitions(previous, current) == {
+            "write": ["year=2151", "year=2153"],
+            "delete": ["year=2152"],
+            "unchanged": ["year=2150"],
+        }
+
+    def test_unchanged_table_not_rewritten(self, tmp_path, monkeypatch):
+        """Test an incremental export skips partitions with equal fingerprints."""
+        written = []
+        monkeypatch.setattr(parquet_export, "write_partition", lambda *args: written.append(args[2]) or 0)
+        session = FingerprintSession([(2150, 10, 1), (2151, 6, 9)])
+
+        stats = export_table(session, FactLabEvent.__table__, tmp_path, {"year=2150": "10:1", "year=2151": "5:2"})
+
+        assert written == ["year=2151"]
+        assert stats["unchanged"] == 1
+        assert stats["fingerprints"] == {"year=2150": "10:1", "year=2151": "6:9"}
+
+    def test_empty_dimension_still_exported(self, tmp_path, monkeypatch):
+        """Test whole tables always have a partition, even when empty."""
+        written = []
+        monkeypatch.setattr(parquet_export, "write_partition", lambda *args: written.append(args[2]) or 0)
+
+        export_table(FingerprintSession([]), DimPatient.__table__, tmp_path)
+
+        assert written == [""]
+
+
+class TestArrowSchema:
+    """Test Arrow types derived from gold columns."""
+
+    def test_column_types(self):
+        """Test SQL types map to the matching Arrow types."""
+        pa = pytest.importorskip("pyarrow")
+
+        schema = parquet_export.arrow_schema(FactLabEvent.__table__)
+
+        assert schema.field("row_id").type == pa.int32()
+        assert schema.field("charttime").type == pa.timestamp("us")
+        assert schema.field("valuenum").type == pa.float64()
+        assert schema.field("value").type == pa.string()
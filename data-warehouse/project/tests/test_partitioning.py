@@ -0,0 +1,275 @@
+"""Unit tests for event table partitioning."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, event, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import registry
+from sqlalchemy.schema import CreateTable
+
+from app.models.partitioning import (
+    create_partitions,
+    event_table_args,
+    get_partition,
+    key_columns,
+    moved_rows_delete,
+    partitions,
+    table_partition_column,
+)
+from app.models.silver import SilverLabEvent
+from app.shared import settings
+from app.transformers.silver.base_transformer import rebuild_partition, upsert_batch
+from scripts import load_gold
+
+
+def make_events_table(method):
+    """Build a small event table declared with the given partitioning method."""
+    *constraints, options = event_table_args("silver", "charttime", primary_key=("row_id",), method=method)
+    return Table(
+        "events",
+        MetaData(),
+        Column("row_id", Integer),
+        Column("subject_id", Integer, nullable=False),
+        Column("charttime", DateTime, nullable=False),
+        Column("value", String(20)),
+        *constraints,
+        **options,
+    )
+
+
+class RecordingConnection:
+    """Connection stand-in that records executed SQL."""
+
+    class dialect:
+        name = "postgresql"
+
+    def __init__(self, schema_translate_map=None):
+        self.executed = []
+        self.schema_translate_map = schema_translate_map or {}
+
+    def schema_for_object(self, table):
+        return self.schema_translate_map.get(table.schema, table.schema)
+
+    def execute(self, statement, params=None):
+        self.executed.append(" ".join(str(statement).split()))
+
+        class Result:
+            rowcount = 3
+
+        return Result()
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def hash_partitioning(monkeypatch):
+    """Configure four hash partitions."""
+    monkeypatch.setattr(settings, "event_partitioning", "hash")
+    monkeypatch.setattr(settings, "partition_hash_modulus", 4)
+
+
+class TestPartitionSchemes:
+    """Test partition layouts for each method."""
+
+    def test_none_has_no_partitions(self):
+        """Test partitioning is off by default."""
+        assert partitions("none") == []
+        assert key_columns(("row_id",), "charttime", method="none") == ("row_id",)
+
+    def test_range_covers_mimic_years(self):
+        """Test range partitions span the shifted MIMIC dates plus a default."""
+        result = partitions("range")
+
+        assert result[0].suffix == "y2100"
+        assert result[-1].suffix == "default"
+        assert "FOR VALUES FROM ('2100-01-01') TO ('2110-01-01')" == result[0].bound
+        assert get_partition("y2130", "range").predicate("silver.labevents", "charttime") == (
+            "charttime >= '2130-01-01' AND charttime < '2140-01-01'"
+        )
+
+    def test_hash_predicate(self, hash_partitioning):
+        """Test hash partitions select rows with satisfies_hash_partition."""
+        result = partitions()
+
+        assert [p.suffix for p in result] == ["h00", "h01", "h02", "h03"]
+        assert result[3].bound == "FOR VALUES WITH (MODULUS 4, REMAINDER 3)"
+        assert result[3].predicate("gold.fact_lab_event", "subject_id") == (
+            "satisfies_hash_partition('gold.fact_lab_event'::regclass, 4, 3, subject_id)"
+        )
+
+    def test_unknown_partition(self, hash_partitioning):
+        """Test looking up a missing partition fails."""
+        with pytest.raises(ValueError):
+            get_partition("y2130")
+
+    def test_keys_include_partition_column(self):
+        """Test keys are extended with the partition key."""
+        assert key_columns(("row_id",), "charttime", method="range") == ("row_id", "charttime")
+        assert key_columns(("row_id",), "charttime", method="hash") == ("row_id", "subject_id")
+        assert key_columns(("subject_id",), "charttime", method="hash") == ("subject_id",)
+
+
+class TestPartitionedTables:
+    """Test DDL of partitioned tables."""
+
+    def test_ddl_declares_partitioning(self):
+        """Test CREATE TABLE declares the partition key and widened primary key."""
+        ddl = str(CreateTable(make_events_table("range")).compile(dialect=postgresql.dialect()))
+
+        assert "PRIMARY KEY (row_id, charttime)" in ddl
+        assert ddl.rstrip().endswith("PARTITION BY RANGE (charttime)")
+
+    def test_unpartitioned_models_by_default(self):
+        """Test models stay plain tables unless partitioning is configured."""
+        assert table_partition_column(SilverLabEvent.__table__) is None
+        assert list(SilverLabEvent.__table__.primary_key.columns.keys()) == ["row_id"]
+
+    def test_partitions_created_after_table(self, hash_partitioning):
+        """Test every partition is created right after its parent."""
+        connection = RecordingConnection()
+
+        create_partitions(make_events_table("hash"), connection)
+
+        assert connection.executed[0] == (
+            "CREATE TABLE IF NOT EXISTS silver.events_h00 PARTITION OF silver.events "
+            "FOR VALUES WITH (MODULUS 4, REMAINDER 0)"
+        )
+        assert len(connection.executed) == 4
+
+    def test_partitions_follow_schema_translation(self, hash_partitioning):
+        """Test a parent created under a schema_translate_map gets its partitions beside it."""
+        connection = RecordingConnection({"silver": "silver_staging"})
+
+        create_partitions(make_events_table("hash"), connection)
+
+        assert connection.executed[0].startswith(
+            "CREATE TABLE IF NOT EXISTS silver_staging.events_h00 PARTITION OF silver_staging.events "
+        )
+
+    def test_plain_tables_get_no_partitions(self):
+        """Test the create hook ignores unpartitioned tables."""
+        connection = RecordingConnection()
+
+        create_partitions(make_events_table("none"), connection)
+
+        assert connection.executed == []
+
+
+class TestPartitionRebuild:
+    """Test rebuilding a single partition."""
+
+    def test_silver_rebuild_truncates_and_filters(self, hash_partitioning):
+        """Test a silver partition is truncated and refilled from matching rows only."""
+        session = RecordingConnection()
+
+        class Model:
+            __table__ = make_events_table("hash")
+
+        sources = [(SilverLabEvent, "SELECT b.row_id, b.subject_id FROM {source} AS b")]
+        written = rebuild_partition(session, Model, sources, "h02")
+
+        assert written == 3
+        assert session.executed[0] == "TRUNCATE silver.events_h02"
+        assert session.executed[1].startswith("DELETE FROM silver.events WHERE EXISTS")
+        assert "FROM silver.labevents AS b" in session.executed[2]
+        assert "WHERE satisfies_hash_partition('silver.events'::regclass, 4, 2, subject_id)" in session.executed[2]
+        assert "ON CONFLICT (row_id, subject_id)" in session.executed[2]
+
+    def test_silver_rebuild_requires_partitioning(self):
+        """Test plain tables cannot be rebuilt by partition."""
+        with pytest.raises(ValueError):
+            rebuild_partition(RecordingConnection(), SilverLabEvent, [], "h00")
+
+    def test_gold_full_source_unchanged(self):
+        """Test gold loaders read whole silver tables without a partition."""
+        assert load_gold.partition_source("silver.labevents", "gold.fact_lab_event") == "silver.labevents"
+        assert load_gold.row_key("gold.fact_lab_event") == "row_id"
+
+    def test_gold_partition_requires_partitioning(self):
+        """Test gold partition rebuilds need a partitioned target."""
+        with pytest.raises(ValueError):
+            load_gold.partition_source("silver.labevents", "gold.fact_lab_event", "h00")
+
+
+class TestMovedRows:
+    """Test corrected partition keys replace the stale row instead of adding one."""
+
+    @pytest.fixture
+    def sqlite(self):
+        """SQLite connection with a range-keyed silver.events table (partitioning itself is PostgreSQL only)."""
+        engine = create_engine("sqlite://")
+
+        @event.listens_for(engine, "connect")
+        def attach_schemas(dbapi_conn, connection_record):
+            dbapi_conn.execute("ATTACH DATABASE ':memory:' AS silver")
+
+        table = make_events_table("range")
+        table.metadata.create_all(engine)
+        with engine.connect() as connection:
+            yield connection, table
+        engine.dispose()
+
+    def test_silver_upsert_moves_row(self, sqlite):
+        """Test a batch correcting a row's charttime leaves one row under the new charttime."""
+        connection, table = sqlite
+
+        class Model:
+            pass
+
+        registry().map_imperatively(Model, table)
+        upsert_batch(connection, Model, [{"row_id": 1, "subject_id": 5, "charttime": datetime(2150, 1, 1)}])
+        upsert_batch(connection, Model, [
+            {"row_id": 1, "subject_id": 5, "charttime": datetime(2151, 6, 1)},
+            {"row_id": 2, "subject_id": 5, "charttime": datetime(2150, 1, 1)},
+        ])
+
+        rows = connection.execute(select(table.c.row_id, table.c.charttime).order_by(table.c.row_id)).all()
+        assert rows == [(1, datetime(2151, 6, 1)), (2, datetime(2150, 1, 1))]
+
+    def test_delete_only_moved_rows(self, sqlite):
+        """Test the pre-upsert DELETE keeps rows whose partition key is unchanged."""
+        connection, table = sqlite
+        connection.execute(table.insert(), [
+            {"row_id": 1, "subject_id": 5, "charttime": datetime(2150, 1, 1)},
+            {"row_id": 2, "subject_id": 5, "charttime": datetime(2150, 1, 1)},
+        ])
+        connection.execute(text("CREATE TABLE silver.corrected (row_id INTEGER, charttime DATETIME)"))
+        connection.execute(text(
+            "INSERT INTO silver.corrected VALUES (1, '2151-06-01 00:00:00.000000'), (2, '2150-01-01 00:00:00.000000')"
+        ))
+
+        connection.execute(text(moved_rows_delete(table, ("row_id", "charttime"), "silver.corrected")))
+
+        assert connection.execute(select(table.c.row_id)).scalars().all() == [2]
+
+    def test_gold_facts_delete_moved_rows_in_window(self, monkeypatch):
+        """Test partitioned gold facts delete the moved rows of the silver window."""
+        *constraints, options = event_table_args(
+            "gold", "charttime", primary_key=("event_key",), unique=("row_id",), method="range"
+        )
+        metadata = MetaData()
+        Table(
+            "fact_lab_event", metadata,
+            Column("event_key", Integer), Column("row_id", Integer), Column("charttime", DateTime),
+            *constraints, **options,
+        )
+        monkeypatch.setattr(load_gold, "GoldBase", SimpleNamespace(metadata=metadata))
+        session = RecordingConnection()
+
+        load_gold.delete_moved_facts(
+            session, "gold.fact_lab_event", "silver.labevents", datetime(2024, 1, 1), datetime(2024, 1, 2)
+        )
+
+        assert session.executed == [
+            "DELETE FROM gold.fact_lab_event WHERE EXISTS (SELECT 1 FROM silver.labevents AS src "
+            "WHERE src.row_id = gold.fact_lab_event.row_id "
+            "AND src.charttime IS DISTINCT FROM gold.fact_lab_event.charttime "
+            "AND src.updated_at > :since AND src.updated_at <= :high)"
+        ]
+
+    def test_plain_tables_skip_delete(self):
+        """Test unpartitioned tables need no pre-upsert DELETE."""
+        assert moved_rows_delete(make_events_table("none"), ("row_id",), "silver.labevents") is None
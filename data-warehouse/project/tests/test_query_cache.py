@@ -0,0 +1,239 @@
+"""Unit tests for the gold query result cache."""
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.models.gold import GoldTableVersion
+from app.shared.query_cache import (
+    DiskStore,
+    MemoryStore,
+    QueryCache,
+    QueryResult,
+    bump_table_versions,
+    bump_versions_on_commit,
+    cache_key,
+    normalize_sql,
+    referenced_tables,
+)
+
+
+class VersionedSession:
+    """Session stand-in with in-memory table versions that counts queries."""
+
+    def __init__(self):
+        self.versions = {}
+        self.executed = []
+
+    def table_versions(self, tables):
+        return {table: self.versions.get(table, 0) for table in tables}
+
+    def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return QueryResult([(len(self.executed),)], ["n"])
+
+
+@pytest.fixture
+def session():
+    return VersionedSession()
+
+
+@pytest.fixture
+def gold_session():
+    """SQLite session with an attached gold schema holding one table, without the version table."""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach_gold(dbapi_conn, connection_record):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS gold")
+        dbapi_conn.create_function("now", 0, lambda: "2150-01-01 00:00:00")
+
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE gold.agg_icu_performance (careunit TEXT)"))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+class TestCacheKeys:
+    """Test SQL normalization and key derivation."""
+
+    def test_formatting_ignored(self):
+        """Test whitespace, case, comments and a trailing semicolon do not matter."""
+        a = "SELECT drug\n  FROM gold.agg_medication_usage -- top drugs\n LIMIT 10;"
+        b = "select drug from GOLD.agg_medication_usage limit 10"
+
+        assert normalize_sql(a) == normalize_sql(b)
+
+    def test_literals_preserved(self):
+        """Test quoted literals keep their case and spacing."""
+        sql = "SELECT * FROM gold.fact_admission WHERE admission_type = 'EMERGENCY  X'"
+
+        assert "'EMERGENCY  X'" in normalize_sql(sql)
+
+    def test_params_and_versions_in_key(self):
+        """Test different binds or table versions give different keys."""
+        sql = "SELECT * FROM gold.dim_patient LIMIT :limit"
+        base = cache_key(sql, {"limit": 5}, {"gold.dim_patient": 1})
+
+        assert base == cache_key(sql, {"limit": 5}, {"gold.dim_patient": 1})
+        assert base != cache_key(sql, {"limit": 6}, {"gold.dim_patient": 1})
+        assert base != cache_key(sql, {"limit": 5}, {"gold.dim_patient": 2})
+
+    def test_referenced_tables(self):
+        """Test FROM and JOIN targets are found, but not inside literals."""
+        sql = """
+            SELECT dl.label FROM gold.fact_lab_event f
+            JOIN gold.dim_labitem dl ON f.labitem_key = dl.labitem_key
+            WHERE dl.label <> 'from silver.labevents'
+        """
+
+        assert referenced_tables(sql) == ["gold.dim_labitem", "gold.fact_lab_event"]
+
+    def test_comma_joins_and_subqueries(self):
+        """Test every item of a FROM list is found, including after a subquery."""
+        assert referenced_tables("SELECT * FROM gold.fact_admission f, gold.dim_patient p") == [
+            "gold.dim_patient",
+            "gold.fact_admission",
+        ]
+        assert referenced_tables("SELECT * FROM (SELECT * FROM gold.a) s, silver.b") == ["gold.a", "silver.b"]
+        assert referenced_tables("WITH t AS (SELECT * FROM gold.a) SELECT * FROM t JOIN gold.b ON true") == [
+            "gold.a",
+            "gold.b",
+        ]
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT * FROM dim_patient",
+        'SELECT * FROM "gold"."dim_patient"',
+        "SELECT * FROM gold.fact_admission f, dim_patient p",
+        "SELECT * FROM gold.fact_admission f JOIN generate_series(1, 3) g ON true",
+    ])
+    def test_unresolved_sources(self, sql):
+        """Test a table source that is not a schema-qualified name makes the tables unknown."""
+        assert referenced_tables(sql) is None
+
+
+class TestQueryCache:
+    """Test hits, misses and version invalidation."""
+
+    def test_repeat_query_served_from_cache(self, session):
+        """Test the second identical query does not reach the database."""
+        cache = QueryCache(MemoryStore())
+        sql = "SELECT COUNT(*) FROM gold.agg_icu_performance"
+
+        first = cache.execute(session, sql).scalar()
+        second = cache.execute(session, " select count(*) from gold.agg_icu_performance ").scalar()
+
+        assert first == second == 1
+        assert len(session.executed) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_version_bump_invalidates(self, session):
+        """Test reloading a table makes the next query miss."""
+        cache = QueryCache(MemoryStore())
+        sql = "SELECT COUNT(*) FROM gold.agg_icu_performance"
+        cache.execute(session, sql)
+
+        session.versions["gold.agg_icu_performance"] = 1
+
+        assert cache.execute(session, sql).scalar() == 2
+
+    def test_non_gold_queries_not_cached(self, session):
+        """Test tables without a version counter always go to the database."""
+        cache = QueryCache(MemoryStore())
+        for _ in range(2):
+            cache.execute(session, "SELECT COUNT(*) FROM silver.patients")
+
+        assert len(session.executed) == 2
+
+    def test_unresolved_queries_not_cached(self, session):
+        """Test a query with an unqualified table bypasses the cache unless its tables are declared."""
+        cache = QueryCache(MemoryStore())
+        sql = "SELECT COUNT(*) FROM gold.fact_admission f, dim_patient p"
+        for _ in range(2):
+            cache.execute(session, sql)
+        assert len(session.executed) == 2
+
+        for _ in range(2):
+            cache.execute(session, sql, tables=["gold.fact_admission", "gold.dim_patient"])
+        assert len(session.executed) == 3
+
+    def test_missing_version_table_not_cached(self, gold_session):
+        """Test a database loaded before the version table existed is queried without the cache."""
+        cache = QueryCache(MemoryStore())
+        sql = "SELECT COUNT(*) FROM gold.agg_icu_performance"
+
+        assert cache.execute(gold_session, sql).scalar() == 0
+        assert (cache.hits, cache.misses, len(cache.store)) == (0, 0, 0)
+
+        GoldTableVersion.__table__.create(gold_session.connection())
+        cache.execute(gold_session, sql)
+        cache.execute(gold_session, sql)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestStores:
+    """Test the memory and disk stores."""
+
+    def test_memory_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        store = MemoryStore(max_entries=2)
+        store.set("a", QueryResult([(1,)], ["x"]))
+        store.set("b", QueryResult([(2,)], ["x"]))
+        store.get("a")
+        store.set("c", QueryResult([(3,)], ["x"]))
+
+        assert store.get("b") is None
+        assert store.get("a").scalar() == 1
+        assert len(store) == 2
+
+    def test_disk_round_trip_and_prune(self, tmp_path):
+        """Test results survive on disk and the store stays bounded."""
+        store = DiskStore(tmp_path, max_entries=2)
+        for age, key in ((30, "a"), (20, "b")):
+            store.set(key, QueryResult([(key,)], ["x"]))
+            os.utime(tmp_path / f"{key}.pickle", (time.time() - age,) * 2)
+        store.set("c", QueryResult([("c",)], ["x"]))
+
+        assert len(store) == 2
+        assert store.get("a") is None
+        assert DiskStore(tmp_path).get("c").fetchall() == [("c",)]
+
+    def test_corrupt_disk_entry_dropped(self, tmp_path):
+        """Test an unreadable file is treated as a miss and removed."""
+        store = DiskStore(tmp_path)
+        (tmp_path / "bad.pickle").write_bytes(b"not a pickle")
+
+        assert store.get("bad") is None
+        assert not (tmp_path / "bad.pickle").exists()
+
+
+class TestVersionBump:
+    """Test version counter updates."""
+
+    def test_bump_upserts_each_table_once(self, session):
+        """Test each table is incremented once, in a stable order."""
+        bump_table_versions(session, ["gold.b", "gold.a", "gold.b"])
+
+        sql, params = session.executed[0]
+        assert "ON CONFLICT (table_name) DO UPDATE" in sql
+        assert params == [{"name": "gold.a"}, {"name": "gold.b"}]
+
+    def test_bump_on_every_commit(self, gold_session):
+        """Test versions are bumped inside each committed transaction, and not on rollback."""
+        GoldTableVersion.__table__.create(gold_session.connection())
+        gold_session.commit()
+        version = "SELECT version FROM gold.etl_table_versions WHERE table_name = 'gold.agg_icu_performance'"
+
+        with bump_versions_on_commit(gold_session, ["gold.agg_icu_performance"]):
+            gold_session.execute(text("INSERT INTO gold.agg_icu_performance VALUES ('MICU')"))
+            gold_session.commit()
+            gold_session.execute(text("INSERT INTO gold.agg_icu_performance VALUES ('SICU')"))
+            gold_session.commit()
+            gold_session.execute(text("INSERT INTO gold.agg_icu_performance VALUES ('CCU')"))
+            gold_session.rollback()
+        gold_session.commit()
+
+        assert gold_session.execute(text(version)).scalar() == 2
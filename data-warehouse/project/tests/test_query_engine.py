@@ -0,0 +1,139 @@
+"""Unit tests for the DuckDB query backend."""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.analytics import queries
+from app.analytics.duckdb_engine import empty_view_sql, has_data_files, to_duckdb_sql, view_sql
+from app.analytics.queries import GOLD_QUERIES, resolve_backend, run_query
+from app.models.gold import DimPatient, FactLabEvent
+from app.shared.query_cache import QueryResult
+
+
+class RecordingSession:
+    """Session stand-in recording statements and bind values."""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return QueryResult([(1,)], ["count"])
+
+
+class TestSqlTranslation:
+    """Test SQL rewriting for DuckDB."""
+
+    def test_bind_parameters_rewritten(self):
+        """Test :name binds become $name without touching ::casts."""
+        sql = "SELECT ROUND(AVG(x)::numeric, 1) FROM t WHERE a = :subject LIMIT :limit"
+
+        assert to_duckdb_sql(sql) == "SELECT ROUND(AVG(x)::numeric, 1) FROM t WHERE a = $subject LIMIT $limit"
+
+    def test_fact_view_reads_year_partitions(self):
+        """Test fact views glob the year= directories but keep table columns."""
+        sql = view_sql(Path("/exports"), FactLabEvent.__table__)
+
+        assert sql.startswith("CREATE OR REPLACE VIEW gold.fact_lab_event AS SELECT lab_event_key,")
+        assert "read_parquet('/exports/fact_lab_event/*/data.parquet', hive_partitioning = true)" in sql
+        assert ", year" not in sql
+
+    def test_dimension_view_reads_one_file(self):
+        """Test whole tables are read from their single file."""
+        sql = view_sql(Path("/exports"), DimPatient.__table__)
+
+        assert sql.endswith("FROM read_parquet('/exports/dim_patient/data.parquet')")
+
+
+    def test_empty_export_gets_typed_view(self, tmp_path):
+        """Test a fact exported without rows has no files and gets a typed empty view."""
+        (tmp_path / "fact_lab_event").mkdir()
+
+        sql = empty_view_sql(FactLabEvent.__table__)
+
+        assert not has_data_files(tmp_path, FactLabEvent.__table__)
+        assert sql.startswith(
+            "CREATE OR REPLACE VIEW gold.fact_lab_event AS SELECT CAST(NULL AS INTEGER) AS lab_event_key,"
+        )
+        assert "CAST(NULL AS TIMESTAMP) AS charttime" in sql
+        assert sql.endswith(" WHERE false")
+
+
+class TestBackendSelection:
+    """Test picking and using a query backend."""
+
+    def test_default_from_settings(self, monkeypatch):
+        """Test the configured backend is used when none is given."""
+        monkeypatch.setattr(queries.settings, "analytics_backend", "duckdb")
+
+        assert resolve_backend() == "duckdb"
+        assert resolve_backend("POSTGRES") == "postgres"
+
+    def test_unknown_backend_rejected(self):
+        """Test an unknown backend fails before connecting."""
+        with pytest.raises(ValueError):
+            resolve_backend("sqlite")
+
+    def test_run_query_binds_only_used_parameters(self):
+        """Test defaults fill binds and unused parameters are dropped."""
+        session = RecordingSession()
+
+        run_query("first_patients", session, cache=False)
+        run_query("patient_count", session, cache=False, limit=3)
+
+        assert session.executed[0][1] == {"limit": 5}
+        assert session.executed[1][1] == {}
+
+
+class TestDuckDBSession:
+    """Test queries against a real Parquet export."""
+
+    @pytest.fixture
+    def export_root(self, tmp_path):
+        """Export with a two-row dim_patient and an empty manifest."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        pytest.importorskip("duckdb")
+        from app.analytics.parquet_export import arrow_schema
+
+        schema = arrow_schema(DimPatient.__table__)
+        rows = {name: [None, None] for name in schema.names}
+        rows.update(patient_key=[1, 2], subject_id=[10, 11], gender=["F", "M"], is_deceased=[True, False],
+                    total_admissions=[2, 1], total_icu_stays=[1, 0])
+        (tmp_path / "dim_patient").mkdir()
+        pq.write_table(pa.table(rows, schema=schema), tmp_path / "dim_patient" / "data.parquet")
+        (tmp_path / "_manifest.json").write_text("{}")
+        return tmp_path
+
+    def test_postgres_sql_runs_on_export(self, export_root):
+        """Test notebook SQL with casts and binds runs unchanged."""
+        from app.analytics import DuckDBSession
+
+        with DuckDBSession(export_root) as session:
+            count = session.execute(text(GOLD_QUERIES["patient_count"])).scalar()
+            by_gender = run_query("patients_by_gender", session)
+            first = run_query("first_patients", session, limit=1)
+
+        assert count == 2
+        assert sorted(row[0] for row in by_gender) == ["F", "M"]
+        assert first == [(10, "F", None, True)]
+
+    def test_table_without_rows_queryable(self, export_root):
+        """Test a manifest table with no Parquet files is an empty view, not a missing table."""
+        from app.analytics import DuckDBSession
+
+        (export_root / "_manifest.json").write_text('{"fact_lab_event": {}}')
+
+        with DuckDBSession(export_root) as session:
+            count = session.execute(text("SELECT COUNT(*) FROM gold.fact_lab_event")).scalar()
+
+        assert count == 0
+
+    def test_missing_export_rejected(self, tmp_path):
+        """Test a directory without a manifest is not treated as an export."""
+        pytest.importorskip("duckdb")
+        from app.analytics import DuckDBSession
+
+        with pytest.raises(FileNotFoundError):
+            DuckDBSession(tmp_path)
@@ -0,0 +1,96 @@
+"""Unit tests for the dependency-aware scheduler."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.shared.scheduler import critical_path, format_timeline, run_dag
+from app.transformers.bronze import MODEL_CLASSES, TABLE_DEPENDENCIES
+
+
+def make_task(log, name, delay=0.01):
+    """Build a task that records its start and end."""
+    def task():
+        log.append(("start", name))
+        time.sleep(delay)
+        log.append(("end", name))
+        return name.lower()
+    return task
+
+
+class TestRunDag:
+    """Test run_dag scheduling."""
+
+    def test_dependencies_finish_first(self):
+        """Test a task only starts after its dependencies end."""
+        log = []
+        tasks = {name: make_task(log, name) for name in ("A", "B", "C", "D")}
+        deps = {"C": ["A", "B"], "D": ["C"]}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = run_dag(tasks, deps, executor)
+
+        assert log.index(("end", "A")) < log.index(("start", "C"))
+        assert log.index(("end", "B")) < log.index(("start", "C"))
+        assert log.index(("end", "C")) < log.index(("start", "D"))
+        assert results["D"].result == "d"
+        assert results["D"].start >= results["C"].end
+
+    def test_independent_tasks_overlap(self):
+        """Test independent tasks run concurrently."""
+        log = []
+        tasks = {name: make_task(log, name, delay=0.05) for name in ("A", "B")}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_dag(tasks, {}, executor)
+
+        assert results["B"].start < results["A"].end
+
+    def test_failure_skips_dependents(self):
+        """Test dependents of a failed task are skipped."""
+        def boom():
+            raise RuntimeError("bad csv")
+
+        log = []
+        tasks = {"A": boom, "B": make_task(log, "B"), "C": make_task(log, "C")}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_dag(tasks, {"B": ["A"]}, executor)
+
+        assert results["A"].error == "bad csv"
+        assert results["B"].skipped
+        assert results["C"].result == "c"
+
+    def test_cycle_rejected(self):
+        """Test cyclic graphs raise ValueError."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(ValueError, match="cycle"):
+                run_dag({"A": lambda: 1, "B": lambda: 2}, {"A": ["B"], "B": ["A"]}, executor)
+
+    def test_critical_path_and_timeline(self):
+        """Test the longest chain is reported and rendered."""
+        log = []
+        tasks = {
+            "A": make_task(log, "A", 0.01),
+            "B": make_task(log, "B", 0.05),
+            "C": make_task(log, "C", 0.01),
+        }
+        deps = {"C": ["A", "B"]}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_dag(tasks, deps, executor)
+
+        assert critical_path(results, deps) == ["B", "C"]
+        timeline = format_timeline(results)
+        assert timeline.splitlines()[0].startswith("TASK")
+        assert len(timeline.splitlines()) == 4
+
+
+class TestTableDependencies:
+    """Test the declared bronze load graph."""
+
+    def test_graph_covers_model_classes(self):
+        """Test every loadable table has a dependency entry."""
+        assert set(TABLE_DEPENDENCIES) == set(MODEL_CLASSES)
+        for deps in TABLE_DEPENDENCIES.values():
+            assert set(deps) <= set(MODEL_CLASSES)
@@ -0,0 +1,448 @@
+"""Unit tests for Silver transformers."""
+import pytest
+import re
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.models.bronze import (
+    BronzeInputEventsCareVue,
+    BronzeInputEventsMetaVision,
+    BronzeLabEvents,
+    BronzePrescriptions,
+)
+from app.models.silver import SilverInputEvent, SilverLabEvent, SilverRejectedRow
+from app.transformers import silver
+from app.transformers.silver import InputEventsTransformer, LabEventsTransformer, PrescriptionTransformer
+from app.transformers.silver.base_transformer import (
+    AUDIT_COLUMNS,
+    NUMERIC_PATTERN,
+    keyset_batches,
+    upsert_from_select,
+)
+from scripts import load_gold
+
+STANDARD_TRANSFORMERS = [
+    getattr(silver, name) for name in silver.__all__ if name != "InputEventsTransformer"
+]
+
+
+def make_labevent(row_id):
+    """Build a minimal bronze lab event."""
+    return BronzeLabEvents(
+        row_id=row_id,
+        subject_id=10000 + row_id,
+        itemid=50912,
+        charttime=datetime(2150, 1, 1, 8, 0),
+        value="1.2",
+        valuenum=1.2,
+        flag="abnormal" if row_id % 2 else None,
+    )
+
+
+class TestKeysetPagination:
+    """Test keyset pagination over bronze tables."""
+
+    def test_batches_cover_every_row_once(self, bronze_session):
+        """Test every row is read exactly once, in primary key order."""
+        row_ids = [17, 3, 25, 8, 1, 12, 30, 5, 21, 9, 14]
+        bronze_session.add_all([make_labevent(row_id) for row_id in row_ids])
+        bronze_session.commit()
+
+        batches = list(keyset_batches(bronze_session, BronzeLabEvents, batch_size=4))
+
+        assert [len(batch) for batch in batches] == [4, 4, 3]
+        seen = [record.row_id for batch in batches for record in batch]
+        assert seen == sorted(row_ids)
+
+    def test_transformer_reads_in_key_order(self, bronze_session):
+        """Test transformer batches follow the primary key."""
+        bronze_session.add_all([make_labevent(row_id) for row_id in (4, 2, 3, 1)])
+        bronze_session.commit()
+
+        transformer = LabEventsTransformer(bronze_session, batch_size=3)
+        batches = list(transformer.read_bronze_batches())
+
+        assert [[r.row_id for r in batch] for batch in batches] == [[1, 2, 3], [4]]
+
+    def test_inputevents_reads_both_sources(self, bronze_session):
+        """Test CV and MV streams are both paged to completion."""
+        bronze_session.add_all([
+            BronzeInputEventsCareVue(row_id=i, subject_id=1, itemid=30001, charttime=datetime(2150, 1, 1, 8, 0))
+            for i in range(1, 6)
+        ])
+        bronze_session.add_all([
+            BronzeInputEventsMetaVision(
+                row_id=i,
+                subject_id=1,
+                itemid=225158,
+                starttime=datetime(2150, 1, 1, 8, 0),
+                endtime=datetime(2150, 1, 1, 10, 30),
+            )
+            for i in range(1, 4)
+        ])
+        bronze_session.commit()
+
+        transformer = InputEventsTransformer(bronze_session, batch_size=2)
+        rows = [row for batch in transformer.read_batches() for row in batch]
+
+        assert [(row["row_id"], row["source_system"]) for row in rows] == (
+            [(i, "CareVue") for i in range(1, 6)] + [(i, "MetaVision") for i in range(1, 4)]
+        )
+        assert rows[-1]["duration_hours"] == 2.5
+        assert transformer.stats["errors"] == 0
+
+
+class TestStreamingMode:
+    """Test server-side streaming reads."""
+
+    def test_stream_yields_all_rows(self, bronze_session):
+        """Test streamed batches cover the table."""
+        bronze_session.add_all([make_labevent(row_id) for row_id in range(1, 8)])
+        bronze_session.commit()
+
+        transformer = LabEventsTransformer(bronze_session, batch_size=3, stream=True)
+        batches = list(transformer.read_bronze_batches())
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert sorted(r.row_id for batch in batches for r in batch) == list(range(1, 8))
+
+    def test_transform_record_accepts_rows(self, bronze_session):
+        """Test transform_record works unchanged on streamed rows."""
+        bronze_session.add_all([make_labevent(row_id) for row_id in (1, 2)])
+        bronze_session.commit()
+
+        orm = LabEventsTransformer(bronze_session, batch_size=10)
+        streamed = LabEventsTransformer(bronze_session, batch_size=10, stream=True)
+
+        orm_rows = [orm.transform_batch(batch) for batch in orm.read_bronze_batches()]
+        stream_rows = [streamed.transform_batch(batch) for batch in streamed.read_bronze_batches()]
+
+        assert stream_rows == orm_rows
+        assert stream_rows[0][0]["is_abnormal"] is True
+
+
+class RecordingSession:
+    """Session stand-in that records executed statements."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+        class Result:
+            rowcount = 5
+
+            def scalar(self):
+                return 7
+
+        return Result()
+
+    def get(self, model, key):
+        return None
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="recording"))
+
+    def merge(self, instance):
+        pass
+
+    def commit(self):
+        pass
+
+
+class TestSqlPushdown:
+    """Test set-based (INSERT ... SELECT) transformation mode."""
+
+    @pytest.mark.parametrize("transformer_class", STANDARD_TRANSFORMERS, ids=lambda c: c.__name__)
+    def test_sql_select_produces_every_silver_column(self, transformer_class):
+        """Test each SELECT names every silver column and reads {source}."""
+        transformer = transformer_class(session=None)
+        sql = transformer.sql_select
+        columns = [c.name for c in transformer.silver_model.__table__.columns if c.name not in AUDIT_COLUMNS]
+
+        assert "{source}" in sql
+        for column in columns:
+            assert re.search(rf"\b{column}\b", sql), column
+
+    def test_upsert_statement(self):
+        """Test the upsert inserts non-audit columns and updates on pk conflict."""
+        session = RecordingSession()
+
+        assert upsert_from_select(session, SilverLabEvent, "SELECT 1") == 5
+
+        statement = session.statements[0]
+        assert statement.startswith("INSERT INTO silver.labevents (row_id, subject_id,")
+        assert "created_at" not in statement
+        assert "ON CONFLICT (row_id) DO UPDATE SET subject_id = EXCLUDED.subject_id" in statement
+        assert statement.endswith("updated_at = now()")
+
+    def test_transform_sql_substitutes_source(self):
+        """Test transform_sql reads the bronze table and records stats."""
+        session = RecordingSession()
+
+        stats = LabEventsTransformer(session).transform_sql()
+
+        assert stats == {"total": 7, "transformed": 5, "errors": 0}
+        assert "FROM bronze.labevents WHERE updated_at <= :watermark_high) AS counted" in session.statements[-2]
+        assert "updated_at <= :watermark_high) AS b" in session.statements[-1]
+
+    def test_labevents_strips_prefixes_in_order(self):
+        """Test numeric prefixes are removed one anchored pattern at a time."""
+        sql = LabEventsTransformer(session=None).sql_select
+
+        assert "REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(REGEXP_REPLACE(BTRIM(b.value, E' \\t\\r\\n'), '^>', ''), '^<', ''), '^>=', ''), '^<=', ''), '^~', '')" in sql
+
+    def test_inputevents_upserts_each_source(self):
+        """Test CareVue and MetaVision are pushed down separately."""
+        session = RecordingSession()
+
+        stats = InputEventsTransformer(session).transform_sql()
+
+        inserts = [s for s in session.statements if s.startswith("INSERT")]
+        assert stats == {"total": 14, "transformed": 10, "errors": 0}
+        assert "FROM bronze.inputevents_cv WHERE" in inserts[0]
+        assert "'MetaVision' AS source_system" in inserts[1]
+        assert "ON CONFLICT (row_id, source_system)" in inserts[1]
+
+
+class TestNumericParity:
+    """Test SQL mode and Python mode parse numeric text by the same rules."""
+
+    EDGE_CASES = [
+        "5.5", " 7 ", "\t8\r\n", ">10", "> 10", "<=0.5", "~2", "1e3", ".5", "5.", "+3", "-2",
+        "1,000", "nan", "NaN", "inf", "-Infinity", "1_000", "0x10", "\u0661\u0662", "5\x0b", "NEGATIVE", " ",
+    ]
+
+    @staticmethod
+    def sql_numeric(text, prefixes=(), drop_commas=False):
+        """Evaluate the SQL mode predicate: BTRIM, cleanups, BTRIM, then ~ NUMERIC_PATTERN before the cast."""
+        text = text.strip(" \t\r\n")
+        for prefix in prefixes:
+            text = re.sub(f"^{prefix}", "", text)
+        if drop_commas:
+            text = text.replace(",", "")
+        text = text.strip(" \t\r\n")
+        return float(text) if re.search(NUMERIC_PATTERN, text) else None
+
+    @pytest.mark.parametrize("value", EDGE_CASES)
+    def test_labevents_value(self, value):
+        """Test lab values parse to the same valuenum in both modes."""
+        from app.transformers.silver.labevents_transformer import NUMERIC_PREFIXES
+
+        transformer = LabEventsTransformer(session=None)
+        bronze = make_labevent(1)
+        bronze.value, bronze.valuenum = value, None
+
+        assert f"~ '{NUMERIC_PATTERN}'" in transformer.sql_select
+        assert "BTRIM(b.value, E' \\t\\r\\n')" in transformer.sql_select
+        assert transformer.transform_record(bronze)["valuenum"] == self.sql_numeric(value, NUMERIC_PREFIXES)
+
+    @pytest.mark.parametrize("value", EDGE_CASES)
+    def test_prescription_dose(self, value):
+        """Test doses parse to the same number in both modes."""
+        transformer = PrescriptionTransformer(session=None)
+        bronze = BronzePrescriptions(row_id=1, subject_id=1, hadm_id=1, dose_val_rx=value)
+
+        assert "BTRIM(REPLACE(BTRIM(b.dose_val_rx, E' \\t\\r\\n'), ',', ''), E' \\t\\r\\n')" in transformer.sql_select
+        assert transformer.transform_record(bronze)["dose_val_rx"] == self.sql_numeric(value, drop_commas=True)
+
+
+class TestInputEventsUpsert:
+    """Test batched upserts and concurrent sources for inputevents."""
+
+    @pytest.fixture
+    def written(self, monkeypatch):
+        """Record upsert_batch calls instead of executing PostgreSQL upserts."""
+        from app.transformers.silver import inputevents_transformer
+
+        calls = []
+        monkeypatch.setattr(
+            inputevents_transformer, "upsert_batch",
+            lambda session, model, rows: calls.append(
+                (session, [(row["row_id"], row["source_system"]) for row in rows])
+            ),
+        )
+        return calls
+
+    def test_sequential_writes_batches(self, bronze_session, written):
+        """Test each transformed batch is written with one upsert."""
+        bronze_session.add_all([
+            BronzeInputEventsCareVue(row_id=i, subject_id=1, itemid=30001, charttime=datetime(2150, 1, 1, 8, 0))
+            for i in range(1, 4)
+        ])
+        bronze_session.commit()
+
+        stats = InputEventsTransformer(bronze_session, batch_size=2, parallel=False).transform()
+
+        assert [keys for _, keys in written] == [[(1, "CareVue"), (2, "CareVue")], [(3, "CareVue")]]
+        assert all(session is bronze_session for session, _ in written)
+        assert stats == {"total": 3, "transformed": 3, "errors": 0}
+
+    def test_parallel_uses_session_per_source(self, bronze_session, written, monkeypatch):
+        """Test CV and MV run on separate sessions and their stats are merged."""
+        from types import SimpleNamespace
+        from app.transformers.silver import inputevents_transformer
+
+        def fake_batches(session, model, batch_size, criteria=()):
+            yield [
+                SimpleNamespace(
+                    row_id=i, subject_id=1, hadm_id=None, icustay_id=None, itemid=1,
+                    charttime=None, starttime=None, endtime=None, amount=None, amountuom=None,
+                    rate=None, rateuom=None, cgid=None, orderid=None,
+                )
+                for i in (1, 2)
+            ]
+
+        monkeypatch.setattr(inputevents_transformer, "keyset_batches", fake_batches)
+        monkeypatch.setattr(inputevents_transformer, "open_window", lambda *args: (None, None))
+
+        stats = InputEventsTransformer(bronze_session, batch_size=10, parallel=True).transform()
+
+        sessions = {id(session) for session, _ in written}
+        assert len(sessions) == 2 and id(bronze_session) not in sessions
+        assert sorted(keys for _, keys in written) == [
+            [(1, "CareVue"), (2, "CareVue")], [(1, "MetaVision"), (2, "MetaVision")]
+        ]
+        assert stats == {"total": 4, "transformed": 4, "errors": 0}
+
+    def test_sources_keyed_apart(self, bronze_session, written):
+        """Test CareVue and MetaVision rows with the same row ID get different silver keys."""
+        bronze_session.add_all([
+            BronzeInputEventsCareVue(row_id=2, subject_id=1, itemid=30001, charttime=datetime(2150, 1, 1)),
+            BronzeInputEventsMetaVision(row_id=2, subject_id=1, itemid=225158, starttime=datetime(2150, 1, 1)),
+        ])
+        bronze_session.commit()
+
+        InputEventsTransformer(bronze_session, batch_size=10, parallel=False).transform()
+
+        assert [keys for _, keys in written] == [[(2, "CareVue")], [(2, "MetaVision")]]
+        assert [c.name for c in SilverInputEvent.__table__.primary_key.columns] == ["row_id", "source_system"]
+        assert load_gold.row_key("gold.fact_input_event") == "row_id, source_system"
+
+    def test_sources_concurrent_by_default(self):
+        """Test the sources run concurrently unless load_silver is asked to run them one after the other."""
+        assert InputEventsTransformer(session=None).parallel
+
+
+class TestQuarantine:
+    """Test records that fail to transform are quarantined."""
+
+    @pytest.fixture
+    def written(self, monkeypatch):
+        """Record upserted row ids instead of executing PostgreSQL upserts."""
+        from app.transformers.silver import base_transformer
+
+        calls = []
+        monkeypatch.setattr(
+            base_transformer, "upsert_batch",
+            lambda session, model, rows: calls.extend(row["row_id"] for row in rows),
+        )
+        return calls
+
+    def test_failed_records_quarantined(self, bronze_session, written):
+        """Test failures go to silver.etl_rejected_rows, even from a batch with no good rows."""
+        bronze_session.add_all([make_labevent(row_id) for row_id in range(1, 6)])
+        bronze_session.commit()
+        transformer = LabEventsTransformer(bronze_session, batch_size=2)
+        transform_record = transformer.transform_record
+
+        def failing(record):
+            if record.row_id in (3, 4):
+                raise ValueError("unit mismatch")
+            return transform_record(record)
+
+        transformer.transform_record = failing
+        stats = transformer.transform()
+
+        rejected = bronze_session.query(SilverRejectedRow).order_by(SilverRejectedRow.source_key).all()
+        assert written == [1, 2, 5]
+        assert stats == {"total": 5, "transformed": 3, "errors": 2}
+        assert [(r.table_name, r.source_table, r.source_key) for r in rejected] == [
+            ("labevents", "labevents", "3"),
+            ("labevents", "labevents", "4"),
+        ]
+        assert rejected[0].error == "ValueError: unit mismatch"
+        assert '"itemid": 50912' in rejected[0].raw_row
+
+
+class TestIncrementalMode:
+    """Test watermark-based incremental transformation."""
+
+    @pytest.fixture
+    def written(self, monkeypatch):
+        """Record upserted row ids instead of executing PostgreSQL upserts."""
+        from app.transformers.silver import base_transformer
+
+        calls = []
+        monkeypatch.setattr(
+            base_transformer, "upsert_batch",
+            lambda session, model, rows: calls.extend(row["row_id"] for row in rows),
+        )
+        return calls
+
+    def add_labevents(self, session, row_ids, updated_at):
+        """Insert bronze lab events stamped with a given updated_at."""
+        for row_id in row_ids:
+            event = make_labevent(row_id)
+            event.updated_at = updated_at
+            session.add(event)
+        session.commit()
+
+    def test_full_run_records_watermark(self, bronze_session, written):
+        """Test a full run processes everything and stores the high-water mark."""
+        from app.models.silver import SilverWatermark
+
+        self.add_labevents(bronze_session, [1, 2, 3], datetime(2024, 1, 1))
+
+        LabEventsTransformer(bronze_session).transform()
+
+        mark = bronze_session.get(SilverWatermark, ("labevents", "labevents"))
+        assert written == [1, 2, 3]
+        assert mark.watermark == datetime(2024, 1, 1)
+
+    def test_incremental_reads_only_new_rows(self, bronze_session, written):
+        """Test incremental runs skip rows at or below the watermark."""
+        self.add_labevents(bronze_session, [1, 2, 3], datetime(2024, 1, 1))
+        LabEventsTransformer(bronze_session).transform()
+
+        self.add_labevents(bronze_session, [4, 5], datetime(2024, 1, 2))
+        stats = LabEventsTransformer(bronze_session, incremental=True).transform()
+
+        assert written == [1, 2, 3, 4, 5]
+        assert stats["total"] == 2
+
+        stats = LabEventsTransformer(bronze_session, incremental=True).transform()
+        assert stats["total"] == 0
+
+    def test_window_stops_before_open_transactions(self, bronze_session, written, monkeypatch):
+        """Test rows stamped at or after the oldest open transaction wait for a later run."""
+        from app.models.silver import SilverWatermark
+        from app.transformers.silver import watermarks
+
+        self.add_labevents(bronze_session, [1], datetime(2024, 1, 1))
+        self.add_labevents(bronze_session, [2], datetime(2024, 1, 2))
+        monkeypatch.setattr(watermarks, "open_transactions_start", lambda session: datetime(2024, 1, 2))
+
+        LabEventsTransformer(bronze_session).transform()
+
+        mark = bronze_session.get(SilverWatermark, ("labevents", "labevents"))
+        assert written == [1]
+        assert mark.watermark == datetime(2024, 1, 2) - watermarks.TIMESTAMP_RESOLUTION
+
+        monkeypatch.setattr(watermarks, "open_transactions_start", lambda session: None)
+        LabEventsTransformer(bronze_session, incremental=True).transform()
+        assert written == [1, 2]
+
+    def test_window_sql_binds_bounds(self):
+        """Test the SQL relation filters on both bounds."""
+        from app.transformers.silver.watermarks import window_sql
+
+        relation, params = window_sql(BronzeLabEvents, (datetime(2024, 1, 1), datetime(2024, 1, 2)))
+
+        assert relation == (
+            "(SELECT * FROM bronze.labevents WHERE updated_at > :watermark_low "
+            "AND updated_at <= :watermark_high)"
+        )
+        assert params == {"watermark_low": datetime(2024, 1, 1), "watermark_high": datetime(2024, 1, 2)}
+        assert window_sql(BronzeLabEvents, (None, None)) == ("bronze.labevents", {})